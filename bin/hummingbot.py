@@ -57,6 +57,10 @@ async def main():
                      override_log_level=global_config_map.get("log_level").value,
                      dev_mode=dev_mode)
         tasks: List[Coroutine] = [hb.run()]
+        if global_config_map.get("metrics_port").value is not None:
+            from hummingbot.core.metrics import MetricsServer
+            metrics_server = MetricsServer(global_config_map.get("metrics_port").value)
+            tasks.append(metrics_server.start())
         if global_config_map.get("debug_console").value:
             if not hasattr(__builtins__, "help"):
                 import _sitebuiltins
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+import path_util        # noqa: F401
+import asyncio
+import logging
+from typing import (
+    Coroutine,
+    List,
+)
+import os
+
+from hummingbot import (
+    check_dev_mode,
+    data_path,
+    init_logging,
+    set_headless,
+)
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.config.config_helpers import (
+    create_yml_files,
+    read_system_configs_from_yml,
+    update_strategy_config_map_from_file,
+    all_configs_complete,
+)
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.management.console import start_management_console
+from bin.hummingbot import (
+    detect_available_port,
+)
+from bin.hummingbot_quickstart import (
+    CmdlineParser,
+    autofix_permissions,
+)
+from hummingbot.client.settings import CONF_FILE_PATH
+from hummingbot.client.config.security import Security
+from hummingbot.client.errors import MissingMasterKeyError
+
+
+class HeadlessCmdlineParser(CmdlineParser):
+    def __init__(self):
+        super().__init__()
+        self.add_argument("--config-password-file",
+                          type=str,
+                          required=False,
+                          help="Specify a file containing the password to unlock your encrypted files and wallets.")
+        self.add_argument("--control-socket",
+                          type=str,
+                          required=False,
+                          default=os.path.join(data_path(), "hummingbot.sock"),
+                          help="Specify the unix socket path to send commands (e.g. status, history, stop, exit) "
+                               "to the bot.")
+
+
+def read_password_file(file_path: str) -> str:
+    with open(file_path) as fd:
+        return fd.read().rstrip("\r\n")
+
+
+async def headless_start(args):
+    strategy = args.strategy
+    config_file_name = args.config_file_name
+    password = args.config_password
+
+    if args.auto_set_permissions is not None:
+        autofix_permissions(args.auto_set_permissions)
+
+    try:
+        if not Security.login(password):
+            logging.getLogger().error("Invalid password.")
+            return
+    except MissingMasterKeyError as e:
+        logging.getLogger().error(str(e))
+        return
+
+    # The CLI log handlers are dropped from now on, all the logs go to the log files.
+    set_headless(True)
+
+    await Security.wait_til_decryption_done()
+    await create_yml_files()
+    init_logging("hummingbot_logs.yml")
+    read_system_configs_from_yml()
+
+    hb = HummingbotApplication.main_application()
+    hb.app.control_socket_path = args.control_socket
+    hb.strategy_name = strategy
+    hb.strategy_file_name = config_file_name
+    update_strategy_config_map_from_file(os.path.join(CONF_FILE_PATH, config_file_name))
+
+    # To ensure headless mode runs with the default value of False for kill_switch_enabled if not present
+    if not global_config_map.get("kill_switch_enabled"):
+        global_config_map.get("kill_switch_enabled").value = False
+
+    if args.wallet:
+        global_config_map.get("ethereum_wallet").value = args.wallet
+
+    if not all_configs_complete(hb.strategy_name):
+        logging.getLogger().error(f"The config file {config_file_name} is incomplete for the {strategy} strategy. "
+                                  f"Complete it with the interactive client first.")
+        return
+
+    dev_mode = check_dev_mode()
+    log_level = global_config_map.get("log_level").value
+    init_logging("hummingbot_logs.yml",
+                 override_log_level=log_level,
+                 dev_mode=dev_mode)
+
+    hb.start(log_level)
+
+    tasks: List[Coroutine] = [hb.run()]
+    if global_config_map.get("metrics_port").value is not None:
+        from hummingbot.core.metrics import MetricsServer
+        metrics_server = MetricsServer(global_config_map.get("metrics_port").value)
+        tasks.append(metrics_server.start())
+    if global_config_map.get("debug_console").value:
+        management_port: int = detect_available_port(8211)
+        tasks.append(start_management_console(locals(), host="localhost", port=management_port))
+    await safe_gather(*tasks)
+
+
+def main():
+    args = HeadlessCmdlineParser().parse_args()
+
+    # Parse environment variables from Dockerfile.
+    # If an environment variable is not empty and it's not defined in the arguments, then we'll use the environment
+    # variable.
+    if args.strategy is None and len(os.environ.get("STRATEGY", "")) > 0:
+        args.strategy = os.environ["STRATEGY"]
+    if args.config_file_name is None and len(os.environ.get("CONFIG_FILE_NAME", "")) > 0:
+        args.config_file_name = os.environ["CONFIG_FILE_NAME"]
+    if args.wallet is None and len(os.environ.get("WALLET", "")) > 0:
+        args.wallet = os.environ["WALLET"]
+    if args.config_password_file is None and len(os.environ.get("CONFIG_PASSWORD_FILE", "")) > 0:
+        args.config_password_file = os.environ["CONFIG_PASSWORD_FILE"]
+    if args.config_password is None and args.config_password_file is not None:
+        args.config_password = read_password_file(args.config_password_file)
+    if args.config_password is None and len(os.environ.get("CONFIG_PASSWORD", "")) > 0:
+        args.config_password = os.environ["CONFIG_PASSWORD"]
+
+    # There's no prompt to fall back on when running headless.
+    if args.strategy is None or args.config_file_name is None or args.config_password is None:
+        print("A strategy, a config file name and a password (or password file) are required to run headless.")
+        return
+
+    asyncio.get_event_loop().run_until_complete(headless_start(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,7 @@ from bin.hummingbot import (
 )
 from hummingbot.client.settings import CONF_FILE_PATH
 from hummingbot.client.config.security import Security
+from hummingbot.client.errors import MissingMasterKeyError
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -78,8 +79,12 @@ async def quick_start(args):
     if args.auto_set_permissions is not None:
         autofix_permissions(args.auto_set_permissions)
 
-    if password is not None and not Security.login(password):
-        logging.getLogger().error("Invalid password.")
+    try:
+        if password is not None and not Security.login(password):
+            logging.getLogger().error("Invalid password.")
+            return
+    except MissingMasterKeyError as e:
+        logging.getLogger().error(str(e))
         return
 
     await Security.wait_til_decryption_done()
@@ -121,6 +126,10 @@ async def quick_start(args):
             hb.start(log_level)
 
         tasks: List[Coroutine] = [hb.run()]
+        if global_config_map.get("metrics_port").value is not None:
+            from hummingbot.core.metrics import MetricsServer
+            metrics_server = MetricsServer(global_config_map.get("metrics_port").value)
+            tasks.append(metrics_server.start())
         if global_config_map.get("debug_console").value:
             management_port: int = detect_available_port(8211)
             tasks.append(start_management_console(locals(), host="localhost", port=management_port))
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from typing import (
+    Dict,
     List,
     Optional
 )
@@ -27,6 +28,7 @@ logging.setLoggerClass(StructLogger)
 
 _shared_executor = None
 _data_path = None
+_headless = False
 
 
 def root_path() -> str:
@@ -77,6 +79,15 @@ def set_data_path(path: str):
     _data_path = path
 
 
+def is_headless() -> bool:
+    return _headless
+
+
+def set_headless(headless: bool):
+    global _headless
+    _headless = headless
+
+
 _independent_package: Optional[bool] = None
 
 
@@ -139,7 +150,6 @@ def init_logging(conf_filename: str,
     import logging.config
     from os.path import join
     import pandas as pd
-    from typing import Dict
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
@@ -170,12 +180,34 @@ def init_logging(conf_filename: str,
                 if global_config_map["logger_override_whitelist"].value and \
                         logger in global_config_map["logger_override_whitelist"].value:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        if _headless:
+            remove_cli_log_handlers(config_dict)
         logging.config.dictConfig(config_dict)
         # add remote logging to logger if in dev mode
         if dev_mode:
             add_remote_logger_handler(config_dict.get("loggers", []))
 
 
+def remove_cli_log_handlers(config_dict: Dict):
+    """
+    Drops the handlers printing to the CLI log pane from a logging config, so that running headless only logs to the
+    files and remote sinks.
+    """
+    from hummingbot.logger.cli_handler import CLIHandler
+    cli_handler_class: str = f"{CLIHandler.__module__}.{CLIHandler.__name__}"
+    handlers: Dict = config_dict.get("handlers", {})
+    cli_handler_names: List[str] = [name for name, handler in handlers.items()
+                                    if handler.get("class") == cli_handler_class]
+    for name in cli_handler_names:
+        del handlers[name]
+    logger_configs: List[Dict] = list(config_dict.get("loggers", {}).values())
+    if "root" in config_dict:
+        logger_configs.append(config_dict["root"])
+    for logger_config in logger_configs:
+        if "handlers" in logger_config:
+            logger_config["handlers"] = [name for name in logger_config["handlers"] if name not in cli_handler_names]
+
+
 def get_strategy_list() -> List[str]:
     """
     Search `hummingbot.strategy` folder for all available strategies
@@ -15,6 +15,7 @@ from .export_command import ExportCommand
 from .silly_commands import SillyCommands
 from .order_book_command import OrderBookCommand
 from .ticker_command import TickerCommand
+from .profile_command import ProfileCommand
 
 
 __all__ = [
@@ -34,5 +35,6 @@ __all__ = [
     ExportCommand,
     SillyCommands,
     OrderBookCommand,
-    TickerCommand
+    TickerCommand,
+    ProfileCommand
 ]
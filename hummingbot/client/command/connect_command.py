@@ -189,4 +189,7 @@ class ConnectCommand:
         if err_msg is not None:
             return err_msg
         err_msg = CeloCLI.unlock_account(celo_address, celo_password)
+        if err_msg is None:
+            # Falls back on celocli if the node can't be reached over JSON-RPC.
+            CeloCLI.connect_rpc()
         return err_msg
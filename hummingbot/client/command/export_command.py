@@ -7,6 +7,7 @@ from sqlalchemy.orm import (
     Query
 )
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_archive import TradeArchive
 from hummingbot.client.config.security import Security
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
@@ -67,7 +68,7 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
-        trades: List[TradeFill] = self._get_trades_from_session(self.init_time)
+        trades: pd.DataFrame = self._get_trades_from_archive(self.init_time)
         if len(trades) == 0:
             self._notify("No past trades to export.")
             return
@@ -79,8 +80,7 @@ class ExportCommand:
         file_name = await self.prompt_new_export_file_name(path)
         file_path = os.path.join(path, file_name)
         try:
-            df: pd.DataFrame = TradeFill.to_pandas(trades)
-            df.to_csv(file_path, header=True)
+            self.trade_archive.export_csv(file_path, self.init_time)
             self._notify(f"Successfully exported trades to {file_path}")
         except Exception as e:
             self._notify(f"Error exporting trades to {path}: {e}")
@@ -108,3 +108,13 @@ class ExportCommand:
         # Get the latest 100 trades in ascending timestamp order
         result.reverse()
         return result
+
+    def _get_trades_from_archive(self,  # type: HummingbotApplication
+                                 start_timestamp: int,
+                                 number_of_rows: Optional[int] = None,
+                                 config_file_path: str = None) -> pd.DataFrame:
+        trade_archive: TradeArchive = self.trade_archive
+        # Get the latest trades in ascending timestamp order
+        return trade_archive.trades(start_timestamp,
+                                    config_file_path=config_file_path,
+                                    number_of_rows=number_of_rows)
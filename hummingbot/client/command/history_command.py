@@ -19,6 +19,10 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from datetime import datetime
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT
+from hummingbot.model.trade_archive import (
+    trade_fills_data_frame,
+    trades_display_data_frame,
+)
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.client.config.config_helpers import secondary_market_conversion_rate
 
@@ -87,7 +91,7 @@ class HistoryCommand:
 
     def _calculate_trade_performance(self,  # type: HummingbotApplication
                                      ) -> Tuple[Dict, Dict]:
-        raw_queried_trades = self._get_trades_from_session(self.init_time, config_file_path=self.strategy_file_name)
+        raw_queried_trades = self._get_trades_from_archive(self.init_time, config_file_path=self.strategy_file_name)
         current_strategy_name: str = self.markets_recorder.strategy_name
         conversion_rate = secondary_market_conversion_rate(current_strategy_name)
         trade_performance_stats, market_trading_pair_stats = calculate_trade_performance(
@@ -171,13 +175,13 @@ class HistoryCommand:
             self._notify("Bot not started. No past trades.")
         else:
             # Query for maximum number of trades to display + 1
-            queried_trades: List[TradeFill] = self._get_trades_from_session(self.init_time,
-                                                                            MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
-                                                                            self.strategy_file_name)
+            queried_trades: pd.DataFrame = self._get_trades_from_archive(self.init_time,
+                                                                         MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
+                                                                         self.strategy_file_name)
             if self.strategy_name == "celo_arb":
-                celo_trades = self.strategy.celo_orders_to_trade_fills()
-                queried_trades = queried_trades + celo_trades
-            df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
+                celo_trades: List[TradeFill] = self.strategy.celo_orders_to_trade_fills()
+                queried_trades = pd.concat([queried_trades, trade_fills_data_frame(celo_trades)], ignore_index=True)
+            df: pd.DataFrame = trades_display_data_frame(queried_trades)
 
             if len(df) > 0:
                 # Check if number of trades exceed maximum number of trades to display
@@ -0,0 +1,103 @@
+import os
+import pandas as pd
+import time
+from typing import (
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.connector.order_latency import (
+    order_latency_stats,
+    OrderLatencyStats,
+)
+from hummingbot.core.profiling import (
+    disable_profiling,
+    enable_profiling,
+    HotPathProfiler,
+    profiler,
+)
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+PROFILE_OPTIONS = ("start", "stop", "show", "reset", "orders", "export")
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                option: str = None):
+        if option is None:
+            option = "show"
+        if option not in PROFILE_OPTIONS:
+            self._notify("Invalid profile option.")
+            return
+        active_profiler: HotPathProfiler = profiler()
+        if option == "start":
+            enable_profiling()
+            self._notify("Profiling clock ticks and event dispatch.")
+        elif option == "orders":
+            self._notify(self.order_latency_report(order_latency_stats()))
+        elif option == "export":
+            self.export_profile(active_profiler, order_latency_stats())
+        elif active_profiler is None:
+            self._notify("Profiling is not running. Use `profile start` to start it.")
+        elif option == "stop":
+            disable_profiling()
+            self._notify("Profiling stopped.")
+        elif option == "reset":
+            active_profiler.reset()
+            self._notify("Profiling statistics cleared.")
+        elif option == "show":
+            self._notify(self.profile_report(active_profiler))
+
+    def profile_report(self,  # type: HummingbotApplication
+                       active_profiler: HotPathProfiler) -> str:
+        lines: List[str] = []
+        for title, df in (("Clock ticks", active_profiler.tick_data_frame()),
+                          ("Event dispatch", active_profiler.event_data_frame())):
+            lines.append(f"\n  {title}:")
+            if len(df) == 0:
+                lines.append("    No samples yet.")
+            else:
+                df = df.sort_values("count", ascending=False)
+                lines.extend(["    " + line for line in df.to_string(index=False, float_format="%.1f").split("\n")])
+        return "\n".join(lines)
+
+    def order_latency_report(self,  # type: HummingbotApplication
+                             latency_stats: OrderLatencyStats) -> str:
+        df: pd.DataFrame = latency_stats.summary_data_frame()
+        if len(df) == 0:
+            return "\n  No order latency samples yet."
+        lines: List[str] = ["\n  Order latencies:"]
+        lines.extend(["    " + line for line in df.to_string(index=False, float_format="%.1f").split("\n")])
+        return "\n".join(lines)
+
+    def export_profile(self,  # type: HummingbotApplication
+                       active_profiler: Optional[HotPathProfiler],
+                       latency_stats: OrderLatencyStats):
+        path = global_config_map["log_file_path"].value
+        if path is None:
+            path = DEFAULT_LOG_FILE_PATH
+        timestamp: int = int(time.time())
+        latency_df: pd.DataFrame = latency_stats.samples_data_frame()
+        if active_profiler is None and len(latency_df) == 0:
+            self._notify("There are no profiling statistics or order latencies to export.")
+            return
+        try:
+            if active_profiler is not None:
+                file_path = os.path.join(path, f"profile_{timestamp}.csv")
+                tick_df: pd.DataFrame = active_profiler.tick_data_frame()
+                tick_df.insert(0, "type", "tick")
+                event_df: pd.DataFrame = active_profiler.event_data_frame()
+                event_df.insert(0, "type", "event")
+                pd.concat([tick_df, event_df], sort=False).to_csv(file_path, index=False)
+                self._notify(f"Successfully exported profiling statistics to {file_path}")
+            if len(latency_df) > 0:
+                file_path = os.path.join(path, f"order_latency_{timestamp}.csv")
+                latency_df.to_csv(file_path, index=False)
+                self._notify(f"Successfully exported order latencies to {file_path}")
+        except Exception as e:
+            self._notify(f"Error exporting profiling statistics to {path}: {e}")
@@ -1,7 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor
 from eth_account import Account
 from hummingbot.core.utils.wallet_setup import get_key_file_path
+from itertools import repeat
 import json
 import os
+from typing import (
+    Any,
+    Dict,
+    List,
+)
 from eth_keyfile.keyfile import (
     Random,
     get_default_work_factor_for_kdf,
@@ -12,11 +19,16 @@ from eth_keyfile.keyfile import (
     SCRYPT_R,
     SCRYPT_P,
     big_endian_to_int,
+    decrypt_aes_ctr,
     encrypt_aes_ctr,
     keccak,
     int_to_big_endian
 )
-from hummingbot.client.settings import ENCYPTED_CONF_PREFIX, ENCYPTED_CONF_POSTFIX
+from hummingbot.client.settings import ENCYPTED_CONF_PREFIX, ENCYPTED_CONF_POSTFIX, MASTER_KEY_FILE_NAME
+
+# Config values encrypted with the master key name it as their key derivation function.
+MASTER_KEY_KDF = "master_key"
+MASTER_KEY_CHECK = b"hummingbot"
 
 
 def list_encrypted_file_paths():
@@ -61,13 +73,132 @@ def decrypt_config_value(config_key, password):
     return decrypt_file(file_path, password)
 
 
-def decrypt_file(file_path, password):
-    with open(file_path, 'r') as f:
-        encrypted = f.read()
+def decrypt_file(file_path, password, master_key: bytes = None):
+    """
+    :param master_key: the master key derived from the password, it's derived again if not given
+    """
+    encrypted = read_encrypted_file(file_path)
+    if is_master_key_encrypted(encrypted):
+        return decrypt_config_json(encrypted, master_key if master_key is not None else derive_master_key(password))
     secured_value = Account.decrypt(encrypted, password)
     return secured_value.decode()
 
 
+def read_encrypted_file(file_path: str) -> Dict[str, Any]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+def decrypt_keyfiles(file_paths: List[str], password: str) -> List[bytes]:
+    """
+    Decrypts v3 key files, i.e. wallets and config values saved before the master key, in a process pool. Each of
+    them runs its own key derivation, which is deliberately slow.
+    """
+    if len(file_paths) <= 1:
+        return [_decrypt_keyfile(file_path, password) for file_path in file_paths]
+    with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(_decrypt_keyfile, file_paths, repeat(password)))
+
+
+def _decrypt_keyfile(file_path: str, password: str) -> bytes:
+    with open(file_path, 'r') as f:
+        encrypted = f.read()
+    return Account.decrypt(encrypted, password)
+
+
+def master_key_file_path() -> str:
+    return "%s%s" % (get_key_file_path(), MASTER_KEY_FILE_NAME)
+
+
+def master_key_exists() -> bool:
+    return os.path.exists(master_key_file_path())
+
+
+def create_master_key(password: str, work_factor: int = None) -> bytes:
+    """
+    Derives a new master key from the password and saves its salt, along with a value to check the password against,
+    to the master key file. Config values are then encrypted with the master key, so logging in runs the slow key
+    derivation once, rather than once per config value.
+    """
+    salt = Random.get_random_bytes(16)
+    if work_factor is None:
+        work_factor = get_default_work_factor_for_kdf("pbkdf2")
+    master_key = _pbkdf2_hash(password.encode(), hash_name='sha256', salt=salt, iterations=work_factor, dklen=DKLEN)
+    key_json = {
+        'kdf': 'pbkdf2',
+        'kdfparams': {
+            'c': work_factor,
+            'dklen': DKLEN,
+            'prf': 'hmac-sha256',
+            'salt': encode_hex_no_prefix(salt),
+        },
+        'mac': encode_hex_no_prefix(_master_key_mac(master_key, MASTER_KEY_CHECK)),
+    }
+    with open(master_key_file_path(), 'w+') as f:
+        f.write(json.dumps(key_json))
+    return master_key
+
+
+def derive_master_key(password: str) -> bytes:
+    """
+    Derives the master key from the password, raises ValueError("MAC mismatch") if the password is incorrect.
+    """
+    with open(master_key_file_path(), 'r') as f:
+        key_json = json.load(f)
+    kdfparams = key_json['kdfparams']
+    master_key = _pbkdf2_hash(
+        password.encode(),
+        hash_name='sha256',
+        salt=bytes.fromhex(kdfparams['salt']),
+        iterations=kdfparams['c'],
+        dklen=kdfparams['dklen'],
+    )
+    if _master_key_mac(master_key, MASTER_KEY_CHECK) != bytes.fromhex(key_json['mac']):
+        raise ValueError("MAC mismatch")
+    return master_key
+
+
+def is_master_key_encrypted(encrypted: Dict[str, Any]) -> bool:
+    return encrypted.get('crypto', {}).get('kdf') == MASTER_KEY_KDF
+
+
+def encrypt_config_json(config_value: str, master_key: bytes) -> Dict[str, Any]:
+    iv = Random.get_random_bytes(16)
+    ciphertext = encrypt_aes_ctr(config_value.encode(), master_key[:16], big_endian_to_int(iv))
+    return {
+        'crypto': {
+            'cipher': 'aes-128-ctr',
+            'cipherparams': {
+                'iv': encode_hex_no_prefix(iv),
+            },
+            'ciphertext': encode_hex_no_prefix(ciphertext),
+            'kdf': MASTER_KEY_KDF,
+            'mac': encode_hex_no_prefix(_master_key_mac(master_key, iv + ciphertext)),
+        },
+    }
+
+
+def decrypt_config_json(encrypted: Dict[str, Any], master_key: bytes) -> str:
+    crypto = encrypted['crypto']
+    iv = bytes.fromhex(crypto['cipherparams']['iv'])
+    ciphertext = bytes.fromhex(crypto['ciphertext'])
+    if _master_key_mac(master_key, iv + ciphertext) != bytes.fromhex(crypto['mac']):
+        raise ValueError("MAC mismatch")
+    return decrypt_aes_ctr(ciphertext, master_key[:16], big_endian_to_int(iv)).decode()
+
+
+def save_config_value(config_key: str, config_value: str, master_key: bytes):
+    """
+    encrypt configuration value with the master key and store in a file, like encrypt_n_save_config_value
+    """
+    with open(encrypted_file_path(config_key), 'w+') as f:
+        f.write(json.dumps(encrypt_config_json(config_value, master_key)))
+
+
+def _master_key_mac(master_key: bytes, data: bytes) -> bytes:
+    return keccak(master_key[16:32] + data)
+
+
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
     """
     Encrypt message by a given password.
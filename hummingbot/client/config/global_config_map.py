@@ -78,6 +78,20 @@ main_config_map = {
                   type_str="bool",
                   required_if=lambda: False,
                   default=False),
+    # Port of the local HTTP endpoint serving the metrics in the Prometheus text format, disabled when null.
+    "metrics_port":
+        ConfigVar(key="metrics_port",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=None),
+    # Tracks the order books of each exchange in its own worker process, keeping the market data off the main loop.
+    "order_book_worker_processes":
+        ConfigVar(key="order_book_worker_processes",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
     "strategy_report_interval":
         ConfigVar(key="strategy_report_interval",
                   prompt=None,
@@ -244,6 +258,13 @@ main_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    # Inserts the order statuses and trade fills of the events recorded within a second together.
+    "db_bulk_insert":
+        ConfigVar(key="db_bulk_insert",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
     "0x_active_cancels":
         ConfigVar(key="0x_active_cancels",
                   prompt="Enable active order cancellations for 0x exchanges (warning: this costs gas)?  >>> ",
@@ -3,15 +3,25 @@ from hummingbot.client.config.config_crypt import (
     decrypt_file,
     secure_config_key,
     encrypted_file_exists,
-    encrypt_n_save_config_value,
-    encrypted_file_path
+    encrypted_file_path,
+    master_key_exists,
+    master_key_file_path,
+    create_master_key,
+    derive_master_key,
+    read_encrypted_file,
+    is_master_key_encrypted,
+    decrypt_config_json,
+    decrypt_keyfiles,
+    save_config_value
 )
 from hummingbot.core.utils.wallet_setup import (
     list_wallets,
     unlock_wallet,
-    import_and_save_wallet
+    import_and_save_wallet,
+    wallet_file_path
 )
 from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.errors import MissingMasterKeyError
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 import asyncio
@@ -21,6 +31,7 @@ from os import unlink
 class Security:
     __instance = None
     password = None
+    _master_key = None
     _secure_configs = {}
     _private_keys = {}
     _decryption_done = asyncio.Event()
@@ -29,7 +40,7 @@ class Security:
     def new_password_required():
         encrypted_files = list_encrypted_file_paths()
         wallets = list_wallets()
-        return len(encrypted_files) == 0 and len(wallets) == 0
+        return len(encrypted_files) == 0 and len(wallets) == 0 and not master_key_exists()
 
     @staticmethod
     def any_encryped_files():
@@ -48,21 +59,34 @@ class Security:
     def login(cls, password):
         encrypted_files = list_encrypted_file_paths()
         wallets = list_wallets()
-        if encrypted_files:
-            try:
-                decrypt_file(encrypted_files[0], password)
-            except ValueError as err:
-                if str(err) == "MAC mismatch":
-                    return False
-                raise err
-        elif wallets:
-            try:
-                unlock_wallet(wallets[0], password)
-            except ValueError as err:
-                if str(err) == "MAC mismatch":
-                    return False
-                raise err
+        try:
+            if master_key_exists():
+                master_key = derive_master_key(password)
+            else:
+                # Checks the password against a file saved before the master key, then creates the master key,
+                # decrypt_all migrates the config values to it.
+                legacy_files = [file_path for file_path in encrypted_files
+                                if not is_master_key_encrypted(read_encrypted_file(file_path))]
+                if len(legacy_files) < len(encrypted_files):
+                    # The key of the values saved with the master key can't be derived without its salt.
+                    raise MissingMasterKeyError(
+                        f"The master key file {master_key_file_path()} is missing, the encrypted config values "
+                        f"saved with it can't be decrypted. Restore the file, or delete the encrypted_*.json files "
+                        f"in {global_config_map['key_file_path'].value} and enter their values again."
+                    )
+                if legacy_files:
+                    decrypt_file(legacy_files[0], password)
+                elif wallets:
+                    unlock_wallet(wallets[0], password)
+                master_key = create_master_key(password)
+        except ValueError as err:
+            if str(err) == "MAC mismatch":
+                return False
+            raise err
         Security.password = password
+        Security._master_key = master_key
+        # The values decrypted on a previous login are not done until decrypt_all runs again.
+        cls._decryption_done.clear()
         coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
         safe_ensure_future(coro)
         return True
@@ -70,7 +94,7 @@ class Security:
     @classmethod
     def decrypt_file(cls, file_path):
         key_name = secure_config_key(file_path)
-        cls._secure_configs[key_name] = decrypt_file(file_path, Security.password)
+        cls._secure_configs[key_name] = decrypt_file(file_path, Security.password, cls._master_key)
 
     @classmethod
     def unlock_wallet(cls, public_key):
@@ -83,12 +107,23 @@ class Security:
         cls._secure_configs.clear()
         cls._private_keys.clear()
         cls._decryption_done.clear()
-        encrypted_files = list_encrypted_file_paths()
-        for file in encrypted_files:
-            cls.decrypt_file(file)
+        legacy_files = []
+        for file_path in list_encrypted_file_paths():
+            encrypted = read_encrypted_file(file_path)
+            if is_master_key_encrypted(encrypted):
+                cls._secure_configs[secure_config_key(file_path)] = decrypt_config_json(encrypted, cls._master_key)
+            else:
+                legacy_files.append(file_path)
         wallets = list_wallets()
-        for wallet in wallets:
-            cls.unlock_wallet(wallet)
+        # Files with their own key derivation are decrypted in parallel.
+        values = decrypt_keyfiles(legacy_files + [wallet_file_path(wallet) for wallet in wallets], Security.password)
+        for file_path, value in zip(legacy_files, values):
+            key_name = secure_config_key(file_path)
+            cls._secure_configs[key_name] = value.decode()
+            # Saves the value again with the master key, so the next logins don't need its key derivation.
+            save_config_value(key_name, cls._secure_configs[key_name], cls._master_key)
+        for wallet, private_key in zip(wallets, values[len(legacy_files):]):
+            cls._private_keys[wallet] = private_key
         cls._decryption_done.set()
 
     @classmethod
@@ -97,7 +132,7 @@ class Security:
             return
         if encrypted_file_exists(key):
             unlink(encrypted_file_path(key))
-        encrypt_n_save_config_value(key, new_value, cls.password)
+        save_config_value(key, new_value, cls._master_key)
         cls._secure_configs[key] = new_value
 
     @classmethod
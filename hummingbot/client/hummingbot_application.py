@@ -7,11 +7,13 @@ import time
 from typing import List, Dict, Optional, Tuple, Set, Deque
 
 from hummingbot.client.command import __all__ as commands
+from hummingbot import is_headless
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_archive import TradeArchive
 
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 
@@ -20,6 +22,7 @@ from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
+from hummingbot.client.ui.headless_cli import HeadlessCLI
 from hummingbot.client.ui.completer import load_completer
 from hummingbot.client.errors import InvalidCommandError, ArgumentParserError
 from hummingbot.client.config.global_config_map import global_config_map, using_wallet
@@ -66,9 +69,12 @@ class HummingbotApplication(*commands):
     def __init__(self):
         self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self.parser: ThrowingArgumentParser = load_parser(self)
-        self.app = HummingbotCLI(
-            input_handler=self._handle_command, bindings=load_key_bindings(self), completer=load_completer(self)
-        )
+        if is_headless():
+            self.app = HeadlessCLI(input_handler=self._handle_command)
+        else:
+            self.app = HummingbotCLI(
+                input_handler=self._handle_command, bindings=load_key_bindings(self), completer=load_completer(self)
+            )
 
         self.markets: Dict[str, ExchangeBase] = {}
         self.wallet: Optional[Web3Wallet] = None
@@ -94,6 +100,7 @@ class HummingbotApplication(*commands):
         self._trading_required: bool = True
 
         self.trade_fill_db: SQLConnectionManager = SQLConnectionManager.get_trade_fills_instance()
+        self.trade_archive: TradeArchive = TradeArchive.get_instance()
         self.markets_recorder: Optional[MarketsRecorder] = None
         self._script_iterator = None
         # This is to start fetching trading pairs for auto-complete
@@ -224,6 +231,12 @@ class HummingbotApplication(*commands):
                 keys = dict((key, value.value) for key, value in dict(filter(lambda item: connector_name in item[0], global_config_map.items())).items())
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**keys, trading_pairs=trading_pairs, trading_required=self._trading_required)
+                if global_config_map.get("order_book_worker_processes").value:
+                    if not connector.run_order_book_tracker_in_worker():
+                        self.logger().warning(f"The {connector_name} order books can't be tracked in a worker "
+                                              f"process, tracking them in the main process.")
+                else:
+                    connector.share_order_book_tracker()
 
             elif connector_name in DEXES:
                 assert self.wallet is not None
@@ -242,6 +255,8 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            self.trade_archive,
+            bulk_insert=global_config_map.get("db_bulk_insert").value,
         )
         self.markets_recorder.start()
 
@@ -1,10 +1,14 @@
 from collections import defaultdict
 from decimal import Decimal
+import numpy as np
+import pandas as pd
 from typing import (
     Tuple,
     Dict,
-    List)
+    List,
+    Union)
 from hummingbot.core.event.events import TradeType
+from hummingbot.model.trade_archive import quote_flat_fees
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
@@ -15,20 +19,9 @@ s_decimal_0 = Decimal(0)
 
 def calculate_trade_asset_delta_with_fees(trade: TradeFill) -> Tuple[Decimal, Decimal]:
     trade_fee: Dict[str, any] = trade.trade_fee
-    total_flat_fees: Decimal = s_decimal_0
+    total_flat_fees: Decimal = quote_flat_fees(trade_fee, trade.quote_asset)
     amount: Decimal = Decimal(str(trade.amount))
     price: Decimal = Decimal(str(trade.price))
-    for flat_fee in trade_fee["flat_fees"]:
-        if isinstance(flat_fee, dict):
-            flat_fee_currency = flat_fee["asset"]
-            flat_fee_amount = flat_fee["amount"]
-        else:
-            flat_fee_currency, flat_fee_amount = flat_fee
-        # Flat fee is currently used only for DEX in ETH token amount, if there is a need for
-        # more interchangable kinda assets, we can handle this in a more proper way (e.g. using global config)
-        if flat_fee_currency == trade.quote_asset or \
-                (flat_fee_currency.upper() in ("ETH", "WETH") and trade.quote_asset.upper() in ("ETH", "WETH")):
-            total_flat_fees += Decimal(str(flat_fee_amount))
     if trade.trade_type == TradeType.SELL.name:
         net_base_delta: Decimal = amount
         net_quote_delta: Decimal = amount * price * (Decimal("1") - Decimal(str(trade_fee["percent"]))) - \
@@ -102,9 +95,82 @@ def calculate_asset_delta_from_trades(current_strategy_name: str,
     return market_trading_pair_stats
 
 
+def float_to_decimal(value: float) -> Decimal:
+    return Decimal(repr(float(value)))
+
+
+def calculate_asset_delta_from_trades_data_frame(current_strategy_name: str,
+                                                 market_trading_pair_tuples: List[MarketTradingPairTuple],
+                                                 trades: pd.DataFrame,
+                                                 ) -> Dict[MarketTradingPairTuple, Dict[str, Decimal]]:
+    """
+    Same as calculate_asset_delta_from_trades, for the trades of the trade archive. The spent and acquired amounts
+    are summed over float columns, and converted to Decimal afterwards.
+
+    :param current_strategy_name: Name of the currently configured strategy
+    :param market_trading_pair_tuples: Current MarketTradingPairTuple
+    :param trades: Trades in the columns of the trade archive, in ascending timestamp order
+    :return: Dictionary consisting of spent and acquired amount for each assets
+    """
+    trades = trades[trades["strategy"] == current_strategy_name]
+    amount: np.ndarray = trades["amount"].to_numpy()
+    quote_amount: np.ndarray = amount * trades["price"].to_numpy()
+    fee_factor: np.ndarray = 1 - trades["fee_percent"].to_numpy()
+    flat_fees: np.ndarray = trades["quote_flat_fees"].to_numpy()
+    is_sell: np.ndarray = (trades["trade_type"] == TradeType.SELL.name).to_numpy()
+    is_buy: np.ndarray = (trades["trade_type"] == TradeType.BUY.name).to_numpy()
+    if not np.all(is_sell | is_buy):
+        raise Exception(f"Unsupported trade type {trades['trade_type'][~(is_sell | is_buy)].iloc[0]}")
+    deltas: pd.DataFrame = pd.DataFrame({
+        "market": trades["market"].to_numpy(),
+        "symbol": trades["symbol"].to_numpy(),
+        "base_spent": np.where(is_sell, amount, 0.0),
+        "base_acquired": np.where(is_buy, amount * fee_factor - flat_fees, 0.0),
+        "quote_spent": np.where(is_buy, quote_amount, 0.0),
+        "quote_acquired": np.where(is_sell, quote_amount * fee_factor - flat_fees, 0.0),
+        "first_price": trades["price"].to_numpy(),
+        "trade_count": 1,
+    })
+    totals: pd.DataFrame = deltas.groupby(["market", "symbol"], sort=False).agg({
+        "base_spent": "sum", "base_acquired": "sum", "quote_spent": "sum", "quote_acquired": "sum",
+        "first_price": "first", "trade_count": "sum"
+    })
+
+    market_trading_pair_stats: Dict[MarketTradingPairTuple, Dict[str, Decimal]] = {}
+    for market_trading_pair_tuple in market_trading_pair_tuples:
+        asset_stats: Dict[str, Dict[str, Decimal]] = defaultdict(
+            lambda: {"spent": s_decimal_0, "acquired": s_decimal_0}
+        )
+        base_asset: str = market_trading_pair_tuple.base_asset.upper()
+        quote_asset: str = market_trading_pair_tuple.quote_asset.upper()
+        key: Tuple[str, str] = (market_trading_pair_tuple.market.display_name, market_trading_pair_tuple.trading_pair)
+        if key not in totals.index:
+            asset_stats[base_asset] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+            asset_stats[quote_asset] = {"spent": s_decimal_0, "acquired": s_decimal_0}
+            market_trading_pair_stats[market_trading_pair_tuple] = {
+                "starting_quote_rate": market_trading_pair_tuple.get_mid_price(),
+                "asset": asset_stats,
+                "trade_count": 0
+            }
+            continue
+
+        row = totals.loc[key]
+        asset_stats[base_asset] = {"spent": float_to_decimal(row["base_spent"]),
+                                   "acquired": float_to_decimal(row["base_acquired"])}
+        asset_stats[quote_asset] = {"spent": float_to_decimal(row["quote_spent"]),
+                                    "acquired": float_to_decimal(row["quote_acquired"])}
+        market_trading_pair_stats[market_trading_pair_tuple] = {
+            "starting_quote_rate": float_to_decimal(row["first_price"]),
+            "asset": asset_stats,
+            "trade_count": int(row["trade_count"])
+        }
+
+    return market_trading_pair_stats
+
+
 def calculate_trade_performance(current_strategy_name: str,
                                 market_trading_pair_tuples: List[MarketTradingPairTuple],
-                                raw_queried_trades: List[TradeFill],
+                                raw_queried_trades: Union[List[TradeFill], pd.DataFrame],
                                 starting_balances: Dict[str, Dict[str, Decimal]],
                                 secondary_market_conversion_rate: Decimal = Decimal("1")) \
         -> Tuple[Dict, Dict]:
@@ -113,7 +179,7 @@ def calculate_trade_performance(current_strategy_name: str,
 
     :param current_strategy_name: Name of the currently configured strategy
     :param market_trading_pair_tuples: Current MarketTradingPairTuple
-    :param raw_queried_trades: List of queried trades
+    :param raw_queried_trades: List of queried trades, or the trades of the trade archive
     :param starting_balances: Dictionary of starting asset balance for each market, as balance_snapshot on
     history command.
     :param secondary_market_conversion_rate: A conversion rate for a secondary market if it differs from the primary.
@@ -123,10 +189,16 @@ def calculate_trade_performance(current_strategy_name: str,
     trade_performance_stats: Dict[str, Decimal] = {}
     # The final stats will be in primary quote unit for arbitrage and maker quote unit for xemm
     primary_trading_pair: str = market_trading_pair_tuples[0].trading_pair
-    market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = calculate_asset_delta_from_trades(
-        current_strategy_name,
-        market_trading_pair_tuples,
-        raw_queried_trades)
+    if isinstance(raw_queried_trades, pd.DataFrame):
+        market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = calculate_asset_delta_from_trades_data_frame(
+            current_strategy_name,
+            market_trading_pair_tuples,
+            raw_queried_trades)
+    else:
+        market_trading_pair_stats: Dict[str, Dict[str, Decimal]] = calculate_asset_delta_from_trades(
+            current_strategy_name,
+            market_trading_pair_tuples,
+            raw_queried_trades)
 
     # Calculate total spent and acquired amount for each trading pair in primary quote value
     for market_trading_pair_tuple, trading_pair_stats in market_trading_pair_stats.items():
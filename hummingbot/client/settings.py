@@ -16,6 +16,7 @@ KEYFILE_PREFIX = "key_file_"
 KEYFILE_POSTFIX = ".json"
 ENCYPTED_CONF_PREFIX = "encrypted_"
 ENCYPTED_CONF_POSTFIX = ".json"
+MASTER_KEY_FILE_NAME = "secrets_master_key.json"
 GLOBAL_CONFIG_PATH = "conf/conf_global.yml"
 TRADE_FEES_CONFIG_PATH = "conf/conf_fee_overrides.yml"
 TOKEN_ADDRESSES_FILE_PATH = realpath(join(__file__, "../../wallet/ethereum/erc20_tokens.json"))
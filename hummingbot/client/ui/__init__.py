@@ -79,6 +79,7 @@ def show_welcome():
 
 def login_prompt():
     from hummingbot.client.config.security import Security
+    from hummingbot.client.errors import MissingMasterKeyError
     import time
 
     err_msg = None
@@ -115,8 +116,15 @@ def login_prompt():
             style=dialog_style).run()
         if password is None:
             return False
-        if not Security.login(password):
-            err_msg = "Invalid password - please try again."
+        try:
+            if not Security.login(password):
+                err_msg = "Invalid password - please try again."
+        except MissingMasterKeyError as e:
+            message_dialog(
+                title='Error',
+                text=str(e),
+                style=dialog_style).run()
+            return False
     if err_msg is not None:
         message_dialog(
             title='Error',
@@ -18,6 +18,7 @@ from hummingbot.client.ui.parser import ThrowingArgumentParser
 from hummingbot.core.utils.wallet_setup import list_wallets
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_EXCHANGES
+from hummingbot.client.command.profile_command import PROFILE_OPTIONS
 
 
 def file_name_list(path, file_extension):
@@ -33,6 +34,7 @@ class HummingbotCompleter(Completer):
         self._exchange_completer = WordCompleter(EXCHANGES, ignore_case=True)
         self._connect_exchange_completer = WordCompleter(CONNECT_EXCHANGES, ignore_case=True)
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
+        self._profile_completer = WordCompleter(list(PROFILE_OPTIONS), ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._strategy_completer = WordCompleter(STRATEGIES, ignore_case=True)
         self._py_file_completer = WordCompleter(file_name_list(SCRIPTS_PATH, "py"))
@@ -105,6 +107,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return "export" in text_before_cursor
 
+    def _complete_profile_options(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def _complete_balance_options(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("balance ")
@@ -160,6 +166,10 @@ class HummingbotCompleter(Completer):
             for c in self._connect_exchange_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_profile_options(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_export_options(document):
             for c in self._export_completer.get_completions(document, complete_event):
                 yield c
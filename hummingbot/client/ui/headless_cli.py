@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+import os
+from typing import (
+    Callable,
+    Optional,
+    Set,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class HeadlessCLI:
+    """
+    Drop-in replacement of HummingbotCLI for running without a terminal. Nothing is rendered: the command outputs go
+    to the log files, and to the clients connected to the optional local control socket.
+
+    Every line received on the control socket is handled as if it was typed in the CLI, e.g. `status` or `history`,
+    and also answers any pending prompt.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 input_handler: Callable,
+                 control_socket_path: Optional[str] = None):
+        self.input_handler = input_handler
+        self.control_socket_path: Optional[str] = control_socket_path
+        # add self.to_stop_config to know if cancel is triggered
+        self.to_stop_config: bool = False
+
+        # settings
+        self.prompt_text = ">>> "
+        self.pending_input = None
+        self.input_event = None
+        self.hide_input = False
+
+        self._exit_event: asyncio.Event = asyncio.Event()
+        self._control_server: Optional[asyncio.AbstractServer] = None
+        self._control_writers: Set[asyncio.StreamWriter] = set()
+
+    async def run(self):
+        if self.control_socket_path is not None:
+            if os.path.exists(self.control_socket_path):
+                os.unlink(self.control_socket_path)
+            self._control_server = await asyncio.start_unix_server(self._handle_control_client,
+                                                                   path=self.control_socket_path)
+            self.logger().info(f"Listening for commands on {self.control_socket_path}.")
+        try:
+            await self._exit_event.wait()
+        finally:
+            if self._control_server is not None:
+                self._control_server.close()
+                await self._control_server.wait_closed()
+                self._control_server = None
+                if os.path.exists(self.control_socket_path):
+                    os.unlink(self.control_socket_path)
+            for writer in self._control_writers:
+                writer.close()
+            self._control_writers.clear()
+
+    async def _handle_control_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._control_writers.add(writer)
+        try:
+            while not reader.at_eof():
+                line: bytes = await reader.readline()
+                if len(line) == 0:
+                    break
+                self.accept(line.decode("utf8"))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        except Exception:
+            self.logger().error("Unexpected error reading from the control socket.", exc_info=True)
+        finally:
+            self._control_writers.discard(writer)
+            writer.close()
+
+    def accept(self, text: str):
+        self.pending_input = text.strip()
+
+        if self.input_event:
+            self.input_event.set()
+            return
+
+        self.log(f"\n>>>  {self.pending_input}")
+        self.input_handler(self.pending_input)
+
+    def clear_input(self):
+        self.pending_input = None
+
+    def log(self, text: str):
+        self.logger().info(text)
+        if len(self._control_writers) > 0:
+            data: bytes = (str(text) + "\n").encode("utf8")
+            for writer in self._control_writers:
+                writer.write(data)
+
+    def change_prompt(self, prompt: str, is_password: bool = False):
+        self.prompt_text = prompt
+
+    async def prompt(self, prompt: str, is_password: bool = False) -> str:
+        self.change_prompt(prompt, is_password)
+        self.log(prompt)
+        self.input_event = asyncio.Event()
+        await self.input_event.wait()
+
+        temp = self.pending_input
+        self.clear_input()
+        self.input_event = None
+
+        if is_password:
+            masked_string = "*" * len(temp)
+            self.log(f"{prompt}{masked_string}")
+        else:
+            self.log(f"{prompt}{temp}")
+        return temp
+
+    def set_text(self, new_text: str):
+        pass
+
+    def toggle_hide_input(self):
+        self.hide_input = not self.hide_input
+
+    def exit(self):
+        self._exit_event.set()
@@ -4,6 +4,7 @@ from typing import (
 )
 from hummingbot.client.errors import ArgumentParserError
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.profile_command import PROFILE_OPTIONS
 
 
 class ThrowingArgumentParser(argparse.ArgumentParser):
@@ -103,4 +104,8 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    profile_parser = subparsers.add_parser("profile", help="Profile clock ticks, event dispatch and order placement latencies")
+    profile_parser.add_argument("option", nargs="?", choices=PROFILE_OPTIONS, default=None, help="Profiling option")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     return parser
@@ -1,3 +1,5 @@
+from libc.stdint cimport int64_t
+
 from hummingbot.core.event.event_reporter cimport EventReporter
 from hummingbot.core.event.event_logger cimport EventLogger
 from hummingbot.core.network_iterator cimport NetworkIterator
@@ -12,11 +14,23 @@ cdef class ConnectorBase(NetworkIterator):
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
+        dict _in_flight_order_locks
+        object _in_flight_order_locks_source
+        dict _in_flight_locked_balances
+        set _updated_in_flight_order_ids
+        dict _in_flight_snapshot_locked_balances
+        dict _in_flight_snapshot_locked_balances_source
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
     cdef c_stop_tracking_order(self, str order_id)
+    cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_did_change_in_flight_order(self, str order_id)
+    cdef c_update_in_flight_order_lock(self, object order_id, object in_flight_orders)
+    cdef dict c_in_flight_locked_balances(self)
+    cdef c_reset_in_flight_order_locks(self, object in_flight_orders)
+    cdef dict c_in_flight_snapshot_locked_balances(self)
     cdef object c_get_balance(self, str currency)
     cdef object c_get_available_balance(self, str currency)
     cdef object c_get_price(self, str trading_pair, bint is_buy)
@@ -1,7 +1,9 @@
 from decimal import Decimal
+import logging
 from typing import (
     Dict,
     List,
+    Optional,
     Tuple
 )
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -11,8 +13,13 @@ from hummingbot.core.event.events import (
     TradeType
 )
 from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.metrics import (
+    metrics_registry,
+    MetricsRegistry,
+)
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -54,6 +61,25 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
+        # Balances locked in in-flight orders, kept up to date as order events are triggered. Order id -> the locked
+        # (asset, amount) or None, built on first use.
+        self._in_flight_order_locks = None
+        self._in_flight_order_locks_source = None
+        self._in_flight_locked_balances = {}
+        self._updated_in_flight_order_ids = set()
+        self._in_flight_snapshot_locked_balances = {}
+        self._in_flight_snapshot_locked_balances_source = None
+        self._register_metrics()
+
+    def _register_metrics(self):
+        registry: MetricsRegistry = metrics_registry()
+        registry.gauge("hummingbot_connector_in_flight_orders", "Orders the connector is tracking.",
+                       ["connector"]).add_object_collector(
+            self, lambda connector: [((connector.name,), len(connector.in_flight_orders))])
+        registry.gauge("hummingbot_connector_network_status",
+                       "Network status of the connector: 0 stopped, 1 not connected, 2 connected.",
+                       ["connector"]).add_object_collector(
+            self, lambda connector: [((connector.name,), connector.network_status.value)])
 
     @property
     def real_time_balance_update(self) -> bool:
@@ -102,22 +128,120 @@ cdef class ConnectorBase(NetworkIterator):
         asset_balances = {}
         if in_flight_orders is None:
             return asset_balances
-        for order in [o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)]:
-            if order.trade_type is TradeType.BUY:
-                order_value = Decimal(order.amount * order.price)
-                outstanding_value = order_value - order.executed_amount_quote
-                if order.quote_asset not in asset_balances:
-                    asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= (Decimal(1) + fee)
-                asset_balances[order.quote_asset] += outstanding_value
-            else:
-                outstanding_value = order.amount - order.executed_amount_base
-                if order.base_asset not in asset_balances:
-                    asset_balances[order.base_asset] = s_decimal_0
-                asset_balances[order.base_asset] += outstanding_value
+        for order in in_flight_orders.values():
+            locked_balance = self.order_locked_balance(order)
+            if locked_balance is not None:
+                asset, amount = locked_balance
+                asset_balances[asset] = asset_balances.get(asset, s_decimal_0) + amount
         return asset_balances
 
+    def order_locked_balance(self, order: InFlightOrderBase) -> Optional[Tuple[str, Decimal]]:
+        """
+        Calculates the asset balance locked in an in-flight order including fee (estimated)
+        :return: the asset and its locked balance, or None if the order is no longer open
+        """
+        if order.is_done or order.is_failure or order.is_cancelled:
+            return None
+        if order.trade_type is TradeType.BUY:
+            order_value = Decimal(order.amount * order.price)
+            outstanding_value = order_value - order.executed_amount_quote
+            fee = self.estimate_fee_pct(True)
+            outstanding_value *= (Decimal(1) + fee)
+            return order.quote_asset, outstanding_value
+        return order.base_asset, order.amount - order.executed_amount_base
+
+    def in_flight_locked_balances(self) -> Dict[str, Decimal]:
+        """
+        Returns the same asset balances as in_flight_asset_balances(self.in_flight_orders), without going through
+        every order: the locked balance of an order is only calculated again when it starts or stops being tracked, or
+        when an event is triggered for it (created, filled, cancelled, completed or failed).
+
+        Orders added to or removed from an InFlightOrderStore are found through its change listener. Connectors
+        keeping their in-flight orders in another mapping call did_change_in_flight_order() when they do.
+        """
+        return dict(self.c_in_flight_locked_balances())
+
+    def did_change_in_flight_order(self, order_id: str):
+        self.c_did_change_in_flight_order(order_id)
+
+    cdef c_did_change_in_flight_order(self, str order_id):
+        """
+        Notes that the order started or stopped being tracked, its locked balance is calculated again on next use.
+        """
+        if self._in_flight_order_locks is not None:
+            self._updated_in_flight_order_ids.add(order_id)
+
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
+        cdef object order_id
+        if self._in_flight_order_locks is not None:
+            order_id = getattr(arg, "order_id", None)
+            if order_id is not None:
+                self._updated_in_flight_order_ids.add(order_id)
+        NetworkIterator.c_trigger_event(self, event_tag, arg)
+
+    cdef c_update_in_flight_order_lock(self, object order_id, object in_flight_orders):
+        cdef:
+            dict balances = self._in_flight_locked_balances
+            object previous_lock = self._in_flight_order_locks.pop(order_id, None)
+            object order = in_flight_orders.get(order_id)
+            object lock
+        if previous_lock is not None:
+            asset, amount = previous_lock
+            balance = balances[asset] - amount
+            if balance == s_decimal_0:
+                del balances[asset]
+            else:
+                balances[asset] = balance
+        if order is None:
+            return
+        lock = self.order_locked_balance(order)
+        self._in_flight_order_locks[order_id] = lock
+        if lock is not None:
+            asset, amount = lock
+            balances[asset] = balances.get(asset, s_decimal_0) + amount
+
+    cdef dict c_in_flight_locked_balances(self):
+        cdef:
+            object in_flight_orders = self.in_flight_orders
+            dict locks = self._in_flight_order_locks
+            object order_id
+        # Connectors merging their in-flight orders into a new dict on every call are calculated in full each time.
+        if locks is None or in_flight_orders is not self._in_flight_order_locks_source:
+            self.c_reset_in_flight_order_locks(in_flight_orders)
+        else:
+            for order_id in self._updated_in_flight_order_ids:
+                self.c_update_in_flight_order_lock(order_id, in_flight_orders)
+            self._updated_in_flight_order_ids.clear()
+        if self.logger().isEnabledFor(logging.DEBUG):
+            # Checks the incremental balances against a full calculation, e.g. orders tracked without notice.
+            expected = {asset: balance for asset, balance in self.in_flight_asset_balances(in_flight_orders).items()
+                        if balance != s_decimal_0}
+            actual = {asset: balance for asset, balance in self._in_flight_locked_balances.items()
+                      if balance != s_decimal_0}
+            if expected != actual:
+                self.logger().warning(f"In-flight locked balances {actual} don't match the in-flight orders "
+                                      f"{expected}, an order was updated or tracked without notice.")
+                self.c_reset_in_flight_order_locks(in_flight_orders)
+        return self._in_flight_locked_balances
+
+    cdef c_reset_in_flight_order_locks(self, object in_flight_orders):
+        cdef object order_id
+        self._in_flight_order_locks = {}
+        self._in_flight_order_locks_source = in_flight_orders
+        self._in_flight_locked_balances = {}
+        self._updated_in_flight_order_ids.clear()
+        if isinstance(in_flight_orders, InFlightOrderStore):
+            in_flight_orders.change_listener = self.did_change_in_flight_order
+        for order_id in in_flight_orders:
+            self.c_update_in_flight_order_lock(order_id, in_flight_orders)
+
+    cdef dict c_in_flight_snapshot_locked_balances(self):
+        # Snapshots are replaced rather than updated, their balances are calculated once.
+        if self._in_flight_snapshot_locked_balances_source is not self._in_flight_orders_snapshot:
+            self._in_flight_snapshot_locked_balances = self.in_flight_asset_balances(self._in_flight_orders_snapshot)
+            self._in_flight_snapshot_locked_balances_source = self._in_flight_orders_snapshot
+        return self._in_flight_snapshot_locked_balances
+
     def order_filled_balances(self, starting_timestamp = 0) -> Dict[str, Decimal]:
         """
         Calculates total asset balance changes from filled orders since the time stamp
@@ -294,7 +418,7 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self.c_in_flight_locked_balances().get(currency, s_decimal_0)
         limit -= in_flight_balance
         filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
         limit += filled_balance
@@ -309,8 +433,8 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        snapshot_bal = self.c_in_flight_snapshot_locked_balances().get(currency, s_decimal_0)
+        in_flight_bal = self.c_in_flight_locked_balances().get(currency, s_decimal_0)
         orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
                                                                                                       s_decimal_0)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
@@ -9,6 +9,7 @@ import copy
 import logging
 import math
 import time
+from functools import partial
 from typing import (
     Any,
     Dict,
@@ -256,6 +257,9 @@ cdef class BambooRelayExchange(ExchangeBase):
     def ready(self) -> bool:
         return all(self.status_dict.values())
 
+    def order_book_tracker_factory(self):
+        return partial(BambooRelayOrderBookTracker, chain=self._wallet.chain)
+
     @property
     def name(self) -> str:
         return "bamboo_relay"
@@ -7,6 +7,7 @@ import pandas as pd
 from typing import (
     Any,
     AsyncIterable,
+    Callable,
     Dict,
     List,
     Optional
@@ -20,6 +21,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -52,6 +54,83 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     def __init__(self, trading_pairs: List[str]):
         super().__init__(trading_pairs)
         self._order_book_create_function = lambda: OrderBook()
+        # stream channel -> open websocket
+        self._websockets: Dict[str, websockets.WebSocketClientProtocol] = {}
+        self._last_subscription_id: int = 0
+
+    @property
+    def dynamic_trading_pairs(self) -> bool:
+        return True
+
+    async def add_trading_pair(self, trading_pair: str):
+        if trading_pair not in self._trading_pairs:
+            self._trading_pairs.append(trading_pair)
+        for channel, ws in list(self._websockets.items()):
+            await self._send_subscription(ws, "SUBSCRIBE", channel, [trading_pair])
+
+    async def remove_trading_pair(self, trading_pair: str):
+        if trading_pair in self._trading_pairs:
+            self._trading_pairs.remove(trading_pair)
+        for channel, ws in list(self._websockets.items()):
+            await self._send_subscription(ws, "UNSUBSCRIBE", channel, [trading_pair])
+
+    @staticmethod
+    def _stream_names(channel: str, trading_pairs: List[str]) -> List[str]:
+        return [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@{channel}" for trading_pair in trading_pairs]
+
+    async def _send_subscription(self,
+                                 ws: websockets.WebSocketClientProtocol,
+                                 method: str,
+                                 channel: str,
+                                 trading_pairs: List[str]):
+        self._last_subscription_id += 1
+        try:
+            await ws.send(ujson.dumps({"method": method,
+                                       "params": self._stream_names(channel, trading_pairs),
+                                       "id": self._last_subscription_id}))
+        except ConnectionClosed:
+            # The next connection subscribes to the current trading pairs.
+            pass
+
+    async def _listen_for_stream(self,
+                                 channel: str,
+                                 output: asyncio.Queue,
+                                 message_from_exchange: Callable[[Dict[str, Any]], OrderBookMessage]):
+        """
+        Connects to the channel streams of the trading pairs, and keeps them in sync with the trading pairs added or
+        removed while connected.
+        """
+        while True:
+            try:
+                trading_pairs: List[str] = list(self._trading_pairs)
+                stream_url: str = f"{DIFF_STREAM_URL}/{'/'.join(self._stream_names(channel, trading_pairs))}"
+
+                async with websockets.connect(stream_url) as ws:
+                    ws: websockets.WebSocketClientProtocol = ws
+                    websocket_connects_counter().labels("binance", channel).inc()
+                    self._websockets[channel] = ws
+                    try:
+                        added: List[str] = [t for t in self._trading_pairs if t not in trading_pairs]
+                        removed: List[str] = [t for t in trading_pairs if t not in self._trading_pairs]
+                        if len(added) > 0:
+                            await self._send_subscription(ws, "SUBSCRIBE", channel, added)
+                        if len(removed) > 0:
+                            await self._send_subscription(ws, "UNSUBSCRIBE", channel, removed)
+                        async for raw_msg in self._inner_messages(ws):
+                            msg = ujson.loads(raw_msg)
+                            if "result" in msg:
+                                # The response to a subscription request.
+                                continue
+                            output.put_nowait(message_from_exchange(msg))
+                    finally:
+                        if self._websockets.get(channel) is ws:
+                            del self._websockets[channel]
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
+                                    exc_info=True)
+                await asyncio.sleep(30.0)
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
@@ -152,43 +231,11 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             await ws.close()
 
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade" for trading_pair in self._trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        await self._listen_for_stream("trade", output, BinanceOrderBook.trade_message_from_exchange)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth" for trading_pair in self._trading_pairs])
-                stream_url: str = f"{DIFF_STREAM_URL}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        await self._listen_for_stream("depth", output,
+                                      lambda msg: BinanceOrderBook.diff_message_from_exchange(msg, time.time()))
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
@@ -12,6 +12,7 @@ from typing import (
 import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
@@ -90,6 +91,7 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
 
     async def messages(self) -> AsyncIterable[str]:
         async with (await self.get_ws_connection()) as ws:
+            websocket_connects_counter().labels("binance", "private").inc()
             async for msg in self._inner_messages(ws):
                 yield msg
 
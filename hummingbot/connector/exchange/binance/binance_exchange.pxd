@@ -1,5 +1,6 @@
 # from hummingbot.market.market_base cimport MarketBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -11,7 +12,7 @@ cdef class BinanceExchange(ExchangeBase):
         object _poll_notifier
         double _last_timestamp
         double _last_poll_timestamp
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         dict _order_not_found_records
         TransactionTracker _tx_tracker
         dict _trading_rules
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from libc.stdint cimport int64_t
 import aiohttp
 from aiokafka import (
@@ -29,6 +28,10 @@ from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.metrics import (
+    rest_path_label,
+    rest_request_histogram,
+)
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
@@ -50,6 +53,12 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_latency import (
+    FIRST_USER_STREAM_EVENT,
+    order_latency_stats,
+    REST_RESPONSE,
+    REST_SEND,
+)
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -137,7 +146,7 @@ cdef class BinanceExchange(ExchangeBase):
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
-        self._in_flight_orders = {}  # Dict[client_order_id:str, BinanceInFlightOrder]
+        self._in_flight_orders = InFlightOrderStore()  # client_order_id:str -> BinanceInFlightOrder
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
         self._tx_tracker = BinanceExchangeTransactionTracker(self)
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
@@ -167,7 +176,7 @@ cdef class BinanceExchange(ExchangeBase):
         return self._trading_rules
 
     @property
-    def in_flight_orders(self) -> Dict[str, BinanceInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     @property
@@ -222,9 +231,14 @@ cdef class BinanceExchange(ExchangeBase):
             **kwargs) -> Dict[str, any]:
         async with self._throttler.weighted_task(request_weight=request_weight):
             try:
-                return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                              timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
+                start_time = time.perf_counter()
+                result = await self._async_scheduler.call_async(partial(func, *args, **kwargs),
+                                                                timeout_seconds=self.API_CALL_TIMEOUT,
+                                                                app_warning_msg=app_warning_msg)
+                # The client calls are labelled with the name of the client method.
+                rest_request_histogram().labels(self.name, "client", func.__name__).observe(
+                    time.perf_counter() - start_time)
+                return result
             except Exception as ex:
                 if "Timestamp for this request" in str(ex):
                     self.logger().warning("Got Binance timestamp error. "
@@ -237,7 +251,10 @@ cdef class BinanceExchange(ExchangeBase):
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
             async with aiohttp.ClientSession() as client:
+                start_time = time.perf_counter()
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+                    rest_request_histogram().labels(self.name, "get", rest_path_label(response.url.path)).observe(
+                        time.perf_counter() - start_time)
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
                     data = await response.json()
@@ -388,17 +405,12 @@ cdef class BinanceExchange(ExchangeBase):
             int64_t current_tick = <int64_t>(self._current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
-            trading_pairs_to_order_map = defaultdict(lambda: {})
-            for o in self._in_flight_orders.values():
-                trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
-
-            trading_pairs = list(trading_pairs_to_order_map.keys())
+            trading_pairs = self._in_flight_orders.trading_pairs
             tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
                      for trading_pair in trading_pairs]
             self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
             results = await safe_gather(*tasks, return_exceptions=True)
             for trades, trading_pair in zip(results, trading_pairs):
-                order_map = trading_pairs_to_order_map[trading_pair]
                 if isinstance(trades, Exception):
                     self.logger().network(
                         f"Error fetching trades update for the order {trading_pair}: {trades}.",
@@ -406,11 +418,10 @@ cdef class BinanceExchange(ExchangeBase):
                     )
                     continue
                 for trade in trades:
-                    order_id = str(trade["orderId"])
-                    if order_id in order_map:
-                        tracked_order = order_map[order_id]
+                    tracked_order = self._in_flight_orders.get_by_exchange_order_id(str(trade["orderId"]))
+                    if tracked_order is not None and tracked_order.trading_pair == trading_pair:
                         order_type = tracked_order.order_type
-                        applied_trade = order_map[order_id].update_with_trade_update(trade)
+                        applied_trade = tracked_order.update_with_trade_update(trade)
                         if applied_trade:
                             self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
                                                  OrderFilledEvent(
@@ -580,6 +591,8 @@ cdef class BinanceExchange(ExchangeBase):
                         client_order_id = event_message.get("C")
 
                     tracked_order = self._in_flight_orders.get(client_order_id)
+                    if tracked_order is None:
+                        tracked_order = self._in_flight_orders.get_by_exchange_order_id(str(event_message.get("i")))
 
                     if tracked_order is None:
                         # Hiding the messages for now. Root cause to be investigated in later sprints.
@@ -587,6 +600,7 @@ cdef class BinanceExchange(ExchangeBase):
                         self.logger().debug(f"Event: {event_message}")
                         continue
 
+                    order_latency_stats().record_span(self.name, tracked_order, FIRST_USER_STREAM_EVENT)
                     tracked_order.update_with_execution_report(event_message)
 
                     if execution_type == "TRADE":
@@ -841,11 +855,14 @@ cdef class BinanceExchange(ExchangeBase):
                                     amount,
                                     order_type
                                     )
+        latency_stats = order_latency_stats()
         try:
+            latency_stats.record_span(self.name, self._in_flight_orders[order_id], REST_SEND)
             order_result = await self.query_api(self._binance_client.create_order, **api_params)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
+                latency_stats.record_span(self.name, tracked_order, REST_RESPONSE)
                 self.logger().info(f"Created {type_str} {side_str} order {order_id} for "
                                    f"{amount} {trading_pair}.")
                 tracked_order.exchange_order_id = exchange_order_id
@@ -922,7 +939,7 @@ cdef class BinanceExchange(ExchangeBase):
         return order_id
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
-        incomplete_orders = [o for o in self._in_flight_orders.values() if not o.is_done]
+        incomplete_orders = self._in_flight_orders.open_orders
         tasks = [self.execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
@@ -42,6 +42,10 @@ class BinanceOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "binance"
 
+    async def remove_trading_pair(self, trading_pair: str):
+        await super().remove_trading_pair(trading_pair)
+        self._saved_message_queues.pop(trading_pair, None)
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -57,6 +61,10 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
+                    if trading_pair not in self._trading_pairs:
+                        # Sent before the trading pair was unsubscribed.
+                        messages_rejected += 1
+                        continue
                     messages_queued += 1
                     # Save diff messages received before snapshots are ready
                     self._saved_message_queues[trading_pair].append(ob_message)
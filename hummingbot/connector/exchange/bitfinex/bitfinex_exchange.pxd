@@ -1,5 +1,6 @@
 from libcpp cimport bool
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -16,7 +17,7 @@ cdef class BitfinexExchange(ExchangeBase):
         double _last_timestamp
         double _last_order_update_timestamp
         double _poll_interval
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         dict _trading_rules
         dict _order_not_found_records
         object _data_source_type
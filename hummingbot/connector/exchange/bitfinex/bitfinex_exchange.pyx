@@ -136,7 +136,7 @@ cdef class BitfinexExchange(ExchangeBase):
         self._last_timestamp = 0
         self._last_order_update_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._trading_rules = {}
         self._order_not_found_records = {}
         self._status_polling_task = None
@@ -21,6 +21,7 @@ from decimal import Decimal
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bittrex.bittrex_active_order_tracker import BittrexActiveOrderTracker
 from hummingbot.connector.exchange.bittrex.bittrex_order_book import BittrexOrderBook
@@ -97,6 +98,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             self.logger().info(f"Subscribed to {trading_pair} deltas")
 
         self._websocket_connection.start()
+        websocket_connects_counter().labels("bittrex", "public").inc()
         self.logger().info("Websocket connection started...")
 
         return self._websocket_connection, self._websocket_hub
@@ -14,6 +14,7 @@ import signalr_aio
 import ujson
 from async_timeout import timeout
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.connector.exchange.bittrex.bittrex_auth import BittrexAuth
 from hummingbot.logger import HummingbotLogger
 
@@ -124,6 +125,7 @@ class BittrexAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 self.hub.server.invoke("Subscribe", ["order"])
                 self.hub.server.invoke("Subscribe", ["balance"])
                 self._websocket_connection.start()
+                websocket_connects_counter().labels("bittrex", "private").inc()
 
                 async for raw_message in self._socket_user_stream(self._websocket_connection):
                     decode: Dict[str, Any] = self._transform_raw_message(raw_message)
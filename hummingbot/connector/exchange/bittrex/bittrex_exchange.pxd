@@ -1,6 +1,7 @@
 from libc.stdint cimport int64_t
 
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -10,7 +11,7 @@ cdef class BittrexExchange(ExchangeBase):
         object _bittrex_auth
         object _coro_queue
         object _ev_loop
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         double _last_timestamp
         double _last_poll_timestamp
         dict _order_not_found_records
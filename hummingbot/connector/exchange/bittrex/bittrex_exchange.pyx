@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from typing import Optional, List, Dict, Any, AsyncIterable
 
@@ -20,6 +21,10 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent, OrderCancelledEvent, MarketTransactionFailureEvent,
     MarketOrderFailureEvent, SellOrderCreatedEvent, BuyOrderCreatedEvent)
+from hummingbot.core.metrics import (
+    rest_path_label,
+    rest_request_histogram,
+)
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
@@ -87,7 +92,7 @@ cdef class BittrexExchange(ExchangeBase):
         self._account_id = ""
         self._bittrex_auth = BittrexAuth(bittrex_api_key, bittrex_secret_key)
         self._ev_loop = asyncio.get_event_loop()
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
         self._order_book_tracker = BittrexOrderBookTracker(trading_pairs=trading_pairs)
@@ -482,12 +487,12 @@ cdef class BittrexExchange(ExchangeBase):
                     order_status = order["status"]
                     order_id = order["id"]
 
-                    tracked_order = None
-                    for o in self._in_flight_orders.values():
-                        exchange_order_id = await o.get_exchange_order_id()
-                        if exchange_order_id == order_id:
-                            tracked_order = o
-                            break
+                    tracked_order = self._in_flight_orders.get_by_exchange_order_id(order_id)
+                    if tracked_order is None:
+                        # The order update can arrive before the exchange order id of its order.
+                        for o in [o for o in self._in_flight_orders.values() if o.exchange_order_id is None]:
+                            await o.get_exchange_order_id()
+                        tracked_order = self._in_flight_orders.get_by_exchange_order_id(order_id)
 
                     if tracked_order is None:
                         continue
@@ -988,12 +993,15 @@ cdef class BittrexExchange(ExchangeBase):
             body = auth_dict["body"]  # Ensures the body is the same as that signed in Api-Content-Hash
 
         client = await self._http_client()
+        start_time = time.perf_counter()
         async with client.request(http_method,
                                   url=url,
                                   headers=headers,
                                   params=params,
                                   data=body,
                                   timeout=self.API_CALL_TIMEOUT) as response:
+            rest_request_histogram().labels(self.name, http_method.lower(), rest_path_label(path_url)).observe(
+                time.perf_counter() - start_time)
             data = await response.json()
             if response.status not in [200, 201]:  # HTTP Response code of 20X generally means it is successful
                 raise IOError(f"Error fetching response from {http_method}-{url}. HTTP Status Code {response.status}: "
@@ -1,4 +1,5 @@
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -14,7 +15,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         object _maker_fee_percentage
         object _taker_fee_percentage
         double _poll_interval
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         TransactionTracker _tx_tracker
         dict _trading_rules
         object _coro_queue
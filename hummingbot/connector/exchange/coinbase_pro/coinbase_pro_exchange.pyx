@@ -112,7 +112,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         self._last_order_update_timestamp = 0
         self._last_fee_percentage_update_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._tx_tracker = CoinbaseProExchangeTransactionTracker(self)
         self._trading_rules = {}
         self._status_polling_task = None
@@ -194,7 +194,7 @@ cdef class CoinbaseProExchange(ExchangeBase):
         }
 
     @property
-    def in_flight_orders(self) -> Dict[str, CoinbaseProInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
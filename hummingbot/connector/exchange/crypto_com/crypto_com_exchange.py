@@ -14,6 +14,10 @@ import math
 import time
 from async_timeout import timeout
 
+from hummingbot.core.metrics import (
+    rest_path_label,
+    rest_request_histogram,
+)
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.clock import Clock
@@ -21,6 +25,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_worker import WorkerOrderBookTracker
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.event.events import (
     MarketEvent,
@@ -36,7 +41,15 @@ from hummingbot.core.event.events import (
     TradeFee
 )
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_order_store import InFlightOrderStore
+from hummingbot.connector.order_latency import (
+    FIRST_USER_STREAM_EVENT,
+    order_latency_stats,
+    REST_RESPONSE,
+    REST_SEND,
+)
 from hummingbot.connector.exchange.crypto_com.crypto_com_order_book_tracker import CryptoComOrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_registry import order_book_tracker_registry
 from hummingbot.connector.exchange.crypto_com.crypto_com_user_stream_tracker import CryptoComUserStreamTracker
 from hummingbot.connector.exchange.crypto_com.crypto_com_auth import CryptoComAuth
 from hummingbot.connector.exchange.crypto_com.crypto_com_in_flight_order import CryptoComInFlightOrder
@@ -84,7 +97,7 @@ class CryptoComExchange(ExchangeBase):
         self._shared_client = None
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
-        self._in_flight_orders = {}  # Dict[client_order_id:str, CryptoComInFlightOrder]
+        self._in_flight_orders = InFlightOrderStore()  # client_order_id:str -> CryptoComInFlightOrder
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
         self._status_polling_task = None
@@ -104,6 +117,19 @@ class CryptoComExchange(ExchangeBase):
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
 
+    def run_order_book_tracker_in_worker(self) -> bool:
+        # The order book tracker is a Python attribute of this connector, rather than the ExchangeBase one.
+        worker_tracker: Optional[WorkerOrderBookTracker] = WorkerOrderBookTracker.from_tracker(self._order_book_tracker)
+        if worker_tracker is None:
+            return False
+        self._order_book_tracker = worker_tracker
+        return True
+
+    def share_order_book_tracker(self) -> bool:
+        self._order_book_tracker = order_book_tracker_registry().shared_tracker(
+            CryptoComOrderBookTracker, self._order_book_tracker._trading_pairs)
+        return True
+
     @property
     def in_flight_orders(self) -> Dict[str, CryptoComInFlightOrder]:
         return self._in_flight_orders
@@ -325,6 +351,7 @@ class CryptoComExchange(ExchangeBase):
         else:
             headers = {"Content-Type": "application/json"}
 
+        start_time: float = time.perf_counter()
         if method == "get":
             response = await client.get(url, headers=headers)
         elif method == "post":
@@ -332,6 +359,7 @@ class CryptoComExchange(ExchangeBase):
             response = await client.post(url, data=post_json, headers=headers)
         else:
             raise NotImplementedError
+        rest_request_histogram().labels(self.name, method, rest_path_label(path_url)).observe(time.perf_counter() - start_time)
 
         try:
             parsed_response = json.loads(await response.text())
@@ -445,11 +473,14 @@ class CryptoComExchange(ExchangeBase):
                                   amount,
                                   order_type
                                   )
+        latency_stats = order_latency_stats()
         try:
+            latency_stats.record_span(self.name, self._in_flight_orders[order_id], REST_SEND)
             order_result = await self._api_request("post", "private/create-order", api_params, True)
             exchange_order_id = str(order_result["result"]["order_id"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
+                latency_stats.record_span(self.name, tracked_order, REST_RESPONSE)
                 self.logger().info(f"Created {order_type.name} {trade_type.name} order {order_id} for "
                                    f"{amount} {trading_pair}.")
                 tracked_order.exchange_order_id = exchange_order_id
@@ -650,12 +681,14 @@ class CryptoComExchange(ExchangeBase):
         Updates in-flight order and trigger order filled event for trade message received. Triggers order completed
         event if the total executed amount equals to the specified order amount.
         """
-        for order in self._in_flight_orders.values():
-            await order.get_exchange_order_id()
-        track_order = [o for o in self._in_flight_orders.values() if trade_msg["order_id"] == o.exchange_order_id]
-        if not track_order:
+        tracked_order = self._in_flight_orders.get_by_exchange_order_id(trade_msg["order_id"])
+        if tracked_order is None:
+            # The trade can arrive before the exchange order id of its order.
+            for order in [o for o in self._in_flight_orders.values() if o.exchange_order_id is None]:
+                await order.get_exchange_order_id()
+            tracked_order = self._in_flight_orders.get_by_exchange_order_id(trade_msg["order_id"])
+        if tracked_order is None:
             return
-        tracked_order = track_order[0]
         updated = tracked_order.update_with_trade_update(trade_msg)
         if not updated:
             return
@@ -784,6 +817,9 @@ class CryptoComExchange(ExchangeBase):
                         await self._process_trade_message(trade_msg)
                 elif "user.order" in channel:
                     for order_msg in event_message["result"]["data"]:
+                        tracked_order = self._in_flight_orders.get(order_msg["client_oid"])
+                        if tracked_order is not None:
+                            order_latency_stats().record_span(self.name, tracked_order, FIRST_USER_STREAM_EVENT)
                         self._process_order_message(order_msg)
                 elif channel == "user.balance":
                     balances = event_message["result"]["data"]
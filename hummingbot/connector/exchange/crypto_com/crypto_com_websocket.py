@@ -5,6 +5,7 @@ import logging
 import websockets
 import ujson
 import hummingbot.connector.exchange.crypto_com.crypto_com_constants as constants
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
@@ -38,6 +39,7 @@ class CryptoComWebsocket(RequestId):
     async def connect(self):
         try:
             self._client = await websockets.connect(self._WS_URL)
+            websocket_connects_counter().labels("crypto_com", "private" if self._isPrivate else "public").inc()
 
             # if auth class was passed into websocket class
             # we need to emit authenticated requests
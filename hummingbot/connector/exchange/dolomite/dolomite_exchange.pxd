@@ -1,4 +1,5 @@
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 cdef class DolomiteExchange(ExchangeBase):
@@ -19,4 +20,4 @@ cdef class DolomiteExchange(ExchangeBase):
         object _exchange_info
         object _exchange_rates
         object _pending_approval_tx_hashes
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
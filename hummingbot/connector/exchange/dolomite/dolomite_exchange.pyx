@@ -13,6 +13,7 @@ from typing import (
 )
 import math
 import logging
+from functools import partial
 from decimal import *
 from libc.stdint cimport int64_t
 from web3 import Web3
@@ -164,7 +165,7 @@ cdef class DolomiteExchange(ExchangeBase):
         self._exchange_info = None
         self._exchange_rates = None
         self._pending_approval_tx_hashes = set()
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
 
     @property
     def name(self) -> str:
@@ -209,9 +210,15 @@ cdef class DolomiteExchange(ExchangeBase):
         return retval
 
     @property
-    def in_flight_orders(self) -> Dict[str, DolomiteInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
+    def order_book_tracker_factory(self):
+        return partial(DolomiteOrderBookTracker,
+                       data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                       rest_api_url=self.API_REST_ENDPOINT,
+                       websocket_url=self.WS_ENDPOINT)
+
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await DolomiteAPIOrderBookDataSource.get_active_exchange_markets()
 
@@ -121,7 +121,7 @@ cdef class EterbaseExchange(ExchangeBase):
         self._last_timestamp = 0
         self._last_order_update_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = dict()
+        self._in_flight_orders = InFlightOrderStore()
         self._tx_tracker = EterbaseExchangeTransactionTracker(self)
         self._trading_rules = {}
         self._status_polling_task = None
@@ -203,7 +203,7 @@ cdef class EterbaseExchange(ExchangeBase):
         }
 
     @property
-    def in_flight_orders(self) -> Dict[str, EterbaseInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
@@ -1,6 +1,7 @@
 from libc.stdint cimport int64_t
 
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -10,7 +11,7 @@ cdef class HuobiExchange(ExchangeBase):
         object _async_scheduler
         object _ev_loop
         object _huobi_auth
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         double _last_poll_timestamp
         double _last_timestamp
         object _poll_notifier
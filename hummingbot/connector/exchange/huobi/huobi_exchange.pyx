@@ -114,7 +114,7 @@ cdef class HuobiExchange(ExchangeBase):
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._ev_loop = asyncio.get_event_loop()
         self._huobi_auth = HuobiAuth(api_key=huobi_api_key, secret_key=huobi_secret_key)
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
         self._order_book_tracker = HuobiOrderBookTracker(
@@ -150,7 +150,7 @@ cdef class HuobiExchange(ExchangeBase):
         return self._trading_rules
 
     @property
-    def in_flight_orders(self) -> Dict[str, HuobiInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     @property
@@ -20,6 +20,7 @@ from websockets.exceptions import ConnectionClosed
 import requests
 import cachetools.func
 
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -176,6 +177,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 async with websockets.connect(DIFF_STREAM_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
+                    websocket_connects_counter().labels("kraken", "trade").inc()
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
                         msg: List[Any] = ujson.loads(raw_msg)
@@ -196,6 +198,7 @@ class KrakenAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 ws_message: str = await self.get_ws_subscription_message("book")
                 async with websockets.connect(DIFF_STREAM_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
+                    websocket_connects_counter().labels("kraken", "book").inc()
                     await ws.send(ws_message)
                     async for raw_msg in self._inner_messages(ws):
                         msg = ujson.loads(raw_msg)
@@ -13,6 +13,7 @@ import time
 import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.metrics import websocket_connects_counter
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.kraken.kraken_auth import KrakenAuth
 from hummingbot.connector.exchange.kraken.kraken_order_book import KrakenOrderBook
@@ -94,6 +95,7 @@ class KrakenAPIUserStreamDataSource(UserStreamTrackerDataSource):
             try:
                 async with websockets.connect(KRAKEN_WS_URL) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
+                    websocket_connects_counter().labels("kraken", "private").inc()
 
                     if self._current_auth_token is None:
                         self._current_auth_token = await self.get_auth_token()
@@ -1,4 +1,5 @@
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 from libc.stdint cimport int32_t
 
@@ -11,7 +12,7 @@ cdef class KrakenExchange(ExchangeBase):
         double _last_timestamp
         double _poll_interval
         double _last_pull_timestamp
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         dict _order_not_found_records
         TransactionTracker _tx_tracker
         dict _trading_rules
@@ -6,6 +6,7 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from collections import defaultdict
+import time
 from typing import (
     Any,
     Dict,
@@ -18,6 +19,7 @@ import copy
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.metrics import rest_request_histogram
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
@@ -123,7 +125,7 @@ cdef class KrakenExchange(ExchangeBase):
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = {}  # Dict[client_order_id:str, KrakenInFlightOrder]
+        self._in_flight_orders = InFlightOrderStore()  # client_order_id:str -> KrakenInFlightOrder
         self._order_not_found_records = {}  # Dict[client_order_id:str, count:int]
         self._tx_tracker = KrakenExchangeTransactionTracker(self)
         self._trading_rules = {}  # Dict[trading_pair:str, TradingRule]
@@ -460,19 +462,9 @@ cdef class KrakenExchange(ExchangeBase):
                         trade: Dict[str, str] = update[trade_id]
                         trade["trade_id"] = trade_id
                         exchange_order_id = trade.get("ordertxid")
-                        try:
-                            client_order_id = next(key for key, value in self._in_flight_orders.items()
-                                                   if value.exchange_order_id == exchange_order_id)
-                        except StopIteration:
-                            continue
-
-                        tracked_order = self._in_flight_orders.get(client_order_id)
+                        tracked_order = self._in_flight_orders.get_by_exchange_order_id(exchange_order_id)
 
                         if tracked_order is None:
-                            # Hiding the messages for now. Root cause to be investigated in later sprints.
-                            self.logger().debug(f"Unrecognized order ID from user stream: {client_order_id}.")
-                            self.logger().debug(f"Event: {event_message}")
-                            self.logger().debug(f"Order Event: {update}")
                             continue
 
                         tracked_order.update_with_trade_update(trade)
@@ -690,7 +682,10 @@ cdef class KrakenExchange(ExchangeBase):
                 timeout=100
             )
 
+            start_time = time.perf_counter()
             async with response_coro as response:
+                rest_request_histogram().labels(self.name, method.lower(), path_url).observe(
+                    time.perf_counter() - start_time)
                 if response.status != 200:
                     raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
                 try:
@@ -110,7 +110,7 @@ cdef class KucoinExchange(ExchangeBase):
         self._ev_loop = asyncio.get_event_loop()
         self._kucoin_auth = KucoinAuth(api_key=kucoin_api_key, passphrase=kucoin_passphrase,
                                        secret_key=kucoin_secret_key)
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._last_poll_timestamp = 0
         self._last_timestamp = 0
         self._order_book_tracker = KucoinOrderBookTracker(trading_pairs)
@@ -156,7 +156,7 @@ cdef class KucoinExchange(ExchangeBase):
         return self._trading_rules
 
     @property
-    def in_flight_orders(self) -> Dict[str, KucoinInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     @property
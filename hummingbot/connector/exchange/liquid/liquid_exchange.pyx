@@ -108,7 +108,7 @@ cdef class LiquidExchange(ExchangeBase):
         self._last_timestamp = 0
         self._last_order_update_timestamp = 0
         self._poll_interval = poll_interval
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._tx_tracker = LiquidExchangeTransactionTracker(self)
         self._trading_rules = {}
         self._status_polling_task = None
@@ -189,7 +189,7 @@ cdef class LiquidExchange(ExchangeBase):
         }
 
     @property
-    def in_flight_orders(self) -> Dict[str, LiquidInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
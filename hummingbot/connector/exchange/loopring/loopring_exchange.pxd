@@ -1,4 +1,5 @@
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 cdef class LoopringExchange(ExchangeBase):
@@ -14,7 +15,7 @@ cdef class LoopringExchange(ExchangeBase):
         int _loopring_accountid
         int _loopring_exchangeid
         str _loopring_private_key
-        object _order_sign_param
+        object _loopring_signer
 
         object _user_stream_tracker
         object _user_stream_tracker_task
@@ -26,7 +27,7 @@ cdef class LoopringExchange(ExchangeBase):
         object _lock
         object _exchange_rates
         object _pending_approval_tx_hashes
-        dict _in_flight_orders
+        InFlightOrderStore _in_flight_orders
         dict _next_order_id
         object _order_id_lock
         dict _loopring_tokenids
@@ -6,7 +6,6 @@ import time
 import uuid
 import traceback
 import urllib
-import hashlib
 from typing import (
     Any,
     Dict,
@@ -15,6 +14,7 @@ from typing import (
 )
 import math
 import logging
+from functools import partial
 from decimal import *
 from libc.stdint cimport int64_t
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -51,9 +51,7 @@ from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
-from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import PureEdDSA, PoseidonEdDSA
-from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ, SNARK_SCALAR_FIELD
-from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import poseidon_params, poseidon
+from hummingbot.connector.exchange.loopring.loopring_signer import LoopringSigner
 
 s_logger = None
 s_decimal_0 = Decimal(0)
@@ -161,10 +159,10 @@ cdef class LoopringExchange(ExchangeBase):
         self._lock = asyncio.Lock()
         self._trading_rules = {}
         self._pending_approval_tx_hashes = set()
-        self._in_flight_orders = {}
+        self._in_flight_orders = InFlightOrderStore()
         self._next_order_id = {}
         self._trading_pairs = trading_pairs
-        self._order_sign_param = poseidon_params(SNARK_SCALAR_FIELD, 14, 6, 53, b'poseidon', 5, security_target=128)
+        self._loopring_signer = LoopringSigner(int(loopring_private_key))
 
         self._order_id_lock = asyncio.Lock()
 
@@ -230,9 +228,15 @@ cdef class LoopringExchange(ExchangeBase):
     # ----------------------------------------------------------
 
     @property
-    def in_flight_orders(self) -> Dict[str, LoopringInFlightOrder]:
+    def in_flight_orders(self) -> InFlightOrderStore:
         return self._in_flight_orders
 
+    def order_book_tracker_factory(self):
+        return partial(LoopringOrderBookTracker,
+                       rest_api_url=self.API_REST_ENDPOINT,
+                       websocket_url=self.WS_ENDPOINT,
+                       token_configuration=self._token_configuration)
+
     async def _get_next_order_id(self, token, force_sync = False):
         async with self._order_id_lock:
             next_id = self._next_order_id
@@ -302,17 +306,9 @@ cdef class LoopringExchange(ExchangeBase):
             order["orderType"] = "MAKER_ONLY"
 
         serialized_message = await self._serialize_order(order)
-        msgHash = poseidon(serialized_message, self._order_sign_param)
-        fq_obj = FQ(int(self._loopring_private_key))
-        signed_message = PoseidonEdDSA.sign(msgHash, fq_obj)
-
-        # Update with signature
-        order.update({
-            "hash": str(msgHash),
-            "signatureRx": str(signed_message.sig.R.x),
-            "signatureRy": str(signed_message.sig.R.y),
-            "signatureS": str(signed_message.sig.s)
-        })
+
+        # Update with hash and signature
+        order.update(await self._loopring_signer.sign_order(serialized_message))
 
         return await self.api_request("POST", ORDER_ROUTE, params=order, data=order)
 
@@ -522,6 +518,8 @@ cdef class LoopringExchange(ExchangeBase):
             self._user_stream_event_listener_task.cancel()
         self._user_stream_tracker_task = None
         self._user_stream_event_listener_task = None
+        # Shuts the signing processes down, they're started again on the next signature.
+        self._loopring_signer.stop()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -872,11 +870,7 @@ cdef class LoopringExchange(ExchangeBase):
         # Signs requests for secure requests
         if secure:
             ordered_data = self._encode_request(full_url, http_method, params)
-            hasher = hashlib.sha256()
-            hasher.update(ordered_data.encode('utf-8'))
-            msgHash = int(hasher.hexdigest(), 16) % SNARK_SCALAR_FIELD
-            signed = PoseidonEdDSA.sign(msgHash, FQ(int(self._loopring_private_key)))
-            signature = ','.join(str(_) for _ in [signed.sig.R.x, signed.sig.R.y, signed.sig.s])
+            signature = await self._loopring_signer.sign_request(ordered_data)
             headers.update({"X-API-SIG": signature})
 
         async with self._shared_client.request(http_method, url=full_url,
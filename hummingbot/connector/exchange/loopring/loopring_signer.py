@@ -0,0 +1,184 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import logging
+import os
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import (
+    PoseidonEdDSA,
+    Signature,
+    SignedMessage,
+    as_scalar,
+)
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ, SNARK_SCALAR_FIELD
+from hummingbot.connector.exchange.loopring.ethsnarks2.jubjub import (
+    EtecPoint,
+    JUBJUB_E,
+    JUBJUB_L,
+    Point,
+)
+from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import poseidon_params, poseidon
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+# Poseidon parameters derive their round constants and MDS matrix from repeated blake2b hashing and modular
+# inverses, so they are computed once per process instead of once per signature.
+ORDER_HASH_PARAMS = poseidon_params(SNARK_SCALAR_FIELD, 14, 6, 53, b'poseidon', 5, security_target=128)
+SIGNATURE_HASH_PARAMS = poseidon_params(SNARK_SCALAR_FIELD, 6, 6, 52, b'poseidon', 5, security_target=128)
+
+FIXED_BASE_WINDOW_BITS = 4
+
+
+class FixedBaseTable:
+    """
+    Precomputed multiples of a point, in extended twisted Edwards coordinates, for multiplying it by any scalar
+    with one point addition per window of the scalar, and no doubling nor field inversion until the result is
+    converted back to affine coordinates.
+
+    windows[i][j] is j * 2^(window_bits * i) * base.
+    """
+
+    def __init__(self, base: Point, scalar_bits: int = JUBJUB_L.bit_length(),
+                 window_bits: int = FIXED_BASE_WINDOW_BITS):
+        self._window_bits = window_bits
+        self._window_mask = (1 << window_bits) - 1
+        self._windows: List[List[EtecPoint]] = []
+        window_base: EtecPoint = base.as_etec()
+        for _ in range((scalar_bits + window_bits - 1) // window_bits):
+            window: List[EtecPoint] = [EtecPoint.infinity(), window_base]
+            for _ in range(2, 1 << window_bits):
+                window.append(window[-1].add(window_base))
+            self._windows.append(window)
+            window_base = window[-1].add(window_base)
+
+    def mult(self, scalar: int) -> Point:
+        result: Optional[EtecPoint] = None
+        for window in self._windows:
+            if scalar == 0:
+                break
+            digit: int = scalar & self._window_mask
+            scalar >>= self._window_bits
+            if digit != 0:
+                result = window[digit] if result is None else result.add(window[digit])
+        if scalar != 0:
+            raise ValueError("Scalar is too large for the fixed base table.")
+        return Point.infinity() if result is None else result.as_point()
+
+
+class FixedBasePoseidonEdDSA(PoseidonEdDSA):
+    """
+    PoseidonEdDSA producing the exact same signatures, using a fixed base table for the generator point, the cached
+    Poseidon parameters and a cached public key.
+    """
+    _generator_table: Optional[FixedBaseTable] = None
+    _public_keys: Dict[int, Point] = {}
+
+    @classmethod
+    def generator_table(cls) -> FixedBaseTable:
+        if cls._generator_table is None:
+            cls._generator_table = FixedBaseTable(cls.B())
+        return cls._generator_table
+
+    @classmethod
+    def public_key(cls, key: FQ) -> Point:
+        if key.n not in cls._public_keys:
+            cls._public_keys[key.n] = cls.generator_table().mult(key.n)
+        return cls._public_keys[key.n]
+
+    @classmethod
+    def hash_public(cls, *args):
+        return poseidon(list(as_scalar(*args)), SIGNATURE_HASH_PARAMS)
+
+    @classmethod
+    def sign(cls, msg, key, B=None):
+        if B is not None:
+            return super().sign(msg, key, B)
+        if not isinstance(key, FQ):
+            raise TypeError("Invalid type for parameter k")
+        # Strict parsing ensures key is in the prime-order group
+        if key.n >= JUBJUB_L or key.n <= 0:
+            raise RuntimeError("Strict parsing of k failed")
+
+        A = cls.public_key(key)                         # A = kB
+        M = cls.prehash_message(msg)
+        r = cls.hash_secret(key, M)                     # r = H(k,M) mod L
+        R = cls.generator_table().mult(r)               # R = rB
+        t = cls.hash_public(R, A, M)
+        S = (r + (key.n * t)) % JUBJUB_E                # r + (H(R,A,M) * k)
+        return SignedMessage(A, Signature(R, S), msg)
+
+
+def sign_order(serialized_order: List[int], private_key: int) -> Dict[str, str]:
+    """
+    :return: the order hash and signature fields expected by the Loopring order API
+    """
+    msg_hash: int = poseidon(serialized_order, ORDER_HASH_PARAMS)
+    signed_message: SignedMessage = FixedBasePoseidonEdDSA.sign(msg_hash, FQ(private_key))
+    return {
+        "hash": str(msg_hash),
+        "signatureRx": str(signed_message.sig.R.x),
+        "signatureRy": str(signed_message.sig.R.y),
+        "signatureS": str(signed_message.sig.s)
+    }
+
+
+def sign_request(ordered_data: str, private_key: int) -> str:
+    """
+    :return: the X-API-SIG header value of an authenticated API request
+    """
+    hasher = hashlib.sha256()
+    hasher.update(ordered_data.encode('utf-8'))
+    msg_hash: int = int(hasher.hexdigest(), 16) % SNARK_SCALAR_FIELD
+    signed_message: SignedMessage = FixedBasePoseidonEdDSA.sign(msg_hash, FQ(private_key))
+    return ','.join(str(_) for _ in [signed_message.sig.R.x, signed_message.sig.R.y, signed_message.sig.s])
+
+
+def _init_signer_process(private_key: int):
+    # Build the generator table and public key up front, so the first orders are not slower than the next ones.
+    FixedBasePoseidonEdDSA.public_key(FQ(private_key))
+
+
+class LoopringSigner:
+    """
+    Signs Loopring orders and API requests in a pool of worker processes, so that the big integer curve arithmetic
+    runs on other cores and never blocks the event loop.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, private_key: int, max_workers: Optional[int] = None):
+        self._private_key: int = private_key
+        self._max_workers: int = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers,
+                                                 initializer=_init_signer_process,
+                                                 initargs=(self._private_key,))
+        return self._executor
+
+    async def sign_order(self, serialized_order: List[int]) -> Dict[str, str]:
+        return await asyncio.get_event_loop().run_in_executor(self.executor, sign_order,
+                                                              serialized_order, self._private_key)
+
+    async def sign_request(self, ordered_data: str) -> str:
+        return await asyncio.get_event_loop().run_in_executor(self.executor, sign_request,
+                                                              ordered_data, self._private_key)
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
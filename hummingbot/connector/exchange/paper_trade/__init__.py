@@ -1,5 +1,6 @@
 from typing import List, Callable
 from hummingbot.client.config.config_helpers import get_connector_class
+from hummingbot.core.data_type.order_book_tracker_registry import order_book_tracker_registry
 from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 
@@ -17,7 +18,10 @@ def get_order_book_tracker_class(connector_name: str) -> Callable:
 
 
 def create_paper_trade_market(exchange_name: str, trading_pairs: List[str]):
-    order_book_tracker = get_order_book_tracker_class(exchange_name)
-    return PaperTradeExchange(order_book_tracker(trading_pairs=trading_pairs),
+    # Paper trade markets record their simulated fills on their own composite order books, so they share the order
+    # book trackers of the live connectors.
+    order_book_tracker = order_book_tracker_registry().shared_tracker(get_order_book_tracker_class(exchange_name),
+                                                                      trading_pairs)
+    return PaperTradeExchange(order_book_tracker,
                               MarketConfig.default_config(),
                               get_connector_class(exchange_name))
@@ -37,6 +37,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
         object _target_market
+        dict _composite_order_books
+        object _source_order_books
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
@@ -169,9 +169,13 @@ cdef class PaperTradeExchange(ExchangeBase):
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
     def __init__(self, order_book_tracker: OrderBookTracker, config: MarketConfig, target_market: type):
-        order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
+        # The order books of the tracker can be shared with other markets. The simulated fills are recorded in
+        # composite order books following them, which only this market reads.
         self._order_book_tracker = order_book_tracker
+        self._composite_order_books = {}
+        self._source_order_books = None
         super(ExchangeBase, self).__init__()
+        self._quantized_prices = {}
         self._account_balances = {}
         self._account_available_balances = {}
         self._paper_trade_market_initialized = False
@@ -190,14 +194,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         return f"{order_side}://" + trading_pair + "/" + "".join([f"{val:02x}" for val in vals])
 
     def init_paper_trade_market(self):
-        for trading_pair_str, order_book in self._order_book_tracker.order_books.items():
-            assert type(order_book) is CompositeOrderBook
+        for trading_pair_str in self.order_books.keys():
             base_asset, quote_asset = self.split_trading_pair(trading_pair_str)
             self._trading_pairs[self._target_market.convert_from_exchange_trading_pair(trading_pair_str)] = TradingPair(trading_pair_str, base_asset, quote_asset)
-            (<CompositeOrderBook>order_book).c_add_listener(
-                self.ORDER_BOOK_TRADE_EVENT_TAG,
-                self._order_book_trade_listener
-            )
 
     def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
         return self._target_market.split_trading_pair(trading_pair)
@@ -217,7 +216,26 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     @property
     def order_books(self) -> Dict[str, CompositeOrderBook]:
-        return self._order_book_tracker.order_books
+        cdef:
+            dict source_order_books = self._order_book_tracker.order_books
+            CompositeOrderBook order_book
+
+        if source_order_books is self._source_order_books and \
+                len(source_order_books) == len(self._composite_order_books) and \
+                all(self._composite_order_books.get(trading_pair) is not None and
+                    (<CompositeOrderBook>self._composite_order_books[trading_pair]).source_order_book is source_order_book
+                    for trading_pair, source_order_book in source_order_books.items()):
+            return self._composite_order_books
+        composite_order_books = {}
+        for trading_pair, source_order_book in source_order_books.items():
+            order_book = self._composite_order_books.get(trading_pair)
+            if order_book is None or order_book.source_order_book is not source_order_book:
+                order_book = CompositeOrderBook(source_order_book)
+                order_book.c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG, self._order_book_trade_listener)
+            composite_order_books[trading_pair] = order_book
+        self._composite_order_books = composite_order_books
+        self._source_order_books = source_order_books
+        return composite_order_books
 
     @property
     def status_dict(self) -> Dict[str, bool]:
@@ -901,7 +919,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         if trading_pair not in self._trading_pairs:
             raise ValueError(f"No order book exists for '{trading_pair}'.")
         trading_pair = self._target_market.convert_to_exchange_trading_pair(trading_pair)
-        return self._order_book_tracker.order_books[trading_pair]
+        return self.order_books[trading_pair]
 
     cdef object c_get_order_price_quantum(self, str trading_pair, object price):
         cdef:
@@ -10,12 +10,14 @@ from hummingbot.core.data_type.order_book_query_result cimport(
 cdef class ExchangeBase(ConnectorBase):
     cdef:
         object _order_book_tracker
+        dict _quantized_prices
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
     cdef c_stop_tracking_order(self, str order_id)
     cdef OrderBook c_get_order_book(self, str trading_pair)
+    cdef list c_get_quantized_prices(self, str trading_pair, OrderBook order_book)
     cdef object c_get_price(self, str trading_pair, bint is_buy)
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_base_amount(self, str trading_pair, bint is_buy, object base_amount)
     cdef ClientOrderBookQueryResult c_get_volume_for_price(self, str trading_pair, bint is_buy, object price)
@@ -1,6 +1,8 @@
 from decimal import Decimal
+from libc.stdint cimport int64_t
 import pandas as pd
 from typing import (
+    Callable,
     Dict,
     List,
     Tuple,
@@ -23,6 +25,12 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_worker import WorkerOrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_registry import (
+    is_created_from_trading_pairs,
+    order_book_tracker_registry,
+)
 from hummingbot.connector.connector_base import ConnectorBase
 
 NaN = float("nan")
@@ -39,6 +47,8 @@ cdef class ExchangeBase(ConnectorBase):
     def __init__(self):
         super().__init__()
         self._order_book_tracker = None
+        # trading pair -> [order book, order book version, best ask, best bid, mid price], quantized
+        self._quantized_prices = {}
 
     @staticmethod
     def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> Optional[str]:
@@ -56,8 +66,53 @@ cdef class ExchangeBase(ConnectorBase):
     def limit_orders(self) -> List[LimitOrder]:
         raise NotImplementedError
 
+    def run_order_book_tracker_in_worker(self) -> bool:
+        """
+        Moves the order book tracking to a worker process, must be called before the connector is started.
+
+        :return: False if the order book tracker can't run in a worker process, and keeps running in this one
+        """
+        worker_tracker = None
+        if self._order_book_tracker is not None:
+            worker_tracker = WorkerOrderBookTracker.from_tracker(self._order_book_tracker)
+        if worker_tracker is None:
+            return False
+        self._order_book_tracker = worker_tracker
+        return True
+
+    def order_book_tracker_factory(self) -> Optional[Callable[..., OrderBookTracker]]:
+        """
+        Connectors whose order book tracker is created with more than its trading pairs, e.g. URLs or a token
+        configuration, return a function creating the same tracker from its trading_pairs keyword argument.
+
+        :return: the order book tracker factory, or None to create the tracker class from its trading pairs alone
+        """
+        return None
+
+    def share_order_book_tracker(self) -> bool:
+        """
+        Tracks the order books with the tracker shared by the other connectors of the exchange in this process, must be
+        called before the connector is started.
+
+        :return: False if the order book tracker can't be shared, and the connector keeps its own
+        """
+        tracker = self._order_book_tracker
+        if tracker is None:
+            return False
+        tracker_factory = self.order_book_tracker_factory()
+        if tracker_factory is None and not is_created_from_trading_pairs(type(tracker)):
+            return False
+        self._order_book_tracker = order_book_tracker_registry().shared_tracker(type(tracker), tracker._trading_pairs,
+                                                                                tracker_factory=tracker_factory)
+        return True
+
     def get_mid_price(self, trading_pair: str) -> Decimal:
-        return (self.get_price(trading_pair, True) + self.get_price(trading_pair, False)) / Decimal("2")
+        cdef:
+            list quantized_prices = self.c_get_quantized_prices(trading_pair, self.c_get_order_book(trading_pair))
+        if quantized_prices[4] is None:
+            quantized_prices[4] = (self.c_get_price(trading_pair, True) +
+                                   self.c_get_price(trading_pair, False)) / Decimal("2")
+        return quantized_prices[4]
 
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         """
@@ -92,20 +147,37 @@ cdef class ExchangeBase(ConnectorBase):
     cdef OrderBook c_get_order_book(self, str trading_pair):
         return self.get_order_book(trading_pair)
 
+    cdef list c_get_quantized_prices(self, str trading_pair, OrderBook order_book):
+        """
+        :returns: the cached quantized prices of the trading pair, reset whenever its order book is updated or replaced
+        """
+        cdef:
+            list quantized_prices = self._quantized_prices.get(trading_pair)
+            int64_t version = order_book.c_get_version()
+        if quantized_prices is None or quantized_prices[0] is not order_book or quantized_prices[1] != version:
+            quantized_prices = [order_book, version, None, None, None]
+            self._quantized_prices[trading_pair] = quantized_prices
+        return quantized_prices
+
     cdef object c_get_price(self, str trading_pair, bint is_buy):
         """
         :returns: Top bid/ask price for a specific trading pair
         """
         cdef:
             OrderBook order_book = self.c_get_order_book(trading_pair)
+            list quantized_prices = self.c_get_quantized_prices(trading_pair, order_book)
+            int index = 2 if is_buy else 3
             object top_price
+        if quantized_prices[index] is not None:
+            return quantized_prices[index]
         try:
             top_price = Decimal(order_book.c_get_price(is_buy))
         except EnvironmentError as e:
             self.logger().warning(f"{'Ask' if is_buy else 'Buy'} orderbook for {trading_pair} is empty.")
             return s_decimal_NaN
 
-        return self.c_quantize_order_price(trading_pair, top_price)
+        quantized_prices[index] = self.c_quantize_order_price(trading_pair, top_price)
+        return quantized_prices[index]
 
     cdef ClientOrderBookQueryResult c_get_vwap_for_volume(self, str trading_pair, bint is_buy, object volume):
         cdef:
@@ -1,7 +1,10 @@
+from hummingbot.connector.in_flight_order_store cimport InFlightOrderStore
+
+
 cdef class InFlightOrderBase:
     cdef:
         public str client_order_id
-        public str exchange_order_id
+        str _exchange_order_id
         public str trading_pair
         public object order_type
         public object trade_type
@@ -11,5 +14,12 @@ cdef class InFlightOrderBase:
         public object executed_amount_quote
         public str fee_asset
         public object fee_paid
-        public str last_state
+        str _last_state
         public object exchange_order_id_update_event
+        public dict latency_spans
+        # The store tracking the order, notified when the indexed fields change
+        public InFlightOrderStore _store
+        str _assets_trading_pair
+        list _assets
+
+    cdef list c_trading_pair_assets(self)
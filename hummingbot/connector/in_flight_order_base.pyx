@@ -25,6 +25,7 @@ cdef class InFlightOrderBase:
                  amount: Decimal,
                  initial_state: str):
 
+        self._store = None
         self.client_order_id = client_order_id
         self.exchange_order_id = exchange_order_id
         self.trading_pair = trading_pair
@@ -38,6 +39,8 @@ cdef class InFlightOrderBase:
         self.fee_paid = s_decimal_0
         self.last_state = initial_state
         self.exchange_order_id_update_event = asyncio.Event()
+        # Span name -> time.perf_counter() when the order first reached it, see hummingbot.connector.order_latency
+        self.latency_spans = {}
 
     def __repr__(self) -> str:
         return f"InFlightOrder(" \
@@ -54,6 +57,28 @@ cdef class InFlightOrderBase:
                f"fee_paid={self.fee_paid}, " \
                f"last_state='{self.last_state}')"
 
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, value: Optional[str]):
+        cdef str previous = self._exchange_order_id
+        self._exchange_order_id = value
+        if self._store is not None and previous != value:
+            self._store.c_index_exchange_order_id(self, previous)
+
+    @property
+    def last_state(self) -> str:
+        return self._last_state
+
+    @last_state.setter
+    def last_state(self, value: str):
+        cdef str previous = self._last_state
+        self._last_state = value
+        if self._store is not None and previous != value:
+            self._store.c_index_state(self, previous)
+
     @property
     def is_done(self) -> bool:
         raise NotImplementedError
@@ -66,13 +91,20 @@ cdef class InFlightOrderBase:
     def is_failure(self) -> bool:
         raise NotImplementedError
 
+    cdef list c_trading_pair_assets(self):
+        # Split once per trading pair rather than on every access.
+        if self._assets_trading_pair is not self.trading_pair:
+            self._assets = self.trading_pair.split("-")
+            self._assets_trading_pair = self.trading_pair
+        return self._assets
+
     @property
     def base_asset(self) -> str:
-        return self.trading_pair.split("-")[0]
+        return self.c_trading_pair_assets()[0]
 
     @property
     def quote_asset(self) -> str:
-        return self.trading_pair.split("-")[1]
+        return self.c_trading_pair_assets()[1]
 
     def update_exchange_order_id(self, exchange_id: str):
         self.exchange_order_id = exchange_id
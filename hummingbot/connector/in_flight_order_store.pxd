@@ -0,0 +1,13 @@
+cdef class InFlightOrderStore:
+    cdef:
+        dict _orders
+        dict _orders_by_exchange_order_id
+        dict _orders_by_trading_pair
+        dict _orders_by_state
+        dict _open_orders
+        object _change_listener
+
+    cdef c_add(self, str client_order_id, object order)
+    cdef object c_remove(self, str client_order_id)
+    cdef c_index_exchange_order_id(self, object order, object previous_exchange_order_id)
+    cdef c_index_state(self, object order, object previous_state)
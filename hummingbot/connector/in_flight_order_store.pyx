@@ -0,0 +1,175 @@
+"""
+In-flight orders of a connector, keyed by client order id, with indexes for the lookups of the user stream and
+polling loops.
+
+The store behaves like the Dict[client_order_id, InFlightOrderBase] connectors used to keep. On top of it, orders
+can be looked up by exchange order id, listed by trading pair or state, and the open orders (not is_done) iterated
+without going through the finished ones. Orders notify the store when their exchange order id or state is set, so
+the indexes follow the updates connectors already make.
+
+A change listener, e.g. the one of ConnectorBase keeping the in-flight locked balances, is called with the client
+order id of every order added or removed.
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+_missing = object()
+
+
+cdef c_remove_from_index(dict index, object key, str client_order_id):
+    cdef dict orders = index.get(key)
+    if orders is None:
+        return
+    orders.pop(client_order_id, None)
+    if len(orders) == 0:
+        del index[key]
+
+
+cdef class InFlightOrderStore:
+    def __init__(self, orders: Optional[Mapping[str, "InFlightOrderBase"]] = None):
+        self._orders = {}
+        self._orders_by_exchange_order_id = {}
+        self._orders_by_trading_pair = {}
+        self._orders_by_state = {}
+        self._open_orders = {}
+        self._change_listener = None
+        if orders is not None:
+            self.update(orders)
+
+    @property
+    def change_listener(self) -> Optional[Callable[[str], None]]:
+        return self._change_listener
+
+    @change_listener.setter
+    def change_listener(self, listener: Optional[Callable[[str], None]]):
+        self._change_listener = listener
+
+    def __repr__(self) -> str:
+        return f"InFlightOrderStore({self._orders!r})"
+
+    def __getitem__(self, client_order_id: str) -> "InFlightOrderBase":
+        return self._orders[client_order_id]
+
+    def __setitem__(self, client_order_id: str, order: "InFlightOrderBase"):
+        self.c_add(client_order_id, order)
+
+    def __delitem__(self, client_order_id: str):
+        if client_order_id not in self._orders:
+            raise KeyError(client_order_id)
+        self.c_remove(client_order_id)
+
+    def __contains__(self, client_order_id: str) -> bool:
+        return client_order_id in self._orders
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._orders)
+
+    def get(self, client_order_id: str, default: Optional["InFlightOrderBase"] = None) -> Optional["InFlightOrderBase"]:
+        return self._orders.get(client_order_id, default)
+
+    def keys(self):
+        return self._orders.keys()
+
+    def values(self):
+        return self._orders.values()
+
+    def items(self):
+        return self._orders.items()
+
+    def pop(self, client_order_id: str, default=_missing) -> "InFlightOrderBase":
+        if client_order_id not in self._orders:
+            if default is _missing:
+                raise KeyError(client_order_id)
+            return default
+        return self.c_remove(client_order_id)
+
+    def update(self, orders: Mapping[str, "InFlightOrderBase"]):
+        for client_order_id, order in orders.items():
+            self.c_add(client_order_id, order)
+
+    def clear(self):
+        for client_order_id in list(self._orders.keys()):
+            self.c_remove(client_order_id)
+
+    def copy(self) -> Dict[str, "InFlightOrderBase"]:
+        return self._orders.copy()
+
+    def get_by_exchange_order_id(self, exchange_order_id: str) -> Optional["InFlightOrderBase"]:
+        return self._orders_by_exchange_order_id.get(exchange_order_id)
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        """
+        The trading pairs with in-flight orders
+        """
+        return list(self._orders_by_trading_pair.keys())
+
+    def orders_for_trading_pair(self, trading_pair: str) -> List["InFlightOrderBase"]:
+        return list(self._orders_by_trading_pair.get(trading_pair, {}).values())
+
+    def orders_in_state(self, state: str) -> List["InFlightOrderBase"]:
+        return list(self._orders_by_state.get(state, {}).values())
+
+    @property
+    def open_orders(self) -> List["InFlightOrderBase"]:
+        """
+        The orders which are not done, as of their last state update
+        """
+        return list(self._open_orders.values())
+
+    cdef c_add(self, str client_order_id, object order):
+        if client_order_id in self._orders:
+            self.c_remove(client_order_id)
+        self._orders[client_order_id] = order
+        order._store = self
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        self._orders_by_trading_pair.setdefault(order.trading_pair, {})[client_order_id] = order
+        self._orders_by_state.setdefault(order.last_state, {})[client_order_id] = order
+        if not order.is_done:
+            self._open_orders[client_order_id] = order
+        if self._change_listener is not None:
+            self._change_listener(client_order_id)
+
+    cdef object c_remove(self, str client_order_id):
+        cdef object order = self._orders.pop(client_order_id)
+        if order._store is self:
+            order._store = None
+        if self._orders_by_exchange_order_id.get(order.exchange_order_id) is order:
+            del self._orders_by_exchange_order_id[order.exchange_order_id]
+        c_remove_from_index(self._orders_by_trading_pair, order.trading_pair, client_order_id)
+        c_remove_from_index(self._orders_by_state, order.last_state, client_order_id)
+        self._open_orders.pop(client_order_id, None)
+        if self._change_listener is not None:
+            self._change_listener(client_order_id)
+        return order
+
+    cdef c_index_exchange_order_id(self, object order, object previous_exchange_order_id):
+        # Copies of tracked orders keep a reference to the store.
+        if self._orders.get(order.client_order_id) is not order:
+            return
+        if self._orders_by_exchange_order_id.get(previous_exchange_order_id) is order:
+            del self._orders_by_exchange_order_id[previous_exchange_order_id]
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    cdef c_index_state(self, object order, object previous_state):
+        cdef str client_order_id = order.client_order_id
+        if self._orders.get(client_order_id) is not order:
+            return
+        c_remove_from_index(self._orders_by_state, previous_state, client_order_id)
+        self._orders_by_state.setdefault(order.last_state, {})[client_order_id] = order
+        if order.is_done:
+            self._open_orders.pop(client_order_id, None)
+        else:
+            self._open_orders[client_order_id] = order
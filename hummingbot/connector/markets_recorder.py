@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import csv
 import os.path
 import pandas as pd
 import asyncio
@@ -7,9 +8,12 @@ from sqlalchemy.orm import (
     Session,
     Query
 )
+from sqlalchemy.schema import Table
 import time
 import threading
+from urllib.parse import unquote
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -32,24 +36,72 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.metrics import (
+    metrics_registry,
+    MetricsRegistry,
+)
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_journal import MarketStateJournal
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_archive import TradeArchive
 from hummingbot.model.trade_fill import TradeFill
 
 
+_missing = object()
+
+
+def flatten_tracking_states(tracking_states: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Splits the nested tracking states, e.g. {"limit_orders": {<client order id>: <order>}}, into one key per nested
+    state, e.g. "limit_orders/<client order id>", so the journal only records the orders which changed.
+    The "/" of the top-level keys are escaped, the nested keys are kept as they are.
+    """
+    flat_states: Dict[str, Any] = {}
+    for state_key, state in tracking_states.items():
+        escaped_key: str = state_key.replace("%", "%25").replace("/", "%2F")
+        if isinstance(state, dict) and len(state) > 0 and all(isinstance(value, dict) for value in state.values()):
+            for nested_key, nested_state in state.items():
+                flat_states[f"{escaped_key}/{nested_key}"] = nested_state
+        else:
+            flat_states[escaped_key] = state
+    return flat_states
+
+
+def nest_tracking_states(flat_states: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuilds the tracking states split by flatten_tracking_states.
+    """
+    tracking_states: Dict[str, Any] = {}
+    for flat_key, state in flat_states.items():
+        escaped_key, separator, nested_key = flat_key.partition("/")
+        if separator:
+            tracking_states.setdefault(unquote(escaped_key), {})[nested_key] = state
+        else:
+            tracking_states[unquote(escaped_key)] = state
+    return tracking_states
+
+
 class MarketsRecorder:
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    # The journal of tracking state changes is folded into the MarketState row once it's longer than twice the
+    # tracking states, and at least this long.
+    MIN_JOURNAL_LENGTH_TO_COMPACT = 100
+    # In bulk insert mode, the order statuses and trade fills of the events recorded within this delay are inserted
+    # together, and committed with the other changes of the events.
+    BULK_INSERT_FLUSH_DELAY = 1.0
 
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 trade_archive: Optional[TradeArchive] = None,
+                 bulk_insert: bool = False):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -58,6 +110,13 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._trade_archive: Optional[TradeArchive] = trade_archive
+        self._bulk_insert: bool = bulk_insert
+        self._pending_rows: Dict[Table, List[Dict[str, Any]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # (config file path, market) -> the flattened saved tracking states, as of the MarketState row and its journal
+        self._saved_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._journal_lengths: Dict[Tuple[str, str], int] = {}
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -77,6 +136,13 @@ class MarketsRecorder:
             (MarketEvent.OrderExpired, self._expire_order_forwarder)
         ]
 
+        registry: MetricsRegistry = metrics_registry()
+        self._order_events_counter = registry.counter("hummingbot_order_events_total",
+                                                      "Order events recorded to the database.", ["connector", "event"])
+        self._write_duration_histogram = registry.histogram("hummingbot_markets_recorder_write_seconds",
+                                                            "Time taken to record an order event to the database.",
+                                                            ["event"])
+
     @property
     def sql(self) -> SQLConnectionManager:
         return self._sql
@@ -85,6 +151,10 @@ class MarketsRecorder:
     def session(self) -> Session:
         return self._sql.get_shared_session()
 
+    @property
+    def trade_archive(self) -> Optional[TradeArchive]:
+        return self._trade_archive
+
     @property
     def config_file_path(self) -> str:
         return self._config_file_path
@@ -106,6 +176,42 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self.flush()
+        if self._trade_archive is not None:
+            self._trade_archive.flush()
+
+    def flush(self):
+        """
+        Inserts and commits the records of the events recorded in bulk insert mode.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._insert_pending_rows()
+        self.session.commit()
+
+    def _add_record(self, record: Union[OrderStatus, TradeFill]):
+        if not self._bulk_insert:
+            self.session.add(record)
+            return
+        table: Table = record.__table__
+        self._pending_rows.setdefault(table, []).append({column.key: getattr(record, column.key)
+                                                         for column in table.columns if not column.primary_key})
+
+    def _insert_pending_rows(self):
+        pending_rows, self._pending_rows = self._pending_rows, {}
+        if len(pending_rows) == 0:
+            return
+        # Core inserts don't autoflush the session, the orders the rows refer to are inserted first.
+        self.session.flush()
+        for table, rows in pending_rows.items():
+            self._sql.bulk_insert(table, rows, self.session)
+
+    def _commit(self):
+        if not self._bulk_insert:
+            self.session.commit()
+        elif self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self.BULK_INSERT_FLUSH_DELAY, self.flush)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase) -> List[Order]:
         session: Session = self.session
@@ -117,6 +223,7 @@ class MarketsRecorder:
         return query.all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self._insert_pending_rows()
         session: Session = self.session
         query: Query = (session
                         .query(TradeFill)
@@ -128,30 +235,90 @@ class MarketsRecorder:
             return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, no_commit: bool = False):
+        """
+        Appends the tracking states which changed since the last save to the journal of the market. Nested states,
+        e.g. the orders in tracking_states["limit_orders"], are journaled one by one.
+        """
         session: Session = self.session
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        saved_states: Dict[str, Any] = self._load_saved_states(config_file_path, market)
+        tracking_states: Dict[str, Any] = flatten_tracking_states(market.tracking_states)
         timestamp: int = self.db_timestamp
+        changes: Dict[str, Any] = {state_key: state for state_key, state in tracking_states.items()
+                                   if saved_states.get(state_key, _missing) != state}
+        changes.update({state_key: None for state_key in saved_states.keys() if state_key not in tracking_states})
+
+        for state_key, state in changes.items():
+            session.add(MarketStateJournal(config_file_path=config_file_path,
+                                           market=market.display_name,
+                                           timestamp=timestamp,
+                                           key=state_key,
+                                           state=state))
+            if state is None:
+                del saved_states[state_key]
+            else:
+                saved_states[state_key] = state
+        self._journal_lengths[key] += len(changes)
+
+        if self._journal_lengths[key] >= max(self.MIN_JOURNAL_LENGTH_TO_COMPACT, 2 * len(saved_states)):
+            self.compact_market_states(config_file_path, market, no_commit=True)
+        if not no_commit:
+            session.commit()
+
+    def compact_market_states(self, config_file_path: str, market: ConnectorBase,
+                              no_commit: bool = False) -> Optional[MarketState]:
+        """
+        Writes the saved tracking states to the MarketState row of the market, and clears its journal.
+        :return: the MarketState row, or None if no state was ever saved for the market
+        """
+        session: Session = self.session
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        saved_states: Dict[str, Any] = self._load_saved_states(config_file_path, market)
+        market_states: Optional[MarketState] = self._query_market_states(config_file_path, market)
 
+        if self._journal_lengths[key] == 0:
+            return market_states
+        timestamp: int = self.db_timestamp
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = nest_tracking_states(saved_states)
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=nest_tracking_states(saved_states))
             session.add(market_states)
+        (session.query(MarketStateJournal)
+         .filter(MarketStateJournal.config_file_path == config_file_path,
+                 MarketStateJournal.market == market.display_name)
+         .delete(synchronize_session=False))
+        self._journal_lengths[key] = 0
 
         if not no_commit:
             session.commit()
+        return market_states
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market)
+        market_states: Optional[MarketState] = self.compact_market_states(config_file_path, market)
 
         if market_states is not None:
             market.restore_tracking_states(market_states.saved_state)
 
     def get_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
+        """
+        Reads the saved tracking states without writing them to the database.
+        :return: the MarketState row of the market, or a copy of it with its journal replayed when it isn't empty
+        """
+        saved_states: Dict[str, Any] = self._load_saved_states(config_file_path, market)
+        market_states: Optional[MarketState] = self._query_market_states(config_file_path, market)
+        if self._journal_lengths[(config_file_path, market.display_name)] == 0:
+            return market_states
+        return MarketState(config_file_path=config_file_path,
+                           market=market.display_name,
+                           timestamp=self.db_timestamp,
+                           saved_state=nest_tracking_states(saved_states))
+
+    def _query_market_states(self, config_file_path: str, market: ConnectorBase) -> Optional[MarketState]:
         session: Session = self.session
         query: Query = (session
                         .query(MarketState)
@@ -160,6 +327,31 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _load_saved_states(self, config_file_path: str, market: ConnectorBase) -> Dict[str, Any]:
+        key: Tuple[str, str] = (config_file_path, market.display_name)
+        if key not in self._saved_states:
+            market_states: Optional[MarketState] = self._query_market_states(config_file_path, market)
+            saved_states: Dict[str, Any] = (flatten_tracking_states(market_states.saved_state)
+                                            if market_states is not None else {})
+            journal: List[MarketStateJournal] = (self.session
+                                                 .query(MarketStateJournal)
+                                                 .filter(MarketStateJournal.config_file_path == config_file_path,
+                                                         MarketStateJournal.market == market.display_name)
+                                                 .order_by(MarketStateJournal.id)
+                                                 .all())
+            for entry in journal:
+                if entry.state is None:
+                    saved_states.pop(entry.key, None)
+                else:
+                    saved_states[entry.key] = entry.state
+            self._saved_states[key] = saved_states
+            self._journal_lengths[key] = len(journal)
+        return self._saved_states[key]
+
+    def _record_metrics(self, market: ConnectorBase, event_type: MarketEvent, start_time: float):
+        self._order_events_counter.labels(market.display_name, event_type.name).inc()
+        self._write_duration_histogram.labels(event_type.name).observe(time.perf_counter() - start_time)
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -168,6 +360,7 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
             return
 
+        start_time: float = time.perf_counter()
         session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
@@ -185,13 +378,14 @@ class MarketsRecorder:
                                     price=float(evt.price) if evt.price == evt.price else 0,
                                     last_status=event_type.name,
                                     last_update_timestamp=timestamp)
-        order_status: OrderStatus = OrderStatus(order=order_record,
+        order_status: OrderStatus = OrderStatus(order_id=evt.order_id,
                                                 timestamp=timestamp,
                                                 status=event_type.name)
         session.add(order_record)
-        session.add(order_status)
+        self._add_record(order_status)
         self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        self._commit()
+        self._record_metrics(market, event_type, start_time)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -201,6 +395,7 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
             return
 
+        start_time: float = time.perf_counter()
         session: Session = self.session
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp: int = self.db_timestamp
@@ -232,11 +427,14 @@ class MarketsRecorder:
                                                  amount=float(evt.amount),
                                                  trade_fee=TradeFee.to_json(evt.trade_fee),
                                                  exchange_trade_id=evt.exchange_trade_id)
-        session.add(order_status)
-        session.add(trade_fill_record)
+        self._add_record(order_status)
+        self._add_record(trade_fill_record)
         self.save_market_states(self._config_file_path, market, no_commit=True)
-        session.commit()
+        if self._trade_archive is not None:
+            self._trade_archive.append(trade_fill_record)
+        self._commit()
         self.append_to_csv(trade_fill_record)
+        self._record_metrics(market, event_type, start_time)
 
     def append_to_csv(self, trade: TradeFill):
         csv_file = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -245,13 +443,14 @@ class MarketsRecorder:
         age = "n/a"
         if "//" not in trade.order_id:
             age = pd.Timestamp(int(trade.timestamp / 1e3 - int(trade.order_id[-16:]) / 1e6), unit='s').strftime('%H:%M:%S')
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([["Config File", "Strategy", "Exchange", "Timestamp", "Market", "Base", "Quote",
-                                       "Trade", "Type", "Price", "Amount", "Fee", "Age", "Order ID", "Exchange Trade ID"]])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([[trade.config_file_path, trade.strategy, trade.market, trade.timestamp, trade.symbol, trade.base_asset, trade.quote_asset,
-                            trade.trade_type, trade.order_type, trade.price, trade.amount, trade.trade_fee, age, trade.order_id, trade.exchange_trade_id]])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        write_header: bool = not os.path.exists(csv_path)
+        with open(csv_path, "a", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            if write_header:
+                writer.writerow(["Config File", "Strategy", "Exchange", "Timestamp", "Market", "Base", "Quote",
+                                 "Trade", "Type", "Price", "Amount", "Fee", "Age", "Order ID", "Exchange Trade ID"])
+            writer.writerow([trade.config_file_path, trade.strategy, trade.market, trade.timestamp, trade.symbol, trade.base_asset, trade.quote_asset,
+                             trade.trade_type, trade.order_type, trade.price, trade.amount, trade.trade_fee, age, trade.order_id, trade.exchange_trade_id])
 
     def _update_order_status(self,
                              event_tag: int,
@@ -265,6 +464,7 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._update_order_status, event_tag, market, evt)
             return
 
+        start_time: float = time.perf_counter()
         session: Session = self.session
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
@@ -277,11 +477,12 @@ class MarketsRecorder:
             order_status: OrderStatus = OrderStatus(order_id=order_id,
                                                     timestamp=timestamp,
                                                     status=event_type.name)
-            session.add(order_status)
+            self._add_record(order_status)
             self.save_market_states(self._config_file_path, market, no_commit=True)
-            session.commit()
-        else:
+            self._commit()
+        elif not self._bulk_insert:
             session.rollback()
+        self._record_metrics(market, event_type, start_time)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -0,0 +1,138 @@
+"""
+Order placement latency tracing.
+
+Every in flight order keeps the time each stage of its life was first reached, in latency_spans. Recording a stage
+through OrderLatencyStats also adds the time since the previous recorded stage, and since the strategy decision, to
+per exchange and per order type samples, summarized as latency percentiles.
+
+Connectors placing their orders in a coroutine only start tracking them after the strategy decision and submit. These
+stages are kept as pending spans of the order id, and recorded on the in flight order along with its next stage.
+"""
+
+from collections import (
+    deque,
+    OrderedDict,
+)
+import numpy as np
+import pandas as pd
+import time
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+
+# The stages of an order, in the order they're expected to happen.
+DECISION = "decision"
+SUBMIT = "submit"
+REST_SEND = "rest_send"
+REST_RESPONSE = "rest_response"
+FIRST_USER_STREAM_EVENT = "first_user_stream_event"
+FILL = "fill"
+HEDGE_SUBMIT = "hedge_submit"
+SPANS: Tuple[str, ...] = (DECISION, SUBMIT, REST_SEND, REST_RESPONSE, FIRST_USER_STREAM_EVENT, FILL, HEDGE_SUBMIT)
+
+DEFAULT_MAX_SAMPLES = 10000
+# Orders which are never tracked, e.g. rejected before being sent, don't keep their pending spans forever.
+DEFAULT_MAX_PENDING_ORDERS = 1000
+
+_stats = None
+
+
+class OrderLatencyStats:
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES, max_pending_orders: int = DEFAULT_MAX_PENDING_ORDERS):
+        self._max_samples: int = max_samples
+        self._max_pending_orders: int = max_pending_orders
+        # (exchange, order type, interval) -> latest latencies in seconds
+        self._samples: Dict[Tuple[str, str, str], Deque[float]] = {}
+        # client order id -> spans reached before the order was tracked, oldest orders first
+        self._pending_spans: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+    @property
+    def max_pending_orders(self) -> int:
+        return self._max_pending_orders
+
+    @property
+    def pending_order_count(self) -> int:
+        return len(self._pending_spans)
+
+    def record_pending_span(self, order_id: str, span: str, timestamp: Optional[float] = None):
+        """
+        Records a span of an order which isn't tracked yet by its connector. The span is recorded on the in flight
+        order before the next span of the order.
+
+        :param timestamp: time.perf_counter() when the span was reached, now if None
+        """
+        spans: Optional[Dict[str, float]] = self._pending_spans.get(order_id)
+        if spans is None:
+            spans = self._pending_spans[order_id] = {}
+            if len(self._pending_spans) > self._max_pending_orders:
+                self._pending_spans.popitem(last=False)
+        if span not in spans:
+            spans[span] = time.perf_counter() if timestamp is None else timestamp
+
+    def record_span(self, exchange: str, order: InFlightOrderBase, span: str, timestamp: Optional[float] = None):
+        """
+        Records the first time the order reached the span. Later records of the same span are ignored.
+
+        :param timestamp: time.perf_counter() when the span was reached, now if None
+        """
+        pending_spans: Optional[Dict[str, float]] = self._pending_spans.pop(order.client_order_id, None)
+        if pending_spans is not None:
+            for pending_span in SPANS:
+                if pending_span in pending_spans:
+                    self.record_span(exchange, order, pending_span, pending_spans[pending_span])
+
+        spans: Dict[str, float] = order.latency_spans
+        if span in spans:
+            return
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        spans[span] = timestamp
+
+        span_index: int = SPANS.index(span)
+        order_type: str = order.order_type.name
+        previous_span: Optional[str] = next((s for s in reversed(SPANS[:span_index]) if s in spans), None)
+        if previous_span is not None:
+            self._add_sample(exchange, order_type, f"{previous_span}->{span}", timestamp - spans[previous_span])
+        if span != DECISION and previous_span != DECISION and DECISION in spans:
+            self._add_sample(exchange, order_type, f"{DECISION}->{span}", timestamp - spans[DECISION])
+
+    def _add_sample(self, exchange: str, order_type: str, interval: str, latency: float):
+        key: Tuple[str, str, str] = (exchange, order_type, interval)
+        samples: Optional[Deque[float]] = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._max_samples)
+        samples.append(latency)
+
+    def reset(self):
+        self._samples.clear()
+        self._pending_spans.clear()
+
+    def samples_data_frame(self) -> pd.DataFrame:
+        rows: List[Tuple[str, str, str, float]] = [
+            (exchange, order_type, interval, latency * 1e3)
+            for (exchange, order_type, interval), samples in self._samples.items()
+            for latency in samples
+        ]
+        return pd.DataFrame(rows, columns=["exchange", "order_type", "interval", "latency_ms"])
+
+    def summary_data_frame(self) -> pd.DataFrame:
+        rows: List[List] = []
+        for (exchange, order_type, interval), samples in sorted(self._samples.items()):
+            latencies_ms: np.ndarray = np.array(samples) * 1e3
+            p50, p90, p99 = np.percentile(latencies_ms, [50, 90, 99])
+            rows.append([exchange, order_type, interval, len(latencies_ms), p50, p90, p99, latencies_ms.max()])
+        return pd.DataFrame(rows, columns=["exchange", "order_type", "interval", "count", "p50_ms", "p90_ms",
+                                           "p99_ms", "max_ms"])
+
+
+def order_latency_stats() -> OrderLatencyStats:
+    global _stats
+    if _stats is None:
+        _stats = OrderLatencyStats()
+    return _stats
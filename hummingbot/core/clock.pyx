@@ -5,12 +5,39 @@ import logging
 import time
 from typing import List
 
+from libc.stdint cimport int64_t
+
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.profiling cimport (
+    c_now_ns,
+    HotPathProfiler,
+)
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+cdef HotPathProfiler _profiler = None
+
+
+def set_profiler(HotPathProfiler profiler):
+    """
+    Times the ticks of every child iterator with the profiler, or stops timing them if profiler is None.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+cdef inline c_tick_iterator(TimeIterator child_iterator, double timestamp):
+    cdef:
+        HotPathProfiler profiler = _profiler
+        int64_t start_ns
+    if profiler is None:
+        child_iterator.c_tick(timestamp)
+        return
+    start_ns = c_now_ns()
+    child_iterator.c_tick(timestamp)
+    profiler.c_tick_histogram(child_iterator).c_record(c_now_ns() - start_ns)
 
 
 cdef class Clock:
@@ -116,7 +143,7 @@ cdef class Clock:
                 for ci in self._current_context:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        c_tick_iterator(child_iterator, self._current_tick)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
@@ -142,7 +169,7 @@ cdef class Clock:
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        c_tick_iterator(child_iterator, self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
@@ -1,8 +1,23 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.event.event_listener cimport EventListener
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        OrderBook _source_order_book
+        EventListener _source_update_listener
+        EventListener _source_trade_listener
 
+    cdef c_did_update_source(self)
+    cdef c_copy_original_entries(self,
+                                 bint is_bid,
+                                 double limit_price,
+                                 size_t max_levels,
+                                 vector[OrderBookEntry] *entries)
+    cdef c_copy_entries(self, bint is_bid, double limit_price, size_t max_levels, vector[OrderBookEntry] *entries)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef int64_t c_get_version(self)
@@ -2,36 +2,86 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 from typing import Iterator
+from libc.stdint cimport SIZE_MAX
 from libcpp.set cimport set
 from cython.operator cimport(
     postincrement as inc,
     dereference as deref,
-    address as ref
 )
 from libcpp.vector cimport vector
 
+from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 
+NaN = float("nan")
+
+cdef class SourceOrderBookUpdateListener(EventListener):
+    cdef:
+        CompositeOrderBook _owner
+
+    def __init__(self, CompositeOrderBook owner):
+        super().__init__()
+        self._owner = owner
+
+    cdef c_call(self, object order_book):
+        self._owner.c_did_update_source()
+
+
+cdef class SourceOrderBookTradeListener(EventListener):
+    cdef:
+        CompositeOrderBook _owner
+
+    def __init__(self, CompositeOrderBook owner):
+        super().__init__()
+        self._owner = owner
+
+    cdef c_call(self, object trade_event):
+        self._owner.c_apply_trade(trade_event)
+
 
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
     Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    Given a source order book, e.g. the one of a tracker shared with live connectors, the composite order book reads
+    the entries of the source, without copying them, and follows its trades. The recorded orders stay in the composite
+    order book.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._source_order_book = order_book
+        if order_book is not None:
+            self._source_update_listener = SourceOrderBookUpdateListener(self)
+            self._source_trade_listener = SourceOrderBookTradeListener(self)
+            order_book.c_add_listener(self.ORDER_BOOK_UPDATE_EVENT_TAG, self._source_update_listener)
+            order_book.c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG, self._source_trade_listener)
+            self.c_did_update_source()
 
     @property
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
 
+    @property
+    def source_order_book(self) -> OrderBook:
+        return self._source_order_book
+
+    cdef c_did_update_source(self):
+        # The trackers also update the last trade prices through their REST APIs, without trade events.
+        self._last_trade_price = self._source_order_book._last_trade_price
+        self._snapshot_uid = self._source_order_book._snapshot_uid
+        self._last_diff_uid = self._source_order_book._last_diff_uid
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._version += 1
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,27 +125,30 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        # The composite entries changed, e.g. the strategies reading the top of the book need to update.
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
+        if self._source_order_book is not None:
+            return self._source_order_book.bid_entries()
         return super().bid_entries()
 
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
+        if self._source_order_book is not None:
+            return self._source_order_book.ask_entries()
         return super().ask_entries()
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
             set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
             OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
             vector[OrderBookEntry] cpp_asks_changes
             vector[OrderBookEntry] cpp_bids_changes
 
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
+        for original_order_row in self.original_bid_entries():
+            original_order_price = original_order_row.price
+            original_order_amount = original_order_row.amount
+            original_order_update_id = original_order_row.update_id
 
             while traded_order_it != self._traded_order_book._bid_book.rend():
                 traded_order_entry = deref(traded_order_it)
@@ -127,24 +180,19 @@ cdef class CompositeOrderBook(OrderBook):
             else:
                 yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
 
-            inc(order_it)
-
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
             set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
             OrderBookEntry traded_order_entry
             vector[OrderBookEntry] cpp_asks_changes
             vector[OrderBookEntry] cpp_bids_changes
 
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
+        for original_order_row in self.original_ask_entries():
+            original_order_price = original_order_row.price
+            original_order_amount = original_order_row.amount
+            original_order_update_id = original_order_row.update_id
 
             while traded_order_it != self._traded_order_book._ask_book.end():
                 traded_order_entry = deref(traded_order_it)
@@ -175,24 +223,77 @@ cdef class CompositeOrderBook(OrderBook):
             else:
                 yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
 
-            inc(order_it)
-
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_copy_original_entries(self,
+                                 bint is_bid,
+                                 double limit_price,
+                                 size_t max_levels,
+                                 vector[OrderBookEntry] *entries):
+        if self._source_order_book is not None:
+            self._source_order_book.c_copy_entries(is_bid, limit_price, max_levels, entries)
+        else:
+            OrderBook.c_copy_entries(self, is_bid, limit_price, max_levels, entries)
+
+    cdef c_copy_entries(self, bint is_bid, double limit_price, size_t max_levels, vector[OrderBookEntry] *entries):
+        """
+        Same as OrderBook.c_copy_entries(), on the composite entries: the recorded filled amounts are subtracted from
+        the levels at the same price, and the levels filled entirely are skipped. The traded order book is left as is.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator traded_bid_it = self._traded_order_book._bid_book.rbegin()
+            set[OrderBookEntry].iterator traded_ask_it = self._traded_order_book._ask_book.begin()
+            size_t traded_levels = (self._traded_order_book._bid_book.size() if is_bid
+                                    else self._traded_order_book._ask_book.size())
+            vector[OrderBookEntry] original_entries
+            double price
+            double amount
+            size_t count = 0
+            size_t i
+
+        # Each recorded filled order skips at most one level of the original entries.
+        self.c_copy_original_entries(is_bid, limit_price,
+                                     max_levels + traded_levels if max_levels < SIZE_MAX - traded_levels else SIZE_MAX,
+                                     &original_entries)
+        for i in range(original_entries.size()):
+            if count >= max_levels:
+                break
+            price = original_entries[i].getPrice()
+            amount = original_entries[i].getAmount()
+            if is_bid:
+                # Recorded filled orders above this level are outside of the bid price range
+                while (traded_bid_it != self._traded_order_book._bid_book.rend() and
+                       deref(traded_bid_it).getPrice() > price):
+                    inc(traded_bid_it)
+                if (traded_bid_it != self._traded_order_book._bid_book.rend() and
+                        deref(traded_bid_it).getPrice() == price):
+                    amount -= deref(traded_bid_it).getAmount()
+                    inc(traded_bid_it)
+            else:
+                # Recorded filled orders below this level are outside of the ask price range
+                while (traded_ask_it != self._traded_order_book._ask_book.end() and
+                       deref(traded_ask_it).getPrice() < price):
+                    inc(traded_ask_it)
+                if (traded_ask_it != self._traded_order_book._ask_book.end() and
+                        deref(traded_ask_it).getPrice() == price):
+                    amount -= deref(traded_ask_it).getAmount()
+                    inc(traded_ask_it)
+            if amount > 0:
+                entries.push_back(OrderBookEntry(price, amount, original_entries[i].getUpdateId()))
+                count += 1
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
+            vector[OrderBookEntry] entries
+        self.c_copy_entries(not is_buy, NaN, 1, &entries)
+        if entries.size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return entries[0].getPrice()
 
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+    cdef int64_t c_get_version(self):
+        # Recorded fills change the composite entries too.
+        cdef:
+            int64_t version = self._version + self._traded_order_book.c_get_version()
+        if self._source_order_book is not None:
+            version += self._source_order_book.c_get_version()
+        return version
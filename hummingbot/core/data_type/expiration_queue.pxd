@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from libcpp.set cimport set as cpp_set
+
+from hummingbot.core.data_type.OrderExpirationEntry cimport OrderExpirationEntry as CPPOrderExpirationEntry
+
+ctypedef cpp_set[CPPOrderExpirationEntry] ExpirationSet
+ctypedef cpp_set[CPPOrderExpirationEntry].iterator ExpirationSetIterator
+
+
+cdef class ExpirationQueue:
+    cdef:
+        ExpirationSet _expiration_set
+        dict _expirations
+
+    cdef c_push(self, str key, double timestamp, double expiration_timestamp)
+    cdef bint c_remove(self, str key)
+    cdef bint c_contains(self, str key)
+    cdef double c_next_expiration(self)
+    cdef list c_pop_expired(self, double timestamp)
@@ -0,0 +1,86 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderExpirationEntry.cpp
+
+from cython.operator cimport dereference as deref
+from libc.math cimport isnan
+from libcpp.string cimport string
+from typing import List
+
+NaN = float("nan")
+
+
+cdef class ExpirationQueue:
+    """
+    Keys ordered by their expiration timestamps, so the ones due can be popped without scanning every tracked key.
+    Pushing, removing and popping each cost O(log n).
+    """
+    def __init__(self):
+        self._expirations = {}
+
+    def __len__(self) -> int:
+        return len(self._expirations)
+
+    def __contains__(self, key: str) -> bool:
+        return self.c_contains(key)
+
+    def push(self, key: str, timestamp: float, expiration_timestamp: float):
+        self.c_push(key, timestamp, expiration_timestamp)
+
+    def remove(self, key: str) -> bool:
+        return self.c_remove(key)
+
+    def next_expiration(self) -> float:
+        return self.c_next_expiration()
+
+    def pop_expired(self, timestamp: float) -> List[str]:
+        return self.c_pop_expired(timestamp)
+
+    cdef c_push(self, str key, double timestamp, double expiration_timestamp):
+        """
+        Schedules the key to expire at expiration_timestamp, replacing its previous expiration if there's one.
+        A NaN expiration timestamp, e.g. pushed before the clock started, never expires.
+        """
+        self.c_remove(key)
+        self._expirations[key] = expiration_timestamp
+        # NaN doesn't compare with the other timestamps, it would break the ordering of the set.
+        if isnan(expiration_timestamp):
+            return
+        self._expiration_set.insert(CPPOrderExpirationEntry(b"", key.encode("utf8"), timestamp, expiration_timestamp))
+
+    cdef bint c_remove(self, str key):
+        cdef:
+            object expiration_timestamp = self._expirations.pop(key, None)
+            CPPOrderExpirationEntry entry
+        if expiration_timestamp is None:
+            return False
+        if isnan(expiration_timestamp):
+            return True
+        # Entries are ordered by expiration timestamp and key only, so this finds the pushed entry.
+        entry = CPPOrderExpirationEntry(b"", key.encode("utf8"), 0, expiration_timestamp)
+        self._expiration_set.erase(entry)
+        return True
+
+    cdef bint c_contains(self, str key):
+        return key in self._expirations
+
+    cdef double c_next_expiration(self):
+        if self._expiration_set.empty():
+            return NaN
+        return deref(self._expiration_set.begin()).getExpirationTimestamp()
+
+    cdef list c_pop_expired(self, double timestamp):
+        """
+        Removes and returns the keys expiring strictly before timestamp, earliest first.
+        """
+        cdef:
+            list expired_keys = []
+            ExpirationSetIterator it = self._expiration_set.begin()
+            string cpp_key
+            str key
+        while it != self._expiration_set.end() and deref(it).getExpirationTimestamp() < timestamp:
+            cpp_key = deref(it).getClientOrderID()
+            key = cpp_key.decode("utf8")
+            expired_keys.append(key)
+            del self._expirations[key]
+            it = self._expiration_set.erase(it)
+        return expired_keys
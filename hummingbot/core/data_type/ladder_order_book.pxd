@@ -0,0 +1,43 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.map cimport map
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from .order_book cimport OrderBook
+
+
+cdef struct LadderLevel:
+    double price
+    double amount
+    int64_t update_id
+    bint occupied
+
+
+cdef class PriceLadder:
+    cdef double _tick_size
+    cdef bint _is_bid
+    cdef int64_t _window_size
+    cdef int64_t _base_tick
+    cdef vector[LadderLevel] _levels
+    cdef map[int64_t, LadderLevel] _sparse_levels
+    cdef int64_t _best_tick
+    cdef size_t _size
+
+    cdef int64_t c_tick(self, double price)
+    cdef LadderLevel *c_level(self, int64_t tick)
+    cdef c_clear(self, int64_t touch_tick)
+    cdef c_recenter(self, int64_t touch_tick)
+    cdef bint c_touch_in_window(self)
+    cdef c_set_level(self, const OrderBookEntry &entry, bint replace)
+    cdef c_remove_level(self, int64_t tick)
+    cdef bint c_next_tick(self, int64_t tick, int64_t *next_tick)
+    cdef bint c_deeper_tick(self, int64_t tick, int64_t *next_tick)
+
+
+cdef class LadderOrderBook(OrderBook):
+    cdef PriceLadder _bid_ladder
+    cdef PriceLadder _ask_ladder
+
+    cdef c_truncate_overlap_levels(self)
+    cdef c_record_best_prices(self)
@@ -0,0 +1,489 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from cython.operator cimport(
+    predecrement as dec,
+    dereference as deref
+)
+from libc.math cimport llround
+from libc.stdint cimport SIZE_MAX
+from typing import Iterator
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from .order_book_query_result cimport OrderBookQueryResult
+
+NaN = float("nan")
+DEFAULT_WINDOW_SIZE = 4096
+
+
+cdef class PriceLadder:
+    """
+    One side of a LadderOrderBook. The levels are indexed by their tick, price / tick_size.
+
+    The ticks within a window around the top of the book are stored in a contiguous array, so updating a level never
+    allocates and walking the book reads consecutive memory. The ticks outside of the window, far from the touch, go
+    to a sparse map. The window is moved whenever the top of the book leaves it.
+    """
+    def __init__(self, double tick_size, bint is_bid, int64_t window_size=DEFAULT_WINDOW_SIZE):
+        if not tick_size > 0:
+            raise ValueError(f"Tick size must be positive, got {tick_size}.")
+        if window_size < 8:
+            raise ValueError(f"Window size must be at least 8 ticks, got {window_size}.")
+        self._tick_size = tick_size
+        self._is_bid = is_bid
+        self._window_size = window_size
+        self._best_tick = 0
+        self.c_clear(0)
+
+    @property
+    def tick_size(self) -> float:
+        return self._tick_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    cdef int64_t c_tick(self, double price):
+        return llround(price / self._tick_size)
+
+    cdef LadderLevel *c_level(self, int64_t tick):
+        """
+        :return: the level at the tick, or NULL if there's none
+        """
+        cdef:
+            int64_t index = tick - self._base_tick
+            map[int64_t, LadderLevel].iterator it
+
+        if 0 <= index < self._window_size:
+            if self._levels[index].occupied:
+                return &self._levels[index]
+            return NULL
+        it = self._sparse_levels.find(tick)
+        if it == self._sparse_levels.end():
+            return NULL
+        return &deref(it).second
+
+    cdef c_clear(self, int64_t touch_tick):
+        """
+        Removes all the levels, and places the window around touch_tick, with most of it on the deep side of the book.
+        """
+        cdef:
+            LadderLevel empty_level
+            int64_t margin = self._window_size // 8
+
+        empty_level.price = empty_level.amount = 0
+        empty_level.update_id = 0
+        empty_level.occupied = False
+        self._base_tick = touch_tick - self._window_size + margin if self._is_bid else touch_tick - margin
+        self._levels.assign(self._window_size, empty_level)
+        self._sparse_levels.clear()
+        self._size = 0
+
+    cdef c_recenter(self, int64_t touch_tick):
+        cdef:
+            vector[OrderBookEntry] entries
+            int64_t tick = self._best_tick
+            bint has_level = self._size > 0
+            LadderLevel *level
+
+        while has_level:
+            level = self.c_level(tick)
+            entries.push_back(OrderBookEntry(level.price, level.amount, level.update_id))
+            has_level = self.c_deeper_tick(tick, &tick)
+        self.c_clear(touch_tick)
+        for entry in entries:
+            self.c_set_level(entry, True)
+
+    cdef bint c_touch_in_window(self):
+        return self._size == 0 or 0 <= self._best_tick - self._base_tick < self._window_size
+
+    cdef c_set_level(self, const OrderBookEntry &entry, bint replace):
+        """
+        Adds or replaces the level at the tick of the entry. An existing level is kept if replace is False.
+        """
+        cdef:
+            int64_t tick = self.c_tick(entry.getPrice())
+            int64_t index = tick - self._base_tick
+            LadderLevel *level
+            LadderLevel new_level
+            map[int64_t, LadderLevel].iterator it
+
+        if 0 <= index < self._window_size:
+            level = &self._levels[index]
+            if level.occupied:
+                if not replace:
+                    return
+            else:
+                self._size += 1
+            level.price = entry.getPrice()
+            level.amount = entry.getAmount()
+            level.update_id = entry.getUpdateId()
+            level.occupied = True
+        else:
+            it = self._sparse_levels.find(tick)
+            if it != self._sparse_levels.end():
+                if not replace:
+                    return
+            else:
+                self._size += 1
+            new_level.price = entry.getPrice()
+            new_level.amount = entry.getAmount()
+            new_level.update_id = entry.getUpdateId()
+            new_level.occupied = True
+            self._sparse_levels[tick] = new_level
+
+        if self._size == 1 or (tick > self._best_tick if self._is_bid else tick < self._best_tick):
+            self._best_tick = tick
+
+    cdef c_remove_level(self, int64_t tick):
+        cdef:
+            int64_t index = tick - self._base_tick
+            map[int64_t, LadderLevel].iterator it
+
+        if 0 <= index < self._window_size:
+            if not self._levels[index].occupied:
+                return
+            self._levels[index].occupied = False
+        else:
+            it = self._sparse_levels.find(tick)
+            if it == self._sparse_levels.end():
+                return
+            self._sparse_levels.erase(it)
+        self._size -= 1
+
+        if self._size > 0 and tick == self._best_tick:
+            self.c_next_tick(tick, &self._best_tick)
+
+    cdef bint c_next_tick(self, int64_t tick, int64_t *next_tick):
+        """
+        Finds the first level at tick or deeper in the book, i.e. at a lower tick for bids and a higher one for asks.
+
+        :return: False if there's no such level
+        """
+        cdef:
+            map[int64_t, LadderLevel].iterator it
+            bint sparse_found = False
+            int64_t sparse_tick = 0
+            int64_t index
+            int64_t stop_index
+            LadderLevel *levels = self._levels.data()
+
+        # The closest sparse level bounds the scan of the window.
+        if self._is_bid:
+            it = self._sparse_levels.upper_bound(tick)
+            if it != self._sparse_levels.begin():
+                dec(it)
+                sparse_found = True
+                sparse_tick = deref(it).first
+            index = min(tick - self._base_tick, self._window_size - 1)
+            stop_index = max(sparse_tick - self._base_tick, -1) if sparse_found else -1
+            while index > stop_index:
+                if levels[index].occupied:
+                    next_tick[0] = self._base_tick + index
+                    return True
+                index -= 1
+        else:
+            it = self._sparse_levels.lower_bound(tick)
+            if it != self._sparse_levels.end():
+                sparse_found = True
+                sparse_tick = deref(it).first
+            index = max(tick - self._base_tick, 0)
+            stop_index = (min(sparse_tick - self._base_tick, self._window_size) if sparse_found
+                          else self._window_size)
+            while index < stop_index:
+                if levels[index].occupied:
+                    next_tick[0] = self._base_tick + index
+                    return True
+                index += 1
+
+        if sparse_found:
+            next_tick[0] = sparse_tick
+        return sparse_found
+
+    cdef bint c_deeper_tick(self, int64_t tick, int64_t *next_tick):
+        return self.c_next_tick(tick - 1 if self._is_bid else tick + 1, next_tick)
+
+
+cdef class LadderOrderBook(OrderBook):
+    """
+    Order book storing its levels in tick indexed price ladders instead of sets, for trading pairs with a known tick
+    size. It has the same update and query API as OrderBook, and the same rules for overlapping bids and asks.
+
+    The tick size must divide the price increment of the trading pair, prices falling within the same tick are
+    stored as one level.
+
+    It's selected per order book tracker, e.g.
+    data_source.order_book_create_function = lambda: LadderOrderBook(0.01)
+    """
+    def __init__(self, double tick_size, dex=False, int64_t window_size=DEFAULT_WINDOW_SIZE):
+        super().__init__(dex=dex)
+        self._bid_ladder = PriceLadder(tick_size, True, window_size)
+        self._ask_ladder = PriceLadder(tick_size, False, window_size)
+
+    @property
+    def tick_size(self) -> float:
+        return self._bid_ladder._tick_size
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            if bid.getAmount() > 0:
+                self._bid_ladder.c_set_level(bid, True)
+            else:
+                self._bid_ladder.c_remove_level(self._bid_ladder.c_tick(bid.getPrice()))
+        for ask in asks:
+            if ask.getAmount() > 0:
+                self._ask_ladder.c_set_level(ask, True)
+            else:
+                self._ask_ladder.c_remove_level(self._ask_ladder.c_tick(ask.getPrice()))
+
+        self.c_truncate_overlap_levels()
+
+        # Move the windows along with the market.
+        if not self._bid_ladder.c_touch_in_window():
+            self._bid_ladder.c_recenter(self._bid_ladder._best_tick)
+        if not self._ask_ladder.c_touch_in_window():
+            self._ask_ladder.c_recenter(self._ask_ladder._best_tick)
+
+        self.c_record_best_prices()
+        self._last_diff_uid = update_id
+        self._version += 1
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double best_bid_price = NaN
+            double best_ask_price = NaN
+
+        for bid in bids:
+            if not (bid.getPrice() <= best_bid_price):
+                best_bid_price = bid.getPrice()
+        for ask in asks:
+            if not (ask.getPrice() >= best_ask_price):
+                best_ask_price = ask.getPrice()
+
+        # Start with empty ladders centered on the new top of the book, and then insert all entries. Like set
+        # insertions, the first entry at a price is kept.
+        self._bid_ladder.c_clear(self._bid_ladder.c_tick(best_bid_price) if bids.size() > 0 else 0)
+        self._ask_ladder.c_clear(self._ask_ladder.c_tick(best_ask_price) if asks.size() > 0 else 0)
+        for bid in bids:
+            self._bid_ladder.c_set_level(bid, False)
+        for ask in asks:
+            self._ask_ladder.c_set_level(ask, False)
+
+        if self._dex:
+            self.c_truncate_overlap_levels()
+
+        self._best_bid = self._best_ask = NaN
+        self.c_record_best_prices()
+        self._snapshot_uid = update_id
+        self._version += 1
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef c_apply_order_book(self, OrderBook order_book):
+        """
+        Replaces the levels with the entries of another order book, whichever its backend, keeping the listeners of
+        this one.
+        """
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        order_book.c_copy_entries(True, NaN, SIZE_MAX, &bids)
+        order_book.c_copy_entries(False, NaN, SIZE_MAX, &asks)
+        self._last_diff_uid = order_book._last_diff_uid
+        self.c_apply_snapshot(bids, asks, order_book._snapshot_uid)
+
+    cdef c_truncate_overlap_levels(self):
+        """
+        Removes the overlapping top levels like truncateOverlapEntries() does. Centralised: the newer level wins, dex:
+        the level with the larger notional wins.
+        """
+        cdef:
+            LadderLevel *top_bid
+            LadderLevel *top_ask
+            bint keep_bid
+
+        while self._bid_ladder._size > 0 and self._ask_ladder._size > 0:
+            top_bid = self._bid_ladder.c_level(self._bid_ladder._best_tick)
+            top_ask = self._ask_ladder.c_level(self._ask_ladder._best_tick)
+            if top_bid.price < top_ask.price:
+                break
+            if self._dex:
+                keep_bid = top_bid.amount * top_bid.price > top_ask.amount * top_ask.price
+            else:
+                keep_bid = top_bid.update_id > top_ask.update_id
+            if keep_bid:
+                self._ask_ladder.c_remove_level(self._ask_ladder._best_tick)
+            else:
+                self._bid_ladder.c_remove_level(self._bid_ladder._best_tick)
+
+    cdef c_record_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if self._bid_ladder._size > 0:
+            self._best_bid = self._bid_ladder.c_level(self._bid_ladder._best_tick).price
+        if self._ask_ladder._size > 0:
+            self._best_ask = self._ask_ladder.c_level(self._ask_ladder._best_tick).price
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        return self._ladder_entries(self._bid_ladder)
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        return self._ladder_entries(self._ask_ladder)
+
+    def _ladder_entries(self, PriceLadder ladder) -> Iterator[OrderBookRow]:
+        cdef:
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel level
+
+        # The level is copied before yielding and the walk goes on from its tick, so it stays valid if the book is
+        # updated in between.
+        while has_level:
+            level = deref(ladder.c_level(tick))
+            yield OrderBookRow(level.price, level.amount, level.update_id)
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+    cdef c_copy_entries(self, bint is_bid, double limit_price, size_t max_levels, vector[OrderBookEntry] *entries):
+        cdef:
+            PriceLadder ladder = self._bid_ladder if is_bid else self._ask_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            size_t count = 0
+            LadderLevel *level
+
+        while has_level and count < max_levels:
+            level = ladder.c_level(tick)
+            if (level.price < limit_price) if is_bid else (level.price > limit_price):
+                break
+            entries.push_back(OrderBookEntry(level.price, level.amount, level.update_id))
+            count += 1
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if (self._ask_ladder._size if is_buy else self._bid_ladder._size) < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while has_level:
+            level = ladder.c_level(tick)
+            cumulative_volume += level.amount
+            if cumulative_volume >= volume:
+                result_price = level.price
+                break
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+            double incremental_amount
+
+        while has_level:
+            level = ladder.c_level(tick)
+            total_cost += level.amount * level.price
+            total_volume += level.amount
+            if total_volume >= volume:
+                total_cost -= level.amount * level.price
+                total_volume -= level.amount
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * level.price
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+                break
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while has_level:
+            level = ladder.c_level(tick)
+            cumulative_volume += level.amount * level.price
+            if cumulative_volume >= quote_volume:
+                result_price = level.price
+                break
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        while has_level:
+            level = ladder.c_level(tick)
+            row_amount = level.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * level.price
+            if cumulative_base_amount >= base_amount:
+                break
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while has_level:
+            level = ladder.c_level(tick)
+            if (level.price > price) if is_buy else (level.price < price):
+                break
+            cumulative_volume += level.amount
+            result_price = level.price
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            PriceLadder ladder = self._ask_ladder if is_buy else self._bid_ladder
+            int64_t tick = ladder._best_tick
+            bint has_level = ladder._size > 0
+            LadderLevel *level
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        while has_level:
+            level = ladder.c_level(tick)
+            if (level.price > price) if is_buy else (level.price < price):
+                break
+            cumulative_volume += level.amount * level.price
+            result_price = level.price
+            has_level = ladder.c_deeper_tick(tick, &tick)
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
@@ -14,6 +14,7 @@ cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _ask_book
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
+    cdef int64_t _version
     cdef double _best_bid
     cdef double _best_ask
     cdef double _last_trade_price
@@ -23,13 +24,17 @@ cdef class OrderBook(PubSub):
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_order_book(self, OrderBook order_book)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_apply_trade_price(self, double price)
+    cdef int64_t c_get_version(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_copy_entries(self, bint is_bid, double limit_price, size_t max_levels, vector[OrderBookEntry] *entries)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
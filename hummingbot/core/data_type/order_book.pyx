@@ -5,12 +5,11 @@ from cython.operator cimport(
     dereference as deref,
     address as ref
 )
+from libc.stdint cimport SIZE_MAX
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
-from hummingbot.core.event.events import (
-    OrderBookEvent,
-    OrderBookTradeEvent
-)
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.event.order_book_trade_event cimport OrderBookTradeEvent
 from typing import (
     List,
     Iterator,
@@ -35,6 +34,7 @@ NaN = float("nan")
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,6 +47,7 @@ cdef class OrderBook(PubSub):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._version = 0
         self._best_bid = self._best_ask = float("NaN")
         self._last_trade_price = float("NaN")
         self._last_applied_trade = -1000.0
@@ -92,6 +93,10 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
+
+        # Listeners receive the order book itself, so no event object is created per diff.
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,12 +137,57 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
+
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
+
+    cdef c_apply_order_book(self, OrderBook order_book):
+        """
+        Replaces the entries of the order book with the ones of another order book, e.g. one just initialized from a new
+        snapshot, keeping the listeners of this one.
+        """
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+        if type(order_book) is not OrderBook:
+            # Other backends, e.g. ladder or composite order books, don't keep their entries in the sets.
+            order_book.c_copy_entries(True, NaN, SIZE_MAX, &bids)
+            order_book.c_copy_entries(False, NaN, SIZE_MAX, &asks)
+            self._last_diff_uid = order_book._last_diff_uid
+            self.c_apply_snapshot(bids, asks, order_book._snapshot_uid)
+            return
+        self._bid_book = order_book._bid_book
+        self._ask_book = order_book._ask_book
+        self._best_bid = order_book._best_bid
+        self._best_ask = order_book._best_ask
+        self._snapshot_uid = order_book._snapshot_uid
+        self._last_diff_uid = order_book._last_diff_uid
+        self._version += 1
+
+        self.c_trigger_event(self.ORDER_BOOK_UPDATE_EVENT_TAG, self)
 
     cdef c_apply_trade(self, object trade_event):
-        self._last_trade_price = trade_event.price
-        self._last_applied_trade = time.perf_counter()
+        if isinstance(trade_event, OrderBookTradeEvent):
+            self.c_apply_trade_price((<OrderBookTradeEvent>trade_event).price)
+        else:
+            self.c_apply_trade_price(trade_event.price)
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_apply_trade_price(self, double price):
+        self._last_trade_price = price
+        self._last_applied_trade = time.perf_counter()
+
+    cdef int64_t c_get_version(self):
+        return self._version
+
+    @property
+    def version(self) -> int:
+        """
+        Increases every time the entries of the order book change, values derived from the entries can be cached until
+        it does.
+        """
+        return self.c_get_version()
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -194,9 +244,18 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
-    def apply_trade(self, trade: OrderBookTradeEvent):
+    def apply_order_book(self, OrderBook order_book):
+        self.c_apply_order_book(order_book)
+
+    def apply_trade(self, object trade):
         self.c_apply_trade(trade)
 
+    def apply_trade_price(self, price: float):
+        """
+        Records a trade without emitting a trade event, for when nobody listens to the trade events.
+        """
+        self.c_apply_trade_price(price)
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
@@ -305,6 +364,33 @@ cdef class OrderBook(PubSub):
                 break
         return retval
 
+    cdef c_copy_entries(self, bint is_bid, double limit_price, size_t max_levels, vector[OrderBookEntry] *entries):
+        """
+        Appends at most max_levels entries of one side of the book to entries, from the top of the book and down to
+        limit_price included. A NaN limit_price doesn't limit the walk.
+
+        Strategies walking the book levels in C go through this, so they work with any order book backend.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            size_t count = 0
+
+        if is_bid:
+            while bid_it != self._bid_book.rend() and count < max_levels:
+                if deref(bid_it).getPrice() < limit_price:
+                    break
+                entries.push_back(deref(bid_it))
+                inc(bid_it)
+                count += 1
+        else:
+            while ask_it != self._ask_book.end() and count < max_levels:
+                if deref(ask_it).getPrice() > limit_price:
+                    break
+                entries.push_back(deref(ask_it))
+                inc(ask_it)
+                count += 1
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -13,9 +13,14 @@ from typing import (
     Tuple,
     List)
 import time
-from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.metrics import (
+    class_label,
+    metrics_registry,
+    MetricsRegistry,
+)
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .order_book_message import (
     OrderBookMessageType,
@@ -63,6 +68,27 @@ class OrderBookTracker(ABC):
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
+        self._register_metrics()
+
+    def _register_metrics(self, exchange: Optional[str] = None):
+        registry: MetricsRegistry = metrics_registry()
+        if exchange is None:
+            exchange = class_label(self, "OrderBookTracker")
+        # Read from the order books on scrape, since most exchange trackers apply the messages in their own loops.
+        registry.counter("hummingbot_order_book_updates_total", "Order book diffs and snapshots applied.",
+                         ["exchange", "trading_pair"]).add_object_collector(
+            self, lambda tracker: [((exchange, trading_pair), order_book.version)
+                                   for trading_pair, order_book in list(tracker.order_books.items())])
+        registry.gauge("hummingbot_order_book_diff_queue_size", "Order book diff messages waiting to be routed.",
+                       ["exchange"]).add_object_collector(
+            self, lambda tracker: [((exchange,), tracker._order_book_diff_stream.qsize())])
+        self._rejected_diffs_counter = registry.counter(
+            "hummingbot_order_book_rejected_diffs_total",
+            "Order book diff messages dropped for an unknown trading pair or an outdated update id.",
+            ["exchange"]).labels(exchange)
+        self._trades_counter = registry.counter("hummingbot_order_book_trades_total",
+                                                "Order book trade messages applied.", ["exchange", "trading_pair"])
+        self._metrics_exchange: str = exchange
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -76,6 +102,13 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def dynamic_trading_pairs(self) -> bool:
+        """
+        True if trading pairs can be added and removed without restarting the tracker
+        """
+        return self._data_source is not None and self._data_source.dynamic_trading_pairs
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,6 +116,15 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def carry_over_order_books(self, order_books: Dict[str, OrderBook]):
+        """
+        Keeps the order books of a previous tracker for the trading pairs of this one, before it's started. Their
+        entries are replaced once this tracker initializes them, and their listeners keep receiving the updates.
+        """
+        for trading_pair, order_book in order_books.items():
+            if trading_pair in self._trading_pairs:
+                self._order_books[trading_pair] = order_book
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -166,19 +208,61 @@ class OrderBookTracker(ABC):
                 self.logger().network("Unexpected error while fetching last trade price.", exc_info=True)
                 await asyncio.sleep(30)
 
+    async def add_trading_pair(self, trading_pair: str):
+        """
+        Subscribes to a trading pair on the running data source connections, and initializes its order book. The other
+        order books keep being tracked.
+        """
+        if trading_pair in self._trading_pairs:
+            return
+        self._trading_pairs.append(trading_pair)
+        await self._data_source.add_trading_pair(trading_pair)
+        if self._init_order_books_task is not None:
+            await self._init_order_book(trading_pair)
+
+    async def remove_trading_pair(self, trading_pair: str):
+        """
+        Unsubscribes from a trading pair, and drops its order book.
+        """
+        if trading_pair not in self._trading_pairs:
+            return
+        self._trading_pairs.remove(trading_pair)
+        await self._data_source.remove_trading_pair(trading_pair)
+        tracking_task: Optional[asyncio.Task] = self._tracking_tasks.pop(trading_pair, None)
+        if tracking_task is not None:
+            tracking_task.cancel()
+        self._tracking_message_queues.pop(trading_pair, None)
+        self._past_diffs_windows.pop(trading_pair, None)
+        self._order_books.pop(trading_pair, None)
+
     async def _init_order_books(self):
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        # Trading pairs added in the meantime initialize their own order books.
+        trading_pairs: List[str] = list(self._trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            if trading_pair not in self._trading_pairs:
+                continue
+            await self._init_order_book(trading_pair)
             self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
+                               f"{index + 1}/{len(trading_pairs)} completed.")
             await asyncio.sleep(1)
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+        if trading_pair not in self._trading_pairs:
+            # Removed while the snapshot was being fetched.
+            return
+        carried_over_order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+        if carried_over_order_book is not None:
+            carried_over_order_book.apply_order_book(order_book)
+            order_book = carried_over_order_book
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -194,6 +278,7 @@ class OrderBookTracker(ABC):
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_rejected += 1
+                    self._rejected_diffs_counter.inc()
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -201,6 +286,7 @@ class OrderBookTracker(ABC):
 
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
+                    self._rejected_diffs_counter.inc()
                     continue
                 await message_queue.put(ob_message)
                 messages_accepted += 1
@@ -289,16 +375,20 @@ class OrderBookTracker(ABC):
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                if order_book.has_listeners(OrderBookEvent.TradeEvent):
+                    order_book.apply_trade(OrderBookTradeEvent(
+                        trading_pair=trade_message.trading_pair,
+                        timestamp=trade_message.timestamp,
+                        price=float(trade_message.content["price"]),
+                        amount=float(trade_message.content["amount"]),
+                        type=TradeType.SELL if
+                        trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+                    ))
+                else:
+                    order_book.apply_trade_price(float(trade_message.content["price"]))
 
                 messages_accepted += 1
+                self._trades_counter.labels(self._metrics_exchange, trading_pair).inc()
 
                 # Log some statistics.
                 now: float = time.time()
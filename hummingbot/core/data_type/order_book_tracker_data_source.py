@@ -27,6 +27,25 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def dynamic_trading_pairs(self) -> bool:
+        """
+        True if trading pairs can be added and removed while the data source is listening
+        """
+        return False
+
+    async def add_trading_pair(self, trading_pair: str):
+        """
+        Subscribes to the order book and trade streams of a trading pair, on the open connections.
+        """
+        raise NotImplementedError
+
+    async def remove_trading_pair(self, trading_pair: str):
+        """
+        Unsubscribes from the order book and trade streams of a trading pair, on the open connections.
+        """
+        raise NotImplementedError
+
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         raise NotImplementedError
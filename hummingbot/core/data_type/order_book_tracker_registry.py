@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+"""
+Order book trackers shared by the connectors of a process.
+
+Connectors, paper trade markets and price delegates on the same exchange each used to run their own order book
+tracker, duplicating the websocket connections, snapshot requests and order books. The registry keeps one tracker per
+exchange and order book class, following the union of the trading pairs of its users, and hands out
+SharedOrderBookTracker views which start and stop like ordinary trackers, but only count references to the trading
+pairs they use.
+
+When the shared tracker is replaced by one following new trading pairs, the order books of the trading pairs still in
+use are carried over: they stay ready, and their listeners keep receiving the updates.
+
+Trackers are created from their trading pairs alone, unless a user supplies a factory creating them with the rest of
+their configuration, e.g. the URLs and token configuration of a connector.
+"""
+
+import inspect
+import logging
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+TrackerKey = Tuple[Type[OrderBookTracker], Type[OrderBook]]
+TrackerFactory = Callable[..., OrderBookTracker]
+
+
+def is_created_from_trading_pairs(tracker_class: Type[OrderBookTracker]) -> bool:
+    """
+    :return: True if the tracker class can be created from its trading pairs alone
+    """
+    parameters = inspect.signature(tracker_class.__init__).parameters.values()
+    if any(p.name not in ("self", "trading_pairs") and p.default is inspect.Parameter.empty and
+           p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+           for p in parameters):
+        return False
+    return "trading_pairs" in [p.name for p in parameters]
+
+
+class SharedOrderBookTracker:
+    """
+    A view of the order books of a shared tracker, limited to the trading pairs of one user.
+    """
+    def __init__(self, registry: "OrderBookTrackerRegistry", key: TrackerKey, trading_pairs: List[str]):
+        self._registry: OrderBookTrackerRegistry = registry
+        self._key: TrackerKey = key
+        self._trading_pairs: List[str] = list(trading_pairs)
+        self._started: bool = False
+        # Connectors read the order books on every order book query.
+        self._order_books: Dict[str, OrderBook] = {}
+        self._order_books_version: int = -1
+
+    @property
+    def tracker(self) -> Optional[OrderBookTracker]:
+        """
+        The shared tracker, or None while no user of the exchange is started.
+        """
+        return self._registry.current_tracker(self._key)
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._registry.data_source(self._key)
+
+    @property
+    def exchange_name(self) -> str:
+        return self._registry.data_source_tracker(self._key).exchange_name
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        """
+        The order books of the trading pairs, the same dictionary until the shared tracker or its trading pairs change
+        once all the order books are initialized.
+        """
+        version: int = self._registry.version(self._key)
+        if version == self._order_books_version and len(self._order_books) == len(self._trading_pairs):
+            return self._order_books
+        tracker: Optional[OrderBookTracker] = self.tracker
+        order_books: Dict[str, OrderBook] = tracker.order_books if tracker is not None else {}
+        self._order_books = {trading_pair: order_books[trading_pair]
+                             for trading_pair in self._trading_pairs if trading_pair in order_books}
+        self._order_books_version = version
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        tracker: Optional[OrderBookTracker] = self.tracker
+        if tracker is None or len(self.order_books) < len(self._trading_pairs):
+            return False
+        return tracker.ready or self._registry.carried_over(self._key, self._trading_pairs)
+
+    @property
+    def snapshot(self):
+        return {trading_pair: order_book.snapshot for trading_pair, order_book in self.order_books.items()}
+
+    def start(self):
+        if not self._started:
+            self._started = True
+            self._registry.acquire(self._key, self._trading_pairs)
+
+    def stop(self):
+        if self._started:
+            self._started = False
+            self._registry.release(self._key, self._trading_pairs)
+
+
+class _SharedTrackerEntry:
+    def __init__(self):
+        self.tracker: Optional[OrderBookTracker] = None
+        # Creates the trackers from their trading_pairs keyword argument, the tracker class itself if None.
+        self.tracker_factory: Optional[TrackerFactory] = None
+        # An unstarted tracker, created to answer data source queries before any user is started.
+        self.idle_tracker: Optional[OrderBookTracker] = None
+        self.reference_counts: Dict[str, int] = {}
+        self.tracked_trading_pairs: List[str] = []
+        # The trading pairs whose order books were carried over from the previous tracker.
+        self.carried_over_trading_pairs: Set[str] = set()
+        # Increases every time the tracker or its trading pairs change.
+        self.version: int = 0
+
+
+class OrderBookTrackerRegistry:
+    _obtr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obtr_logger is None:
+            cls._obtr_logger = logging.getLogger(__name__)
+        return cls._obtr_logger
+
+    def __init__(self):
+        self._entries: Dict[TrackerKey, _SharedTrackerEntry] = {}
+
+    def shared_tracker(self,
+                       tracker_class: Type[OrderBookTracker],
+                       trading_pairs: List[str],
+                       order_book_class: Type[OrderBook] = OrderBook,
+                       tracker_factory: Optional[TrackerFactory] = None) -> SharedOrderBookTracker:
+        """
+        :param tracker_class: an exchange order book tracker class
+        :param order_book_class: the class of the order books, users with different classes don't share trackers
+        :param tracker_factory: creates a tracker_class tracker from its trading_pairs keyword argument, required if
+                                the class can't be created from its trading pairs alone. The factory of the last user
+                                supplying one creates the following trackers.
+        :return: a tracker view, which tracks the order books of the trading pairs once started
+        """
+        key: TrackerKey = (tracker_class, order_book_class)
+        entry: _SharedTrackerEntry = self._entries.setdefault(key, _SharedTrackerEntry())
+        if tracker_factory is not None:
+            entry.tracker_factory = tracker_factory
+        elif entry.tracker_factory is None and not is_created_from_trading_pairs(tracker_class):
+            raise ValueError(f"{tracker_class.__name__} can't be created from trading pairs alone.")
+        return SharedOrderBookTracker(self, key, trading_pairs)
+
+    def current_tracker(self, key: TrackerKey) -> Optional[OrderBookTracker]:
+        entry: Optional[_SharedTrackerEntry] = self._entries.get(key)
+        return entry.tracker if entry is not None else None
+
+    def version(self, key: TrackerKey) -> int:
+        entry: Optional[_SharedTrackerEntry] = self._entries.get(key)
+        return entry.version if entry is not None else 0
+
+    def carried_over(self, key: TrackerKey, trading_pairs: List[str]) -> bool:
+        """
+        :return: True if the order books of all the trading pairs were carried over from the previous tracker
+        """
+        entry: Optional[_SharedTrackerEntry] = self._entries.get(key)
+        return entry is not None and all(trading_pair in entry.carried_over_trading_pairs
+                                         for trading_pair in trading_pairs)
+
+    def data_source_tracker(self, key: TrackerKey) -> OrderBookTracker:
+        """
+        :return: the running tracker, or an unstarted one for its data source
+        """
+        entry: _SharedTrackerEntry = self._entries.setdefault(key, _SharedTrackerEntry())
+        if entry.tracker is not None:
+            return entry.tracker
+        if entry.idle_tracker is None:
+            entry.idle_tracker = self._create_tracker(key, entry, [])
+        return entry.idle_tracker
+
+    def data_source(self, key: TrackerKey) -> OrderBookTrackerDataSource:
+        return self.data_source_tracker(key).data_source
+
+    def trading_pairs(self, key: TrackerKey) -> List[str]:
+        """
+        :return: the trading pairs in use, sorted
+        """
+        entry: Optional[_SharedTrackerEntry] = self._entries.get(key)
+        return sorted(entry.reference_counts.keys()) if entry is not None else []
+
+    def acquire(self, key: TrackerKey, trading_pairs: List[str]):
+        entry: _SharedTrackerEntry = self._entries.setdefault(key, _SharedTrackerEntry())
+        new_trading_pairs: List[str] = [trading_pair for trading_pair in trading_pairs
+                                        if trading_pair not in entry.tracked_trading_pairs]
+        for trading_pair in trading_pairs:
+            entry.reference_counts[trading_pair] = entry.reference_counts.get(trading_pair, 0) + 1
+        entry.version += 1
+        if entry.tracker is not None and entry.tracker.dynamic_trading_pairs:
+            for trading_pair in new_trading_pairs:
+                entry.tracked_trading_pairs.append(trading_pair)
+                safe_ensure_future(entry.tracker.add_trading_pair(trading_pair))
+        elif entry.tracker is None or len(new_trading_pairs) > 0:
+            # Data sources subscribing to a fixed list of trading pairs are replaced by one following the new pairs.
+            self._restart(key, entry)
+
+    def release(self, key: TrackerKey, trading_pairs: List[str]):
+        entry: Optional[_SharedTrackerEntry] = self._entries.get(key)
+        if entry is None:
+            return
+        for trading_pair in trading_pairs:
+            count: int = entry.reference_counts.get(trading_pair, 0) - 1
+            if count > 0:
+                entry.reference_counts[trading_pair] = count
+            else:
+                entry.reference_counts.pop(trading_pair, None)
+        entry.version += 1
+        if entry.tracker is None:
+            return
+        if len(entry.reference_counts) == 0:
+            entry.tracker.stop()
+            entry.tracker = None
+            entry.tracked_trading_pairs = []
+            entry.carried_over_trading_pairs = set()
+        elif entry.tracker.dynamic_trading_pairs:
+            for trading_pair in [t for t in entry.tracked_trading_pairs if t not in entry.reference_counts]:
+                entry.tracked_trading_pairs.remove(trading_pair)
+                safe_ensure_future(entry.tracker.remove_trading_pair(trading_pair))
+        # Otherwise, unused trading pairs stay tracked until the tracker is replaced.
+
+    def _restart(self, key: TrackerKey, entry: _SharedTrackerEntry):
+        trading_pairs: List[str] = sorted(entry.reference_counts.keys())
+        previous_order_books: Dict[str, OrderBook] = {}
+        if entry.tracker is not None:
+            self.logger().info(f"Restarting the shared {key[0].__name__} for {trading_pairs}.")
+            entry.tracker.stop()
+            previous_order_books = entry.tracker.order_books
+        entry.tracker = self._create_tracker(key, entry, list(trading_pairs))
+        entry.tracker.carry_over_order_books(previous_order_books)
+        entry.tracked_trading_pairs = trading_pairs
+        entry.carried_over_trading_pairs = set(previous_order_books.keys()) & set(trading_pairs)
+        entry.idle_tracker = None
+        entry.version += 1
+        entry.tracker.start()
+
+    @staticmethod
+    def _create_tracker(key: TrackerKey, entry: _SharedTrackerEntry, trading_pairs: List[str]) -> OrderBookTracker:
+        tracker_class, order_book_class = key
+        tracker_factory: TrackerFactory = entry.tracker_factory or tracker_class
+        tracker: OrderBookTracker = tracker_factory(trading_pairs=trading_pairs)
+        if tracker.data_source is not None:
+            tracker.data_source.order_book_create_function = order_book_class
+        return tracker
+
+
+_registry: Optional[OrderBookTrackerRegistry] = None
+
+
+def order_book_tracker_registry() -> OrderBookTrackerRegistry:
+    global _registry
+    if _registry is None:
+        _registry = OrderBookTrackerRegistry()
+    return _registry
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+"""
+Order book tracking in a worker process.
+
+The worker runs the exchange's own order book tracker, with its websocket decoding, diff routing and order book
+updates, on its own event loop. Whenever an order book changes, it publishes the top levels of the book to a shared
+memory block, and the main process copies them into its order books. The strategies keep reading ordinary OrderBook
+objects, without the market data traffic competing with them for the main event loop.
+
+Each trading pair has a fixed size row in the shared memory block. The worker guards every write with a sequence
+number, odd while the row is being written, so the main process can retry a read that raced with a write.
+"""
+
+import asyncio
+from itertools import islice
+import logging
+import math
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import os
+from typing import (
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_registry import is_created_from_trading_pairs
+from hummingbot.core.metrics import class_label
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_SNAPSHOT_DEPTH = 100
+DEFAULT_PUBLISH_INTERVAL = 0.01
+DEFAULT_POLL_INTERVAL = 0.01
+WORKER_STOP_TIMEOUT = 1.0
+MAX_READ_ATTEMPTS = 10
+
+# Row layout: header fields, then depth (price, amount) bid levels, then depth (price, amount) ask levels.
+SEQUENCE = 0
+VERSION = 1
+BID_COUNT = 2
+ASK_COUNT = 3
+LAST_TRADE_PRICE = 4
+HEADER_SIZE = 5
+
+Snapshot = Tuple[int, np.ndarray, np.ndarray, float]
+
+
+class SharedOrderBookSnapshots:
+    """
+    The top levels of the order books of several trading pairs, in a shared memory block.
+    """
+    def __init__(self, num_trading_pairs: int, depth: int, name: Optional[str] = None):
+        """
+        :param name: the name of an existing block to attach to, or None to create a new one
+        """
+        self._depth: int = depth
+        row_size: int = HEADER_SIZE + depth * 4
+        self._shared_memory: SharedMemory = SharedMemory(name=name, create=name is None,
+                                                         size=num_trading_pairs * row_size * 8)
+        self._rows: np.ndarray = np.ndarray((num_trading_pairs, row_size), dtype=np.float64,
+                                            buffer=self._shared_memory.buf)
+        if name is None:
+            self._rows[:] = 0
+            self._rows[:, LAST_TRADE_PRICE] = np.nan
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    def write(self, index: int, order_book: OrderBook):
+        depth: int = self._depth
+        bids: List[Tuple[float, float]] = [(row.price, row.amount) for row in islice(order_book.bid_entries(), depth)]
+        asks: List[Tuple[float, float]] = [(row.price, row.amount) for row in islice(order_book.ask_entries(), depth)]
+        row: np.ndarray = self._rows[index]
+        row[SEQUENCE] += 1
+        row[VERSION] = order_book.version
+        row[BID_COUNT] = len(bids)
+        row[ASK_COUNT] = len(asks)
+        row[LAST_TRADE_PRICE] = order_book.last_trade_price
+        if len(bids) > 0:
+            row[HEADER_SIZE:HEADER_SIZE + len(bids) * 2] = np.array(bids, dtype=np.float64).ravel()
+        if len(asks) > 0:
+            asks_start: int = HEADER_SIZE + depth * 2
+            row[asks_start:asks_start + len(asks) * 2] = np.array(asks, dtype=np.float64).ravel()
+        row[SEQUENCE] += 1
+
+    def read(self, index: int, last_version: int) -> Optional[Snapshot]:
+        """
+        :return: (version, bids, asks, last trade price), with bids and asks in [price, amount, update_id] rows, or
+                 None if the order book hasn't changed since last_version, or is being written
+        """
+        row: np.ndarray = self._rows[index]
+        for _ in range(MAX_READ_ATTEMPTS):
+            sequence: float = row[SEQUENCE]
+            if sequence % 2 == 1:
+                continue
+            if row[VERSION] == last_version:
+                return None
+            row_copy: np.ndarray = row.copy()
+            if row[SEQUENCE] == sequence:
+                break
+        else:
+            return None
+
+        version: int = int(row_copy[VERSION])
+        asks_start: int = HEADER_SIZE + self._depth * 2
+        bids: np.ndarray = self._levels(row_copy[HEADER_SIZE:HEADER_SIZE + int(row_copy[BID_COUNT]) * 2], version)
+        asks: np.ndarray = self._levels(row_copy[asks_start:asks_start + int(row_copy[ASK_COUNT]) * 2], version)
+        return version, bids, asks, row_copy[LAST_TRADE_PRICE]
+
+    @staticmethod
+    def _levels(values: np.ndarray, version: int) -> np.ndarray:
+        levels: np.ndarray = np.empty((len(values) // 2, 3), dtype=np.float64)
+        levels[:, :2] = values.reshape(-1, 2)
+        levels[:, 2] = version
+        return levels
+
+    def close(self):
+        self._rows = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+
+async def _publish_order_books(tracker: OrderBookTracker,
+                               trading_pairs: List[str],
+                               snapshots: SharedOrderBookSnapshots,
+                               publish_interval: float,
+                               stop_event: multiprocessing.Event,
+                               parent_pid: int):
+    versions: List[int] = [0] * len(trading_pairs)
+    while not stop_event.is_set() and os.getppid() == parent_pid:
+        for index, trading_pair in enumerate(trading_pairs):
+            order_book: Optional[OrderBook] = tracker.order_books.get(trading_pair)
+            if order_book is not None and order_book.version != versions[index]:
+                snapshots.write(index, order_book)
+                versions[index] = order_book.version
+        await asyncio.sleep(publish_interval)
+
+
+def run_order_book_worker(tracker_class: Type[OrderBookTracker],
+                          trading_pairs: List[str],
+                          snapshots_name: str,
+                          depth: int,
+                          publish_interval: float,
+                          stop_event: multiprocessing.Event,
+                          parent_pid: int):
+    """
+    The worker process entry point. Tracks the order books until stop_event is set, or the parent process exits.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    # The worker shares the resource tracker of the main process, which owns the block and unlinks it.
+    snapshots: SharedOrderBookSnapshots = SharedOrderBookSnapshots(len(trading_pairs), depth, name=snapshots_name)
+    tracker: OrderBookTracker = tracker_class(trading_pairs=trading_pairs)
+    tracker.start()
+    try:
+        loop.run_until_complete(_publish_order_books(tracker, trading_pairs, snapshots, publish_interval, stop_event,
+                                                     parent_pid))
+    finally:
+        tracker.stop()
+        pending_tasks = asyncio.all_tasks(loop)
+        for task in pending_tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+        snapshots.close()
+        loop.close()
+
+
+class WorkerOrderBookTracker(OrderBookTracker):
+    """
+    Tracks the order books of an exchange in a worker process, and keeps copies of their top levels.
+
+    The order books only hold the top depth levels of each side, and don't emit order book trade events.
+    """
+    _wobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wobt_logger is None:
+            cls._wobt_logger = logging.getLogger(__name__)
+        return cls._wobt_logger
+
+    @classmethod
+    def from_tracker(cls, tracker: OrderBookTracker) -> Optional["WorkerOrderBookTracker"]:
+        """
+        :return: a worker tracker running the same tracker class, or None if the class can't be created from the
+                 trading pairs alone
+        """
+        tracker_class: Type[OrderBookTracker] = type(tracker)
+        if not is_created_from_trading_pairs(tracker_class):
+            return None
+        return cls(tracker_class, tracker.data_source, tracker._trading_pairs)
+
+    def __init__(self,
+                 tracker_class: Type[OrderBookTracker],
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 depth: int = DEFAULT_SNAPSHOT_DEPTH,
+                 publish_interval: float = DEFAULT_PUBLISH_INTERVAL,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self._tracker_class: Type[OrderBookTracker] = tracker_class
+        super().__init__(data_source, trading_pairs)
+        self._depth: int = depth
+        self._publish_interval: float = publish_interval
+        self._poll_interval: float = poll_interval
+        self._snapshots: Optional[SharedOrderBookSnapshots] = None
+        self._worker: Optional[multiprocessing.Process] = None
+        self._stop_event: Optional[multiprocessing.Event] = None
+        self._poll_snapshots_task: Optional[asyncio.Task] = None
+
+    def _register_metrics(self, exchange: Optional[str] = None):
+        super()._register_metrics(exchange or class_label(self._tracker_class, "OrderBookTracker"))
+
+    @property
+    def exchange_name(self) -> str:
+        return class_label(self._tracker_class, "OrderBookTracker")
+
+    @property
+    def dynamic_trading_pairs(self) -> bool:
+        # The trading pairs of the worker tracker are fixed when it starts.
+        return False
+
+    def start(self):
+        self.stop()
+        context = multiprocessing.get_context("spawn")
+        self._snapshots = SharedOrderBookSnapshots(len(self._trading_pairs), self._depth)
+        self._stop_event = context.Event()
+        self._worker = context.Process(
+            target=run_order_book_worker,
+            args=(self._tracker_class, self._trading_pairs, self._snapshots.name, self._depth,
+                  self._publish_interval, self._stop_event, os.getpid()),
+            name=f"{self.exchange_name}_order_book_worker",
+            daemon=True
+        )
+        self._worker.start()
+        self._poll_snapshots_task = safe_ensure_future(self._poll_snapshots_loop())
+
+    def stop(self):
+        if self._poll_snapshots_task is not None:
+            self._poll_snapshots_task.cancel()
+            self._poll_snapshots_task = None
+        if self._worker is not None:
+            self._stop_event.set()
+            self._worker.join(WORKER_STOP_TIMEOUT)
+            if self._worker.is_alive():
+                self._worker.terminate()
+            self._worker = None
+        if self._snapshots is not None:
+            self._snapshots.close()
+            self._snapshots.unlink()
+            self._snapshots = None
+
+    def apply_snapshots(self, versions: List[int]):
+        """
+        Copies the order books published since versions into the order books.
+        """
+        for index, trading_pair in enumerate(self._trading_pairs):
+            snapshot: Optional[Snapshot] = self._snapshots.read(index, versions[index])
+            if snapshot is None:
+                continue
+            version, bids, asks, last_trade_price = snapshot
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                order_book = self._order_books[trading_pair] = OrderBook()
+            order_book.apply_numpy_snapshot(bids, asks)
+            if not math.isnan(last_trade_price):
+                order_book.last_trade_price = last_trade_price
+            versions[index] = version
+        if len(self._order_books) == len(self._trading_pairs):
+            self._order_books_initialized.set()
+
+    async def _poll_snapshots_loop(self):
+        versions: List[int] = [0] * len(self._trading_pairs)
+        while True:
+            try:
+                self.apply_snapshots(versions)
+                if not self._worker.is_alive():
+                    self.logger().error(f"The {self.exchange_name} order book worker exited with code "
+                                        f"{self._worker.exitcode}. Restarting it after 5 seconds.")
+                    await asyncio.sleep(5.0)
+                    # Stops this task as well.
+                    self.start()
+                    return
+                await asyncio.sleep(self._poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error while copying the worker order books.", exc_info=True,
+                                      app_warning_msg="Unexpected error while copying the worker order books. "
+                                                      "Retrying after 5 seconds.")
+                await asyncio.sleep(5.0)
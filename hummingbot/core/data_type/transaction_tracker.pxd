@@ -1,9 +1,10 @@
+from hummingbot.core.data_type.expiration_queue cimport ExpirationQueue
 from hummingbot.core.time_iterator cimport TimeIterator
 
 
 cdef class TransactionTracker(TimeIterator):
     cdef:
-        dict _tx_time_limits
+        ExpirationQueue _tx_expiration_queue
 
     cdef c_start_tx_tracking(self, str tx_id, float timeout_seconds)
     cdef c_stop_tx_tracking(self, str tx_id)
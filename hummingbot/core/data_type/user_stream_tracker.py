@@ -4,10 +4,16 @@ import asyncio
 from abc import abstractmethod, ABC
 from enum import Enum
 import logging
+import time
 from typing import (
     Optional
 )
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.metrics import (
+    class_label,
+    metrics_registry,
+    MetricsRegistry,
+)
 from hummingbot.logger import HummingbotLogger
 
 
@@ -29,6 +35,18 @@ class UserStreamTracker(ABC):
     def __init__(self):
         self._user_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._register_metrics()
+
+    def _register_metrics(self):
+        registry: MetricsRegistry = metrics_registry()
+        exchange: str = class_label(self, "UserStreamTracker")
+        registry.gauge("hummingbot_user_stream_lag_seconds", "Seconds since the last user stream message.",
+                       ["exchange"]).add_object_collector(
+            self, lambda tracker: [((exchange,), time.time() - tracker.last_recv_time)]
+            if tracker.last_recv_time > 0 else [])
+        registry.gauge("hummingbot_user_stream_queue_size", "User stream messages waiting to be processed.",
+                       ["exchange"]).add_object_collector(
+            self, lambda tracker: [((exchange,), tracker.user_stream.qsize())])
 
     @property
     @abstractmethod
@@ -9,6 +9,7 @@ from typing import (
 )
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.order_book_trade_event import OrderBookTradeEvent  # noqa: F401
 
 
 class WalletEvent(Enum):
@@ -51,6 +52,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    UpdateEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -228,14 +230,6 @@ class TradeFee(NamedTuple):
         )
 
 
-class OrderBookTradeEvent(NamedTuple):
-    trading_pair: str
-    timestamp: float
-    type: TradeType
-    price: Decimal
-    amount: Decimal
-
-
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -0,0 +1,9 @@
+cdef class OrderBookTradeEvent:
+    cdef:
+        readonly str trading_pair
+        readonly double timestamp
+        readonly object type
+        readonly double price
+        readonly double amount
+        object _decimal_price
+        object _decimal_amount
@@ -0,0 +1,77 @@
+# distutils: language=c++
+
+cimport cython
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+)
+
+_fields = ("trading_pair", "timestamp", "type", "price", "amount")
+
+
+@cython.freelist(256)
+cdef class OrderBookTradeEvent:
+    """
+    A public trade on an order book, emitted for every trade on every tracked trading pair.
+
+    Price and amount are floats, as the order book trackers emit them. The Decimal price and amount (decimal_price,
+    decimal_amount) are only created when they're first read. Otherwise it behaves like the NamedTuple it replaces.
+    """
+    _fields = _fields
+
+    def __init__(self, str trading_pair, double timestamp, object type, object price, object amount):
+        self.trading_pair = trading_pair
+        self.timestamp = timestamp
+        self.type = type
+        self.price = price
+        self.amount = amount
+        self._decimal_price = price if isinstance(price, Decimal) else None
+        self._decimal_amount = amount if isinstance(amount, Decimal) else None
+
+    @property
+    def decimal_price(self) -> Decimal:
+        if self._decimal_price is None:
+            self._decimal_price = Decimal(repr(self.price))
+        return self._decimal_price
+
+    @property
+    def decimal_amount(self) -> Decimal:
+        if self._decimal_amount is None:
+            self._decimal_amount = Decimal(repr(self.amount))
+        return self._decimal_amount
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "timestamp": self.timestamp,
+            "type": self.type,
+            "price": self.price,
+            "amount": self.amount
+        }
+
+    def _replace(self, **kwargs) -> "OrderBookTradeEvent":
+        values: Dict[str, Any] = self._asdict()
+        values.update(kwargs)
+        return OrderBookTradeEvent(**values)
+
+    def __iter__(self):
+        return iter((self.trading_pair, self.timestamp, self.type, self.price, self.amount))
+
+    def __len__(self) -> int:
+        return len(_fields)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, OrderBookTradeEvent):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return OrderBookTradeEvent, tuple(self)
+
+    def __repr__(self) -> str:
+        return (f"OrderBookTradeEvent(trading_pair={self.trading_pair!r}, timestamp={self.timestamp!r}, "
+                f"type={self.type!r}, price={self.price!r}, amount={self.amount!r})")
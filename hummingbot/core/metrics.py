@@ -0,0 +1,358 @@
+"""
+Process wide metrics registry: counters, gauges and histograms with labels, rendered in the Prometheus text
+exposition format and served over HTTP by MetricsServer.
+
+Recording a sample is an attribute update on a labelled child, so hot paths look the child up once and keep it.
+Values that already live somewhere else, like the number of in flight orders of a connector, are read by collectors
+only when the metrics are scraped.
+"""
+
+from aiohttp import web
+from bisect import bisect_left
+import logging
+import math
+import re
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+import weakref
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+_registry = None
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                                              5.0, 10.0)
+
+# Label sets beyond this many per metric evict the oldest one, e.g. REST paths with order ids nobody scrapes.
+DEFAULT_MAX_LABEL_SETS = 1000
+
+EXPOSITION_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Returns (label values, value) samples, or None once the object it reads from is gone.
+Collector = Callable[[], Optional[Iterable[Tuple[Tuple[str, ...], float]]]]
+
+
+def class_label(obj: object, suffix: str) -> str:
+    """
+    :param obj: an object, or a class
+    :return: the snake case class name of obj without suffix, e.g. "coinbase_pro" for a CoinbaseProOrderBookTracker
+    """
+    name: str = obj.__name__ if isinstance(obj, type) else type(obj).__name__
+    if name.endswith(suffix) and name != suffix:
+        name = name[:-len(suffix)]
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def rest_path_label(path_url: str) -> str:
+    """
+    :return: the path of a REST request without its query string, and with the ids in it replaced by {id}, so the
+    requests of one endpoint share a label
+    """
+    path: str = path_url.split("?", 1)[0]
+    return re.sub(r"(?<=/)(?=[^/]*\d)[0-9A-Fa-f-]{8,}(?=/|$)|(?<=/)\d{4,}(?=/|$)", "{id}", path)
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if len(label_names) == 0:
+        return ""
+    return "{" + ",".join(f"{name}=\"{_escape_label_value(str(value))}\""
+                          for name, value in zip(label_names, label_values)) + "}"
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value: float = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+
+class HistogramChild:
+    __slots__ = ("upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds: Tuple[float, ...] = upper_bounds
+        # The last bucket is +Inf.
+        self.bucket_counts: List[int] = [0] * (len(upper_bounds) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric:
+    metric_type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 max_label_sets: int = DEFAULT_MAX_LABEL_SETS):
+        self._name: str = name
+        self._documentation: str = documentation
+        self._label_names: Tuple[str, ...] = tuple(label_names)
+        self._max_label_sets: int = max_label_sets
+        # In insertion order, the oldest label set is evicted first.
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._collectors: List[Collector] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def label_names(self) -> Tuple[str, ...]:
+        return self._label_names
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *label_values: str):
+        if len(label_values) != len(self._label_names):
+            raise ValueError(f"{self._name} takes the labels {self._label_names}, got {label_values}.")
+        child = self._children.get(label_values)
+        if child is None:
+            if len(self._children) >= self._max_label_sets:
+                del self._children[next(iter(self._children))]
+            child = self._new_child()
+            self._children[label_values] = child
+        return child
+
+    def remove(self, *label_values: str):
+        self._children.pop(label_values, None)
+
+    def add_collector(self, collector: Collector):
+        self._collectors.append(collector)
+
+    def add_object_collector(self, obj: object, collect: Callable[[object], Iterable[Tuple[Tuple[str, ...], float]]]):
+        """
+        Adds a collector that reads from obj, without keeping obj alive. The collector is dropped once obj is gone.
+        """
+        obj_ref = weakref.ref(obj)
+
+        def collector():
+            target = obj_ref()
+            return collect(target) if target is not None else None
+        self.add_collector(collector)
+
+    def _child_lines(self) -> List[str]:
+        return [f"{self._name}{_format_labels(self._label_names, label_values)} {_format_value(child.value)}"
+                for label_values, child in list(self._children.items())]
+
+    def _collected_lines(self) -> List[str]:
+        lines: List[str] = []
+        live_collectors: List[Collector] = []
+        for collector in self._collectors:
+            try:
+                samples = collector()
+                if samples is None:
+                    continue
+                samples = list(samples)
+            except Exception:
+                samples = []
+            live_collectors.append(collector)
+            lines.extend(f"{self._name}{_format_labels(self._label_names, label_values)} {_format_value(value)}"
+                         for label_values, value in samples)
+        self._collectors = live_collectors
+        return lines
+
+    def _sample_lines(self) -> List[str]:
+        raise NotImplementedError
+
+    def exposition(self) -> str:
+        lines: List[str] = [f"# HELP {self._name} {self._documentation}", f"# TYPE {self._name} {self.metric_type}"]
+        lines.extend(self._sample_lines())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def labels(self, *label_values: str) -> CounterChild:
+        return super().labels(*label_values)
+
+    def _sample_lines(self) -> List[str]:
+        return self._child_lines() + self._collected_lines()
+
+
+class Gauge(Metric):
+    metric_type = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def labels(self, *label_values: str) -> GaugeChild:
+        return super().labels(*label_values)
+
+    def _sample_lines(self) -> List[str]:
+        return self._child_lines() + self._collected_lines()
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, max_label_sets: int = DEFAULT_MAX_LABEL_SETS):
+        super().__init__(name, documentation, label_names, max_label_sets)
+        self._upper_bounds: Tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self._upper_bounds)
+
+    def labels(self, *label_values: str) -> HistogramChild:
+        return super().labels(*label_values)
+
+    def _sample_lines(self) -> List[str]:
+        lines: List[str] = []
+        bucket_label_names: Tuple[str, ...] = self._label_names + ("le",)
+        for label_values, child in list(self._children.items()):
+            cumulative: int = 0
+            for upper_bound, bucket_count in zip(self._upper_bounds + (math.inf,), child.bucket_counts):
+                cumulative += bucket_count
+                bucket_labels: str = _format_labels(bucket_label_names, label_values + (_format_value(upper_bound),))
+                lines.append(f"{self._name}_bucket{bucket_labels} {cumulative}")
+            labels: str = _format_labels(self._label_names, label_values)
+            lines.append(f"{self._name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self._name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def _get_or_create(self, metric_class, name: str, documentation: str, label_names: Sequence[str], **kwargs):
+        metric: Optional[Metric] = self._metrics.get(name)
+        if metric is None:
+            metric = metric_class(name, documentation, label_names, **kwargs)
+            self._metrics[name] = metric
+        elif type(metric) is not metric_class or metric.label_names != tuple(label_names):
+            raise ValueError(f"Metric {name} is already registered as a {metric.metric_type} with the labels "
+                             f"{metric.label_names}.")
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        return "\n".join(metric.exposition() for metric in list(self._metrics.values())) + "\n"
+
+
+def metrics_registry() -> MetricsRegistry:
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+def rest_request_histogram() -> Histogram:
+    return metrics_registry().histogram("hummingbot_rest_request_duration_seconds",
+                                        "Time until the response of an exchange REST request.",
+                                        ["connector", "method", "path"])
+
+
+def websocket_connects_counter() -> Counter:
+    return metrics_registry().counter("hummingbot_websocket_connects_total",
+                                      "Websocket connections opened to an exchange, the first one and reconnects.",
+                                      ["connector", "stream"])
+
+
+class MetricsServer:
+    """
+    Serves the registry at http://<host>:<port>/metrics.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, port: int, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None):
+        self._host: str = host
+        self._port: int = port
+        self._registry: MetricsRegistry = registry or metrics_registry()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(body=self._registry.exposition().encode("utf-8"),
+                            headers={"Content-Type": EXPOSITION_CONTENT_TYPE})
+
+    async def start(self):
+        if self._runner is not None:
+            return
+        app: web.Application = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner: web.AppRunner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, self._host, self._port)
+        await site.start()
+        if self._port == 0:
+            self._port = runner.addresses[0][1]
+        self._runner = runner
+        self.logger().info(f"Serving metrics at http://{self._host}:{self._port}/metrics.")
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,33 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+cdef enum:
+    NUM_LATENCY_BUCKETS = 32
+
+
+cdef class LatencyHistogram:
+    cdef:
+        str _name
+        int64_t _buckets[NUM_LATENCY_BUCKETS]
+        int64_t _count
+        int64_t _total_ns
+        int64_t _max_ns
+        int64_t _last_listener_count
+        int64_t _max_listener_count
+
+    cdef c_record(self, int64_t duration_ns)
+    cdef c_record_listeners(self, int64_t listener_count)
+    cdef c_reset(self)
+
+
+cdef class HotPathProfiler:
+    cdef:
+        dict _tick_histograms
+        dict _event_histograms
+
+    cdef LatencyHistogram c_tick_histogram(self, object iterator)
+    cdef LatencyHistogram c_event_histogram(self, int64_t event_tag)
+
+
+cdef int64_t c_now_ns()
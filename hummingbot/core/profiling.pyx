@@ -0,0 +1,204 @@
+# distutils: language=c++
+"""
+Opt-in timing of the hot paths: the clock tick of every time iterator, and the dispatch of every event tag to its
+listeners.
+
+Each sample goes into a fixed bucket latency histogram, so recording doesn't allocate. When profiling is disabled,
+Clock and PubSub only check for a missing profiler.
+"""
+
+from enum import Enum
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+import pandas as pd
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+_profiler = None
+
+
+cdef extern from *:
+    """
+    #include <chrono>
+    static inline int64_t hb_steady_clock_ns() {
+        return std::chrono::duration_cast<std::chrono::nanoseconds>(
+            std::chrono::steady_clock::now().time_since_epoch()).count();
+    }
+    """
+    int64_t hb_steady_clock_ns()
+
+
+cdef int64_t c_now_ns():
+    return hb_steady_clock_ns()
+
+
+cdef class LatencyHistogram:
+    """
+    Latency histogram with power of 2 nanosecond buckets, bucket i counts the durations in [2^(i-1), 2^i) ns.
+    """
+    def __init__(self, str name):
+        self._name = name
+        self.c_reset()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ns(self) -> float:
+        return self._total_ns / self._count if self._count > 0 else float("nan")
+
+    @property
+    def max_ns(self) -> int:
+        return self._max_ns
+
+    @property
+    def buckets(self) -> List[int]:
+        return [self._buckets[i] for i in range(NUM_LATENCY_BUCKETS)]
+
+    cdef c_record(self, int64_t duration_ns):
+        cdef:
+            int index = 0
+            int64_t remaining = duration_ns
+        while remaining > 0 and index < NUM_LATENCY_BUCKETS - 1:
+            remaining >>= 1
+            index += 1
+        self._buckets[index] += 1
+        self._count += 1
+        self._total_ns += duration_ns
+        if duration_ns > self._max_ns:
+            self._max_ns = duration_ns
+
+    cdef c_record_listeners(self, int64_t listener_count):
+        self._last_listener_count = listener_count
+        if listener_count > self._max_listener_count:
+            self._max_listener_count = listener_count
+
+    cdef c_reset(self):
+        cdef int i
+        for i in range(NUM_LATENCY_BUCKETS):
+            self._buckets[i] = 0
+        self._count = self._total_ns = self._max_ns = 0
+        self._last_listener_count = self._max_listener_count = 0
+
+    def percentile_ns(self, percentile: float) -> float:
+        """
+        :return: the upper bound of the bucket the percentile falls into
+        """
+        cdef:
+            int64_t threshold
+            int64_t cumulative = 0
+            int i
+        if self._count == 0:
+            return float("nan")
+        threshold = <int64_t>(self._count * percentile / 100.0 + 0.5)
+        for i in range(NUM_LATENCY_BUCKETS):
+            cumulative += self._buckets[i]
+            if cumulative >= threshold:
+                return min(float(1 << i), float(self._max_ns))
+        return float(self._max_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self._name,
+            "count": self._count,
+            "mean_us": self.mean_ns / 1e3,
+            "p50_us": self.percentile_ns(50) / 1e3,
+            "p99_us": self.percentile_ns(99) / 1e3,
+            "max_us": self._max_ns / 1e3,
+            "listeners": self._last_listener_count,
+            "max_listeners": self._max_listener_count,
+        }
+
+
+def event_tag_name(event_tag: int) -> str:
+    from hummingbot.core.event import events
+    for value in vars(events).values():
+        if isinstance(value, type) and issubclass(value, Enum) and value.__name__.endswith("Event"):
+            for member in value:
+                if member.value == event_tag:
+                    return f"{value.__name__}.{member.name}"
+    return str(event_tag)
+
+
+cdef class HotPathProfiler:
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self):
+        self._tick_histograms = {}
+        self._event_histograms = {}
+
+    cdef LatencyHistogram c_tick_histogram(self, object iterator):
+        cdef LatencyHistogram histogram = self._tick_histograms.get(iterator)
+        if histogram is None:
+            histogram = LatencyHistogram(getattr(iterator, "display_name", None) or type(iterator).__name__)
+            self._tick_histograms[iterator] = histogram
+        return histogram
+
+    cdef LatencyHistogram c_event_histogram(self, int64_t event_tag):
+        cdef LatencyHistogram histogram = self._event_histograms.get(event_tag)
+        if histogram is None:
+            histogram = LatencyHistogram(event_tag_name(event_tag))
+            self._event_histograms[event_tag] = histogram
+        return histogram
+
+    @property
+    def tick_histograms(self) -> List[LatencyHistogram]:
+        return list(self._tick_histograms.values())
+
+    @property
+    def event_histograms(self) -> List[LatencyHistogram]:
+        return list(self._event_histograms.values())
+
+    def reset(self):
+        self._tick_histograms.clear()
+        self._event_histograms.clear()
+
+    def tick_data_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([h.to_dict() for h in self.tick_histograms],
+                            columns=["name", "count", "mean_us", "p50_us", "p99_us", "max_us"])
+
+    def event_data_frame(self) -> pd.DataFrame:
+        return pd.DataFrame([h.to_dict() for h in self.event_histograms],
+                            columns=["name", "count", "mean_us", "p50_us", "p99_us", "max_us", "listeners",
+                                     "max_listeners"])
+
+
+def profiler() -> HotPathProfiler:
+    """
+    :return: the active profiler, or None when profiling is disabled
+    """
+    return _profiler
+
+
+def enable_profiling() -> HotPathProfiler:
+    global _profiler
+    from hummingbot.core import clock, pubsub
+    if _profiler is None:
+        _profiler = HotPathProfiler()
+        clock.set_profiler(_profiler)
+        pubsub.set_profiler(_profiler)
+    return _profiler
+
+
+def disable_profiling():
+    global _profiler
+    from hummingbot.core import clock, pubsub
+    clock.set_profiler(None)
+    pubsub.set_profiler(None)
+    _profiler = None
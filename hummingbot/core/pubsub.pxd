@@ -24,4 +24,5 @@ cdef class PubSub:
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef bint c_has_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
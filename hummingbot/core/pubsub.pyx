@@ -20,8 +20,22 @@ from typing import List
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.profiling cimport (
+    c_now_ns,
+    HotPathProfiler,
+    LatencyHistogram,
+)
 
 class_logger = None
+cdef HotPathProfiler _profiler = None
+
+
+def set_profiler(HotPathProfiler profiler):
+    """
+    Times the dispatch of every event to its listeners with the profiler, or stops timing it if profiler is None.
+    """
+    global _profiler
+    _profiler = profiler
 
 
 cdef class PubSub:
@@ -37,10 +51,13 @@ cdef class PubSub:
     1. c_add_listener():
        Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
        make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    2. c_remove_listener() and c_get_listeners():
+       Every time. This assumes both are called infrequently.
+    3. c_trigger_event():
+       Only when a dead listener is met while dispatching the event, since it goes through every listener anyway.
+
+    c_has_listeners() takes O(1), so producers can check it before building an event nobody would receive. Listeners
+    that died since the last GC are still counted until the next GC.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -67,6 +84,9 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def has_listeners(self, event_tag: Enum) -> bool:
+        return self.c_has_listeners(event_tag.value)
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -143,23 +163,37 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+    cdef bint c_has_listeners(self, int64_t event_tag):
+        cdef:
+            EventsIterator it = self._events.find(event_tag)
+        return it != self._events.end() and deref(it).second.size() > 0
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection listeners
             object listener_weafref
+            object listener
             EventListener typed_listener
+            bint has_dead_listeners = False
+            HotPathProfiler profiler = _profiler
+            LatencyHistogram histogram
+            int64_t start_ns = 0
         if it == self._events.end():
             return
 
         # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
         # c_remove_listener(), which breaks the iterator if we're using the underlying set.
         listeners = deref(it).second
+        if profiler is not None:
+            start_ns = c_now_ns()
         for pyref in listeners:
             listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is None:
+                has_dead_listeners = True
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +201,9 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+        if profiler is not None:
+            histogram = profiler.c_event_histogram(event_tag)
+            histogram.c_record(c_now_ns() - start_ns)
+            histogram.c_record_listeners(listeners.size())
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
@@ -35,16 +35,20 @@ def import_and_save_wallet(password: str, private_key: str) -> Account:
     return save_wallet(acct, password)
 
 
+def wallet_file_path(public_key: str) -> str:
+    return "%s%s%s%s" % (get_key_file_path(), KEYFILE_PREFIX, public_key, KEYFILE_POSTFIX)
+
+
 def save_wallet(acct: Account, password: str) -> Account:
     encrypted: Dict = Account.encrypt(acct.privateKey, password)
-    file_path: str = "%s%s%s%s" % (get_key_file_path(), KEYFILE_PREFIX, acct.address, KEYFILE_POSTFIX)
+    file_path: str = wallet_file_path(acct.address)
     with open(file_path, 'w+') as f:
         f.write(json.dumps(encrypted))
     return acct
 
 
 def unlock_wallet(public_key: str, password: str) -> str:
-    file_path: str = "%s%s%s%s" % (get_key_file_path(), KEYFILE_PREFIX, public_key, KEYFILE_POSTFIX)
+    file_path: str = wallet_file_path(public_key)
     with open(file_path, 'r') as f:
         encrypted = f.read()
     private_key: str = Account.decrypt(encrypted, password)
@@ -1,8 +1,10 @@
+import logging
 import subprocess
 from subprocess import CalledProcessError
 from decimal import Decimal
 from typing import List, Optional, Dict
 from hummingbot.market.celo.celo_data_types import CeloExchangeRate, CeloBalance
+from hummingbot.market.celo.celo_rpc import CeloRPC, DEFAULT_NODE_URL
 
 
 UNIT_MULTIPLIER = Decimal(1e18)
@@ -39,6 +41,44 @@ def error_msg_from_output(output):
 class CeloCLI:
     unlocked = False
     address = None
+    # Reads go through the node JSON-RPC once connected, transactions always go through celocli.
+    rpc: Optional[CeloRPC] = None
+
+    @classmethod
+    def configured_node_url(cls) -> str:
+        output = command(["celocli", "config:get"]) or ""
+        for line in output.split("\n"):
+            if line.strip().startswith("node:"):
+                return line.split(":", 1)[1].strip()
+        return DEFAULT_NODE_URL
+
+    @classmethod
+    def connect_rpc(cls, node_url: Optional[str] = None) -> Optional[str]:
+        """
+        Connects to the node celocli is configured with, so that balances, exchange rates and the node sync status
+        are read over JSON-RPC instead of starting a celocli process each time.
+        """
+        try:
+            if node_url is None:
+                node_url = cls.configured_node_url()
+            rpc = CeloRPC(node_url)
+            rpc.contract_address("Exchange")
+            cls.rpc = rpc
+            return None
+        except Exception as e:
+            cls.disconnect_rpc(e)
+            return str(e)
+
+    @classmethod
+    def disconnect_rpc(cls, error: Exception):
+        """
+        Falls back on celocli for the reads, e.g. once the node can't be reached anymore.
+        """
+        logging.getLogger(__name__).warning(f"Cannot read from the Celo node over JSON-RPC, celocli is used "
+                                            f"instead. {error}")
+        if cls.rpc is not None:
+            cls.rpc.close()
+        cls.rpc = None
 
     @classmethod
     def unlock_account(cls, address: str, password: str) -> Optional[str]:
@@ -54,14 +94,21 @@ class CeloCLI:
     @classmethod
     def balances(cls) -> Dict[str, CeloBalance]:
         balances = {}
-        output = command(["celocli", "account:balance", cls.address])
-        lines = output.split("\n")
         raw_balances = {}
-        data_type = ["gold", "lockedGold", "usd", "pending"]
-        for line in lines:
-            if ":" in line and [key for key in data_type if (key in line)]:
-                asset, value = line.split(":")
-                raw_balances[asset.strip()] = Decimal(value) / UNIT_MULTIPLIER
+        if cls.rpc is not None:
+            try:
+                for asset, value in cls.rpc.balances(cls.address).items():
+                    raw_balances[asset] = Decimal(value) / UNIT_MULTIPLIER
+            except Exception as e:
+                cls.disconnect_rpc(e)
+        if cls.rpc is None:
+            output = command(["celocli", "account:balance", cls.address])
+            lines = output.split("\n")
+            data_type = ["gold", "lockedGold", "usd", "pending"]
+            for line in lines:
+                if ":" in line and [key for key in data_type if (key in line)]:
+                    asset, value = line.split(":")
+                    raw_balances[asset.strip()] = Decimal(value) / UNIT_MULTIPLIER
         balances[CELO_BASE] = CeloBalance(CELO_BASE, raw_balances["gold"], raw_balances["lockedGold"])
         balances[CELO_QUOTE] = CeloBalance(CELO_QUOTE, raw_balances["usd"], Decimal("0"))
         return balances
@@ -69,6 +116,14 @@ class CeloCLI:
     @classmethod
     def exchange_rate(cls, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
         amount *= UNIT_MULTIPLIER
+        if cls.rpc is not None:
+            try:
+                usd_amount, gold_amount = cls.rpc.buy_token_amounts(int(amount))
+                raw_amount = Decimal(int(amount)) / UNIT_MULTIPLIER
+                return [CeloExchangeRate(CELO_BASE, raw_amount, CELO_QUOTE, Decimal(usd_amount) / UNIT_MULTIPLIER),
+                        CeloExchangeRate(CELO_QUOTE, raw_amount, CELO_BASE, Decimal(gold_amount) / UNIT_MULTIPLIER)]
+            except Exception as e:
+                cls.disconnect_rpc(e)
         output = command(["celocli", "exchange:show", "--amount", str(int(amount))])
         lines = output.split("\n")
         rates = []
@@ -112,6 +167,11 @@ class CeloCLI:
 
     @classmethod
     def validate_node_synced(cls) -> Optional[str]:
+        if cls.rpc is not None:
+            try:
+                return None if cls.rpc.is_synced() else "Celo node is not synced."
+            except Exception as e:
+                cls.disconnect_rpc(e)
         output = command(["celocli", "node:synced"])
         lines = output.split("\n")
         if "true" not in [line.strip().lower() for line in lines]:
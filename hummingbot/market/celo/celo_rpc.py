@@ -0,0 +1,163 @@
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+from hexbytes import HexBytes
+import logging
+import requests
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from web3 import Web3
+
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+DEFAULT_NODE_URL = "http://localhost:8545"
+RPC_TIMEOUT = 10.0
+# How long the latest block number is trusted for before asking the node again, Celo blocks are 5 seconds apart.
+BLOCK_NUMBER_POLL_INTERVAL = 1.0
+# The Registry contract is at the same address on every Celo network, and knows the address of every core contract.
+REGISTRY_ADDRESS = "0x000000000000000000000000000000000000ce10"
+EXCHANGE_CONTRACT = "Exchange"
+STABLE_TOKEN_CONTRACT = "StableToken"
+LOCKED_GOLD_CONTRACT = "LockedGold"
+
+
+def selector(signature: str) -> bytes:
+    return bytes(Web3.keccak(text=signature)[:4])
+
+
+GET_ADDRESS_FOR_STRING_SELECTOR = selector("getAddressForString(string)")
+GET_BUY_TOKEN_AMOUNT_SELECTOR = selector("getBuyTokenAmount(uint256,bool)")
+BALANCE_OF_SELECTOR = selector("balanceOf(address)")
+GET_ACCOUNT_TOTAL_LOCKED_GOLD_SELECTOR = selector("getAccountTotalLockedGold(address)")
+
+
+class CeloRPCError(IOError):
+    pass
+
+
+class CeloRPC:
+    """
+    Reads the Celo state celo_arb needs straight from the node over JSON-RPC, on one kept alive HTTP session, instead
+    of starting a celocli process for every read.
+
+    Exchange rate quotes are evaluated at the latest block and cached for that block, so evaluating the same amount
+    again before the next block doesn't reach the node.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, node_url: str = DEFAULT_NODE_URL):
+        self._node_url: str = node_url
+        self._session: requests.Session = requests.Session()
+        self._next_id: int = 0
+        self._contract_addresses: Dict[str, str] = {}
+        self._block_number: Optional[int] = None
+        self._block_number_timestamp: float = 0
+        # (block number, sell amount) -> (CGLD sold for cUSD, cUSD sold for CGLD)
+        self._buy_token_amounts: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+    @property
+    def node_url(self) -> str:
+        return self._node_url
+
+    def close(self):
+        self._session.close()
+
+    def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Sends the calls in one JSON-RPC batch request.
+
+        :param calls: list of (JSON-RPC method, params)
+        :return: the results, in the order of the calls
+        """
+        first_id: int = self._next_id
+        self._next_id += len(calls)
+        payload: List[Dict[str, Any]] = [
+            {"jsonrpc": "2.0", "id": first_id + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        response = self._session.post(self._node_url, json=payload, timeout=RPC_TIMEOUT)
+        if response.status_code != 200:
+            raise CeloRPCError(f"Error sending request to {self._node_url}. HTTP status is {response.status_code}.")
+        results: List[Any] = [None] * len(calls)
+        for item in response.json():
+            index: int = item["id"] - first_id
+            if "error" in item:
+                raise CeloRPCError(f"Error calling {calls[index][0]}: {item['error'].get('message')}")
+            results[index] = item.get("result")
+        return results
+
+    def call(self, method: str, params: List[Any]) -> Any:
+        return self.batch_call([(method, params)])[0]
+
+    def contract_address(self, contract_name: str) -> str:
+        if contract_name not in self._contract_addresses:
+            data: bytes = GET_ADDRESS_FOR_STRING_SELECTOR + encode_abi(["string"], [contract_name])
+            result: str = self.call("eth_call", [{"to": REGISTRY_ADDRESS, "data": HexBytes(data).hex()}, "latest"])
+            address: str = decode_abi(["address"], HexBytes(result))[0]
+            if int(address, 16) == 0:
+                raise CeloRPCError(f"{contract_name} contract is not registered on the node's network.")
+            self._contract_addresses[contract_name] = address
+        return self._contract_addresses[contract_name]
+
+    def block_number(self) -> int:
+        now: float = time.time()
+        if self._block_number is None or now - self._block_number_timestamp > BLOCK_NUMBER_POLL_INTERVAL:
+            block_number: int = int(self.call("eth_blockNumber", []), 16)
+            if block_number != self._block_number:
+                self._buy_token_amounts.clear()
+            self._block_number = block_number
+            self._block_number_timestamp = now
+        return self._block_number
+
+    def is_synced(self) -> bool:
+        return self.call("eth_syncing", []) is False
+
+    def buy_token_amounts(self, sell_amount: int) -> Tuple[int, int]:
+        """
+        :param sell_amount: raw amount sold, in wei
+        :return: raw cUSD bought for sell_amount CGLD, and raw CGLD bought for sell_amount cUSD
+        """
+        block_number: int = self.block_number()
+        key: Tuple[int, int] = (block_number, sell_amount)
+        if key not in self._buy_token_amounts:
+            exchange_address: str = self.contract_address(EXCHANGE_CONTRACT)
+            calls: List[Tuple[str, List[Any]]] = []
+            for sell_gold in (True, False):
+                data: bytes = GET_BUY_TOKEN_AMOUNT_SELECTOR + encode_abi(["uint256", "bool"], [sell_amount, sell_gold])
+                calls.append(("eth_call", [{"to": exchange_address, "data": HexBytes(data).hex()}, hex(block_number)]))
+            results: List[Any] = self.batch_call(calls)
+            self._buy_token_amounts[key] = tuple(decode_abi(["uint256"], HexBytes(result))[0] for result in results)
+        return self._buy_token_amounts[key]
+
+    def balances(self, address: str) -> Dict[str, int]:
+        """
+        :return: raw gold, lockedGold and usd balances of the account, like celocli account:balance
+        """
+        account_data: bytes = encode_abi(["address"], [address])
+        results: List[Any] = self.batch_call([
+            ("eth_getBalance", [address, "latest"]),
+            ("eth_call", [{"to": self.contract_address(LOCKED_GOLD_CONTRACT),
+                           "data": HexBytes(GET_ACCOUNT_TOTAL_LOCKED_GOLD_SELECTOR + account_data).hex()}, "latest"]),
+            ("eth_call", [{"to": self.contract_address(STABLE_TOKEN_CONTRACT),
+                           "data": HexBytes(BALANCE_OF_SELECTOR + account_data).hex()}, "latest"]),
+        ])
+        return {
+            "gold": int(results[0], 16),
+            "lockedGold": decode_abi(["uint256"], HexBytes(results[1]))[0],
+            "usd": decode_abi(["uint256"], HexBytes(results[2]))[0],
+        }
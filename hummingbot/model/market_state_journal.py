@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+from sqlalchemy import (
+    Column,
+    Text,
+    JSON,
+    Integer,
+    BigInteger,
+    Index
+)
+
+from . import HummingbotBase
+
+
+class MarketStateJournal(HummingbotBase):
+    """
+    Changes to the tracking states of a market since its MarketState row was last written. Each row sets one key of
+    the tracking states, or removes it when state is null.
+    """
+    __tablename__ = "MarketStateJournal"
+    __table_args__ = (Index("msj_config_market_id_index",
+                            "config_file_path", "market", "id"),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    key = Column(Text, nullable=False)
+    state = Column(JSON, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"MarketStateJournal(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', timestamp={self.timestamp}, key='{self.key}', state={self.state})"
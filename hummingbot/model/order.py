@@ -20,6 +20,8 @@ class Order(HummingbotBase):
     __tablename__ = "Order"
     __table_args__ = (Index("o_config_timestamp_index",
                             "config_file_path", "creation_timestamp"),
+                      Index("o_config_market_timestamp_index",
+                            "config_file_path", "market", "creation_timestamp"),
                       Index("o_market_trading_pair_timestamp_index",
                             "market", "symbol", "creation_timestamp"),
                       Index("o_market_base_asset_timestamp_index",
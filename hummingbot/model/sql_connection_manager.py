@@ -5,6 +5,7 @@ import logging
 from os.path import join
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
@@ -16,7 +17,12 @@ from sqlalchemy.orm import (
     Query
 )
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
-from typing import Optional
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot import data_path
 from hummingbot.logger.logger import HummingbotLogger
@@ -47,7 +53,17 @@ class SQLConnectionManager:
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20190614"
+    LOCAL_DB_VERSION_VALUE = "20201019"
+
+    # Write-ahead logging lets readers run alongside the writer, and only syncs to disk at checkpoints.
+    SQLITE_PRAGMAS = ["PRAGMA journal_mode=WAL",
+                      "PRAGMA synchronous=NORMAL",
+                      "PRAGMA cache_size=-65536",
+                      "PRAGMA temp_store=MEMORY"]
+    BULK_INSERT_BATCH_SIZE = 10000
+    POOL_SIZE = 5
+    POOL_MAX_OVERFLOW = 10
+    POOL_RECYCLE_SECONDS = 3600
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -76,7 +92,9 @@ class SQLConnectionManager:
         if "sqlite" in dialect:
             db_path = params.get("db_path")
 
-            return create_engine(f"{dialect}:///{db_path}")
+            engine: Engine = create_engine(f"{dialect}:///{db_path}")
+            event.listen(engine, "connect", cls._set_sqlite_pragmas)
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -84,7 +102,18 @@ class SQLConnectionManager:
             port = params.get("db_port")
             db_name = params.get("db_name")
 
-            return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
+            return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}",
+                                 pool_size=cls.POOL_SIZE,
+                                 max_overflow=cls.POOL_MAX_OVERFLOW,
+                                 pool_recycle=cls.POOL_RECYCLE_SECONDS,
+                                 pool_pre_ping=True)
+
+    @classmethod
+    def _set_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in cls.SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
 
     def __init__(self,
                  connection_type: SQLConnectionType,
@@ -149,15 +178,45 @@ class SQLConnectionManager:
                 self._shared_session.add(version_info)
                 self._shared_session.commit()
             else:
-                # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                # if needed.
                 if result.value < self.LOCAL_DB_VERSION_VALUE:
+                    # Tables created by earlier versions lack the indexes added since.
+                    self.create_missing_indexes()
                     result.value = self.LOCAL_DB_VERSION_VALUE
                     self._shared_session.commit()
         except SQLAlchemyError:
             self.logger().error("Unexpected error while checking and upgrading the local database.",
                                 exc_info=True)
 
+    def create_missing_indexes(self):
+        """
+        Creates the indexes of the models missing from their tables, e.g. the ones added after the tables were.
+        """
+        inspector = inspect(self._engine)
+        for table in self._metadata.sorted_tables:
+            existing_indexes = set(index["name"] for index in inspector.get_indexes(table.name))
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                try:
+                    self.logger().info(f"Creating the {index.name} index of the {table.name} table.")
+                    index.create(self._engine)
+                except SQLAlchemyError:
+                    self.logger().error(f"Error creating the {index.name} index of the {table.name} table.",
+                                        exc_info=True)
+
+    def bulk_insert(self, table: Table, rows: List[Dict[str, Any]], session: Optional[Session] = None):
+        """
+        Inserts rows with core INSERT statements executed in batches, in the transaction of the session.
+        :param rows: the values of the rows, all with the same columns
+        :param session: the session to insert the rows with, the shared session by default
+        """
+        if len(rows) == 0:
+            return
+        if session is None:
+            session = self._shared_session
+        for i in range(0, len(rows), self.BULK_INSERT_BATCH_SIZE):
+            session.execute(table.insert(), rows[i:i + self.BULK_INSERT_BATCH_SIZE])
+
     def commit(self):
         self._shared_session.commit()
 
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+"""
+Columnar archive of trade fills, read by the history and export commands.
+
+Fills are buffered in memory and written in compressed numpy chunks, one array per column, partitioned by day (UTC)
+and market: <archive path>/<YYYY-MM-DD>/<market>/<chunk>.npz. Reading the trades of a session only loads the days it
+spans, and returns a DataFrame the performance report aggregates with vectorized operations, without loading TradeFill
+objects through the ORM. The TradeFill table remains the record of the fills, the archive is written alongside it by
+the MarketsRecorder.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from dateutil import tz
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal(0)
+
+TRADE_ARCHIVE_COLUMNS: Dict[str, str] = {
+    "config_file_path": "str",
+    "strategy": "str",
+    "market": "str",
+    "symbol": "str",
+    "base_asset": "str",
+    "quote_asset": "str",
+    "timestamp": "int64",
+    "order_id": "str",
+    "trade_type": "str",
+    "order_type": "str",
+    "price": "float64",
+    "amount": "float64",
+    "trade_fee": "str",
+    "fee_percent": "float64",
+    # The flat fees paid in the quote asset, as counted by the performance report
+    "quote_flat_fees": "float64",
+    "exchange_trade_id": "str",
+}
+
+
+def quote_flat_fees(trade_fee: Dict[str, Any], quote_asset: str) -> Decimal:
+    """
+    :return: the sum of the flat fees of a trade paid in its quote asset, or in ETH and WETH when quoted in either
+    """
+    total_flat_fees: Decimal = s_decimal_0
+    for flat_fee in trade_fee["flat_fees"]:
+        if isinstance(flat_fee, dict):
+            flat_fee_currency = flat_fee["asset"]
+            flat_fee_amount = flat_fee["amount"]
+        else:
+            flat_fee_currency, flat_fee_amount = flat_fee
+        # Flat fee is currently used only for DEX in ETH token amount, if there is a need for
+        # more interchangable kinda assets, we can handle this in a more proper way (e.g. using global config)
+        if flat_fee_currency == quote_asset or \
+                (flat_fee_currency.upper() in ("ETH", "WETH") and quote_asset.upper() in ("ETH", "WETH")):
+            total_flat_fees += Decimal(str(flat_fee_amount))
+    return total_flat_fees
+
+
+def trade_fill_row(trade: TradeFill) -> Tuple:
+    """
+    :return: the values of the archive columns for a trade fill
+    """
+    return (trade.config_file_path, trade.strategy, trade.market, trade.symbol, trade.base_asset, trade.quote_asset,
+            int(trade.timestamp), trade.order_id, trade.trade_type, trade.order_type, float(trade.price),
+            float(trade.amount), json.dumps(trade.trade_fee), float(trade.trade_fee["percent"]),
+            float(quote_flat_fees(trade.trade_fee, trade.quote_asset)), str(trade.exchange_trade_id))
+
+
+def trades_data_frame(rows: List[Tuple]) -> pd.DataFrame:
+    df: pd.DataFrame = pd.DataFrame.from_records(rows, columns=list(TRADE_ARCHIVE_COLUMNS.keys()))
+    return df.astype({column: dtype for column, dtype in TRADE_ARCHIVE_COLUMNS.items() if dtype != "str"})
+
+
+def trade_fills_data_frame(trades: List[TradeFill]) -> pd.DataFrame:
+    """
+    :return: trade fills which are not archived, e.g. the celo arbitrage trades, in the archive columns
+    """
+    return trades_data_frame([trade_fill_row(trade) for trade in trades])
+
+
+def trades_display_data_frame(trades: pd.DataFrame) -> pd.DataFrame:
+    """
+    The trades in the format of TradeFill.to_pandas, shown by the history command and exported to csv.
+    """
+    timestamps: pd.Series = trades["timestamp"].reset_index(drop=True)
+    order_ids: pd.Series = trades["order_id"].reset_index(drop=True)
+    # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
+    order_nonces: pd.Series = pd.to_numeric(order_ids.str[-16:], errors="coerce")
+    ages: pd.Series = np.trunc(timestamps / 1e3 - order_nonces / 1e6)
+    live_orders: pd.Series = ~order_ids.str.contains("//", regex=False) & ages.notna()
+    age_strings: pd.Series = pd.Series("n/a", index=order_ids.index, dtype=object)
+    if live_orders.any():
+        age_strings[live_orders] = pd.to_datetime(ages[live_orders].astype("int64"), unit="s").dt.strftime("%H:%M:%S")
+    df: pd.DataFrame = pd.DataFrame({
+        "Timestamp": (pd.to_datetime(timestamps // 1000, unit="s", utc=True)
+                      .dt.tz_convert(tz.tzlocal())
+                      .dt.strftime("%Y-%m-%d %H:%M:%S")),
+        "Exchange": trades["market"].to_numpy(),
+        "Market": trades["symbol"].to_numpy(),
+        "Order_type": trades["order_type"].str.lower().to_numpy(),
+        "Side": trades["trade_type"].str.lower().to_numpy(),
+        "Price": trades["price"].to_numpy(),
+        "Amount": trades["amount"].to_numpy(),
+        "Age": age_strings,
+    })
+    df.index = pd.RangeIndex(1, len(df) + 1, name="Index")
+    return df
+
+
+class TradeArchive:
+    _ta_logger: Optional[HummingbotLogger] = None
+    _ta_instance: Optional["TradeArchive"] = None
+
+    # Buffered fills are written once a partition has this many, or once the oldest is this old.
+    CHUNK_SIZE = 1000
+    FLUSH_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ta_logger is None:
+            cls._ta_logger = logging.getLogger(__name__)
+        return cls._ta_logger
+
+    @classmethod
+    def get_instance(cls) -> "TradeArchive":
+        if cls._ta_instance is None:
+            cls._ta_instance = TradeArchive(os.path.join(data_path(), "trade_archive"))
+        return cls._ta_instance
+
+    def __init__(self, archive_path: str):
+        self._archive_path: str = archive_path
+        self._buffers: Dict[Tuple[str, str], List[Tuple]] = {}
+        self._first_buffered_time: Optional[float] = None
+        self._chunk_count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def archive_path(self) -> str:
+        return self._archive_path
+
+    @staticmethod
+    def partition_day(timestamp: int) -> str:
+        return datetime.fromtimestamp(timestamp / 1e3, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def partition_market(market: str) -> str:
+        return re.sub(r"[^\w.-]", "_", market)
+
+    def append(self, trade: TradeFill):
+        row: Tuple = trade_fill_row(trade)
+        partition: Tuple[str, str] = (self.partition_day(trade.timestamp), self.partition_market(trade.market))
+        with self._lock:
+            buffer: List[Tuple] = self._buffers.setdefault(partition, [])
+            buffer.append(row)
+            if self._first_buffered_time is None:
+                self._first_buffered_time = time.time()
+            if len(buffer) < self.CHUNK_SIZE and time.time() - self._first_buffered_time < self.FLUSH_INTERVAL:
+                return
+        self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered fills to the archive.
+        """
+        with self._lock:
+            buffers, self._buffers = self._buffers, {}
+            self._first_buffered_time = None
+            for (day, market), rows in buffers.items():
+                try:
+                    self._write_chunk(day, market, trades_data_frame(rows))
+                except Exception:
+                    self.logger().error(f"Error archiving {len(rows)} trades of {market} on {day}.", exc_info=True)
+
+    def trades(self,
+               start_timestamp: Optional[int] = None,
+               end_timestamp: Optional[int] = None,
+               config_file_path: Optional[str] = None,
+               number_of_rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        :param config_file_path: only the trades of config file paths containing it
+        :param number_of_rows: only the latest trades
+        :return: the archived and buffered trades, in ascending timestamp order
+        """
+        start_day: Optional[str] = self.partition_day(start_timestamp) if start_timestamp is not None else None
+        end_day: Optional[str] = self.partition_day(end_timestamp) if end_timestamp is not None else None
+        with self._lock:
+            buffered: Dict[str, List[Tuple]] = {}
+            for (day, _), rows in self._buffers.items():
+                buffered.setdefault(day, []).extend(rows)
+        days: List[str] = sorted(set(self._archived_days()) | set(buffered.keys()), reverse=True)
+
+        frames: List[pd.DataFrame] = []
+        row_count: int = 0
+        for day in days:
+            if (start_day is not None and day < start_day) or (end_day is not None and day > end_day):
+                continue
+            day_frames: List[pd.DataFrame] = [self._read_chunk(path) for path in self._chunk_paths(day)]
+            if day in buffered:
+                day_frames.append(trades_data_frame(buffered[day]))
+            df: pd.DataFrame = pd.concat(day_frames, ignore_index=True)
+            mask: np.ndarray = np.ones(len(df), dtype=bool)
+            if start_timestamp is not None:
+                mask &= (df["timestamp"] >= start_timestamp).to_numpy()
+            if end_timestamp is not None:
+                mask &= (df["timestamp"] <= end_timestamp).to_numpy()
+            if config_file_path is not None:
+                mask &= df["config_file_path"].str.contains(config_file_path, regex=False).to_numpy()
+            frames.append(df[mask])
+            row_count += int(mask.sum())
+            # Partitions of earlier days only hold earlier trades.
+            if number_of_rows is not None and row_count >= number_of_rows:
+                break
+
+        if len(frames) == 0:
+            return trades_data_frame([])
+        df: pd.DataFrame = pd.concat(frames, ignore_index=True)
+        df = df.sort_values("timestamp", kind="stable", ignore_index=True)
+        if number_of_rows is not None:
+            df = df.iloc[max(0, len(df) - number_of_rows):].reset_index(drop=True)
+        return df
+
+    def export_csv(self, file_path: str, start_timestamp: Optional[int] = None) -> int:
+        """
+        Writes the trades to a csv file, in the format of the history command.
+        :return: the number of trades exported
+        """
+        trades: pd.DataFrame = self.trades(start_timestamp)
+        trades_display_data_frame(trades).to_csv(file_path, header=True)
+        return len(trades)
+
+    def _archived_days(self) -> List[str]:
+        if not os.path.isdir(self._archive_path):
+            return []
+        return [day for day in os.listdir(self._archive_path) if os.path.isdir(os.path.join(self._archive_path, day))]
+
+    def _chunk_paths(self, day: str) -> List[str]:
+        day_path: str = os.path.join(self._archive_path, day)
+        if not os.path.isdir(day_path):
+            return []
+        return [os.path.join(day_path, market, file_name)
+                for market in sorted(os.listdir(day_path))
+                for file_name in sorted(os.listdir(os.path.join(day_path, market)))
+                if file_name.endswith(".npz")]
+
+    def _write_chunk(self, day: str, market: str, df: pd.DataFrame):
+        partition_path: str = os.path.join(self._archive_path, day, market)
+        os.makedirs(partition_path, exist_ok=True)
+        self._chunk_count += 1
+        file_name: str = f"{int(time.time() * 1e3)}-{os.getpid()}-{self._chunk_count}"
+        temporary_path: str = os.path.join(partition_path, f"{file_name}.tmp")
+        columns: Dict[str, np.ndarray] = {column: (df[column].to_numpy(dtype=str) if dtype == "str"
+                                                   else df[column].to_numpy(dtype=dtype))
+                                          for column, dtype in TRADE_ARCHIVE_COLUMNS.items()}
+        with open(temporary_path, "wb") as chunk_file:
+            np.savez_compressed(chunk_file, **columns)
+        os.replace(temporary_path, os.path.join(partition_path, f"{file_name}.npz"))
+
+    @staticmethod
+    def _read_chunk(path: str) -> pd.DataFrame:
+        with np.load(path, allow_pickle=False) as chunk:
+            return pd.DataFrame({column: chunk[column] for column in TRADE_ARCHIVE_COLUMNS.keys()})
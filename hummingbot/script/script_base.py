@@ -1,10 +1,14 @@
 import asyncio
+from collections import deque
 from multiprocessing import Queue
-from typing import List, Optional, Dict, Any, Callable
+from multiprocessing.connection import Connection
+import numpy as np
+from typing import List, Optional, Dict, Any, Callable, Deque
 from decimal import Decimal
 from statistics import mean, median
 from operator import itemgetter
-from .script_interface import OnTick, OnStatus, PMMParameters, CallNotify, CallLog
+from .script_interface import OnTick, OnStatus, PMMParameters, CallNotify, CallLog, ScriptTrade
+from .script_market_data import ScriptMarketData, DEFAULT_TRADES_CAPACITY
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
@@ -18,18 +22,31 @@ class ScriptBase:
     """
     def __init__(self):
         self._parent_queue: Queue = None
-        self._child_queue: Queue = None
+        self._child_connection: Connection = None
         self._queue_check_interval: float = 0.0
+        self._market_data: Optional[ScriptMarketData] = None
         self.mid_prices: List[Decimal] = []
         self.pmm_parameters: PMMParameters = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
         # for example {"binance": {"BTC": Decimal("0.1"), "ETH": Decimal("20"}}
         self.all_total_balances: Dict[str, Dict[str, Decimal]] = None
-
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+        # The top levels of the market order book, in [price, amount] rows, best price first.
+        self.order_book_bids: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        self.order_book_asks: np.ndarray = np.empty((0, 2), dtype=np.float64)
+        # The latest public trades of the market, oldest first.
+        self.recent_trades: Deque[ScriptTrade] = deque(maxlen=DEFAULT_TRADES_CAPACITY)
+
+    def assign_init(self,
+                    parent_queue: Queue,
+                    child_connection: Connection,
+                    queue_check_interval: float,
+                    market_data: Optional[ScriptMarketData] = None):
         self._parent_queue = parent_queue
-        self._child_queue = child_queue
+        self._child_connection = child_connection
         self._queue_check_interval = queue_check_interval
+        self._market_data = market_data
+        if market_data is not None:
+            self.recent_trades = deque(maxlen=market_data.trades_capacity)
 
     @property
     def mid_price(self):
@@ -42,20 +59,17 @@ class ScriptBase:
         asyncio.ensure_future(self.listen_to_parent())
 
     async def listen_to_parent(self):
+        ev_loop = asyncio.get_event_loop()
         while True:
-            if self._parent_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._parent_queue.get()
+            # Wait for the next message on an executor thread, rather than polling the queue.
+            item = await ev_loop.run_in_executor(None, self._parent_queue.get)
             # print(f"child gets {str(item)}")
             if item is None:
                 # print("child exiting..")
-                asyncio.get_event_loop().stop()
+                ev_loop.stop()
                 break
             if isinstance(item, OnTick):
-                self.mid_prices.append(item.mid_price)
-                self.pmm_parameters = item.pmm_parameters
-                self.all_total_balances = item.all_total_balances
+                self.apply_tick(item)
                 self.on_tick()
             elif isinstance(item, BuyOrderCompletedEvent):
                 self.on_buy_order_completed(item)
@@ -65,20 +79,53 @@ class ScriptBase:
                 status_msg = self.on_status()
                 self.notify(f"Script status: {status_msg}")
 
+    def apply_tick(self, on_tick: OnTick):
+        """
+        Updates the mid prices, strategy parameters, balances and market data with a tick from the main process.
+        """
+        self.mid_prices.append(on_tick.mid_price)
+        if self.pmm_parameters is None:
+            self.pmm_parameters = PMMParameters()
+        for name, value in on_tick.parameter_updates.items():
+            # Set the underlying attribute, so the update isn't sent back to the main process.
+            setattr(self.pmm_parameters, "_" + name, value)
+        if self.all_total_balances is None:
+            self.all_total_balances = {}
+        for exchange, balances in on_tick.balance_updates.items():
+            exchange_balances = self.all_total_balances.setdefault(exchange, {})
+            for token, balance in balances.items():
+                if balance > 0:
+                    exchange_balances[token] = balance
+                else:
+                    exchange_balances.pop(token, None)
+        self.refresh_market_data()
+
+    def refresh_market_data(self):
+        """
+        Reads the latest order book depth and trades from shared memory. Called before every on_tick, scripts only
+        need to call it to look at the market between ticks.
+        """
+        if self._market_data is None:
+            return
+        depth = self._market_data.read_order_book()
+        if depth is not None:
+            self.order_book_bids, self.order_book_asks = depth
+        self.recent_trades.extend(self._market_data.read_trades())
+
     def notify(self, msg: str):
         """
         Notifies the user, the message will appear on top left panel of HB application.
         If Telegram integration enabled, the message will also be sent to the telegram user.
         :param msg: The message.
         """
-        self._child_queue.put(CallNotify(msg))
+        self._child_connection.send(CallNotify(msg))
 
     def log(self, msg: str):
         """
         Logs message to the strategy log file and display it on Running Logs section of HB.
         :param msg: The message.
         """
-        self._child_queue.put(CallLog(msg))
+        self._child_connection.send(CallLog(msg))
 
     def avg_mid_price(self, interval: int, length: int) -> Optional[Decimal]:
         """
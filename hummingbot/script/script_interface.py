@@ -1,18 +1,25 @@
-from typing import Dict
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+    Tuple,
+)
 from decimal import Decimal
 
-child_queue = None
+from hummingbot.core.event.events import TradeType
 
+child_connection = None
 
-def set_child_queue(queue):
-    global child_queue
-    child_queue = queue
+
+def set_child_connection(connection):
+    global child_connection
+    child_connection = connection
 
 
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
-    The set method detects if there is a value change it will put itself into the child queue.
+    The set method detects if there is a value change it will send itself through the child connection.
     """
     def __init__(self, attr):
         self.name = attr
@@ -23,11 +30,11 @@ class StrategyParameter(object):
         return getattr(obj, self.attr)
 
     def __set__(self, obj, value):
-        global child_queue
+        global child_connection
         old_value = getattr(obj, self.attr)
         if old_value is not None and old_value != value:
             self.updated_value = value
-            child_queue.put(self)
+            child_connection.send(self)
         setattr(obj, self.attr, value)
 
     def __repr__(self):
@@ -98,13 +105,50 @@ class PMMParameters:
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
 
+PMM_PARAMETER_NAMES: Tuple[str, ...] = tuple(name for name, value in vars(PMMParameters).items()
+                                             if isinstance(value, StrategyParameter))
+
+
+def parameter_updates(strategy: Any, last_values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the strategy parameters which changed since last_values, and records them in last_values.
+    """
+    updates = {}
+    for name in PMM_PARAMETER_NAMES:
+        value = getattr(strategy, name)
+        if name not in last_values or last_values[name] != value:
+            updates[name] = last_values[name] = value
+    return updates
+
+
+def balance_updates(balances: Dict[str, Dict[str, Decimal]],
+                    last_balances: Dict[str, Dict[str, Decimal]]) -> Dict[str, Dict[str, Decimal]]:
+    """
+    Returns the balances which changed since last_balances, and records them in last_balances. Tokens which are no
+    longer held are returned with a zero balance.
+    """
+    updates = {}
+    for exchange, tokens in balances.items():
+        last_tokens = last_balances.setdefault(exchange, {})
+        exchange_updates = {token: balance for token, balance in tokens.items() if last_tokens.get(token) != balance}
+        exchange_updates.update({token: Decimal(0) for token in last_tokens if token not in tokens})
+        if len(exchange_updates) > 0:
+            updates[exchange] = exchange_updates
+        last_balances[exchange] = dict(tokens)
+    return updates
+
+
 class OnTick:
+    """
+    Sent to the script on every tick. Only carries the strategy parameters and total balances which changed since the
+    previous tick, the script keeps track of the others.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]]):
+                 parameter_updates: Dict[str, Any],
+                 balance_updates: Dict[str, Dict[str, Decimal]]):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
-        self.all_total_balances = all_total_balances
+        self.parameter_updates = parameter_updates
+        self.balance_updates = balance_updates
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
@@ -128,3 +172,10 @@ class CallLog:
 
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
+
+
+class ScriptTrade(NamedTuple):
+    timestamp: float
+    price: float
+    amount: float
+    trade_type: TradeType
@@ -14,7 +14,11 @@ cdef class ScriptIterator(TimeIterator):
         object _did_complete_sell_order_forwarder
         object _script_module
         object _parent_queue
-        object _child_queue
+        object _child_connection
+        object _trade_forwarder
+        dict _last_parameters
+        dict _last_balances
+        object _market_data
         object _ev_loop
         object _script_process
         object _listen_to_child_task
@@ -3,7 +3,7 @@
 from typing import List
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+from multiprocessing import Pipe, Process, Queue
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
@@ -11,12 +11,30 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent,
     MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
+)
+from hummingbot.core.event.event_forwarder import (
+    EventForwarder,
+    SourceInfoEventForwarder,
 )
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.script.script_process import run_script
-from hummingbot.script.script_interface import StrategyParameter, PMMParameters, OnTick, OnStatus, CallNotify, CallLog
+from hummingbot.script.script_interface import (
+    balance_updates,
+    CallLog,
+    CallNotify,
+    OnStatus,
+    OnTick,
+    parameter_updates,
+    StrategyParameter,
+)
+from hummingbot.script.script_market_data import (
+    DEFAULT_DEPTH,
+    DEFAULT_TRADES_CAPACITY,
+    ScriptMarketData,
+)
 
 sir_logger = None
 
@@ -34,7 +52,13 @@ cdef class ScriptIterator(TimeIterator):
                  markets: List[ExchangeBase],
                  strategy: PureMarketMakingStrategy,
                  queue_check_interval: float = 0.01,
-                 is_unit_testing_mode: bool = False):
+                 is_unit_testing_mode: bool = False,
+                 depth: int = DEFAULT_DEPTH,
+                 trades_capacity: int = DEFAULT_TRADES_CAPACITY):
+        """
+        :param depth: the number of order book levels on each side shared with the script
+        :param trades_capacity: the number of latest trades shared with the script
+        """
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
@@ -47,17 +71,29 @@ cdef class ScriptIterator(TimeIterator):
             (MarketEvent.BuyOrderCompleted, self._did_complete_buy_order_forwarder),
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
+        self._trade_forwarder = EventForwarder(self._did_trade)
+        self._last_parameters = {}
+        self._last_balances = {}
+        self._market_data = ScriptMarketData(depth, trades_capacity)
         self._ev_loop = asyncio.get_event_loop()
         self._parent_queue = Queue()
-        self._child_queue = Queue()
-        self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
+        self._child_connection, child_connection = Pipe(duplex=False)
+        self._listen_to_child_task = None
 
         self._script_process = Process(
             target=run_script,
-            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(script_file_path, self._parent_queue, child_connection, queue_check_interval,
+                  self._market_data.names, depth, trades_capacity,)
         )
         self.logger().info(f"starting script in {script_file_path}")
         self._script_process.start()
+        # Only the script keeps the sending end open, so the pipe reports end of file once the script exits.
+        child_connection.close()
+        try:
+            self._ev_loop.add_reader(self._child_connection.fileno(), self._read_child_connection)
+        except NotImplementedError:
+            # Event loops without file descriptor callbacks, e.g. the proactor loop on Windows, poll the pipe.
+            self._listen_to_child_task = safe_ensure_future(self.listen_to_child_connection(), loop=self._ev_loop)
 
     @property
     def strategy(self):
@@ -68,25 +104,30 @@ cdef class ScriptIterator(TimeIterator):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        self._strategy.market_info.order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
+        self._strategy.market_info.order_book.remove_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
         self._script_process.join()
+        self._close_child_connection()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+            self._listen_to_child_task = None
+        if self._market_data is not None:
+            self._market_data.close()
+            self._market_data.unlink()
+            self._market_data = None
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy, self.all_total_balances())
+        self._market_data.write_order_book(self._strategy.market_info.order_book)
+        cdef object on_tick = OnTick(self.strategy.get_mid_price(),
+                                     parameter_updates(self._strategy, self._last_parameters),
+                                     balance_updates(self.all_total_balances(), self._last_balances))
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -101,24 +142,41 @@ cdef class ScriptIterator(TimeIterator):
                                  event: SellOrderCompletedEvent):
         self._parent_queue.put(event)
 
-    async def listen_to_child_queue(self):
-        while True:
-            if self._child_queue.empty():
-                await asyncio.sleep(self._queue_check_interval)
-                continue
-            item = self._child_queue.get()
-            # print(f"received: {str(item)}")
-            self.logger().info(f"received: {str(item)}")
-            if item is None:
-                break
-            if isinstance(item, StrategyParameter):
-                setattr(self._strategy, item.name, item.updated_value)
-            elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
-                # ignore this on unit testing as the below import will mess up unit testing.
-                from hummingbot.client.hummingbot_application import HummingbotApplication
-                HummingbotApplication.main_application()._notify(item.msg)
-            elif isinstance(item, CallLog):
-                self.logger().info(f"script - {item.msg}")
+    def _did_trade(self, event: OrderBookTradeEvent):
+        if self._market_data is not None:
+            self._market_data.write_trade(event)
+
+    def _read_child_connection(self):
+        try:
+            while self._child_connection is not None and self._child_connection.poll():
+                self.process_child_message(self._child_connection.recv())
+        except (EOFError, OSError):
+            # The script exited.
+            self._close_child_connection()
+
+    def _close_child_connection(self):
+        if self._child_connection is None:
+            return
+        if self._listen_to_child_task is None:
+            self._ev_loop.remove_reader(self._child_connection.fileno())
+        self._child_connection.close()
+        self._child_connection = None
+
+    async def listen_to_child_connection(self):
+        while self._child_connection is not None:
+            self._read_child_connection()
+            await asyncio.sleep(self._queue_check_interval)
+
+    def process_child_message(self, item):
+        self.logger().info(f"received: {str(item)}")
+        if isinstance(item, StrategyParameter):
+            setattr(self._strategy, item.name, item.updated_value)
+        elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
+            # ignore this on unit testing as the below import will mess up unit testing.
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            HummingbotApplication.main_application()._notify(item.msg)
+        elif isinstance(item, CallLog):
+            self.logger().info(f"script - {item.msg}")
 
     def request_status(self):
         self._parent_queue.put(OnStatus())
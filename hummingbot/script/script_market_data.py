@@ -0,0 +1,167 @@
+"""
+Market data shared with the script process.
+
+The main process publishes the top levels of the strategy's order book, and appends every public trade to a ring
+buffer, in shared memory blocks. The script reads them when it handles a tick, so market data never goes through the
+script queue. Both blocks guard their writes with a sequence number, odd while a write is in progress, so the script
+can retry a read that raced with a write.
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_worker import SharedOrderBookSnapshots
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.script.script_interface import ScriptTrade
+
+DEFAULT_DEPTH = 20
+DEFAULT_TRADES_CAPACITY = 1000
+MAX_READ_ATTEMPTS = 10
+
+# Ring buffer header fields, followed by (timestamp, price, amount, trade type) rows.
+SEQUENCE = 0
+COUNT = 1
+HEADER_SIZE = 2
+TRADE_ROW_SIZE = 4
+
+
+class SharedTradeRing:
+    """
+    The latest trades of a market, in a shared memory ring buffer.
+    """
+    def __init__(self, capacity: int, name: Optional[str] = None):
+        """
+        :param name: the name of an existing block to attach to, or None to create a new one
+        """
+        self._capacity: int = capacity
+        self._shared_memory: SharedMemory = SharedMemory(name=name, create=name is None,
+                                                         size=(HEADER_SIZE + capacity * TRADE_ROW_SIZE) * 8)
+        buffer: np.ndarray = np.ndarray((HEADER_SIZE + capacity * TRADE_ROW_SIZE,), dtype=np.float64,
+                                        buffer=self._shared_memory.buf)
+        self._header: np.ndarray = buffer[:HEADER_SIZE]
+        self._rows: np.ndarray = buffer[HEADER_SIZE:].reshape(capacity, TRADE_ROW_SIZE)
+        if name is None:
+            buffer[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, timestamp: float, price: float, amount: float, trade_type: TradeType):
+        header: np.ndarray = self._header
+        count: int = int(header[COUNT])
+        header[SEQUENCE] += 1
+        self._rows[count % self._capacity] = (timestamp, price, amount, trade_type.value)
+        header[COUNT] = count + 1
+        header[SEQUENCE] += 1
+
+    def read(self, last_count: int) -> Tuple[int, np.ndarray]:
+        """
+        :return: (trade count, rows of the trades after the first last_count trades, oldest first). Only the latest
+                 capacity trades are kept, so a reader that fell behind misses the older ones. If the buffer keeps
+                 being written during the read, returns (last_count, no rows).
+        """
+        header: np.ndarray = self._header
+        for _ in range(MAX_READ_ATTEMPTS):
+            sequence: float = header[SEQUENCE]
+            if sequence % 2 == 1:
+                continue
+            count: int = int(header[COUNT])
+            num_trades: int = min(count - last_count, self._capacity)
+            if num_trades <= 0:
+                return count, np.empty((0, TRADE_ROW_SIZE), dtype=np.float64)
+            indices: np.ndarray = np.arange(count - num_trades, count) % self._capacity
+            rows: np.ndarray = self._rows[indices]
+            if header[SEQUENCE] == sequence:
+                return count, rows
+        return last_count, np.empty((0, TRADE_ROW_SIZE), dtype=np.float64)
+
+    def close(self):
+        self._header = self._rows = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+
+class ScriptMarketData:
+    """
+    The order book depth and recent trades of the strategy's market, shared between the main and the script process.
+    """
+    def __init__(self,
+                 depth: int = DEFAULT_DEPTH,
+                 trades_capacity: int = DEFAULT_TRADES_CAPACITY,
+                 names: Optional[Tuple[str, str]] = None):
+        """
+        :param names: the names of the existing blocks to attach to, or None to create new ones
+        """
+        self._depth: int = depth
+        self._trades_capacity: int = trades_capacity
+        self._order_book_snapshots: SharedOrderBookSnapshots = SharedOrderBookSnapshots(
+            1, depth, name=names[0] if names is not None else None)
+        self._trade_ring: SharedTradeRing = SharedTradeRing(trades_capacity,
+                                                            name=names[1] if names is not None else None)
+        self._order_book_version: int = 0
+        self._trade_count: int = 0
+
+    @property
+    def names(self) -> Tuple[str, str]:
+        return self._order_book_snapshots.name, self._trade_ring.name
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def trades_capacity(self) -> int:
+        return self._trades_capacity
+
+    def write_order_book(self, order_book: OrderBook):
+        """
+        Publishes the top levels of the order book, if it changed since the last call.
+        """
+        if order_book.version != self._order_book_version:
+            self._order_book_snapshots.write(0, order_book)
+            self._order_book_version = order_book.version
+
+    def write_trade(self, trade: OrderBookTradeEvent):
+        self._trade_ring.write(trade.timestamp, trade.price, trade.amount, trade.type)
+
+    def read_order_book(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        :return: the (price, amount) rows of the top bids and asks, or None if they didn't change since the last read
+        """
+        snapshot = self._order_book_snapshots.read(0, self._order_book_version)
+        if snapshot is None:
+            return None
+        self._order_book_version, bids, asks, _ = snapshot
+        return bids[:, :2], asks[:, :2]
+
+    def read_trades(self) -> List[ScriptTrade]:
+        """
+        :return: the trades since the last read, oldest first
+        """
+        self._trade_count, rows = self._trade_ring.read(self._trade_count)
+        return [ScriptTrade(timestamp, price, amount, TradeType(int(trade_type)))
+                for timestamp, price, amount, trade_type in rows.tolist()]
+
+    def close(self):
+        self._order_book_snapshots.close()
+        self._trade_ring.close()
+
+    def unlink(self):
+        self._order_book_snapshots.unlink()
+        self._trade_ring.unlink()
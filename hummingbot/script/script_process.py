@@ -3,21 +3,33 @@ import importlib
 import inspect
 import os
 from multiprocessing import Queue
+from multiprocessing.connection import Connection
+from typing import Tuple
 from hummingbot.script.script_base import ScriptBase
-from hummingbot.script.script_interface import set_child_queue
+from hummingbot.script.script_interface import set_child_connection
+from hummingbot.script.script_market_data import ScriptMarketData
 
 
-def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_script(script_file_name: str,
+               parent_queue: Queue,
+               child_connection: Connection,
+               queue_check_interval: float,
+               market_data_names: Tuple[str, str],
+               depth: int,
+               trades_capacity: int):
     script_class = import_script_sub_class(script_file_name)
     script = script_class()
-    script.assign_init(parent_queue, child_queue, queue_check_interval)
-    set_child_queue(child_queue)
+    market_data = ScriptMarketData(depth, trades_capacity, names=market_data_names)
+    script.assign_init(parent_queue, child_connection, queue_check_interval, market_data)
+    set_child_connection(child_connection)
     policy = asyncio.get_event_loop_policy()
     policy.set_event_loop(policy.new_event_loop())
     ev_loop = asyncio.get_event_loop()
     ev_loop.create_task(script.run())
     ev_loop.run_forever()
     ev_loop.close()
+    market_data.close()
+    child_connection.close()
 
 
 def import_script_sub_class(script_file_name: str):
@@ -5,6 +5,14 @@ from hummingbot.strategy.strategy_base cimport StrategyBase
 from libc.stdint cimport int64_t
 
 
+cdef struct ArbitrageWalkResult:
+    double amount
+    double profitability
+    double bid_price
+    double ask_price
+    bint balance_limited
+
+
 cdef class ArbitrageStrategy(StrategyBase):
     cdef:
         list _market_pairs
@@ -39,3 +47,15 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object sell_market_trading_pair_tuple,
                                              object buy_market_conversion_rate,
                                              object sell_market_conversion_rate)
+
+cdef ArbitrageWalkResult c_walk_arbitrage_order_books(OrderBook buy_order_book,
+                                                     OrderBook sell_order_book,
+                                                     double buy_market_conversion_rate,
+                                                     double sell_market_conversion_rate,
+                                                     double min_profitability,
+                                                     double buy_fee_percent,
+                                                     double sell_fee_percent,
+                                                     double total_buy_flat_fees,
+                                                     double total_sell_flat_fees,
+                                                     double buy_market_quote_balance,
+                                                     double sell_market_base_balance)
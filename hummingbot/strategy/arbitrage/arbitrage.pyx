@@ -1,4 +1,5 @@
 # distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 import logging
 from decimal import Decimal
 import pandas as pd
@@ -9,6 +10,9 @@ from typing import (
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from libc.stdint cimport SIZE_MAX
+from libcpp.vector cimport vector
 from hummingbot.core.event.events import (
     TradeType,
     OrderType,
@@ -23,6 +27,7 @@ from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketP
 
 NaN = float("nan")
 s_decimal_0 = Decimal(0)
+s_decimal_nan = Decimal("nan")
 as_logger = None
 
 
@@ -332,8 +337,6 @@ cdef class ArbitrageStrategy(StrategyBase):
         :type sell_market_trading_pair_tuple: MarketTradingPairTuple
         """
         cdef:
-            object quantized_buy_amount
-            object quantized_sell_amount
             object quantized_order_amount
             object best_amount = s_decimal_0  # best profitable order amount
             object best_profitability = s_decimal_0  # best profitable order amount
@@ -343,9 +346,8 @@ cdef class ArbitrageStrategy(StrategyBase):
         best_amount, best_profitability, buy_price, sell_price = self.c_find_best_profitable_amount(
             buy_market_trading_pair_tuple, sell_market_trading_pair_tuple
         )
-        quantized_buy_amount = buy_market.c_quantize_order_amount(buy_market_trading_pair_tuple.trading_pair, Decimal(best_amount))
-        quantized_sell_amount = sell_market.c_quantize_order_amount(sell_market_trading_pair_tuple.trading_pair, Decimal(best_amount))
-        quantized_order_amount = min(quantized_buy_amount, quantized_sell_amount)
+        # best_amount is already quantized against both markets.
+        quantized_order_amount = best_amount
 
         if quantized_order_amount:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
@@ -392,115 +394,94 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        Fees and balances are looked up once per evaluation, and the order books are walked in C with float math
+        (see c_walk_arbitrage_order_books()). Only the final order size and prices are converted back to Decimal and
+        quantized.
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
-        :rtype: Tuple[float, float, float, float]
+        :rtype: Tuple[Decimal, Decimal, Decimal, Decimal]
         """
         cdef:
-            object total_bid_value = s_decimal_0  # total revenue
-            object total_ask_value = s_decimal_0  # total cost
-            object total_bid_value_adjusted = s_decimal_0  # total revenue adjusted with exchange rate conversion
-            object total_ask_value_adjusted = s_decimal_0  # total cost adjusted with exchange rate conversion
-            object total_previous_step_base_amount = s_decimal_0
-            object profitability
-            object best_profitable_order_amount = s_decimal_0
-            object best_profitable_order_profitability = s_decimal_0
-            object buy_fee
-            object sell_fee
-            object total_sell_flat_fees
-            object total_buy_flat_fees
-            object quantized_profitable_base_amount
-            object net_sell_proceeds
-            object net_buy_costs
-            object buy_market_quote_balance
-            object sell_market_base_balance
             ExchangeBase buy_market = buy_market_trading_pair_tuple.market
             ExchangeBase sell_market = sell_market_trading_pair_tuple.market
             OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
             OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
+            object buy_market_conversion_rate = self.market_conversion_rate(buy_market_trading_pair_tuple)
+            object sell_market_conversion_rate = self.market_conversion_rate(sell_market_trading_pair_tuple)
+            object buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+            object sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
+            object buy_fee
+            object sell_fee
+            object best_profitable_order_amount = s_decimal_0
+            object bid_price = s_decimal_nan
+            object ask_price = s_decimal_nan
+            ArbitrageWalkResult walk_result
 
-        buy_market_conversion_rate = self.market_conversion_rate(buy_market_trading_pair_tuple)
-        sell_market_conversion_rate = self.market_conversion_rate(sell_market_trading_pair_tuple)
-        profitable_orders = c_find_profitable_arbitrage_orders(self._min_profitability,
-                                                               buy_market_trading_pair_tuple,
-                                                               sell_market_trading_pair_tuple,
-                                                               buy_market_conversion_rate,
-                                                               sell_market_conversion_rate)
-
-        # check if each step meets the profit level after fees, and is within the wallet balance
-        # fee must be calculated at every step because fee might change a potentially profitable order to unprofitable
         # market.c_get_fee returns a namedtuple with 2 keys "percent" and "flat_fees"
         # "percent" is the percent in decimals the exchange charges for the particular trade
         # "flat_fees" returns list of additional fees ie: [("ETH", 0.01), ("BNB", 2.5)]
         # typically most exchanges will only have 1 flat fee (ie: gas cost of transaction in ETH)
-        for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
-            buy_fee = buy_market.c_get_fee(
-                buy_market_trading_pair_tuple.base_asset,
-                buy_market_trading_pair_tuple.quote_asset,
-                buy_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.BUY,
-                total_previous_step_base_amount + amount,
-                ask_price
-            )
-            sell_fee = sell_market.c_get_fee(
-                sell_market_trading_pair_tuple.base_asset,
-                sell_market_trading_pair_tuple.quote_asset,
-                sell_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.SELL,
-                total_previous_step_base_amount + amount,
-                bid_price
-            )
-            # accumulated flat fees of exchange
-            total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
-            total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
-
-            # accumulated profitability with fees
-            total_bid_value_adjusted += bid_price_adjusted * amount
-            total_ask_value_adjusted += ask_price_adjusted * amount
-            net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee.percent) - total_sell_flat_fees
-            net_buy_costs = total_ask_value_adjusted * (1 + buy_fee.percent) + total_buy_flat_fees
-            profitability = net_sell_proceeds / net_buy_costs
-
-            # if current step is within minimum profitability, set to best profitable order
-            # because the total amount is greater than the previous step
-            if profitability > (1 + self._min_profitability):
-                best_profitable_order_amount = total_previous_step_base_amount + amount
-                best_profitable_order_profitability = profitability
-
-            if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
-                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {profitability}, "
-                                                   f"Current step profitability: {bid_price/ask_price},"
-                                                   f"bid, ask price, amount: {bid_price, ask_price, amount}")
-            buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
-            sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
-            # stop current step if buy/sell market does not have enough asset
-            if (buy_market_quote_balance < net_buy_costs or
-                    sell_market_base_balance < (total_previous_step_base_amount + amount)):
-                # use previous step as best profitable order if below min profitability
-                if profitability < (1 + self._min_profitability):
-                    break
-                if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
-                    self.log_with_clock(logging.DEBUG,
-                                        f"Not enough asset to complete this step. "
-                                        f"Quote asset needed: {total_ask_value + ask_price * amount}. "
-                                        f"Quote asset available balance: {buy_market_quote_balance}. "
-                                        f"Base asset needed: {total_bid_value + bid_price * amount}. "
-                                        f"Base asset available balance: {sell_market_base_balance}. ")
-
-                # market buys need to be adjusted to account for additional fees
-                buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
-                                                  (1 + buy_fee.percent))
-                # buy and sell with the amount of available base or quote asset, whichever is smaller
-                best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
-                best_profitable_order_profitability = profitability
-                break
+        # Fees are estimated once at the top of the books for the largest tradable amount, instead of at every step.
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            buy_market.get_taker_order_type(),
+            TradeType.BUY,
+            sell_market_base_balance,
+            buy_market.c_get_price(buy_market_trading_pair_tuple.trading_pair, True)
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            sell_market.get_taker_order_type(),
+            TradeType.SELL,
+            sell_market_base_balance,
+            sell_market.c_get_price(sell_market_trading_pair_tuple.trading_pair, False)
+        )
 
-            total_bid_value += bid_price * amount
-            total_ask_value += ask_price * amount
-            total_previous_step_base_amount += amount
+        walk_result = c_walk_arbitrage_order_books(
+            buy_order_book,
+            sell_order_book,
+            float(buy_market_conversion_rate),
+            float(sell_market_conversion_rate),
+            float(self._min_profitability),
+            float(buy_fee.percent),
+            float(sell_fee.percent),
+            float(self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)),
+            float(self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)),
+            float(buy_market_quote_balance),
+            float(sell_market_base_balance)
+        )
 
+        if walk_result.amount > 0:
+            best_profitable_order_amount = min(
+                buy_market.c_quantize_order_amount(buy_market_trading_pair_tuple.trading_pair,
+                                                   Decimal(walk_result.amount)),
+                sell_market.c_quantize_order_amount(sell_market_trading_pair_tuple.trading_pair,
+                                                    Decimal(walk_result.amount))
+            )
+        if walk_result.bid_price == walk_result.bid_price:
+            bid_price = sell_market.c_quantize_order_price(sell_market_trading_pair_tuple.trading_pair,
+                                                           Decimal(walk_result.bid_price))
+            ask_price = buy_market.c_quantize_order_price(buy_market_trading_pair_tuple.trading_pair,
+                                                          Decimal(walk_result.ask_price))
+
+        if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
+            self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {walk_result.profitability}, "
+                                               f"bid, ask price, amount: {bid_price, ask_price, best_profitable_order_amount}")
+        if walk_result.balance_limited and self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
+            self.log_with_clock(logging.DEBUG,
+                                f"Not enough asset to take all profitable orders. "
+                                f"Quote asset available balance: {buy_market_quote_balance}. "
+                                f"Base asset available balance: {sell_market_base_balance}. ")
         if self._logging_options & self.OPTION_LOG_FULL_PROFITABILITY_STEP:
+            profitable_orders = c_find_profitable_arbitrage_orders(self._min_profitability,
+                                                                   buy_market_trading_pair_tuple,
+                                                                   sell_market_trading_pair_tuple,
+                                                                   buy_market_conversion_rate,
+                                                                   sell_market_conversion_rate)
             self.log_with_clock(
                 logging.DEBUG,
                 "\n" + pd.DataFrame(
@@ -513,7 +494,7 @@ cdef class ArbitrageStrategy(StrategyBase):
                 ).to_string()
             )
 
-        return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
+        return best_profitable_order_amount, Decimal(walk_result.profitability), bid_price, ask_price
 
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
@@ -613,3 +594,145 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         pass
 
     return profitable_orders
+
+
+cdef ArbitrageWalkResult c_walk_arbitrage_order_books(OrderBook buy_order_book,
+                                                     OrderBook sell_order_book,
+                                                     double buy_market_conversion_rate,
+                                                     double sell_market_conversion_rate,
+                                                     double min_profitability,
+                                                     double buy_fee_percent,
+                                                     double sell_fee_percent,
+                                                     double total_buy_flat_fees,
+                                                     double total_sell_flat_fees,
+                                                     double buy_market_quote_balance,
+                                                     double sell_market_base_balance):
+    """
+    Walks the sell market bid book and the buy market ask book over copies of their C++ entries, matching the levels
+    like c_find_profitable_arbitrage_orders() does, and stops at the largest amount that is still profitable after
+    fees and within the available balances.
+
+    No Python objects are created inside the loop. Prices and amounts are raw (unquantized) floats, the caller is
+    expected to quantize the result.
+
+    :param buy_order_book: order book of the buy side market, its ask entries are taken
+    :param sell_order_book: order book of the sell side market, its bid entries are taken
+    :param buy_market_conversion_rate: conversion rate for buy market price
+    :param sell_market_conversion_rate: conversion rate for sell market price
+    :param min_profitability: Minimum profit ratio
+    :param buy_fee_percent: taker fee percent on the buy market
+    :param sell_fee_percent: taker fee percent on the sell market
+    :param total_buy_flat_fees: flat fees on the buy market, in its quote asset
+    :param total_sell_flat_fees: flat fees on the sell market, in its quote asset
+    :param buy_market_quote_balance: available quote balance on the buy market
+    :param sell_market_base_balance: available base balance on the sell market
+    :return: best profitable amount, its profitability and the bid/ask prices of the last step taken
+    """
+    cdef:
+        vector[OrderBookEntry] bid_entries
+        vector[OrderBookEntry] ask_entries
+        size_t bid_index = 0
+        size_t ask_index = 0
+        double top_bid_price
+        double top_ask_price
+        double current_bid_price = NaN
+        double current_ask_price = NaN
+        double bid_leftover_amount = 0
+        double ask_leftover_amount = 0
+        double current_bid_price_adjusted
+        double current_ask_price_adjusted
+        double step_amount
+        double total_bid_value_adjusted = 0  # total revenue adjusted with exchange rate conversion
+        double total_ask_value_adjusted = 0  # total cost adjusted with exchange rate conversion
+        double total_previous_step_base_amount = 0
+        double net_sell_proceeds
+        double net_buy_costs
+        double profitability
+        ArbitrageWalkResult result
+
+    result.amount = 0
+    result.profitability = 0
+    result.bid_price = NaN
+    result.ask_price = NaN
+    result.balance_limited = False
+
+    # Only the levels crossing the top of the other book can be matched, the small margin makes sure rounding in the
+    # conversion doesn't leave out a level right at the limit.
+    sell_order_book.c_copy_entries(True, NaN, 1, &bid_entries)
+    buy_order_book.c_copy_entries(False, NaN, 1, &ask_entries)
+    if bid_entries.size() == 0 or ask_entries.size() == 0:
+        return result
+    top_bid_price = bid_entries[0].getPrice()
+    top_ask_price = ask_entries[0].getPrice()
+    bid_entries.clear()
+    ask_entries.clear()
+    sell_order_book.c_copy_entries(True,
+                                   top_ask_price * buy_market_conversion_rate / sell_market_conversion_rate *
+                                   (1 - 1e-9),
+                                   SIZE_MAX, &bid_entries)
+    buy_order_book.c_copy_entries(False,
+                                  top_bid_price * sell_market_conversion_rate / buy_market_conversion_rate *
+                                  (1 + 1e-9),
+                                  SIZE_MAX, &ask_entries)
+
+    while True:
+        # advance to the next bid and/or ask entry once the current one is filled completely, skipping entries with
+        # 0 amount for exchanges like binance that include them
+        while bid_leftover_amount <= 0 and bid_index < bid_entries.size():
+            current_bid_price = bid_entries[bid_index].getPrice()
+            bid_leftover_amount = bid_entries[bid_index].getAmount()
+            bid_index += 1
+        while ask_leftover_amount <= 0 and ask_index < ask_entries.size():
+            current_ask_price = ask_entries[ask_index].getPrice()
+            ask_leftover_amount = ask_entries[ask_index].getAmount()
+            ask_index += 1
+        if bid_leftover_amount <= 0 or ask_leftover_amount <= 0:
+            break
+
+        # adjust price based on the quote token rates
+        current_bid_price_adjusted = current_bid_price * sell_market_conversion_rate
+        current_ask_price_adjusted = current_ask_price * buy_market_conversion_rate
+        # arbitrage not possible
+        if current_bid_price_adjusted < current_ask_price_adjusted:
+            break
+        # allow negative profitability for debugging
+        if min_profitability < 0 and current_bid_price_adjusted / current_ask_price_adjusted < (1 + min_profitability):
+            break
+
+        step_amount = min(bid_leftover_amount, ask_leftover_amount)
+        result.bid_price = current_bid_price
+        result.ask_price = current_ask_price
+
+        # accumulated profitability with fees
+        total_bid_value_adjusted += current_bid_price_adjusted * step_amount
+        total_ask_value_adjusted += current_ask_price_adjusted * step_amount
+        net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee_percent) - total_sell_flat_fees
+        net_buy_costs = total_ask_value_adjusted * (1 + buy_fee_percent) + total_buy_flat_fees
+        profitability = net_sell_proceeds / net_buy_costs
+
+        # if current step is within minimum profitability, set to best profitable order
+        # because the total amount is greater than the previous step
+        if profitability > (1 + min_profitability):
+            result.amount = total_previous_step_base_amount + step_amount
+            result.profitability = profitability
+
+        # stop current step if buy/sell market does not have enough asset
+        if (buy_market_quote_balance < net_buy_costs or
+                sell_market_base_balance < (total_previous_step_base_amount + step_amount)):
+            # use previous step as best profitable order if below min profitability
+            if profitability < (1 + min_profitability):
+                break
+            # buy and sell with the amount of available base or quote asset, whichever is smaller
+            # market buys need to be adjusted to account for additional fees
+            result.amount = min(sell_market_base_balance,
+                                (buy_market_quote_balance / current_ask_price - total_buy_flat_fees) /
+                                (1 + buy_fee_percent))
+            result.profitability = profitability
+            result.balance_limited = True
+            break
+
+        total_previous_step_base_amount += step_amount
+        ask_leftover_amount -= step_amount
+        bid_leftover_amount -= step_amount
+
+    return result
@@ -23,6 +23,7 @@ cdef class CeloArbStrategy(StrategyBase):
         bint _hb_app_notification
         object _async_scheduler
         object _main_task
+        double _last_main_process_started
         bint _mock_celo_cli_mode
         object _trade_profits
         object _ev_loop
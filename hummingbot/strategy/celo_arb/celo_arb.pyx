@@ -41,6 +41,9 @@ NaN = float("nan")
 s_decimal_zero = Decimal(0)
 ds_logger = None
 NODE_SYNCED_CHECK_INTERVAL = 60.0 * 5.0
+RPC_CALL_INTERVAL = 0.01
+# Without JSON-RPC, every evaluation starts celocli processes.
+CELOCLI_CALL_INTERVAL = 1.0
 
 
 def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
@@ -116,6 +119,7 @@ cdef class CeloArbStrategy(StrategyBase):
         self._ev_loop = asyncio.get_event_loop()
         self._async_scheduler = None
         self._main_task = None
+        self._last_main_process_started = 0
         self._last_synced_checked = 0
         self._node_synced = False
 
@@ -233,7 +237,8 @@ cdef class CeloArbStrategy(StrategyBase):
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
         try:
             if self._async_scheduler is None:
-                self._async_scheduler = AsyncCallScheduler(call_interval=1)
+                # Reads over JSON-RPC take milliseconds, c_main() spaces out the evaluations when celocli is used.
+                self._async_scheduler = AsyncCallScheduler(call_interval=RPC_CALL_INTERVAL)
             if not self._all_markets_ready:
                 self._all_markets_ready = all([market.ready for market in self._sb_markets])
                 if not self._all_markets_ready:
@@ -259,6 +264,11 @@ cdef class CeloArbStrategy(StrategyBase):
             self.main_process()
         else:
             if self._main_task is None or self._main_task.done():
+                # The node may become unreachable while trading, CeloCLI falls back on celocli then.
+                if (CeloCLI.rpc is None and
+                        self._current_timestamp < self._last_main_process_started + CELOCLI_CALL_INTERVAL):
+                    return
+                self._last_main_process_started = self._current_timestamp
                 coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30)
                 self._main_task = safe_ensure_future(coro)
 
@@ -21,6 +21,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.order_latency import HEDGE_SUBMIT
 from hummingbot.core.event.events import OrderType
 
 from hummingbot.core.data_type.order_book import OrderBook
@@ -612,6 +613,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             if quantized_hedge_amount > s_decimal_zero:
                 self.c_place_order(market_pair, False, False, quantized_hedge_amount, order_price)
+                for _, fill_event in buy_fill_records:
+                    self.c_record_order_span(market_pair.maker.market, fill_event.order_id, HEDGE_SUBMIT)
 
                 del self._order_fill_buy_events[market_pair]
                 if self._logging_options & self.OPTION_LOG_MAKER_ORDER_HEDGED:
@@ -645,6 +648,8 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
             if quantized_hedge_amount > s_decimal_zero:
                 self.c_place_order(market_pair, True, False, quantized_hedge_amount, order_price)
+                for _, fill_event in sell_fill_records:
+                    self.c_record_order_span(market_pair.maker.market, fill_event.order_id, HEDGE_SUBMIT)
 
                 del self._order_fill_sell_events[market_pair]
                 if self._logging_options & self.OPTION_LOG_MAKER_ORDER_HEDGED:
@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from hummingbot.core.data_type.expiration_queue cimport ExpirationQueue
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.time_iterator cimport TimeIterator
 
@@ -13,6 +14,7 @@ cdef class OrderTracker(TimeIterator):
         dict _shadow_order_id_to_market_pair
         object _shadow_gc_requests
         object _in_flight_cancels
+        ExpirationQueue _in_flight_cancel_expiration_queue
         object _in_flight_pending_created
 
     cdef dict c_get_limit_orders(self)
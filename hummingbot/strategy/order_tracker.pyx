@@ -34,6 +34,7 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        self._in_flight_cancel_expiration_queue = ExpirationQueue()
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -139,24 +140,21 @@ cdef class OrderTracker(TimeIterator):
         :param order_id: the order id to be cancelled
         :return: True if there's no existing in flight cancel for the order id, False otherwise.
         """
-        cdef:
-            list keys_to_delete = []
-
         if order_id in self._in_flight_pending_created:  # Checks if a Buy/SellOrderCreatedEvent has been received
             return False
 
         # Maintain the cancel expiry time invariant.
-        for k, cancel_timestamp in self._in_flight_cancels.items():
-            if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
-                keys_to_delete.append(k)
-        for k in keys_to_delete:
-            del self._in_flight_cancels[k]
+        for k in self._in_flight_cancel_expiration_queue.c_pop_expired(self._current_timestamp):
+            self._in_flight_cancels.pop(k, None)
 
         if order_id in self.in_flight_cancels:
             return False
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        self._in_flight_cancel_expiration_queue.c_push(order_id,
+                                                       self._current_timestamp,
+                                                       self._current_timestamp + self.CANCEL_EXPIRY_DURATION)
         return True
 
     cdef object c_get_market_pair_from_order_id(self, str order_id):
@@ -212,6 +210,7 @@ cdef class OrderTracker(TimeIterator):
             del self._order_id_to_market_pair[order_id]
         if order_id in self._in_flight_cancels:
             del self._in_flight_cancels[order_id]
+        self._in_flight_cancel_expiration_queue.c_remove(order_id)
 
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity):
         if market_pair not in self._tracked_market_orders:
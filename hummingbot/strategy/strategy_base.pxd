@@ -35,6 +35,9 @@ cdef class StrategyBase(TimeIterator):
     cdef c_did_expire_order_tracker(self, object order_expired_event)
     cdef c_did_complete_buy_order_tracker(self, object order_completed_event)
     cdef c_did_complete_sell_order_tracker(self, object order_completed_event)
+    cdef c_did_create_order_tracker(self, object order_created_event)
+    cdef c_did_fill_order_tracker(self, object order_filled_event)
+    cdef c_record_order_span(self, object market, str order_id, str span, object timestamp = *)
 
     cdef str c_buy_with_specific_market(self, object market_trading_pair_tuple, object amount,
                                         object order_type = *, object price = *, double expiration_seconds = *)
@@ -1,6 +1,7 @@
 from decimal import Decimal
 import logging
 import pandas as pd
+import time
 from typing import (
     List)
 
@@ -11,6 +12,14 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_latency import (
+    DECISION,
+    FILL,
+    order_latency_stats,
+    REST_RESPONSE,
+    SUBMIT,
+)
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import (
     OrderFilledEvent,
@@ -47,6 +56,7 @@ cdef class SellOrderCompletedListener(BaseStrategyEventListener):
 
 cdef class OrderFilledListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_did_fill_order_tracker(arg)
         self._owner.c_did_fill_order(arg)
 
 
@@ -70,11 +80,13 @@ cdef class OrderExpiredListener(BaseStrategyEventListener):
 
 cdef class BuyOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_did_create_order_tracker(arg)
         self._owner.c_did_create_buy_order(arg)
 
 
 cdef class SellOrderCreatedListener(BaseStrategyEventListener):
     cdef c_call(self, object arg):
+        self._owner.c_did_create_order_tracker(arg)
         self._owner.c_did_create_sell_order(arg)
 # </editor-fold>
 
@@ -357,6 +369,38 @@ cdef class StrategyBase(TimeIterator):
     cdef c_did_complete_sell_order_tracker(self, object order_completed_event):
         self.c_did_complete_buy_order_tracker(order_completed_event)
 
+    cdef c_did_create_order_tracker(self, object order_created_event):
+        cdef:
+            str order_id = order_created_event.order_id
+            object market_pair = self._sb_order_tracker.c_get_market_pair_from_order_id(order_id)
+
+        # Connectors that trace their REST calls have recorded the response already, for the others the order created
+        # event is the exchange acknowledgement.
+        if market_pair is not None:
+            self.c_record_order_span(market_pair.market, order_id, REST_RESPONSE)
+
+    cdef c_did_fill_order_tracker(self, object order_filled_event):
+        cdef:
+            str order_id = order_filled_event.order_id
+            object market_pair = self._sb_order_tracker.c_get_market_pair_from_order_id(order_id)
+
+        if market_pair is not None:
+            self.c_record_order_span(market_pair.market, order_id, FILL)
+
+    cdef c_record_order_span(self, object market, str order_id, str span, object timestamp=None):
+        """
+        Records the order latency span on the in flight order, if the market tracks in flight orders. The decision and
+        submit of orders the market starts tracking later, in a coroutine, are kept pending until then.
+        """
+        try:
+            in_flight_order = market.in_flight_orders.get(order_id)
+        except NotImplementedError:
+            return
+        if isinstance(in_flight_order, InFlightOrderBase):
+            order_latency_stats().record_span(market.name, in_flight_order, span, timestamp)
+        elif in_flight_order is None and span in (DECISION, SUBMIT):
+            order_latency_stats().record_pending_span(order_id, span, timestamp)
+
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -392,12 +436,16 @@ cdef class StrategyBase(TimeIterator):
             raise ValueError(f"Market object for buy order is not in the whitelisted markets set.")
 
         cdef:
+            double decision_time = time.perf_counter()
             str order_id = market.c_buy(market_trading_pair_tuple.trading_pair,
                                         amount=amount,
                                         order_type=order_type,
                                         price=price,
                                         kwargs=kwargs)
 
+        self.c_record_order_span(market, order_id, DECISION, decision_time)
+        self.c_record_order_span(market, order_id, SUBMIT)
+
         # Start order tracking
         if order_type.is_limit_type():
             self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, True, price, amount)
@@ -436,9 +484,13 @@ cdef class StrategyBase(TimeIterator):
             raise ValueError(f"Market object for sell order is not in the whitelisted markets set.")
 
         cdef:
+            double decision_time = time.perf_counter()
             str order_id = market.c_sell(market_trading_pair_tuple.trading_pair, amount,
                                          order_type=order_type, price=price, kwargs=kwargs)
 
+        self.c_record_order_span(market, order_id, DECISION, decision_time)
+        self.c_record_order_span(market, order_id, SUBMIT)
+
         # Start order tracking
         if order_type.is_limit_type():
             self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, False, price, amount)
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+from .currency_graph import CurrencyGraph
+from .triangular_arbitrage import TriangularArbitrageStrategy
+
+
+__all__ = [
+    CurrencyGraph,
+    TriangularArbitrageStrategy,
+]
@@ -0,0 +1,29 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+
+cdef class CurrencyGraph:
+    cdef:
+        dict _asset_indices
+        list _assets
+        list _edge_infos
+        vector[int] _edge_from
+        vector[int] _edge_to
+        vector[double] _edge_rate
+        vector[double] _edge_weight
+        vector[double] _edge_volume
+        vector[int] _changed_edges
+        vector[char] _edge_changed
+        vector[double] _distances
+        vector[int] _predecessors
+        int64_t _rejected_cycle_count
+
+    cdef int c_get_asset_index(self, str asset)
+    cdef int c_add_edge(self, str from_asset, str to_asset, object edge_info)
+    cdef c_update_edge(self, int edge_id, double rate, double volume)
+    cdef c_mark_all_changed(self)
+    cdef list c_find_best_cycle(self, double min_profitability, int max_legs)
+    cdef list c_find_best_cycle_through_edge(self, int edge_id, double max_weight, int max_legs)
+    cdef double c_get_cycle_rate(self, list cycle)
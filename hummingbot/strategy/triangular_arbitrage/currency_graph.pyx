@@ -0,0 +1,232 @@
+# distutils: language=c++
+
+from libc.math cimport (
+    log,
+    INFINITY
+)
+from typing import (
+    Any,
+    List,
+    Tuple
+)
+
+
+cdef class CurrencyGraph:
+    """
+    Directed graph of assets, where every edge is a conversion from one asset to another on a market (e.g. selling
+    ETH for USDT on binance) and is weighted by -log(rate). A cycle whose weights sum up to less than 0 converts an
+    asset back into more of itself, i.e. it is an arbitrage opportunity.
+
+    Edge weights are updated incrementally. Only an edge whose rate got better can create a new profitable cycle, so
+    those edges are remembered, and the search (a hop bounded Bellman-Ford) only looks for cycles going through them.
+    Each search takes O(max_legs * number of edges) per changed edge.
+    """
+
+    def __init__(self):
+        self._asset_indices = {}
+        self._assets = []
+        self._edge_infos = []
+        self._rejected_cycle_count = 0
+
+    @property
+    def assets(self) -> List[str]:
+        return list(self._assets)
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_from.size()
+
+    @property
+    def changed_edge_count(self) -> int:
+        return self._changed_edges.size()
+
+    @property
+    def rejected_cycle_count(self) -> int:
+        """
+        The number of searches whose lightest path back to an edge visited an asset twice. Those are dropped rather
+        than searched again for the best simple cycle, so a growing count means opportunities may be missed.
+        """
+        return self._rejected_cycle_count
+
+    def edge_info(self, edge_id: int) -> Any:
+        return self._edge_infos[edge_id]
+
+    def edge_rate(self, edge_id: int) -> float:
+        return self._edge_rate[edge_id]
+
+    def edge_volume(self, edge_id: int) -> float:
+        return self._edge_volume[edge_id]
+
+    def edge_assets(self, edge_id: int) -> Tuple[str, str]:
+        cdef:
+            int from_asset = self._edge_from[edge_id]
+            int to_asset = self._edge_to[edge_id]
+        return self._assets[from_asset], self._assets[to_asset]
+
+    def add_edge(self, from_asset: str, to_asset: str, edge_info: Any = None) -> int:
+        return self.c_add_edge(from_asset, to_asset, edge_info)
+
+    def update_edge(self, edge_id: int, rate: float, volume: float):
+        self.c_update_edge(edge_id, rate, volume)
+
+    def mark_all_changed(self):
+        self.c_mark_all_changed()
+
+    def find_best_cycle(self, min_profitability: float, max_legs: int) -> List[int]:
+        return self.c_find_best_cycle(min_profitability, max_legs)
+
+    def get_cycle_rate(self, cycle: List[int]) -> float:
+        return self.c_get_cycle_rate(cycle)
+
+    cdef int c_get_asset_index(self, str asset):
+        cdef:
+            object index = self._asset_indices.get(asset)
+        if index is None:
+            index = len(self._assets)
+            self._asset_indices[asset] = index
+            self._assets.append(asset)
+        return index
+
+    cdef int c_add_edge(self, str from_asset, str to_asset, object edge_info):
+        """
+        Adds an edge with no usable rate yet, its rate is set with c_update_edge().
+
+        :return: the edge id
+        """
+        cdef:
+            int edge_id = self._edge_from.size()
+        self._edge_from.push_back(self.c_get_asset_index(from_asset))
+        self._edge_to.push_back(self.c_get_asset_index(to_asset))
+        self._edge_rate.push_back(0)
+        self._edge_weight.push_back(INFINITY)
+        self._edge_volume.push_back(0)
+        self._edge_changed.push_back(0)
+        self._edge_infos.append(edge_info)
+        return edge_id
+
+    cdef c_update_edge(self, int edge_id, double rate, double volume):
+        """
+        :param edge_id: the edge id
+        :param rate: how much of the to asset is received for 1 unit of the from asset, after fees
+        :param volume: how much of the from asset can be converted at this rate
+        """
+        cdef:
+            double weight = -log(rate) if rate > 0 and volume > 0 else INFINITY
+        if weight < self._edge_weight[edge_id] and not self._edge_changed[edge_id]:
+            self._edge_changed[edge_id] = 1
+            self._changed_edges.push_back(edge_id)
+        self._edge_rate[edge_id] = rate
+        self._edge_weight[edge_id] = weight
+        self._edge_volume[edge_id] = volume
+
+    cdef c_mark_all_changed(self):
+        """
+        Makes the next search look at every edge, e.g. to find again the opportunities that were ignored while the
+        strategy was not ready to trade.
+        """
+        cdef:
+            int edge_id
+        self._changed_edges.clear()
+        for edge_id in range(self._edge_from.size()):
+            self._edge_changed[edge_id] = 1
+            self._changed_edges.push_back(edge_id)
+
+    cdef list c_find_best_cycle(self, double min_profitability, int max_legs):
+        """
+        Finds the most profitable cycle going through any of the edges changed since the last search.
+
+        :param min_profitability: minimum profit ratio of the cycle, after fees
+        :param max_legs: maximum number of edges in the cycle
+        :return: list of edge ids in trading order, or an empty list if no cycle is profitable enough
+        """
+        cdef:
+            double best_weight = -log(1 + min_profitability)
+            double weight
+            list best_cycle = []
+            list cycle
+            int edge_id
+
+        for edge_id in self._changed_edges:
+            self._edge_changed[edge_id] = 0
+            cycle = self.c_find_best_cycle_through_edge(edge_id, best_weight, max_legs)
+            if len(cycle) > 0:
+                weight = -log(self.c_get_cycle_rate(cycle))
+                if weight < best_weight:
+                    best_weight = weight
+                    best_cycle = cycle
+        self._changed_edges.clear()
+        return best_cycle
+
+    cdef list c_find_best_cycle_through_edge(self, int edge_id, double max_weight, int max_legs):
+        """
+        Hop bounded Bellman-Ford from the end of the edge back to its start. distances[k][n] is the lowest weight of
+        a path of exactly k edges from the end of the edge to asset n, and predecessors[k][n] is the last edge of
+        that path.
+
+        :return: list of edge ids in trading order, starting with edge_id, or an empty list if there's no simple
+                 cycle lighter than max_weight
+        """
+        cdef:
+            int asset_count = len(self._assets)
+            int edge_count = self._edge_from.size()
+            int source = self._edge_to[edge_id]
+            int target = self._edge_from[edge_id]
+            double edge_weight = self._edge_weight[edge_id]
+            double best_weight = max_weight
+            double candidate_weight
+            int best_legs = 0
+            int k
+            int n
+            int e
+            int from_asset
+            int to_asset
+            list path
+            set visited
+
+        if source == target or edge_weight == INFINITY:
+            return []
+
+        self._distances.assign(max_legs * asset_count, INFINITY)
+        self._predecessors.assign(max_legs * asset_count, -1)
+        self._distances[source] = 0
+
+        for k in range(1, max_legs):
+            for e in range(edge_count):
+                if e == edge_id:
+                    continue
+                from_asset = self._edge_from[e]
+                to_asset = self._edge_to[e]
+                candidate_weight = self._distances[(k - 1) * asset_count + from_asset] + self._edge_weight[e]
+                if candidate_weight < self._distances[k * asset_count + to_asset]:
+                    self._distances[k * asset_count + to_asset] = candidate_weight
+                    self._predecessors[k * asset_count + to_asset] = e
+            candidate_weight = self._distances[k * asset_count + target] + edge_weight
+            if candidate_weight < best_weight:
+                best_weight = candidate_weight
+                best_legs = k
+
+        if best_legs == 0:
+            return []
+
+        # Walk the predecessors back from the start of the edge, and reject cycles visiting an asset twice.
+        path = []
+        visited = {target}
+        n = target
+        for k in range(best_legs, 0, -1):
+            e = self._predecessors[k * asset_count + n]
+            path.append(e)
+            n = self._edge_from[e]
+            if n in visited:
+                self._rejected_cycle_count += 1
+                return []
+            visited.add(n)
+        path.reverse()
+        return [edge_id] + path
+
+    cdef double c_get_cycle_rate(self, list cycle):
+        cdef:
+            double rate = 1
+            int edge_id
+        for edge_id in cycle:
+            rate *= self._edge_rate[edge_id]
+        return rate
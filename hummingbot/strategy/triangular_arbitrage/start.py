@@ -0,0 +1,42 @@
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+from decimal import Decimal
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.triangular_arbitrage.triangular_arbitrage import TriangularArbitrageStrategy
+from hummingbot.strategy.triangular_arbitrage.triangular_arbitrage_config_map import triangular_arbitrage_config_map
+
+
+def start(self):
+    markets: Dict[str, List[str]] = triangular_arbitrage_config_map.get("markets").value
+    min_profitability = triangular_arbitrage_config_map.get("min_profitability").value / Decimal("100")
+    max_legs = triangular_arbitrage_config_map.get("max_legs").value
+
+    try:
+        market_names: List[Tuple[str, List[str]]] = [(exchange.lower(), trading_pairs)
+                                                     for exchange, trading_pairs in markets.items()]
+        market_assets: Dict[str, List[Tuple[str, str]]] = {
+            exchange: self._initialize_market_assets(exchange, trading_pairs)
+            for exchange, trading_pairs in market_names
+        }
+    except ValueError as e:
+        self._notify(str(e))
+        return
+
+    all_assets = set(asset for assets in market_assets.values() for pair_assets in assets for asset in pair_assets)
+    self._initialize_wallet(token_trading_pairs=list(all_assets))
+    self._initialize_markets(market_names)
+    self.assets = all_assets
+
+    self.market_trading_pair_tuples = [
+        MarketTradingPairTuple(self.markets[exchange], trading_pair, *assets)
+        for exchange, trading_pairs in market_names
+        for trading_pair, assets in zip(trading_pairs, market_assets[exchange])
+    ]
+    self.strategy = TriangularArbitrageStrategy(market_infos=self.market_trading_pair_tuples,
+                                                min_profitability=min_profitability,
+                                                max_legs=max_legs,
+                                                logging_options=TriangularArbitrageStrategy.OPTION_LOG_ALL,
+                                                hb_app_notification=True)
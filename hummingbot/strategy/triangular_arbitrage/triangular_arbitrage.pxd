@@ -0,0 +1,42 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.strategy.strategy_base cimport StrategyBase
+from .currency_graph cimport CurrencyGraph
+
+
+cdef class TriangularArbitrageStrategy(StrategyBase):
+    cdef:
+        list _market_infos
+        CurrencyGraph _graph
+        dict _order_book_to_market_index
+        list _subscribed_order_books
+        EventListener _order_book_update_listener
+        object _min_profitability
+        int _max_legs
+        bint _all_markets_ready
+        bint _all_markets_connected
+        bint _ready_for_new_orders
+        bint _cool_off_logged
+        double _status_report_interval
+        double _last_timestamp
+        double _last_trade_timestamp
+        double _next_trade_delay
+        int64_t _logging_options
+        bint _hb_app_notification
+        vector[double] _buy_fee_percents
+        vector[double] _sell_fee_percents
+        vector[double] _bid_prices
+        vector[double] _ask_prices
+        list _last_cycle
+        double _last_cycle_profitability
+
+    cdef c_initialize_graph(self)
+    cdef c_did_update_order_book(self, OrderBook order_book)
+    cdef c_update_market_edges(self, int market_index)
+    cdef bint c_check_ready_for_new_orders(self)
+    cdef c_find_and_execute_cycle(self)
+    cdef c_execute_cycle(self, list cycle)
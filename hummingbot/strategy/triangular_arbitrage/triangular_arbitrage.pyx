@@ -0,0 +1,446 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from decimal import Decimal
+import logging
+import pandas as pd
+from typing import (
+    List,
+    Tuple
+)
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    TradeType
+)
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+from .currency_graph cimport CurrencyGraph
+from .currency_graph import CurrencyGraph
+
+NaN = float("nan")
+s_decimal_0 = Decimal(0)
+s_decimal_1 = Decimal(1)
+tas_logger = None
+
+
+cdef class OrderBookUpdateListener(EventListener):
+    cdef:
+        TriangularArbitrageStrategy _owner
+
+    def __init__(self, TriangularArbitrageStrategy owner):
+        super().__init__()
+        self._owner = owner
+
+    cdef c_call(self, object order_book):
+        self._owner.c_did_update_order_book(order_book)
+
+
+cdef class TriangularArbitrageStrategy(StrategyBase):
+    """
+    Looks for profitable cycles of trades (e.g. USDT -> ETH -> BTC -> USDT) across all the trading pairs and markets
+    given to it, and takes all the legs of a cycle at once, using the inventory held on each market.
+
+    Every market trading pair adds two edges to a CurrencyGraph: selling the base asset at the best bid, and buying
+    it at the best ask, both after taker fees. The edges of a trading pair are updated, and the graph searched,
+    whenever its order book changes, rather than once per clock tick.
+    """
+    OPTION_LOG_STATUS_REPORT = 1 << 0
+    OPTION_LOG_CREATE_ORDER = 1 << 1
+    OPTION_LOG_ORDER_COMPLETED = 1 << 2
+    OPTION_LOG_CYCLE_FOUND = 1 << 3
+    OPTION_LOG_INSUFFICIENT_ASSET = 1 << 4
+    OPTION_LOG_ALL = 0xfffffffffffffff
+
+    ORDER_BOOK_UPDATE_EVENT_TAG = OrderBookEvent.UpdateEvent.value
+
+    @classmethod
+    def logger(cls):
+        global tas_logger
+        if tas_logger is None:
+            tas_logger = logging.getLogger(__name__)
+        return tas_logger
+
+    def __init__(self,
+                 market_infos: List[MarketTradingPairTuple],
+                 min_profitability: Decimal,
+                 max_legs: int = 3,
+                 logging_options: int = OPTION_LOG_ORDER_COMPLETED,
+                 status_report_interval: float = 60.0,
+                 next_trade_delay_interval: float = 15.0,
+                 hb_app_notification: bool = False):
+        """
+        :param market_infos: list of all the market trading pairs that can be used as a leg
+        :param min_profitability: minimum profitability of a cycle after fees, e.g. 0.003 for 0.3%
+        :param max_legs: maximum number of trades in a cycle
+        :param logging_options: select the types of logs to output
+        :param status_report_interval: how often to report network connection related warnings, if any
+        :param next_trade_delay_interval: cool off period between trades
+        """
+        if len(market_infos) < 2:
+            raise ValueError("At least 2 market trading pairs are needed to form a cycle.")
+        if max_legs < 2:
+            raise ValueError("max_legs must be at least 2.")
+        super().__init__()
+        self._market_infos = market_infos
+        self._min_profitability = min_profitability
+        self._max_legs = max_legs
+        self._logging_options = logging_options
+        self._status_report_interval = status_report_interval
+        self._next_trade_delay = next_trade_delay_interval
+        self._hb_app_notification = hb_app_notification
+        self._all_markets_ready = False
+        self._all_markets_connected = False
+        self._ready_for_new_orders = True
+        self._cool_off_logged = False
+        self._last_timestamp = 0
+        self._last_trade_timestamp = 0
+        self._order_book_to_market_index = {}
+        self._subscribed_order_books = []
+        self._order_book_update_listener = OrderBookUpdateListener(self)
+        self._last_cycle = []
+        self._last_cycle_profitability = NaN
+
+        self._graph = CurrencyGraph()
+        for market_info in market_infos:
+            market_index = len(self._bid_prices)
+            # Edge 2 * market_index sells the base asset, edge 2 * market_index + 1 buys it.
+            self._graph.c_add_edge(market_info.base_asset, market_info.quote_asset, (market_index, False))
+            self._graph.c_add_edge(market_info.quote_asset, market_info.base_asset, (market_index, True))
+            self._buy_fee_percents.push_back(0)
+            self._sell_fee_percents.push_back(0)
+            self._bid_prices.push_back(NaN)
+            self._ask_prices.push_back(NaN)
+
+        self.c_add_markets(list(set(market_info.market for market_info in market_infos)))
+
+    @property
+    def market_infos(self) -> List[MarketTradingPairTuple]:
+        return self._market_infos
+
+    @property
+    def graph(self) -> CurrencyGraph:
+        return self._graph
+
+    @property
+    def tracked_limit_orders(self) -> List[Tuple[ExchangeBase, LimitOrder]]:
+        return self._sb_order_tracker.tracked_limit_orders
+
+    @property
+    def tracked_market_orders(self) -> List[Tuple[ExchangeBase, MarketOrder]]:
+        return self._sb_order_tracker.tracked_market_orders
+
+    @property
+    def last_cycle(self) -> List[MarketTradingPairTuple]:
+        return [self._market_infos[self._graph.edge_info(edge_id)[0]] for edge_id in self._last_cycle]
+
+    @property
+    def last_cycle_profitability(self) -> float:
+        return self._last_cycle_profitability
+
+    def notify_hb_app(self, msg: str):
+        if self._hb_app_notification:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            HummingbotApplication.main_application()._notify(msg)
+
+    def format_cycle(self, cycle: List[int]) -> str:
+        cdef:
+            list legs = []
+        for edge_id in cycle:
+            market_index, is_buy = self._graph.edge_info(edge_id)
+            market_info = self._market_infos[market_index]
+            legs.append(f"{'buy' if is_buy else 'sell'} {market_info.trading_pair} on {market_info.market.name}")
+        return ", ".join(legs)
+
+    def format_status(self) -> str:
+        cdef:
+            list lines = []
+            list warning_lines = []
+
+        warning_lines.extend(self.network_warning(self._market_infos))
+
+        markets_df = self.market_status_data_frame(self._market_infos)
+        lines.extend(["", "  Markets:"] + ["    " + line for line in str(markets_df).split("\n")])
+
+        assets_df = self.wallet_balance_data_frame(self._market_infos)
+        lines.extend(["", "  Assets:"] + ["    " + line for line in str(assets_df).split("\n")])
+
+        lines.extend(["", f"  Currency graph: {len(self._graph.assets)} assets, {self._graph.edge_count} edges, "
+                          f"cycles of up to {self._max_legs} legs, {self._graph.rejected_cycle_count} non-simple "
+                          f"cycles rejected."])
+        if len(self._last_cycle) > 0:
+            lines.extend(["", "  Last profitable cycle (after fees):",
+                          f"    {self.format_cycle(self._last_cycle)}: "
+                          f"{round((self._last_cycle_profitability - 1) * 100, 4)} %"])
+
+        tracked_market_orders_df = self._sb_order_tracker.tracked_market_orders_data_frame
+        tracked_limit_orders_df = self._sb_order_tracker.tracked_limit_orders_data_frame
+        if len(tracked_limit_orders_df) > 0 or len(tracked_market_orders_df) > 0:
+            lines.extend(["", "  Pending orders:"] +
+                         ["    " + line for line in str(tracked_limit_orders_df).split("\n")] +
+                         ["    " + line for line in str(tracked_market_orders_df).split("\n")])
+        else:
+            lines.extend(["", "  No pending orders."])
+
+        warning_lines.extend(self.balance_warning(self._market_infos))
+        if len(warning_lines) > 0:
+            lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
+
+        return "\n".join(lines)
+
+    cdef c_stop(self, Clock clock):
+        cdef:
+            OrderBook order_book
+        for order_book in self._subscribed_order_books:
+            order_book.c_remove_listener(self.ORDER_BOOK_UPDATE_EVENT_TAG, self._order_book_update_listener)
+        self._subscribed_order_books = []
+        StrategyBase.c_stop(self, clock)
+
+    cdef c_tick(self, double timestamp):
+        """
+        Clock tick entry point.
+
+        Trading itself happens on order book updates. The clock tick checks the markets readiness and connection
+        status, and ends the cool off period after a trade.
+
+        :param timestamp: current tick timestamp
+        """
+        StrategyBase.c_tick(self, timestamp)
+
+        cdef:
+            int64_t current_tick = <int64_t>(timestamp // self._status_report_interval)
+            int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
+            bint should_report_warnings = ((current_tick > last_tick) and
+                                           (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
+        try:
+            if not self._all_markets_ready:
+                self._all_markets_ready = all([market.ready for market in self._sb_markets])
+                if not self._all_markets_ready:
+                    # Markets not ready yet. Don't do anything.
+                    if should_report_warnings:
+                        self.logger().warning(f"Markets are not ready. No arbitrage trading is permitted.")
+                    return
+                else:
+                    if self._logging_options & self.OPTION_LOG_STATUS_REPORT:
+                        self.logger().info(f"Markets are ready. Trading started.")
+                    self.c_initialize_graph()
+
+            self._all_markets_connected = all([market.network_status is NetworkStatus.CONNECTED
+                                               for market in self._sb_markets])
+            if not self._all_markets_connected:
+                if should_report_warnings:
+                    self.logger().warning(f"Markets are not all online. No arbitrage trading is permitted.")
+                return
+
+            # Resumes the search once the cool off period is over, even if no order book changed since.
+            self.c_find_and_execute_cycle()
+        finally:
+            self._last_timestamp = timestamp
+
+    cdef c_initialize_graph(self):
+        """
+        Estimates the taker fees, subscribes to the order books updates and sets all the edges of the graph.
+        """
+        cdef:
+            ExchangeBase market
+            OrderBook order_book
+            int market_index
+
+        for market_index, market_info in enumerate(self._market_infos):
+            market = market_info.market
+            buy_fee = market.c_get_fee(market_info.base_asset, market_info.quote_asset,
+                                       market.get_taker_order_type(), TradeType.BUY, s_decimal_1, s_decimal_0)
+            sell_fee = market.c_get_fee(market_info.base_asset, market_info.quote_asset,
+                                        market.get_taker_order_type(), TradeType.SELL, s_decimal_1, s_decimal_0)
+            if len(buy_fee.flat_fees) > 0 or len(sell_fee.flat_fees) > 0:
+                self.logger().warning(f"Flat fees on {market.name} are not accounted for in cycle profitability.")
+            self._buy_fee_percents[market_index] = float(buy_fee.percent)
+            self._sell_fee_percents[market_index] = float(sell_fee.percent)
+
+            order_book = market_info.order_book
+            self._order_book_to_market_index.setdefault(order_book, []).append(market_index)
+            if order_book not in self._subscribed_order_books:
+                order_book.c_add_listener(self.ORDER_BOOK_UPDATE_EVENT_TAG, self._order_book_update_listener)
+                self._subscribed_order_books.append(order_book)
+            self.c_update_market_edges(market_index)
+
+    cdef c_did_update_order_book(self, OrderBook order_book):
+        cdef:
+            list market_indices = self._order_book_to_market_index.get(order_book)
+            int market_index
+
+        if market_indices is None:
+            return
+        for market_index in market_indices:
+            self.c_update_market_edges(market_index)
+        if self._all_markets_connected:
+            self.c_find_and_execute_cycle()
+
+    cdef c_update_market_edges(self, int market_index):
+        """
+        Reads the top of the order book of a market trading pair from its C++ entries, and updates the sell and buy
+        edges of the trading pair.
+        """
+        cdef:
+            OrderBook order_book = self._market_infos[market_index].order_book
+            vector[OrderBookEntry] bid_entries
+            vector[OrderBookEntry] ask_entries
+            double bid_price = NaN
+            double bid_amount = 0
+            double ask_price = NaN
+            double ask_amount = 0
+
+        order_book.c_copy_entries(True, NaN, 1, &bid_entries)
+        order_book.c_copy_entries(False, NaN, 1, &ask_entries)
+        if bid_entries.size() > 0:
+            bid_price = bid_entries[0].getPrice()
+            bid_amount = bid_entries[0].getAmount()
+        if ask_entries.size() > 0:
+            ask_price = ask_entries[0].getPrice()
+            ask_amount = ask_entries[0].getAmount()
+        self._bid_prices[market_index] = bid_price
+        self._ask_prices[market_index] = ask_price
+
+        # Selling base: rate in quote per base, volume in base.
+        self._graph.c_update_edge(2 * market_index,
+                                  bid_price * (1 - self._sell_fee_percents[market_index]),
+                                  bid_amount)
+        # Buying base: rate in base per quote, volume in quote.
+        self._graph.c_update_edge(2 * market_index + 1,
+                                  (1 - self._buy_fee_percents[market_index]) / ask_price if ask_price > 0 else 0,
+                                  ask_amount * ask_price)
+
+    cdef bint c_check_ready_for_new_orders(self):
+        """
+        Check whether we are ready for making new arbitrage orders or not. Conditions where we should not make further
+        new orders include:
+
+         1. There are outstanding taker orders.
+         2. We're still within the cool-off period from the last trade, which means the exchange balances may be not
+            accurate temporarily.
+        """
+        if len(self._sb_order_tracker.c_get_limit_orders()) > 0 or len(self._sb_order_tracker.c_get_market_orders()) > 0:
+            return False
+        if self._last_trade_timestamp > 0 and self._current_timestamp < self._last_trade_timestamp + self._next_trade_delay:
+            if not self._cool_off_logged:
+                self.log_with_clock(logging.INFO,
+                                    f"Cooling off from previous trade. Resuming in "
+                                    f"{int(self._last_trade_timestamp + self._next_trade_delay - self._current_timestamp)}"
+                                    f" seconds.")
+                self._cool_off_logged = True
+            return False
+        if self._cool_off_logged:
+            self.log_with_clock(logging.INFO, f"Cool off completed. Arbitrage strategy is now ready for new orders.")
+            self._cool_off_logged = False
+        return True
+
+    cdef c_find_and_execute_cycle(self):
+        cdef:
+            list cycle
+            bint ready = self.c_check_ready_for_new_orders()
+            int64_t rejected_cycle_count
+
+        if not ready:
+            self._ready_for_new_orders = False
+            return
+        if not self._ready_for_new_orders:
+            # Opportunities that appeared while not ready were not searched for, search the whole graph once.
+            self._graph.c_mark_all_changed()
+            self._ready_for_new_orders = True
+
+        rejected_cycle_count = self._graph._rejected_cycle_count
+        cycle = self._graph.c_find_best_cycle(float(self._min_profitability), self._max_legs)
+        if self._graph._rejected_cycle_count > rejected_cycle_count:
+            self.logger().debug(f"Rejected {self._graph._rejected_cycle_count - rejected_cycle_count} cycles visiting "
+                                f"an asset twice, {self._graph._rejected_cycle_count} since the start.")
+        if len(cycle) > 0:
+            self._last_cycle = cycle
+            self._last_cycle_profitability = self._graph.c_get_cycle_rate(cycle)
+            if self._logging_options & self.OPTION_LOG_CYCLE_FOUND:
+                self.log_with_clock(logging.INFO,
+                                    f"Found profitable cycle: {self.format_cycle(cycle)}, profitability "
+                                    f"{round((self._last_cycle_profitability - 1) * 100, 4)} %.")
+            self.c_execute_cycle(cycle)
+
+    cdef c_execute_cycle(self, list cycle):
+        """
+        Sizes the cycle by the top of book volume of every leg and by the balances available on every market, then
+        sends all the legs as taker orders at once.
+
+        :param cycle: edge ids in trading order
+        """
+        cdef:
+            double start_amount = float("inf")
+            double leg_input_ratio = 1
+            double leg_input_amount
+            double balance
+            int edge_id
+            int market_index
+            bint is_buy
+            ExchangeBase market
+            list orders = []
+
+        for edge_id in cycle:
+            market_index, is_buy = self._graph.edge_info(edge_id)
+            market_info = self._market_infos[market_index]
+            market = market_info.market
+            balance = float(market.c_get_available_balance(market_info.quote_asset if is_buy
+                                                           else market_info.base_asset))
+            start_amount = min(start_amount, min(self._graph._edge_volume[edge_id], balance) / leg_input_ratio)
+            leg_input_ratio *= self._graph._edge_rate[edge_id]
+
+        leg_input_ratio = 1
+        for edge_id in cycle:
+            market_index, is_buy = self._graph.edge_info(edge_id)
+            market_info = self._market_infos[market_index]
+            market = market_info.market
+            leg_input_amount = start_amount * leg_input_ratio
+            leg_input_ratio *= self._graph._edge_rate[edge_id]
+            if is_buy:
+                amount = market.c_quantize_order_amount(market_info.trading_pair,
+                                                        Decimal(leg_input_amount / self._ask_prices[market_index]))
+                price = market.c_quantize_order_price(market_info.trading_pair,
+                                                      Decimal(self._ask_prices[market_index]))
+            else:
+                amount = market.c_quantize_order_amount(market_info.trading_pair, Decimal(leg_input_amount))
+                price = market.c_quantize_order_price(market_info.trading_pair,
+                                                      Decimal(self._bid_prices[market_index]))
+            if amount <= s_decimal_0:
+                if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
+                    self.log_with_clock(logging.INFO,
+                                        f"Order size on {market_info.trading_pair} ({market.name}) is too small, "
+                                        f"not enough asset or order book volume to take the cycle.")
+                return
+            orders.append((market_info, is_buy, amount, price))
+
+        for market_info, is_buy, amount, price in orders:
+            if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
+                self.log_with_clock(logging.INFO,
+                                    f"Executing {'buy' if is_buy else 'sell'} order of {amount} "
+                                    f"{market_info.trading_pair} at {market_info.market.name} at {price}.")
+            if is_buy:
+                self.c_buy_with_specific_market(market_info, amount,
+                                                order_type=market_info.market.get_taker_order_type(), price=price,
+                                                expiration_seconds=self._next_trade_delay)
+            else:
+                self.c_sell_with_specific_market(market_info, amount,
+                                                 order_type=market_info.market.get_taker_order_type(), price=price,
+                                                 expiration_seconds=self._next_trade_delay)
+        self._last_trade_timestamp = self._current_timestamp
+        self.notify_hb_app(f"Arbitrage cycle executed: {self.format_cycle(cycle)}.")
+
+    cdef c_did_complete_buy_order(self, object buy_order_completed_event):
+        if self._logging_options & self.OPTION_LOG_ORDER_COMPLETED:
+            self.log_with_clock(logging.INFO, f"Buy order completed: {buy_order_completed_event.order_id}")
+
+    cdef c_did_complete_sell_order(self, object sell_order_completed_event):
+        if self._logging_options & self.OPTION_LOG_ORDER_COMPLETED:
+            self.log_with_clock(logging.INFO, f"Sell order completed: {sell_order_completed_event.order_id}")
@@ -0,0 +1,82 @@
+import json
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.config_validators import (
+    validate_exchange,
+    validate_market_trading_pair,
+    validate_decimal,
+    validate_int
+)
+from hummingbot.client.settings import (
+    required_exchanges,
+    EXAMPLE_PAIRS,
+)
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional
+)
+
+
+def parse_markets(value: str) -> Dict[str, List[str]]:
+    # str() of a dict uses single quotes, which is not valid JSON
+    return json.loads(value.replace("'", '"'))
+
+
+def validate_markets(value: str) -> Optional[str]:
+    try:
+        markets = parse_markets(value)
+    except Exception:
+        return "Invalid format, e.g. {\"binance\": [\"ETH-USDT\", \"BTC-USDT\", \"ETH-BTC\"]}"
+    if not isinstance(markets, dict) or len(markets) == 0:
+        return "At least one exchange is required."
+    if sum(len(trading_pairs) for trading_pairs in markets.values()) < 2:
+        return "At least 2 trading pairs are required."
+    for exchange, trading_pairs in markets.items():
+        err_msg = validate_exchange(exchange)
+        if err_msg is not None:
+            return err_msg
+        for trading_pair in trading_pairs:
+            err_msg = validate_market_trading_pair(exchange, trading_pair)
+            if err_msg is not None:
+                return err_msg
+
+
+def markets_on_validated(value: str):
+    for exchange in parse_markets(value):
+        required_exchanges.append(exchange)
+
+
+def markets_prompt() -> str:
+    example = EXAMPLE_PAIRS.get("binance")
+    return "Enter the exchanges and trading pairs to build the currency graph from, " \
+           "e.g. {\"binance\": [\"%s\", ...], \"kucoin\": [...]} >>> " % (example or "ETH-USDT")
+
+
+triangular_arbitrage_config_map = {
+    "strategy":
+        ConfigVar(key="strategy",
+                  prompt="",
+                  default="triangular_arbitrage"),
+    "markets": ConfigVar(
+        key="markets",
+        prompt=markets_prompt,
+        prompt_on_new=True,
+        validator=validate_markets,
+        on_validated=markets_on_validated,
+        type_str="json"),
+    "min_profitability": ConfigVar(
+        key="min_profitability",
+        prompt="What is the minimum profitability of a cycle, after fees, for you to trade it? "
+               "(Enter 1 to indicate 1%) >>> ",
+        prompt_on_new=True,
+        default=Decimal("0.3"),
+        validator=lambda v: validate_decimal(v, Decimal(0), Decimal("100"), inclusive=True),
+        type_str="decimal"),
+    "max_legs": ConfigVar(
+        key="max_legs",
+        prompt="What is the maximum number of trades in a cycle? >>> ",
+        default=3,
+        validator=lambda v: validate_int(v, 2, 6, inclusive=True),
+        type_str="int"),
+}
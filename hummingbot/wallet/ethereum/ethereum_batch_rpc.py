@@ -0,0 +1,206 @@
+import aiohttp
+from cachetools import TTLCache
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import ujson
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+
+s_logger = None
+
+BATCH_RPC_TIMEOUT = 10.0
+
+# MakerDAO Multicall, aggregates many eth_call into a single one evaluated at the same block.
+MULTICALL_ADDRESSES: Dict[EthereumChain, str] = {
+    EthereumChain.MAIN_NET: "0xeefBa1e63905eF1D7ACbA5a8513c70307C1cE441",
+}
+MULTICALL_AGGREGATE_SELECTOR: bytes = bytes(Web3.keccak(text="aggregate((address,bytes)[])")[:4])
+ERC20_BALANCE_OF_SELECTOR: bytes = bytes(Web3.keccak(text="balanceOf(address)")[:4])
+
+# Blocks fetched by any watcher or by the wallet backend, by block hash.
+_shared_block_cache: TTLCache = TTLCache(maxsize=100, ttl=120)
+
+
+def shared_block_cache() -> TTLCache:
+    return _shared_block_cache
+
+
+class JSONRPCError(IOError):
+    def __init__(self, method: str, error: Dict[str, Any]):
+        super().__init__(f"Error calling {method}: {error.get('message')} (code {error.get('code')}).")
+        self.method: str = method
+        self.error: Dict[str, Any] = error
+
+
+class EthereumBatchRPC:
+    """
+    Sends many Ethereum JSON-RPC calls as a single batch request, instead of one request per call through the
+    AsyncCallScheduler thread.
+
+    Results are returned in the order of the calls. A failed call gives a JSONRPCError in place of its result,
+    like asyncio.gather(return_exceptions=True), so one failing call doesn't fail the whole batch.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, jsonrpc_url: str, multicall_address: Optional[str] = None):
+        self._jsonrpc_url: str = jsonrpc_url
+        self._multicall_address: Optional[str] = multicall_address
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._next_id: int = 0
+
+    @property
+    def multicall_address(self) -> Optional[str]:
+        return self._multicall_address
+
+    def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None:
+            self._shared_client = aiohttp.ClientSession()
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        :param calls: list of (JSON-RPC method, params)
+        :return: the raw results, or a JSONRPCError for the failed calls
+        """
+        if len(calls) == 0:
+            return []
+        first_id: int = self._next_id
+        self._next_id += len(calls)
+        payload: List[Dict[str, Any]] = [
+            {"jsonrpc": "2.0", "id": first_id + i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        async with self._http_client().post(self._jsonrpc_url,
+                                            data=ujson.dumps(payload),
+                                            headers={"Content-Type": "application/json"},
+                                            timeout=BATCH_RPC_TIMEOUT) as response:
+            if response.status != 200:
+                raise IOError(f"Error sending batch request to {self._jsonrpc_url}. "
+                              f"HTTP status is {response.status}.")
+            responses: List[Dict[str, Any]] = await response.json(loads=ujson.loads, content_type=None)
+
+        results: List[Any] = [None] * len(calls)
+        for item in responses:
+            index: int = item["id"] - first_id
+            if "error" in item:
+                results[index] = JSONRPCError(calls[index][0], item["error"])
+            else:
+                results[index] = item.get("result")
+        return results
+
+    async def get_balances(self, account_address: str, token_addresses: List[str]) -> Tuple[int, List[int]]:
+        """
+        Fetches the ETH balance and the ERC20 token balances of an account in one request. The token balances go
+        through Multicall when it's deployed on the chain, or as one eth_call per token in the same batch otherwise.
+
+        :return: (raw ETH balance, raw token balances in the order of token_addresses)
+        """
+        balance_of_data: bytes = ERC20_BALANCE_OF_SELECTOR + encode_abi(["address"], [account_address])
+        calls: List[Tuple[str, List[Any]]] = [("eth_getBalance", [account_address, "latest"])]
+        if self._multicall_address is not None and len(token_addresses) > 0:
+            aggregate_data: bytes = MULTICALL_AGGREGATE_SELECTOR + encode_abi(
+                ["(address,bytes)[]"],
+                [[(token_address, balance_of_data) for token_address in token_addresses]]
+            )
+            calls.append(("eth_call", [{"to": self._multicall_address, "data": HexBytes(aggregate_data).hex()},
+                                       "latest"]))
+        else:
+            calls.extend(("eth_call", [{"to": token_address, "data": HexBytes(balance_of_data).hex()}, "latest"])
+                         for token_address in token_addresses)
+
+        results: List[Any] = await self.batch_call(calls)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        eth_balance: int = int(results[0], 16)
+        if self._multicall_address is not None and len(token_addresses) > 0:
+            _, token_return_data = decode_abi(["uint256", "bytes[]"], HexBytes(results[1]))
+        else:
+            token_return_data = [HexBytes(result) for result in results[1:]]
+        token_balances: List[int] = [decode_abi(["uint256"], data)[0] for data in token_return_data]
+        return eth_balance, token_balances
+
+    async def get_transaction_receipts(self, tx_hashes: List[str]) -> List[Optional[AttributeDict]]:
+        """
+        :return: the receipts, or None for the transactions not mined yet (or whose receipt could not be fetched)
+        """
+        results: List[Any] = await self.batch_call([("eth_getTransactionReceipt", [tx_hash])
+                                                    for tx_hash in tx_hashes])
+        receipts: List[Optional[AttributeDict]] = []
+        for tx_hash, result in zip(tx_hashes, results):
+            if isinstance(result, Exception):
+                self.logger().debug(f"Error fetching the receipt of {tx_hash}: {result}")
+                result = None
+            receipts.append(self.format_receipt(result) if result is not None else None)
+        return receipts
+
+    async def get_blocks(self, block_hashes: List[HexBytes]) -> List[Optional[AttributeDict]]:
+        """
+        Fetches the blocks missing from the shared block cache in one request, without their transactions.
+
+        :return: the blocks, or None for the blocks not found
+        """
+        block_cache: TTLCache = shared_block_cache()
+        missing_block_hashes: List[HexBytes] = list(set(block_hash for block_hash in block_hashes
+                                                        if block_hash not in block_cache))
+        if len(missing_block_hashes) > 0:
+            results: List[Any] = await self.batch_call([("eth_getBlockByHash", [block_hash.hex(), False])
+                                                        for block_hash in missing_block_hashes])
+            for block_hash, result in zip(missing_block_hashes, results):
+                if isinstance(result, Exception):
+                    self.logger().debug(f"Error fetching block {block_hash.hex()}: {result}")
+                elif result is not None:
+                    block_cache[block_hash] = self.format_block(result)
+        return [block_cache.get(block_hash) for block_hash in block_hashes]
+
+    @staticmethod
+    def format_receipt(raw_receipt: Dict[str, Any]) -> AttributeDict:
+        """
+        Converts the fields of a raw receipt used by the wallet to the types returned by web3.
+        """
+        return AttributeDict({
+            **raw_receipt,
+            "transactionHash": HexBytes(raw_receipt["transactionHash"]),
+            "blockHash": HexBytes(raw_receipt["blockHash"]) if raw_receipt.get("blockHash") is not None else None,
+            "blockNumber": int(raw_receipt["blockNumber"], 16) if raw_receipt.get("blockNumber") else None,
+            "gasUsed": int(raw_receipt["gasUsed"], 16),
+            "status": int(raw_receipt["status"], 16) if raw_receipt.get("status") is not None else None,
+        })
+
+    @staticmethod
+    def format_block(raw_block: Dict[str, Any]) -> AttributeDict:
+        """
+        Converts the fields of a raw block header used by the wallet and watchers to the types returned by web3.
+        """
+        return AttributeDict({
+            **raw_block,
+            "hash": HexBytes(raw_block["hash"]),
+            "parentHash": HexBytes(raw_block["parentHash"]),
+            "number": int(raw_block["number"], 16),
+            "timestamp": int(raw_block["timestamp"], 16),
+        })
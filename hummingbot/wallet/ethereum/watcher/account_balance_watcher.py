@@ -16,6 +16,7 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.ethereum_batch_rpc import EthereumBatchRPC
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import (
@@ -42,8 +43,10 @@ class AccountBalanceWatcher(BaseWatcher):
                  blocks_watcher: WSNewBlocksWatcher,
                  account_address: str,
                  erc20_addresses: List[str],
-                 erc20_abis: List[any]):
+                 erc20_abis: List[any],
+                 batch_rpc: Optional[EthereumBatchRPC] = None):
         super().__init__(w3)
+        self._batch_rpc: Optional[EthereumBatchRPC] = batch_rpc
         self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
         self._account_address: str = account_address
         self._addresses_to_contracts: Dict[str, Contract] = {
@@ -131,6 +134,10 @@ class AccountBalanceWatcher(BaseWatcher):
         safe_ensure_future(self.update_balances())
 
     async def update_balances(self):
+        if self._batch_rpc is not None:
+            await self.update_balances_in_batch()
+            return
+
         asset_symbols: List[str] = []
         asset_update_tasks: List[Coroutine] = []
 
@@ -152,3 +159,24 @@ class AccountBalanceWatcher(BaseWatcher):
                                   exc_info=True,
                                   app_warning_msg="Error account balance updates. "
                                                   "Check Ethereum node connection.")
+
+    async def update_balances_in_batch(self):
+        """
+        Fetches all the balances as a single JSON-RPC batch request, instead of one call per asset.
+        """
+        asset_symbols: List[str] = list(self._erc20_contracts.keys())
+        try:
+            eth_raw_balance, token_raw_balances = await self._batch_rpc.get_balances(
+                self._account_address,
+                [self._erc20_contracts[asset_name].address for asset_name in asset_symbols]
+            )
+            for asset_name, raw_balance in zip(asset_symbols, token_raw_balances):
+                self._raw_account_balances[asset_name] = raw_balance
+            self._raw_account_balances["ETH"] = eth_raw_balance
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error fetching account balance updates.",
+                                  exc_info=True,
+                                  app_warning_msg="Error account balance updates. "
+                                                  "Check Ethereum node connection.")
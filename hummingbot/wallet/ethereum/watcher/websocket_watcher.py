@@ -8,13 +8,13 @@ import asyncio
 
 from hexbytes import HexBytes
 from web3.datastructures import AttributeDict
-from cachetools import TTLCache
 
 from typing import Optional, Dict, AsyncIterable, Any
 
 from contextlib import suppress
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.wallet.ethereum.ethereum_batch_rpc import shared_block_cache
 from hummingbot.wallet.ethereum.watcher.base_watcher import BaseWatcher
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import NewBlocksWatcherEvent
@@ -34,7 +34,7 @@ class WSNewBlocksWatcher(BaseWatcher):
         self._node_address = None
         self._client: Optional[websockets.WebSocketClientProtocol] = None
         self._fetch_new_blocks_task: Optional[asyncio.Task] = None
-        self._block_cache = TTLCache(maxsize=10, ttl=120)
+        self._block_cache = shared_block_cache()
 
     _nbw_logger: Optional[HummingbotLogger] = None
 
@@ -13,7 +13,6 @@ from typing import (
     List,
     Dict,
     Optional,
-    Set,
     Coroutine
 )
 from web3 import Web3
@@ -22,13 +21,14 @@ from web3.contract import (
     ContractFunction
 )
 from web3.datastructures import AttributeDict
-from web3.exceptions import (
-    BlockNotFound,
-    TransactionNotFound
-)
+from web3.exceptions import BlockNotFound
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+from hummingbot.wallet.ethereum.ethereum_batch_rpc import (
+    EthereumBatchRPC,
+    MULTICALL_ADDRESSES,
+)
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
     WalletEvent,
@@ -86,6 +86,7 @@ class Web3WalletBackend(PubSub):
         # Initialize Web3, accounts and contracts.
         self._w3: Web3 = Web3(Web3.HTTPProvider(jsonrpc_url))
         self._chain: EthereumChain = chain
+        self._batch_rpc: EthereumBatchRPC = EthereumBatchRPC(jsonrpc_url, MULTICALL_ADDRESSES.get(chain))
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
@@ -240,7 +241,8 @@ class Web3WalletBackend(PubSub):
             self._new_blocks_watcher,
             self._account.address,
             [erc20_token.address for erc20_token in self._erc20_tokens.values()],
-            [token.abi for token in self._erc20_tokens.values()]
+            [token.abi for token in self._erc20_tokens.values()],
+            batch_rpc=self._batch_rpc
         )
         self._erc20_events_watcher = ERC20EventsWatcher(
             self._w3,
@@ -334,6 +336,7 @@ class Web3WalletBackend(PubSub):
         if self._check_transaction_receipts_task is not None:
             self._check_transaction_receipts_task.cancel()
             self._check_transaction_receipts_task = None
+        await self._batch_rpc.close()
 
     async def check_network(self) -> NetworkStatus:
         # Assume connected if received new blocks in last 2 minutes
@@ -383,36 +386,27 @@ class Web3WalletBackend(PubSub):
                                     "Check wallet network connection")
                 await asyncio.sleep(5.0)
 
-    async def _check_transaction_receipt(self, tx_hash: str, timestamp: int):
-        """
-        Look for transaction receipt, only raise not found error if they are missing for longer than two minutes.
-        """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        try:
-            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
-        except TransactionNotFound as e:
-            now: float = time.time()
-            if now - timestamp > 120:
-                stop_tx_hash = e.args[0].split(" ")[3]
-                self._stop_tx_tracking(stop_tx_hash)
-                self.logger().info(f"Stopped tracking transaction with hash: {stop_tx_hash}.")
-            return None
-
     async def check_transaction_receipts(self):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
+
+        The receipts of all the pending transactions, then their blocks, are fetched as single batch requests.
+        Transactions still missing a receipt after two minutes are not tracked anymore.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        tasks = [self._check_transaction_receipt(tx_hash, self._pending_tx_dict[tx_hash]['timestamp'])
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
-                                                     if (tr is not None and tr.get("blockHash") is not None)]
-        block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
-                             for block_hash in block_hash_set]
-        blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
-                                                     for block
-                                                     in await safe_gather(*fetch_block_tasks)
+        tx_hashes: List[str] = list(self._pending_tx_dict.keys())
+        now: float = time.time()
+        transaction_receipts: List[AttributeDict] = []
+        for tx_hash, receipt in zip(tx_hashes, await self._batch_rpc.get_transaction_receipts(tx_hashes)):
+            if receipt is not None and receipt.get("blockHash") is not None:
+                transaction_receipts.append(receipt)
+            elif now - self._pending_tx_dict[tx_hash]['timestamp'] > 120:
+                self._stop_tx_tracking(tx_hash)
+                self.logger().info(f"Stopped tracking transaction with hash: {tx_hash}.")
+
+        block_hashes: List[HexBytes] = list(set(tr.blockHash for tr in transaction_receipts))
+        blocks: Dict[HexBytes, AttributeDict] = dict((block_hash, block)
+                                                     for block_hash, block
+                                                     in zip(block_hashes, await self._batch_rpc.get_blocks(block_hashes))
                                                      if block is not None)
 
         for receipt in transaction_receipts:
@@ -52,6 +52,7 @@ def main():
         "hummingbot.strategy.arbitrage",
         "hummingbot.strategy.cross_exchange_market_making",
         "hummingbot.strategy.pure_market_making",
+        "hummingbot.strategy.triangular_arbitrage",
         "hummingbot.templates",
         "hummingbot.wallet",
         "hummingbot.wallet.ethereum",
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Measures the time taken by the arbitrage strategy to evaluate one market pair on deep order books.
+
+Compares the C book walk used by ArbitrageStrategy.find_best_profitable_amount() against the Decimal based iterator
+walk of ArbitrageStrategy.find_profitable_arbitrage_orders().
+
+Usage: python test/benchmark_arbitrage.py [depth] [iterations]
+"""
+import sys
+import os; sys.path.insert(0, os.path.realpath(os.path.join(__file__, "../../")))
+import logging; logging.basicConfig(level=logging.ERROR)
+import time
+from decimal import Decimal
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_order_book_tracker import BinanceOrderBookTracker
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.strategy.arbitrage import (
+    ArbitrageStrategy,
+    ArbitrageMarketPair
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+TRADING_PAIR = ("ETH-USDT", "ETH", "USDT")
+
+
+def make_market(mid_price: float, depth: int) -> PaperTradeExchange:
+    tracker = BinanceOrderBookTracker(trading_pairs=[TRADING_PAIR[0]])
+    market = PaperTradeExchange(tracker, MarketConfig.default_config(), BinanceExchange)
+    order_book = CompositeOrderBook()
+    levels = np.arange(1, depth + 1, dtype=np.float64)
+    bids = np.column_stack([mid_price - levels * 0.01, np.full(depth, 1.5), np.ones(depth)])
+    asks = np.column_stack([mid_price + levels * 0.01, np.full(depth, 1.5), np.ones(depth)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    tracker.order_books[TRADING_PAIR[0]] = order_book
+    market.init_paper_trade_market()
+    market.set_balance(TRADING_PAIR[1], Decimal(depth * 10))
+    market.set_balance(TRADING_PAIR[2], Decimal(depth * 10 * mid_price))
+    return market
+
+
+def time_per_call(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    # The two books cross across most of their depth, so the walk has to go deep.
+    buy_market_info = MarketTradingPairTuple(make_market(100.0, depth), *TRADING_PAIR)
+    sell_market_info = MarketTradingPairTuple(make_market(100.0 + depth * 0.015, depth), *TRADING_PAIR)
+    strategy = ArbitrageStrategy([ArbitrageMarketPair(buy_market_info, sell_market_info)],
+                                 min_profitability=Decimal("0.0001"))
+
+    iterator_walk = time_per_call(
+        lambda: ArbitrageStrategy.find_profitable_arbitrage_orders(Decimal("0.0001"),
+                                                                   buy_market_info,
+                                                                   sell_market_info,
+                                                                   Decimal("1"),
+                                                                   Decimal("1")),
+        iterations
+    )
+    c_walk = time_per_call(lambda: strategy.find_best_profitable_amount(buy_market_info, sell_market_info),
+                           iterations)
+    amount, profitability, bid_price, ask_price = strategy.find_best_profitable_amount(buy_market_info,
+                                                                                       sell_market_info)
+
+    print(f"Book depth: {depth} levels, {iterations} iterations")
+    print(f"Result: amount {amount}, profitability {profitability:.6f}, bid {bid_price}, ask {ask_price}")
+    print(f"Decimal iterator walk (matching only): {iterator_walk * 1e6:10.1f} us / evaluation")
+    print(f"C book walk (with fees and balances):  {c_walk * 1e6:10.1f} us / evaluation")
+    print(f"Speed up: {iterator_walk / c_walk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Compares the cost of the order book trade events emitted for every public trade, as the NamedTuple they used to be and
+as the OrderBookTradeEvent extension type: time to allocate an event, bytes per live event, the time taken to apply the
+trade to an order book and dispatch it to a listener, and the time taken to read the price and amount as Decimals.
+
+Usage: python test/benchmark_events.py [--num-events N]
+"""
+import sys
+import os; sys.path.insert(0, os.path.realpath(os.path.join(__file__, "../../")))
+import argparse
+from decimal import Decimal
+import time
+import tracemalloc
+from typing import (
+    Callable,
+    List,
+    NamedTuple,
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+
+class NamedTupleOrderBookTradeEvent(NamedTuple):
+    trading_pair: str
+    timestamp: float
+    type: TradeType
+    price: Decimal
+    amount: Decimal
+
+
+def make_events(event_class: Callable, num_events: int) -> List:
+    return [event_class(trading_pair="ETH-USDT",
+                        timestamp=1600000000.0 + i,
+                        price=float(100 + i % 100),
+                        amount=float(i % 7 + 1),
+                        type=TradeType.SELL if i % 2 else TradeType.BUY)
+            for i in range(num_events)]
+
+
+def allocation_ns(event_class: Callable, num_events: int) -> float:
+    # Events are dropped once dispatched, so each one is discarded right away.
+    trade_type: TradeType = TradeType.BUY
+    start = time.perf_counter()
+    for i in range(num_events):
+        event_class(trading_pair="ETH-USDT", timestamp=1600000000.0, price=100.0, amount=1.0, type=trade_type)
+    return (time.perf_counter() - start) * 1e9 / num_events
+
+
+def bytes_per_event(event_class: Callable, num_events: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = make_events(event_class, num_events)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return (after - before) / num_events
+
+
+def dispatch_ns(event_class: Callable, num_events: int) -> float:
+    order_book: OrderBook = OrderBook()
+    buys: List[int] = [0]
+
+    def on_trade(event):
+        if event.type is TradeType.BUY:
+            buys[0] += 1
+
+    forwarder: EventForwarder = EventForwarder(on_trade)
+    order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+    events = make_events(event_class, num_events)
+    start = time.perf_counter()
+    for event in events:
+        order_book.apply_trade(event)
+    return (time.perf_counter() - start) * 1e9 / num_events
+
+
+def decimal_read_ns(event_class: Callable, num_events: int) -> float:
+    events = make_events(event_class, num_events)
+    start = time.perf_counter()
+    if event_class is OrderBookTradeEvent:
+        for event in events:
+            event.decimal_price * event.decimal_amount
+    else:
+        for event in events:
+            Decimal(repr(event.price)) * Decimal(repr(event.amount))
+    return (time.perf_counter() - start) * 1e9 / num_events
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-events", type=int, default=200000)
+    args = parser.parse_args()
+
+    for name, event_class in (("NamedTuple", NamedTupleOrderBookTradeEvent),
+                              ("OrderBookTradeEvent", OrderBookTradeEvent)):
+        print(f"{name}:")
+        print(f"    allocate: {allocation_ns(event_class, args.num_events):.0f} ns/event")
+        print(f"    memory: {bytes_per_event(event_class, args.num_events):.0f} bytes/event")
+        print(f"    apply and dispatch: {dispatch_ns(event_class, args.num_events):.0f} ns/event")
+        print(f"    read Decimal price and amount: {decimal_read_ns(event_class, args.num_events):.0f} ns/event")
+
+
+if __name__ == "__main__":
+    main()
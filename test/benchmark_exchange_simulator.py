@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""
+Runs Binance connectors against the local exchange simulator, optionally with a pure market making strategy on each
+trading pair or a cross exchange market making strategy between two simulated accounts, and reports over time:
+the market data messages sent by the simulator and applied to the order books per second, the clock tick latency of
+the connectors and strategies, the orders created, filled and cancelled, and the resident memory of the process.
+The order round trip latencies recorded by the strategies are printed at the end.
+
+Usage: python test/benchmark_exchange_simulator.py [--pairs N] [--diffs-per-second R] [--trades-per-second R]
+           [--strategy {none,pmm,xemm}] [--duration SECONDS] [--report-interval SECONDS]
+           [--fill-delay SECONDS] [--recorded-messages PATH]
+"""
+import sys
+import os; sys.path.insert(0, os.path.realpath(os.path.join(__file__, "../../")))
+import argparse
+import asyncio
+from decimal import Decimal
+import logging
+import resource
+import time
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.order_latency import order_latency_stats
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.profiling import (
+    enable_profiling,
+    HotPathProfiler,
+)
+from hummingbot.strategy.cross_exchange_market_making import (
+    CrossExchangeMarketMakingStrategy,
+    CrossExchangeMarketPair,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
+from hummingbot.strategy.strategy_base import StrategyBase
+from test.integration.exchange_simulator import BinanceSimulator
+
+READY_TIMEOUT = 60.0
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as fd:
+            return int(fd.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        # ru_maxrss is the peak, in kilobytes on Linux and bytes on macOS.
+        max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / 1e6 if sys.platform == "darwin" else max_rss / 1e3
+
+
+def market_info(market: BinanceExchange, trading_pair: str) -> MarketTradingPairTuple:
+    base_asset, quote_asset = trading_pair.split("-")
+    return MarketTradingPairTuple(market, trading_pair, base_asset, quote_asset)
+
+
+def make_strategies(strategy: str, markets: List[BinanceExchange], trading_pairs: List[str]) -> List[StrategyBase]:
+    if strategy == "pmm":
+        return [PureMarketMakingStrategy(market_info(markets[0], trading_pair),
+                                         bid_spread=Decimal("0.0005"),
+                                         ask_spread=Decimal("0.0005"),
+                                         order_amount=Decimal("1"),
+                                         order_levels=3,
+                                         order_level_spread=Decimal("0.0005"),
+                                         order_refresh_time=5.0,
+                                         filled_order_delay=1.0)
+                for trading_pair in trading_pairs]
+    if strategy == "xemm":
+        market_pairs: List[CrossExchangeMarketPair] = [
+            CrossExchangeMarketPair(maker=market_info(markets[0], trading_pair),
+                                    taker=market_info(markets[1], trading_pair))
+            for trading_pair in trading_pairs
+        ]
+        return [CrossExchangeMarketMakingStrategy(market_pairs,
+                                                  min_profitability=Decimal("0.0005"),
+                                                  order_amount=Decimal("1"),
+                                                  limit_order_min_expiration=5.0,
+                                                  anti_hysteresis_duration=1.0)]
+    return []
+
+
+class AppliedMessageCounter:
+    """
+    Counts the diffs and snapshots applied to the order books of the markets, from their versions. An order book
+    replaced after a reconnection starts again from version 0.
+    """
+    def __init__(self, markets: List[BinanceExchange]):
+        self._markets: List[BinanceExchange] = markets
+        self._versions: Dict[Tuple[int, str], int] = {}
+        self.total: int = 0
+
+    def update(self) -> int:
+        for market in self._markets:
+            for trading_pair, order_book in market.order_books.items():
+                key: Tuple[int, str] = (id(market), trading_pair)
+                version: int = order_book.version
+                last_version: int = self._versions.get(key, 0)
+                self.total += version - last_version if version >= last_version else version
+                self._versions[key] = version
+        return self.total
+
+
+def report_ticks(profiler: HotPathProfiler) -> str:
+    return ", ".join(f"{histogram.name} p50 {histogram.percentile_ns(50) / 1e3:.0f}us "
+                     f"p99 {histogram.percentile_ns(99) / 1e3:.0f}us"
+                     for histogram in profiler.tick_histograms if histogram.count > 0)
+
+
+async def run_benchmark(args: argparse.Namespace, simulator: BinanceSimulator):
+    api_keys: List[str] = ["maker", "taker"] if args.strategy == "xemm" else ["maker"]
+    markets: List[BinanceExchange] = [BinanceExchange(api_key, "secret", simulator.trading_pairs, True)
+                                      for api_key in api_keys]
+    clock: Clock = Clock(ClockMode.REALTIME, tick_size=args.tick_size)
+    for market in markets:
+        clock.add_iterator(market)
+
+    with clock:
+        start: float = time.time()
+        while not all(market.ready for market in markets):
+            if time.time() - start > READY_TIMEOUT:
+                raise TimeoutError(f"The connectors were not ready after {READY_TIMEOUT} seconds: "
+                                   f"{[market.status_dict for market in markets]}")
+            await clock.run_til(time.time() + 1.0)
+        print(f"Connectors ready after {time.time() - start:.1f}s.")
+
+        for strategy in make_strategies(args.strategy, markets, simulator.trading_pairs):
+            clock.add_iterator(strategy)
+        profiler: HotPathProfiler = enable_profiling()
+        order_latency_stats().reset()
+
+        start = time.time()
+        last_report_time: float = start
+        last_sent: int = simulator.messages_sent
+        applied_counter: AppliedMessageCounter = AppliedMessageCounter(markets)
+        last_applied: int = applied_counter.update()
+        print("elapsed    sent/s  applied/s  created  filled  cancelled  rss_mb  ticks")
+        while time.time() - start < args.duration:
+            await clock.run_til(min(last_report_time + args.report_interval, start + args.duration))
+            now: float = time.time()
+            elapsed: float = now - last_report_time
+            sent: int = simulator.messages_sent
+            applied: int = applied_counter.update()
+            print(f"{now - start:7.1f} {(sent - last_sent) / elapsed:9.0f} {(applied - last_applied) / elapsed:10.0f} "
+                  f"{simulator.orders_created:8d} {simulator.orders_filled:7d} {simulator.orders_cancelled:10d} "
+                  f"{rss_mb():7.1f}  {report_ticks(profiler)}")
+            profiler.reset()
+            last_report_time, last_sent, last_applied = now, sent, applied
+
+    print("\nOrder latencies:")
+    latency_df = order_latency_stats().summary_data_frame()
+    if len(latency_df) == 0:
+        print("  No orders were placed.")
+    else:
+        print(latency_df.to_string(index=False, float_format="%.1f"))
+    for market in markets:
+        await market.stop_network()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=4)
+    parser.add_argument("--diffs-per-second", type=float, default=20.0, help="per trading pair")
+    parser.add_argument("--trades-per-second", type=float, default=2.0, help="per trading pair")
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--strategy", choices=("none", "pmm", "xemm"), default="pmm")
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--report-interval", type=float, default=5.0)
+    parser.add_argument("--tick-size", type=float, default=1.0)
+    parser.add_argument("--ack-delay", type=float, default=0.0)
+    parser.add_argument("--fill-delay", type=float, default=0.0)
+    parser.add_argument("--recorded-messages", default=None,
+                        help="a file of Binance depthUpdate and trade stream messages, one JSON object per line")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    trading_pairs: List[str] = [f"S{i:03d}-USDT" for i in range(args.pairs)]
+    simulator: BinanceSimulator = BinanceSimulator(trading_pairs,
+                                                   api_keys=["maker", "taker"],
+                                                   diffs_per_second=args.diffs_per_second,
+                                                   trades_per_second=args.trades_per_second,
+                                                   depth=args.depth,
+                                                   ack_delay=args.ack_delay,
+                                                   fill_delay=args.fill_delay,
+                                                   recorded_messages_path=args.recorded_messages,
+                                                   seed=args.seed)
+    simulator.start()
+    try:
+        with simulator.patch_network():
+            asyncio.get_event_loop().run_until_complete(run_benchmark(args, simulator))
+    finally:
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
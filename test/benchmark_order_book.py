@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Replays order book diffs through the set based OrderBook and the tick indexed LadderOrderBook, and reports the time
+taken per diff level update and per query.
+
+The diffs are either generated around a drifting mid price, or replayed from a captured file with one JSON message per
+line: {"type": "snapshot" or "diff", "bids": [[price, amount], ...], "asks": [[price, amount], ...]}.
+
+Usage: python test/benchmark_order_book.py [--diffs-file FILE] [--tick-size TICK] [--num-diffs N]
+"""
+import sys
+import os; sys.path.insert(0, os.path.realpath(os.path.join(__file__, "../../")))
+import argparse
+import json
+import random
+import time
+from typing import (
+    Callable,
+    List,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+Message = Tuple[str, np.ndarray, np.ndarray]
+
+
+def generate_messages(tick_size: float, num_diffs: int, levels_per_diff: int, seed: int = 0) -> List[Message]:
+    rng = random.Random(seed)
+    mid_tick = int(round(100.0 / tick_size))
+    messages: List[Message] = []
+
+    def side_array(is_bid: bool, count: int, update_id: int, removal_ratio: float) -> np.ndarray:
+        rows = []
+        for _ in range(count):
+            distance = int(rng.expovariate(1 / 30)) + 1
+            tick = mid_tick - distance if is_bid else mid_tick + distance
+            amount = 0.0 if rng.random() < removal_ratio else rng.uniform(0.1, 10)
+            rows.append((tick * tick_size, amount, update_id))
+        return np.array(rows, dtype=np.float64).reshape(-1, 3)
+
+    messages.append(("snapshot", side_array(True, 1000, 1, 0), side_array(False, 1000, 1, 0)))
+    for update_id in range(2, num_diffs + 2):
+        mid_tick += rng.randint(-2, 2)
+        messages.append(("diff",
+                         side_array(True, levels_per_diff, update_id, 0.4),
+                         side_array(False, levels_per_diff, update_id, 0.4)))
+    return messages
+
+
+def load_messages(file_path: str) -> List[Message]:
+    messages: List[Message] = []
+    with open(file_path) as fd:
+        for update_id, line in enumerate(fd, start=1):
+            msg = json.loads(line)
+            bids = np.array([(float(price), float(amount), update_id) for price, amount in msg["bids"]],
+                            dtype=np.float64).reshape(-1, 3)
+            asks = np.array([(float(price), float(amount), update_id) for price, amount in msg["asks"]],
+                            dtype=np.float64).reshape(-1, 3)
+            messages.append((msg["type"], bids, asks))
+    return messages
+
+
+def replay(order_book: OrderBook, messages: List[Message]) -> float:
+    """
+    :return: nanoseconds per diff level
+    """
+    levels = 0
+    start = time.perf_counter()
+    for message_type, bids, asks in messages:
+        if message_type == "snapshot":
+            order_book.apply_numpy_snapshot(bids, asks)
+        else:
+            order_book.apply_numpy_diffs(bids, asks)
+            levels += len(bids) + len(asks)
+    return (time.perf_counter() - start) * 1e9 / max(levels, 1)
+
+
+def time_per_call(func: Callable, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1e9 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--diffs-file", type=str, default=None)
+    parser.add_argument("--tick-size", type=float, default=0.01)
+    parser.add_argument("--num-diffs", type=int, default=20000)
+    parser.add_argument("--levels-per-diff", type=int, default=10)
+    parser.add_argument("--query-iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    messages = (load_messages(args.diffs_file) if args.diffs_file is not None
+                else generate_messages(args.tick_size, args.num_diffs, args.levels_per_diff))
+    order_books = [("OrderBook", OrderBook()), ("LadderOrderBook", LadderOrderBook(args.tick_size))]
+
+    print(f"{len(messages)} messages")
+    for name, order_book in order_books:
+        ns_per_update = replay(order_book, messages)
+        mid_price = (order_book.get_price(True) + order_book.get_price(False)) / 2
+        queries = {
+            "get_price": lambda: order_book.get_price(True),
+            "get_price_for_volume(50)": lambda: order_book.get_price_for_volume(True, 50),
+            "get_vwap_for_volume(50)": lambda: order_book.get_vwap_for_volume(False, 50),
+            "get_volume_for_price(mid+0.5%)": lambda: order_book.get_volume_for_price(True, mid_price * 1.005),
+            "snapshot": lambda: order_book.snapshot,
+        }
+        print(f"{name}:")
+        print(f"    apply diffs: {ns_per_update:.0f} ns/update")
+        for query_name, query in queries.items():
+            iterations = args.query_iterations if query_name != "snapshot" else args.query_iterations // 100 + 1
+            print(f"    {query_name}: {time_per_call(query, iterations):.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Measures the trades database: the throughput of recording trade fills one commit per event (as the MarketsRecorder
+does by default) with SQLite's default journaling and with the WAL pragmas, the throughput of bulk inserts,
+and the latency of the history query of the trades of a session with and without the timestamp index, at the given
+number of rows.
+
+Usage: python test/benchmark_trades_db.py [--num-rows N] [--num-events N]
+"""
+import sys
+import os; sys.path.insert(0, os.path.realpath(os.path.join(__file__, "../../")))
+import argparse
+import tempfile
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+START_TIMESTAMP = 1600000000000
+
+
+def trade_fill_row(i: int) -> Dict[str, Any]:
+    return {"config_file_path": f"conf_pure_mm_{i % 3}.yml", "strategy": "pure_market_making",
+            "market": "binance", "symbol": "ETH-USDT", "base_asset": "ETH", "quote_asset": "USDT",
+            "timestamp": START_TIMESTAMP + i * 100, "order_id": f"buy-ETH-USDT-{i // 4}", "trade_type": "BUY",
+            "order_type": "LIMIT", "price": 100.0 + i % 50, "amount": 1.0,
+            "trade_fee": {"percent": 0.001, "flat_fees": []}, "exchange_trade_id": str(i)}
+
+
+def open_db(db_path: str, sqlite_pragmas: List[str]) -> SQLConnectionManager:
+    SQLConnectionManager.SQLITE_PRAGMAS = sqlite_pragmas
+    return SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=db_path)
+
+
+def commit_per_event_rows_per_second(db_path: str, sqlite_pragmas: List[str], num_events: int) -> float:
+    sql: SQLConnectionManager = open_db(db_path, sqlite_pragmas)
+    session = sql.get_shared_session()
+    start = time.perf_counter()
+    for i in range(num_events):
+        session.add(TradeFill(**trade_fill_row(i)))
+        session.commit()
+    return num_events / (time.perf_counter() - start)
+
+
+def bulk_insert_rows_per_second(sql: SQLConnectionManager, num_rows: int, rows_per_commit: int = 10000) -> float:
+    start = time.perf_counter()
+    for i in range(0, num_rows, rows_per_commit):
+        sql.bulk_insert(TradeFill.__table__, [trade_fill_row(j) for j in range(i, min(num_rows, i + rows_per_commit))])
+        sql.commit()
+    return num_rows / (time.perf_counter() - start)
+
+
+def history_query_ms(sql: SQLConnectionManager, start_timestamp: int, repeats: int = 20) -> float:
+    # The query of HummingbotApplication._get_trades_from_session, for the latest trades of a session.
+    session = sql.get_shared_session()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        (session.query(TradeFill)
+         .filter(TradeFill.timestamp >= start_timestamp, TradeFill.config_file_path.like("%conf_pure_mm_1.yml%"))
+         .order_by(TradeFill.timestamp.desc())
+         .limit(101)
+         .all())
+    return (time.perf_counter() - start) * 1e3 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-rows", type=int, default=1000000)
+    parser.add_argument("--num-events", type=int, default=2000)
+    args = parser.parse_args()
+    wal_pragmas: List[str] = list(SQLConnectionManager.SQLITE_PRAGMAS)
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        print("Commit per event:")
+        print(f"    default journaling: "
+              f"{commit_per_event_rows_per_second(os.path.join(db_dir, 'default.sqlite'), [], args.num_events):.0f}"
+              f" rows/s")
+        print(f"    WAL: "
+              f"{commit_per_event_rows_per_second(os.path.join(db_dir, 'wal.sqlite'), wal_pragmas, args.num_events):.0f}"
+              f" rows/s")
+
+        sql: SQLConnectionManager = open_db(os.path.join(db_dir, "trades.sqlite"), wal_pragmas)
+        print(f"Bulk insert of {args.num_rows} rows: {bulk_insert_rows_per_second(sql, args.num_rows):.0f} rows/s")
+
+        # A session started an hour before the last trade.
+        session_start: int = START_TIMESTAMP + args.num_rows * 100 - 3600 * 1000
+        print(f"History query at {args.num_rows} rows:")
+        print(f"    with tf_timestamp_index: {history_query_ms(sql, session_start):.2f} ms")
+        with sql.engine.begin() as conn:
+            conn.execute("DROP INDEX tf_timestamp_index")
+        print(f"    without: {history_query_ms(sql, session_start):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
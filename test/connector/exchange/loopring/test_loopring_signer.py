@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from hummingbot.connector.exchange.loopring.ethsnarks2.eddsa import PoseidonEdDSA
+from hummingbot.connector.exchange.loopring.ethsnarks2.field import FQ
+from hummingbot.connector.exchange.loopring.ethsnarks2.jubjub import JUBJUB_L, Point
+from hummingbot.connector.exchange.loopring.ethsnarks2.poseidon import poseidon
+from hummingbot.connector.exchange.loopring.loopring_signer import (
+    FixedBasePoseidonEdDSA,
+    FixedBaseTable,
+    LoopringSigner,
+    ORDER_HASH_PARAMS,
+    sign_order,
+    sign_request,
+)
+
+
+class TestLoopringSigner(unittest.TestCase):
+    private_key = 1234567890123456789012345678901234567890
+    serialized_order = [2, 5, 1234, 0, 2, 1000000, 2000000, 0, 1600000000, 1600600000, 63, 1, 20]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_fixed_base_mult(self):
+        generator: Point = Point.generator()
+        table: FixedBaseTable = FixedBaseTable(generator)
+        for scalar in [0, 1, 15, 16, 17, 12345678901234567890, JUBJUB_L - 1]:
+            self.assertEqual(generator * scalar, table.mult(scalar))
+
+    def test_same_signature(self):
+        msg_hash: int = poseidon(self.serialized_order, ORDER_HASH_PARAMS)
+        expected = PoseidonEdDSA.sign(msg_hash, FQ(self.private_key))
+        signed = FixedBasePoseidonEdDSA.sign(msg_hash, FQ(self.private_key))
+        self.assertEqual(expected.A, signed.A)
+        self.assertEqual(expected.sig.R, signed.sig.R)
+        self.assertEqual(expected.sig.s, signed.sig.s)
+
+    def test_sign_in_process_pool(self):
+        signer: LoopringSigner = LoopringSigner(self.private_key, max_workers=2)
+        try:
+            signed_order = self.ev_loop.run_until_complete(signer.sign_order(self.serialized_order))
+        finally:
+            signer.stop()
+        self.assertEqual(sign_order(self.serialized_order, self.private_key), signed_order)
+
+    def test_sign_after_stop(self):
+        signer: LoopringSigner = LoopringSigner(self.private_key, max_workers=1)
+        try:
+            self.ev_loop.run_until_complete(signer.sign_request("a=1"))
+            executor = signer.executor
+            signer.stop()
+            self.assertIsNone(signer._executor)
+            signer.stop()
+            signature: str = self.ev_loop.run_until_complete(signer.sign_request("a=1"))
+            self.assertIsNot(executor, signer.executor)
+        finally:
+            signer.stop()
+        self.assertEqual(sign_request("a=1", self.private_key), signature)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,19 @@
 #!/usr/bin/env python
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import logging
 import unittest
 from decimal import Decimal
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
-from hummingbot.core.event.events import OrderType, TradeType
+from hummingbot.connector.in_flight_order_store import InFlightOrderStore
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
 
 from hummingbot.connector.connector_base import ConnectorBase
 
@@ -23,7 +32,100 @@ class InFightOrderTest(InFlightOrderBase):
         return False
 
 
+class StatefulInFlightOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state in ("filled", "cancelled")
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.last_state == "cancelled"
+
+    @property
+    def is_failure(self) -> bool:
+        return False
+
+
+class OrderTrackingConnector(ConnectorBase):
+    def __init__(self):
+        super().__init__()
+        self._in_flight_orders = InFlightOrderStore()
+        self.fee_estimate_calls = 0
+
+    @property
+    def in_flight_orders(self):
+        return self._in_flight_orders
+
+    def estimate_fee_pct(self, is_maker: bool) -> Decimal:
+        self.fee_estimate_calls += 1
+        return Decimal("0.01")
+
+    def fill(self, order_id: str, amount: Decimal):
+        order = self._in_flight_orders[order_id]
+        order.executed_amount_base += amount
+        order.executed_amount_quote += amount * order.price
+        self.trigger_event(MarketEvent.OrderFilled,
+                           OrderFilledEvent(0, order_id, order.trading_pair, order.trade_type, order.order_type,
+                                            order.price, amount, TradeFee(Decimal(0))))
+
+
 class ConnectorBaseUnitTest(unittest.TestCase):
+    def test_in_flight_locked_balances(self):
+        connector = OrderTrackingConnector()
+        orders = connector.in_flight_orders
+        orders["1"] = StatefulInFlightOrder("1", "A", "HBOT-USDT", OrderType.LIMIT, TradeType.BUY, Decimal(100),
+                                            Decimal(1), "live")
+        orders["2"] = StatefulInFlightOrder("2", "B", "HBOT-USDT", OrderType.LIMIT, TradeType.SELL, Decimal(110),
+                                            Decimal("1.5"), "live")
+        self.assertEqual({"USDT": Decimal("101"), "HBOT": Decimal("1.5")}, connector.in_flight_locked_balances())
+        self.assertEqual(1, connector.fee_estimate_calls)
+        # Orders without events aren't calculated again.
+        connector.in_flight_locked_balances()
+        self.assertEqual(1, connector.fee_estimate_calls)
+
+        connector.fill("1", Decimal("0.5"))
+        connector.fill("2", Decimal("0.5"))
+        self.assertEqual({"USDT": Decimal("50.5"), "HBOT": Decimal("1.0")}, connector.in_flight_locked_balances())
+
+        orders["3"] = StatefulInFlightOrder("3", "C", "ETH-USDT", OrderType.LIMIT, TradeType.SELL, Decimal(10),
+                                            Decimal(2), "live")
+        orders["2"].last_state = "cancelled"
+        connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(0, "2"))
+        del orders["1"]
+        self.assertEqual({"ETH": Decimal(2)}, connector.in_flight_locked_balances())
+        self.assertEqual(connector.in_flight_asset_balances(orders), {"ETH": Decimal(2)})
+
+    def test_in_flight_locked_balances_check(self):
+        connector = OrderTrackingConnector()
+        connector._in_flight_orders["1"] = StatefulInFlightOrder("1", "A", "HBOT-USDT", OrderType.LIMIT,
+                                                                 TradeType.SELL, Decimal(100), Decimal(1), "live")
+        connector.in_flight_locked_balances()
+        connector._in_flight_orders["1"].last_state = "filled"
+        self.assertEqual({"HBOT": Decimal(1)}, connector.in_flight_locked_balances())
+        # In debug mode, orders updated without events are found by the full calculation.
+        with self.assertLogs(connector.logger(), logging.DEBUG):
+            self.assertEqual({}, connector.in_flight_locked_balances())
+
+    def test_in_flight_locked_balances_dict(self):
+        connector = OrderTrackingConnector()
+        connector._in_flight_orders = orders = {}
+        orders["1"] = StatefulInFlightOrder("1", "A", "HBOT-USDT", OrderType.LIMIT, TradeType.SELL, Decimal(100),
+                                            Decimal(1), "live")
+        self.assertEqual({"HBOT": Decimal(1)}, connector.in_flight_locked_balances())
+
+        orders["2"] = StatefulInFlightOrder("2", "B", "ETH-USDT", OrderType.LIMIT, TradeType.SELL, Decimal(10),
+                                            Decimal(2), "live")
+        connector.did_change_in_flight_order("2")
+        del orders["1"]
+        connector.did_change_in_flight_order("1")
+        self.assertEqual({"ETH": Decimal(2)}, connector.in_flight_locked_balances())
+
+        # Orders tracked without notice are only found by the full calculation in debug mode.
+        orders["3"] = StatefulInFlightOrder("3", "C", "ETH-USDT", OrderType.LIMIT, TradeType.SELL, Decimal(10),
+                                            Decimal(1), "live")
+        self.assertEqual({"ETH": Decimal(2)}, connector.in_flight_locked_balances())
+        with self.assertLogs(connector.logger(), logging.DEBUG):
+            self.assertEqual({"ETH": Decimal(3)}, connector.in_flight_locked_balances())
 
     def test_in_flight_asset_balances(self):
         connector = ConnectorBase(balance_limits={}, fee_estimates={})
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class ExchangeBaseTest(ExchangeBase):
+    def __init__(self, order_book: OrderBook):
+        super().__init__()
+        self.order_book = order_book
+        self.quantum_calls = 0
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        self.quantum_calls += 1
+        return Decimal("0.01")
+
+
+class ExchangeBaseUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(99.004, 1, 1)], [OrderBookRow(101.006, 1, 1)], 1)
+        self.exchange: ExchangeBaseTest = ExchangeBaseTest(self.order_book)
+
+    def test_cached_prices(self):
+        self.assertEqual(Decimal("101.01"), self.exchange.get_price("HBOT-USDT", True))
+        self.assertEqual(Decimal("99.00"), self.exchange.get_price("HBOT-USDT", False))
+        self.assertEqual(Decimal("100.005"), self.exchange.get_mid_price("HBOT-USDT"))
+        self.assertEqual(Decimal("100.005"), self.exchange.get_mid_price("HBOT-USDT"))
+        self.assertEqual(Decimal("101.01"), self.exchange.get_price("HBOT-USDT", True))
+        self.assertEqual(2, self.exchange.quantum_calls)
+
+    def test_order_book_update(self):
+        version: int = self.order_book.version
+        self.assertEqual(Decimal("101.01"), self.exchange.get_price("HBOT-USDT", True))
+        self.order_book.apply_diffs([], [OrderBookRow(100.5, 1, 2)], 2)
+        self.assertGreater(self.order_book.version, version)
+        self.assertEqual(Decimal("100.50"), self.exchange.get_price("HBOT-USDT", True))
+
+        # A new order book starts over from version 0.
+        self.exchange.order_book = OrderBook()
+        self.exchange.order_book.apply_snapshot([], [OrderBookRow(102, 1, 1)], 1)
+        self.assertEqual(Decimal("102.00"), self.exchange.get_price("HBOT-USDT", True))
+        self.assertTrue(self.exchange.get_price("HBOT-USDT", False).is_nan())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import copy
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.in_flight_order_store import InFlightOrderStore
+from hummingbot.core.event.events import OrderType, TradeType
+
+
+class StatefulInFlightOrder(InFlightOrderBase):
+    @property
+    def is_done(self) -> bool:
+        return self.last_state in ("filled", "cancelled")
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.last_state == "cancelled"
+
+    @property
+    def is_failure(self) -> bool:
+        return False
+
+
+def create_order(client_order_id: str, trading_pair: str, exchange_order_id: str = None) -> StatefulInFlightOrder:
+    return StatefulInFlightOrder(client_order_id, exchange_order_id, trading_pair, OrderType.LIMIT, TradeType.BUY,
+                                 Decimal(100), Decimal(1), "live")
+
+
+class InFlightOrderStoreUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.store = InFlightOrderStore()
+        self.store["1"] = create_order("1", "HBOT-USDT", "A")
+        self.store["2"] = create_order("2", "HBOT-USDT")
+        self.store.update({"3": create_order("3", "ETH-USDT", "C")})
+
+    def test_mapping(self):
+        self.assertEqual(3, len(self.store))
+        self.assertEqual(["1", "2", "3"], list(self.store))
+        self.assertIn("2", self.store)
+        self.assertIsNone(self.store.get("4"))
+        self.assertEqual("3", self.store.pop("3").client_order_id)
+        self.assertIsNone(self.store.pop("3", None))
+        with self.assertRaises(KeyError):
+            del self.store["3"]
+        del self.store["2"]
+        self.assertEqual(["1"], list(self.store.keys()))
+        self.store.clear()
+        self.assertEqual(0, len(self.store))
+        self.assertEqual([], self.store.trading_pairs)
+
+    def test_indexes(self):
+        self.assertIs(self.store["1"], self.store.get_by_exchange_order_id("A"))
+        self.assertIsNone(self.store.get_by_exchange_order_id("B"))
+        self.store["2"].update_exchange_order_id("B")
+        self.assertIs(self.store["2"], self.store.get_by_exchange_order_id("B"))
+        self.assertEqual(["HBOT-USDT", "ETH-USDT"], self.store.trading_pairs)
+        self.assertEqual(["1", "2"], [o.client_order_id for o in self.store.orders_for_trading_pair("HBOT-USDT")])
+
+        self.store["1"].last_state = "filled"
+        self.assertEqual(["2", "3"], [o.client_order_id for o in self.store.open_orders])
+        self.assertEqual(["1"], [o.client_order_id for o in self.store.orders_in_state("filled")])
+        self.assertEqual(["2", "3"], [o.client_order_id for o in self.store.orders_in_state("live")])
+
+        order = self.store.pop("1")
+        self.assertIsNone(self.store.get_by_exchange_order_id("A"))
+        self.assertEqual([], self.store.orders_in_state("filled"))
+        # Removed orders and copies of tracked orders don't update the indexes.
+        order.last_state = "live"
+        snapshot = copy.copy(self.store["2"])
+        snapshot.last_state = "cancelled"
+        snapshot.exchange_order_id = "D"
+        self.assertEqual(["2", "3"], [o.client_order_id for o in self.store.open_orders])
+        self.assertIsNone(self.store.get_by_exchange_order_id("D"))
+
+    def test_replace_order(self):
+        self.store["1"] = create_order("1", "ETH-USDT", "E")
+        self.assertIsNone(self.store.get_by_exchange_order_id("A"))
+        self.assertIs(self.store["1"], self.store.get_by_exchange_order_id("E"))
+        self.assertEqual(["2"], [o.client_order_id for o in self.store.orders_for_trading_pair("HBOT-USDT")])
+
+    def test_cached_assets(self):
+        order = self.store["3"]
+        self.assertEqual(("ETH", "USDT"), (order.base_asset, order.quote_asset))
+        order.trading_pair = "HBOT-BTC"
+        self.assertEqual(("HBOT", "BTC"), (order.base_asset, order.quote_asset))
+
+
+if __name__ == "__main__":
+    unittest.main()
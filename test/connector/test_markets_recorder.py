@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../../")))
+import asyncio
+from decimal import Decimal
+import os
+import tempfile
+import unittest
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from hummingbot.connector.markets_recorder import (
+    flatten_tracking_states,
+    MarketsRecorder,
+    nest_tracking_states,
+)
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_journal import MarketStateJournal
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TrackingStatesConnector:
+    def __init__(self):
+        self.tracking_states: Dict[str, Any] = {}
+        self.restored_states: Dict[str, Any] = None
+
+    @property
+    def display_name(self) -> str:
+        return "tracking"
+
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        self.restored_states = saved_states
+
+
+class NoCsvMarketsRecorder(MarketsRecorder):
+    def append_to_csv(self, trade: TradeFill):
+        pass
+
+
+class MarketsRecorderUnitTest(unittest.TestCase):
+    def setUp(self):
+        # The tests which run next keep using the current event loop.
+        self.previous_ev_loop = asyncio.get_event_loop()
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.db_dir.name, "trades.sqlite")
+        self.sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.connector = TrackingStatesConnector()
+        self.recorder = MarketsRecorder(self.sql, [], "config.yml", "strategy")
+
+    def tearDown(self):
+        self.sql.get_shared_session().close()
+        self.sql.engine.dispose()
+        self.db_dir.cleanup()
+        self.ev_loop.close()
+        asyncio.set_event_loop(self.previous_ev_loop)
+
+    def journal(self):
+        return [(entry.key, entry.state)
+                for entry in self.sql.get_shared_session().query(MarketStateJournal).order_by(MarketStateJournal.id)]
+
+    def test_journal_changes(self):
+        self.connector.tracking_states = {"1": {"amount": "1"}, "2": {"amount": "2"}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.connector.tracking_states = {"1": {"amount": "1"}, "3": {"amount": "3"}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.assertEqual([("1", {"amount": "1"}), ("2", {"amount": "2"}), ("3", {"amount": "3"}), ("2", None)],
+                         self.journal())
+
+        # A new recorder replays the journal on restore.
+        recorder = MarketsRecorder(self.sql, [], "config.yml", "strategy")
+        recorder.restore_market_states("config.yml", self.connector)
+        self.assertEqual({"1": {"amount": "1"}, "3": {"amount": "3"}}, self.connector.restored_states)
+        self.assertEqual([], self.journal())
+
+    def test_compaction(self):
+        self.recorder.MIN_JOURNAL_LENGTH_TO_COMPACT = 3
+        for i in range(3):
+            self.connector.tracking_states = {"1": {"amount": str(i)}}
+            self.recorder.save_market_states("config.yml", self.connector)
+        self.assertEqual([], self.journal())
+        self.connector.tracking_states = {}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.assertEqual([("1", None)], self.journal())
+
+        market_states = MarketsRecorder(self.sql, [], "config.yml", "strategy").get_market_states("config.yml",
+                                                                                                  self.connector)
+        self.assertEqual({}, market_states.saved_state)
+        self.assertIsNone(self.recorder.get_market_states("other.yml", self.connector))
+
+    def test_nested_states(self):
+        # As saved by the bamboo relay and radar relay connectors.
+        self.connector.tracking_states = {"market_orders": {}, "limit_orders": {"1": {"amount": "1"}}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.connector.tracking_states = {"market_orders": {},
+                                          "limit_orders": {"1": {"amount": "1"}, "2": {"amount": "2"}}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.connector.tracking_states = {"market_orders": {}, "limit_orders": {"2": {"amount": "2"}}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        self.assertEqual([("market_orders", {}), ("limit_orders/1", {"amount": "1"}),
+                          ("limit_orders/2", {"amount": "2"}), ("limit_orders/1", None)],
+                         self.journal())
+
+        recorder = MarketsRecorder(self.sql, [], "config.yml", "strategy")
+        recorder.restore_market_states("config.yml", self.connector)
+        self.assertEqual({"market_orders": {}, "limit_orders": {"2": {"amount": "2"}}},
+                         self.connector.restored_states)
+        self.assertEqual([], self.journal())
+
+        # The journal keeps going from the compacted states.
+        self.connector.tracking_states = {"market_orders": {}, "limit_orders": {}}
+        recorder.save_market_states("config.yml", self.connector)
+        self.assertEqual([("limit_orders", {}), ("limit_orders/2", None)], self.journal())
+        self.assertEqual({"market_orders": {}, "limit_orders": {}},
+                         MarketsRecorder(self.sql, [], "config.yml", "strategy")
+                         .get_market_states("config.yml", self.connector).saved_state)
+
+    def test_escaped_keys(self):
+        tracking_states = {"buy://ETH-USDT/1%2F": {"amount": "1"}}
+        self.assertEqual({"buy:%2F%2FETH-USDT%2F1%252F": {"amount": "1"}}, flatten_tracking_states(tracking_states))
+        self.assertEqual(tracking_states, nest_tracking_states(flatten_tracking_states(tracking_states)))
+
+    def test_get_market_states_read_only(self):
+        self.connector.tracking_states = {"1": {"amount": "1"}}
+        self.recorder.save_market_states("config.yml", self.connector)
+        recorder = MarketsRecorder(self.sql, [], "config.yml", "strategy")
+        self.assertEqual({"1": {"amount": "1"}}, recorder.get_market_states("config.yml", self.connector).saved_state)
+        self.assertEqual([("1", {"amount": "1"})], self.journal())
+        self.assertEqual(0, self.sql.get_shared_session().query(MarketState).count())
+
+    def test_bulk_insert(self):
+        recorder = NoCsvMarketsRecorder(self.sql, [], "config.yml", "strategy", bulk_insert=True)
+        recorder.BULK_INSERT_FLUSH_DELAY = 0.01
+        session = self.sql.get_shared_session()
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.connector,
+                                   BuyOrderCreatedEvent(1, OrderType.LIMIT, "ETH-USDT", Decimal(1), Decimal(100), "1"))
+        for i in range(3):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self.connector,
+                                     OrderFilledEvent(1, "1", "ETH-USDT", TradeType.BUY, OrderType.LIMIT,
+                                                      Decimal(100), Decimal("0.25"), TradeFee(Decimal("0.001")),
+                                                      str(i)))
+        self.assertEqual(0, session.query(TradeFill).count())
+        self.assertEqual(3, len(recorder.get_trades_for_config("config.yml")))
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        # Another connection sees the committed records.
+        other_session = sessionmaker(bind=self.sql.engine)()
+        self.assertEqual("OrderFilled", other_session.query(Order).one().last_status)
+        self.assertEqual(4, other_session.query(OrderStatus).filter(OrderStatus.order_id == "1").count())
+        trade_fills = other_session.query(TradeFill).order_by(TradeFill.id).all()
+        self.assertEqual(["0", "1", "2"], [t.exchange_trade_id for t in trade_fills])
+        self.assertEqual({"percent": 0.001, "flat_fees": []}, trade_fills[0].trade_fee)
+        other_session.close()
+
+    def test_bulk_insert_foreign_keys(self):
+        self.sql.get_shared_session().close()
+        event.listen(self.sql.engine, "connect",
+                     lambda dbapi_connection, _: dbapi_connection.execute("PRAGMA foreign_keys=ON"))
+        self.sql.engine.dispose()
+        recorder = NoCsvMarketsRecorder(self.sql, [], "config.yml", "strategy", bulk_insert=True)
+        session = self.sql.get_shared_session()
+        self.assertEqual(1, session.execute("PRAGMA foreign_keys").scalar())
+        for order_id in ["1", "2"]:
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self.connector,
+                                       BuyOrderCreatedEvent(1, OrderType.LIMIT, "ETH-USDT", Decimal(1), Decimal(100),
+                                                            order_id))
+        # The order status rows refer to the orders, which are inserted first.
+        recorder.flush()
+        other_session = sessionmaker(bind=self.sql.engine)()
+        self.assertEqual(["1", "2"], [order.id for order in other_session.query(Order).order_by(Order.id)])
+        self.assertEqual(2, other_session.query(OrderStatus).count())
+        other_session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
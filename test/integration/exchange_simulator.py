@@ -0,0 +1,591 @@
+#!/usr/bin/env python
+"""
+A local Binance exchange, for load testing the connector and the strategies running on it.
+
+The simulator serves the Binance REST API on the HummingWebApp and the market and user data streams on
+HummingWsServers. It streams order book diffs and trades at configurable rates for any number of trading pairs, either
+from a synthetic order book moving in a random walk, or from recorded stream messages. Orders are acknowledged on the
+user stream, taker orders are filled against the top of the simulated book, and resting orders are filled once the
+book crosses their price.
+
+Usage:
+    simulator = BinanceSimulator(["S000-USDT", "S001-USDT"], diffs_per_second=50, trades_per_second=5)
+    simulator.start()
+    with simulator.patch_network():
+        market = BinanceExchange("simulator", "secret", ["S000-USDT", "S001-USDT"], True)
+        ...
+    simulator.stop()
+"""
+
+import asyncio
+from aiohttp import web
+from collections import OrderedDict
+import contextlib
+import json
+import random
+import requests
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+import unittest.mock
+
+from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from test.integration.humming_web_app import HummingWebApp
+from test.integration.humming_ws_server import (
+    HummingWsServer,
+    HummingWsServerFactory,
+)
+
+API_HOST = "api.binance.com"
+WS_BASE_URL = "wss://stream.binance.com:9443/ws"
+FEE_RATE = 0.001
+MAX_FINISHED_ORDERS = 10000
+SERVER_START_TIMEOUT = 10.0
+MAX_BURST_MESSAGES = 1000
+
+
+def format_decimal(value: float) -> str:
+    return f"{value:.8f}"
+
+
+class SimulatedMarket:
+    """
+    The order book, trades and resting orders of one simulated trading pair.
+
+    Price levels are keyed by their price in ticks. The synthetic book keeps depth levels on each side of a mid price.
+    """
+    def __init__(self,
+                 trading_pair: str,
+                 initial_price: float,
+                 tick_size: float,
+                 depth: int,
+                 rng: random.Random):
+        self.trading_pair: str = trading_pair
+        self.symbol: str = convert_to_exchange_trading_pair(trading_pair)
+        self.base_asset, self.quote_asset = trading_pair.split("-")
+        self.update_id: int = 1
+        self.open_orders: Dict[str, Dict[str, Any]] = {}
+        self._tick_size: float = tick_size
+        self._depth: int = depth
+        self._rng: random.Random = rng
+        self._mid_ticks: int = int(round(initial_price / tick_size))
+        self._trade_id: int = 0
+        self.bids: Dict[int, float] = {self._mid_ticks - i: self._random_amount() for i in range(1, depth + 1)}
+        self.asks: Dict[int, float] = {self._mid_ticks + i: self._random_amount() for i in range(1, depth + 1)}
+
+    def _random_amount(self) -> float:
+        return round(self._rng.uniform(1, 100), 3)
+
+    def price(self, ticks: int) -> float:
+        return ticks * self._tick_size
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.price(max(self.bids)) if len(self.bids) > 0 else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.price(min(self.asks)) if len(self.asks) > 0 else None
+
+    def _levels(self, levels: Dict[int, float], reverse: bool) -> List[List[str]]:
+        return [[format_decimal(self.price(ticks)), format_decimal(levels[ticks])]
+                for ticks in sorted(levels, reverse=reverse)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"lastUpdateId": self.update_id, "bids": self._levels(self.bids, True),
+                "asks": self._levels(self.asks, False)}
+
+    def next_diff(self, timestamp_ms: int) -> Dict[str, Any]:
+        """
+        Moves the mid price by at most one tick, refills the levels around it, and changes the amount of one random level
+        on each side.
+        """
+        changed_bids: Dict[int, float] = {}
+        changed_asks: Dict[int, float] = {}
+        self._mid_ticks += self._rng.choice((-1, 0, 0, 1))
+        mid_ticks: int = self._mid_ticks
+        depth: int = self._depth
+        for levels, changed, first, last in ((self.bids, changed_bids, mid_ticks - depth, mid_ticks - 1),
+                                             (self.asks, changed_asks, mid_ticks + 1, mid_ticks + depth)):
+            for ticks in [ticks for ticks in levels if ticks < first or ticks > last]:
+                del levels[ticks]
+                changed[ticks] = 0.0
+            for ticks in range(first, last + 1):
+                if ticks not in levels:
+                    levels[ticks] = changed[ticks] = self._random_amount()
+            ticks = self._rng.randint(first, last)
+            levels[ticks] = changed[ticks] = self._random_amount()
+        self.update_id += 1
+        return {"e": "depthUpdate", "E": timestamp_ms, "s": self.symbol, "U": self.update_id, "u": self.update_id,
+                "b": self._levels(changed_bids, True), "a": self._levels(changed_asks, False)}
+
+    def replay_diff(self, message: Dict[str, Any], timestamp_ms: int) -> Dict[str, Any]:
+        """
+        Applies a recorded diff message to the book, and renumbers it for this trading pair.
+        """
+        for key, levels in (("b", self.bids), ("a", self.asks)):
+            for price, amount in message[key]:
+                ticks: int = int(round(float(price) / self._tick_size))
+                if float(amount) == 0:
+                    levels.pop(ticks, None)
+                else:
+                    levels[ticks] = float(amount)
+        self.update_id += 1
+        return dict(message, E=timestamp_ms, s=self.symbol, U=self.update_id, u=self.update_id)
+
+    def next_trade(self, timestamp_ms: int) -> Optional[Dict[str, Any]]:
+        is_buyer_maker: bool = self._rng.random() < 0.5
+        price: Optional[float] = self.best_bid if is_buyer_maker else self.best_ask
+        if price is None:
+            return None
+        self._trade_id += 1
+        return {"e": "trade", "E": timestamp_ms, "s": self.symbol, "t": self._trade_id, "p": format_decimal(price),
+                "q": format_decimal(round(self._rng.uniform(0.1, 10), 3)), "b": 0, "a": 0, "T": timestamp_ms,
+                "m": is_buyer_maker, "M": True}
+
+    def replay_trade(self, message: Dict[str, Any], timestamp_ms: int) -> Dict[str, Any]:
+        self._trade_id += 1
+        return dict(message, E=timestamp_ms, T=timestamp_ms, s=self.symbol, t=self._trade_id)
+
+    def taker_price(self, side: str, order_type: str, price: float) -> Optional[float]:
+        """
+        :return: the price an order fills at right away, or None if it would rest on the book
+        """
+        opposite_price: Optional[float] = self.best_ask if side == "BUY" else self.best_bid
+        if opposite_price is None:
+            return None
+        if order_type == "MARKET" or (side == "BUY" and price >= opposite_price) or \
+                (side == "SELL" and price <= opposite_price):
+            return opposite_price
+        return None
+
+    def pop_crossed_orders(self) -> List[Dict[str, Any]]:
+        """
+        Removes and returns the resting orders the book has moved through.
+        """
+        best_bid: float = self.best_bid or 0.0
+        best_ask: float = self.best_ask or float("inf")
+        crossed: List[Dict[str, Any]] = [order for order in self.open_orders.values()
+                                         if (order["side"] == "BUY" and float(order["price"]) >= best_ask) or
+                                         (order["side"] == "SELL" and float(order["price"]) <= best_bid)]
+        for order in crossed:
+            del self.open_orders[order["clientOrderId"]]
+        return crossed
+
+
+class BinanceSimulator:
+    """
+    Serves a simulated Binance exchange on local web and websocket servers.
+
+    Each API key is an account with its own orders and user stream. Balances are fixed, and large enough for any
+    strategy. Fills are reported on the user stream only; the trade history endpoint is always empty.
+    """
+    def __init__(self,
+                 trading_pairs: List[str],
+                 api_keys: List[str] = ("simulator",),
+                 diffs_per_second: float = 10.0,
+                 trades_per_second: float = 1.0,
+                 depth: int = 20,
+                 initial_price: float = 100.0,
+                 tick_size: float = 0.01,
+                 step_size: float = 0.001,
+                 balance: float = 1e6,
+                 ack_delay: float = 0.0,
+                 fill_delay: float = 0.0,
+                 recorded_messages_path: Optional[str] = None,
+                 seed: Optional[int] = None):
+        """
+        :param diffs_per_second: order book diff messages sent per second, for each trading pair
+        :param trades_per_second: trade messages sent per second, for each trading pair
+        :param ack_delay: seconds between an order request and its NEW execution report
+        :param fill_delay: seconds between a taker order's NEW and TRADE execution reports
+        :param recorded_messages_path: a file of recorded Binance depthUpdate and trade messages, one JSON object per
+                                       line, to replay in a loop in place of the synthetic traffic
+        """
+        rng: random.Random = random.Random(seed)
+        self._markets: Dict[str, SimulatedMarket] = {}
+        for trading_pair in trading_pairs:
+            market: SimulatedMarket = SimulatedMarket(trading_pair, initial_price, tick_size, depth, rng)
+            self._markets[market.symbol] = market
+        self._market_list: List[SimulatedMarket] = list(self._markets.values())
+        self._api_keys: List[str] = list(api_keys)
+        self._diffs_per_second: float = diffs_per_second
+        self._trades_per_second: float = trades_per_second
+        self._tick_size: float = tick_size
+        self._step_size: float = step_size
+        self._balance: float = balance
+        self._ack_delay: float = ack_delay
+        self._fill_delay: float = fill_delay
+        self._recorded_diffs: List[Dict[str, Any]] = []
+        self._recorded_trades: List[Dict[str, Any]] = []
+        if recorded_messages_path is not None:
+            with open(recorded_messages_path) as fd:
+                for line in fd:
+                    if line.strip():
+                        message: Dict[str, Any] = json.loads(line)
+                        if message.get("e") == "depthUpdate":
+                            self._recorded_diffs.append(message)
+                        elif message.get("e") == "trade":
+                            self._recorded_trades.append(message)
+
+        # The web app and each websocket server run on their own threads.
+        self._lock: threading.Lock = threading.Lock()
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._finished_orders: OrderedDict = OrderedDict()
+        self._order_accounts: Dict[str, str] = {}
+        self._last_order_id: int = 0
+        self._last_trade_id: int = 0
+        self._running: bool = False
+        self._web_app: Optional[HummingWebApp] = None
+        self._ws_servers: List[HummingWsServer] = []
+        self.messages_sent: int = 0
+        self.orders_created: int = 0
+        self.orders_filled: int = 0
+        self.orders_cancelled: int = 0
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return [market.trading_pair for market in self._market_list]
+
+    @property
+    def depth_stream_url(self) -> str:
+        return f"{WS_BASE_URL}/" + "/".join(f"{symbol.lower()}@depth" for symbol in self._markets)
+
+    @property
+    def trade_stream_url(self) -> str:
+        return f"{WS_BASE_URL}/" + "/".join(f"{symbol.lower()}@trade" for symbol in self._markets)
+
+    @staticmethod
+    def listen_key(api_key: str) -> str:
+        return f"simulated{api_key}"
+
+    def user_stream_url(self, api_key: str) -> str:
+        return f"{WS_BASE_URL}/{self.listen_key(api_key)}"
+
+    def start(self):
+        self._web_app = HummingWebApp.get_instance()
+        self._web_app.add_host_to_mock(API_HOST)
+        self._web_app.start()
+        self._wait_for(lambda: self._web_app.started)
+        self._add_responses()
+
+        urls: List[str] = [self.depth_stream_url, self.trade_stream_url] + \
+                          [self.user_stream_url(api_key) for api_key in self._api_keys]
+        self._ws_servers = [HummingWsServerFactory.start_new_server(url) for url in urls]
+        self._wait_for(lambda: all(hasattr(server, "ev_loop") for server in self._ws_servers))
+
+        self._running = True
+        depth_server, trade_server = self._ws_servers[:2]
+        total_diffs_per_second: float = self._diffs_per_second * len(self._market_list)
+        total_trades_per_second: float = self._trades_per_second * len(self._market_list)
+        if total_diffs_per_second > 0:
+            asyncio.run_coroutine_threadsafe(
+                self._stream_loop(depth_server, self._next_diff_message, total_diffs_per_second),
+                depth_server.ev_loop)
+        if total_trades_per_second > 0:
+            asyncio.run_coroutine_threadsafe(
+                self._stream_loop(trade_server, self._next_trade_message, total_trades_per_second),
+                trade_server.ev_loop)
+
+    def stop(self):
+        self._running = False
+        for ws_server in self._ws_servers:
+            ws_server.stop()
+        self._ws_servers = []
+        if self._web_app is not None:
+            self._web_app.stop()
+            self._web_app = None
+
+    @staticmethod
+    def _wait_for(condition: Callable[[], bool]):
+        deadline: float = time.time() + SERVER_START_TIMEOUT
+        while not condition():
+            if time.time() > deadline:
+                raise TimeoutError("The simulator servers did not start in time.")
+            time.sleep(0.01)
+
+    @contextlib.contextmanager
+    def patch_network(self):
+        """
+        Reroutes the REST requests and websocket connections to Binance to the simulator, for the duration of the
+        context. Connectors must be created inside the context, since the Binance client pings the server on creation.
+        """
+        with unittest.mock.patch("aiohttp.client.URL") as url_mock, \
+                unittest.mock.patch.object(requests.Session, "request", autospec=True) as request_mock, \
+                unittest.mock.patch("websockets.connect", autospec=True) as ws_connect_mock:
+            url_mock.side_effect = HummingWebApp.reroute_local
+            request_mock.side_effect = HummingWebApp.reroute_request
+            ws_connect_mock.side_effect = HummingWsServerFactory.reroute_ws_connect
+            yield self
+
+    def _add_responses(self):
+        responses = [
+            ("get", "/api/v1/ping", {}),
+            ("get", "/api/v1/time", lambda request: {"serverTime": int(time.time() * 1e3)}),
+            ("get", "/api/v1/exchangeInfo", self._exchange_info()),
+            ("get", "/api/v1/depth", self._depth),
+            ("get", "/api/v1/ticker/24hr", self._ticker),
+            ("get", "/wapi/v3/tradeFee.html", self._trade_fees()),
+            ("post", "/api/v1/userDataStream", self._listen_key),
+            ("put", "/api/v1/userDataStream", {}),
+            ("get", "/api/v3/account", self._account()),
+            ("post", "/api/v3/order", self._create_order),
+            ("get", "/api/v3/order", self._order_status),
+            ("delete", "/api/v3/order", self._cancel_order),
+            ("get", "/api/v3/openOrders", self._open_orders),
+            ("get", "/api/v3/myTrades", []),
+        ]
+        for method, path, data in responses:
+            self._web_app.update_response(method, API_HOST, path, data)
+
+    @staticmethod
+    async def _params(request: web.Request) -> Dict[str, str]:
+        params: Dict[str, str] = dict(request.query)
+        params.update(dict(await request.post()))
+        return params
+
+    @staticmethod
+    def _error(code: int, message: str) -> web.Response:
+        return web.json_response({"code": code, "msg": message}, status=400)
+
+    def _exchange_info(self) -> Dict[str, Any]:
+        symbols: List[Dict[str, Any]] = [{
+            "symbol": market.symbol, "status": "TRADING",
+            "baseAsset": market.base_asset, "baseAssetPrecision": 8,
+            "quoteAsset": market.quote_asset, "quotePrecision": 8, "quoteAssetPrecision": 8,
+            "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET"],
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": format_decimal(self._tick_size),
+                 "maxPrice": "1000000.00000000", "tickSize": format_decimal(self._tick_size)},
+                {"filterType": "LOT_SIZE", "minQty": format_decimal(self._step_size),
+                 "maxQty": "1000000.00000000", "stepSize": format_decimal(self._step_size)},
+                {"filterType": "MIN_NOTIONAL", "minNotional": format_decimal(self._tick_size),
+                 "applyToMarket": True, "avgPriceMins": 5}
+            ],
+            "permissions": ["SPOT"]
+        } for market in self._market_list]
+        return {"timezone": "UTC", "serverTime": int(time.time() * 1e3), "rateLimits": [], "exchangeFilters": [],
+                "symbols": symbols}
+
+    def _trade_fees(self) -> Dict[str, Any]:
+        return {"tradeFee": [{"symbol": symbol, "maker": FEE_RATE, "taker": FEE_RATE} for symbol in self._markets],
+                "success": True}
+
+    def _account(self) -> Dict[str, Any]:
+        assets: List[str] = sorted({asset for market in self._market_list
+                                    for asset in (market.base_asset, market.quote_asset)})
+        return {"makerCommission": 10, "takerCommission": 10, "buyerCommission": 0, "sellerCommission": 0,
+                "canTrade": True, "canWithdraw": True, "canDeposit": True, "updateTime": 0, "accountType": "SPOT",
+                "balances": [{"asset": asset, "free": format_decimal(self._balance), "locked": "0.00000000"}
+                             for asset in assets],
+                "permissions": ["SPOT"]}
+
+    def _listen_key(self, request: web.Request) -> Dict[str, str]:
+        return {"listenKey": self.listen_key(request.headers.get("X-MBX-APIKEY", self._api_keys[0]))}
+
+    def _depth(self, request: web.Request):
+        market: Optional[SimulatedMarket] = self._markets.get(request.query.get("symbol"))
+        if market is None:
+            return self._error(-1121, "Invalid symbol.")
+        with self._lock:
+            return market.snapshot()
+
+    def _ticker(self, request: web.Request):
+        markets: List[SimulatedMarket] = self._market_list
+        if "symbol" in request.query:
+            if request.query["symbol"] not in self._markets:
+                return self._error(-1121, "Invalid symbol.")
+            markets = [self._markets[request.query["symbol"]]]
+        with self._lock:
+            tickers: List[Dict[str, Any]] = []
+            for market in markets:
+                bid_price: float = market.best_bid or 0.0
+                ask_price: float = market.best_ask or 0.0
+                tickers.append({"symbol": market.symbol, "bidPrice": format_decimal(bid_price),
+                                "askPrice": format_decimal(ask_price),
+                                "lastPrice": format_decimal((bid_price + ask_price) / 2),
+                                "volume": "0.00000000", "quoteVolume": "0.00000000"})
+        return tickers[0] if "symbol" in request.query else tickers
+
+    def _execution_report(self,
+                          order: Dict[str, Any],
+                          execution_type: str,
+                          last_amount: float = 0.0,
+                          last_price: float = 0.0,
+                          trade_id: int = -1,
+                          client_order_id: Optional[str] = None) -> Dict[str, Any]:
+        now_ms: int = int(time.time() * 1e3)
+        market: SimulatedMarket = self._markets[order["symbol"]]
+        commission: float = 0.0
+        commission_asset: Optional[str] = None
+        if execution_type == "TRADE":
+            commission_asset = market.base_asset if order["side"] == "BUY" else market.quote_asset
+            commission = last_amount * FEE_RATE * (1 if order["side"] == "BUY" else last_price)
+        return {"e": "executionReport", "E": now_ms, "s": order["symbol"],
+                "c": client_order_id or order["clientOrderId"], "S": order["side"], "o": order["type"],
+                "f": order["timeInForce"], "q": order["origQty"], "p": order["price"], "P": "0.00000000",
+                "F": "0.00000000", "g": -1,
+                "C": order["clientOrderId"] if client_order_id is not None else "",
+                "x": execution_type, "X": order["status"], "r": "NONE", "i": order["orderId"],
+                "l": format_decimal(last_amount), "z": order["executedQty"], "L": format_decimal(last_price),
+                "n": format_decimal(commission), "N": commission_asset, "T": now_ms, "t": trade_id, "I": 0,
+                "w": order["status"] == "NEW", "m": execution_type == "TRADE" and order["type"] != "MARKET",
+                "M": execution_type == "TRADE", "O": order["time"], "Z": order["cummulativeQuoteQty"],
+                "Y": format_decimal(last_amount * last_price), "Q": "0.00000000"}
+
+    def _send_user_event(self, client_order_id: str, data: Dict[str, Any], delay: float):
+        api_key: str = self._order_accounts[client_order_id]
+        ws_server: HummingWsServer = HummingWsServerFactory.get_ws_server(self.user_stream_url(api_key))
+
+        async def send():
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await ws_server.broadcast(json.dumps(data))
+
+        asyncio.run_coroutine_threadsafe(send(), ws_server.ev_loop)
+
+    def _finish_order(self, order: Dict[str, Any]):
+        # Called with the lock held. Finished orders are kept for status queries, up to a limit.
+        self._finished_orders[order["clientOrderId"]] = order
+        self._orders.pop(order["clientOrderId"], None)
+        if len(self._finished_orders) > MAX_FINISHED_ORDERS:
+            _, old_order = self._finished_orders.popitem(last=False)
+            self._order_accounts.pop(old_order["clientOrderId"], None)
+
+    def _fill(self, order: Dict[str, Any], price: float, delay: float):
+        with self._lock:
+            amount: float = float(order["origQty"])
+            self._last_trade_id += 1
+            order["status"] = "FILLED"
+            order["executedQty"] = order["origQty"]
+            order["cummulativeQuoteQty"] = format_decimal(amount * price)
+            order["updateTime"] = int(time.time() * 1e3)
+            self._finish_order(order)
+            report: Dict[str, Any] = self._execution_report(order, "TRADE", amount, price, self._last_trade_id)
+            self.orders_filled += 1
+        self._send_user_event(order["clientOrderId"], report, delay)
+
+    async def _create_order(self, request: web.Request):
+        params: Dict[str, str] = await self._params(request)
+        market: Optional[SimulatedMarket] = self._markets.get(params.get("symbol"))
+        if market is None:
+            return self._error(-1121, "Invalid symbol.")
+        client_order_id: str = params["newClientOrderId"]
+        now_ms: int = int(time.time() * 1e3)
+        with self._lock:
+            taker_price: Optional[float] = market.taker_price(params["side"], params["type"],
+                                                              float(params.get("price", 0)))
+            if taker_price is not None and params["type"] == "LIMIT_MAKER":
+                return self._error(-2010, "Order would immediately match and take.")
+            self._last_order_id += 1
+            order: Dict[str, Any] = {
+                "symbol": market.symbol, "orderId": self._last_order_id, "orderListId": -1,
+                "clientOrderId": client_order_id, "transactTime": now_ms,
+                "price": format_decimal(float(params.get("price", 0))), "origQty": params["quantity"],
+                "executedQty": "0.00000000", "cummulativeQuoteQty": "0.00000000", "status": "NEW",
+                "timeInForce": params.get("timeInForce", "GTC"), "type": params["type"], "side": params["side"],
+                "time": now_ms, "updateTime": now_ms
+            }
+            self._orders[client_order_id] = order
+            self._order_accounts[client_order_id] = request.headers.get("X-MBX-APIKEY", self._api_keys[0])
+            if taker_price is None:
+                market.open_orders[client_order_id] = order
+            self.orders_created += 1
+            response: Dict[str, Any] = dict(order, fills=[])
+            report: Dict[str, Any] = self._execution_report(order, "NEW")
+        self._send_user_event(client_order_id, report, self._ack_delay)
+        if taker_price is not None:
+            self._fill(order, taker_price, self._ack_delay + self._fill_delay)
+        return response
+
+    async def _order_status(self, request: web.Request):
+        params: Dict[str, str] = await self._params(request)
+        client_order_id: str = params.get("origClientOrderId")
+        with self._lock:
+            order: Optional[Dict[str, Any]] = self._orders.get(client_order_id) or \
+                self._finished_orders.get(client_order_id)
+            if order is None:
+                return self._error(-2013, "Order does not exist.")
+            return dict(order)
+
+    async def _cancel_order(self, request: web.Request):
+        params: Dict[str, str] = await self._params(request)
+        market: Optional[SimulatedMarket] = self._markets.get(params.get("symbol"))
+        client_order_id: str = params.get("origClientOrderId")
+        with self._lock:
+            order: Optional[Dict[str, Any]] = market.open_orders.pop(client_order_id, None) \
+                if market is not None else None
+            if order is None:
+                return self._error(-2011, "Unknown order sent.")
+            order["status"] = "CANCELED"
+            order["updateTime"] = int(time.time() * 1e3)
+            self._finish_order(order)
+            cancel_id: str = f"cancel-{order['orderId']}"
+            self.orders_cancelled += 1
+            report: Dict[str, Any] = self._execution_report(order, "CANCELED", client_order_id=cancel_id)
+            response: Dict[str, Any] = dict(order, origClientOrderId=client_order_id, clientOrderId=cancel_id)
+        self._send_user_event(client_order_id, report, self._ack_delay)
+        return response
+
+    async def _open_orders(self, request: web.Request):
+        params: Dict[str, str] = await self._params(request)
+        api_key: str = request.headers.get("X-MBX-APIKEY", self._api_keys[0])
+        with self._lock:
+            return [dict(order) for market in self._market_list for order in market.open_orders.values()
+                    if self._order_accounts.get(order["clientOrderId"]) == api_key and
+                    params.get("symbol", market.symbol) == market.symbol]
+
+    def _next_diff_message(self, index: int) -> Optional[Dict[str, Any]]:
+        market: SimulatedMarket = self._market_list[index % len(self._market_list)]
+        timestamp_ms: int = int(time.time() * 1e3)
+        with self._lock:
+            if len(self._recorded_diffs) > 0:
+                recorded: Dict[str, Any] = self._recorded_diffs[index % len(self._recorded_diffs)]
+                message: Dict[str, Any] = market.replay_diff(recorded, timestamp_ms)
+            else:
+                message = market.next_diff(timestamp_ms)
+            crossed_orders: List[Dict[str, Any]] = market.pop_crossed_orders()
+        for order in crossed_orders:
+            self._fill(order, float(order["price"]), self._fill_delay)
+        return message
+
+    def _next_trade_message(self, index: int) -> Optional[Dict[str, Any]]:
+        market: SimulatedMarket = self._market_list[index % len(self._market_list)]
+        timestamp_ms: int = int(time.time() * 1e3)
+        with self._lock:
+            if len(self._recorded_trades) > 0:
+                return market.replay_trade(self._recorded_trades[index % len(self._recorded_trades)], timestamp_ms)
+            return market.next_trade(timestamp_ms)
+
+    async def _stream_loop(self,
+                           ws_server: HummingWsServer,
+                           next_message: Callable[[int], Optional[Dict[str, Any]]],
+                           messages_per_second: float):
+        """
+        Sends messages to the connected clients at a fixed rate. Messages that fall behind schedule are sent in bursts,
+        so the average rate holds even when the event loop stalls.
+        """
+        interval: float = 1.0 / messages_per_second
+        index: int = 0
+        next_send_time: float = time.perf_counter()
+        while self._running:
+            if len(ws_server.websockets) == 0:
+                await asyncio.sleep(0.1)
+                next_send_time = time.perf_counter()
+                continue
+            burst_size: int = 0
+            while next_send_time <= time.perf_counter() and burst_size < MAX_BURST_MESSAGES:
+                burst_size += 1
+                message: Optional[Dict[str, Any]] = next_message(index)
+                index += 1
+                next_send_time += interval
+                if message is not None:
+                    await ws_server.broadcast(json.dumps(message))
+                    self.messages_sent += 1
+            await asyncio.sleep(max(0.0, next_send_time - time.perf_counter()))
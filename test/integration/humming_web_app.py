@@ -104,6 +104,13 @@ class HummingWebApp:
         if not resps:
             raise web.HTTPNotFound(text=f"No Match found for {host}{path} {method}")
         is_json, response = resps[0].is_json, resps[0].response
+        if callable(response):
+            # Dynamic responses are computed from the request, e.g. by an exchange simulator.
+            response = response(request)
+            if asyncio.iscoroutine(response):
+                response = await response
+            if isinstance(response, web.StreamResponse):
+                return response
         if is_json:
             return web.json_response(data=response)
         elif type(response) == str:
@@ -136,7 +143,7 @@ class HummingWebApp:
         :param method: request method
                host: request host
                path: request path
-               data: data to respond
+               data: data to respond, or a function of the web request returning it
                params=None: request parameters
                is_json=True: if it's in Json format
         """
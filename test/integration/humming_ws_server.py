@@ -138,7 +138,8 @@ class HummingWsServer:
     _started : if started indicator
     host : host
     port : port
-    websocket : websocket
+    websocket : the last connected websocket
+    websockets : connected websockets
     _stock_responses : stocked web response
     host : host
 
@@ -146,6 +147,7 @@ class HummingWsServer:
     -------
     add_stock_response(self, request, json_response)
     _handler(self, websocket, path)
+    broadcast(self, message)
 
     """
     def __init__(self, host, port):
@@ -154,6 +156,7 @@ class HummingWsServer:
         self.host = host
         self.port = port
         self.websocket = None
+        self.websockets = set()
         self.stock_responses = {}
 
     def add_stock_response(self, request, json_response):
@@ -172,12 +175,27 @@ class HummingWsServer:
         :return: the web socket
         """
         self.websocket = websocket
-        async for msg in self.websocket:
-            stock_responses = [v for k, v in self.stock_responses.items() if k in msg]
-            if len(stock_responses) > 0:
-                await websocket.send(json.dumps(stock_responses[0]))
+        self.websockets.add(websocket)
+        try:
+            async for msg in websocket:
+                stock_responses = [v for k, v in self.stock_responses.items() if k in msg]
+                if len(stock_responses) > 0:
+                    await websocket.send(json.dumps(stock_responses[0]))
+        finally:
+            self.websockets.discard(websocket)
         print('websocket connection closed')
-        return self.websocket
+        return websocket
+
+    async def broadcast(self, message):
+        """
+        Send the message to every connected web socket
+        :param message: the message to be sent
+        """
+        for websocket in list(self.websockets):
+            try:
+                await websocket.send(message)
+            except websockets.exceptions.ConnectionClosed:
+                self.websockets.discard(websocket)
 
     @property
     def started(self) -> bool:
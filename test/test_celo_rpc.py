@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from eth_abi import (
+    decode_abi,
+    encode_abi,
+)
+from hexbytes import HexBytes
+from http.server import (
+    BaseHTTPRequestHandler,
+    HTTPServer,
+)
+import json
+import socket
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from unittest import mock
+
+from hummingbot.market.celo.celo_cli import CeloCLI, CELO_BASE, CELO_QUOTE
+from hummingbot.market.celo.celo_rpc import (
+    CeloRPC,
+    BALANCE_OF_SELECTOR,
+    GET_ACCOUNT_TOTAL_LOCKED_GOLD_SELECTOR,
+    GET_ADDRESS_FOR_STRING_SELECTOR,
+    GET_BUY_TOKEN_AMOUNT_SELECTOR,
+    REGISTRY_ADDRESS,
+)
+from test.integration.assets.mock_data.fixture_celo import outputs as celo_outputs, TEST_ADDRESS
+
+ADDRESS = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+CONTRACT_ADDRESSES = {
+    "Exchange": "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    "StableToken": "0x1d7022f5b17d2f8b695918fb48fa1089c9f85401",
+    "LockedGold": "0x871dd7c2b4b25e1aa18728e9d5f2af4c4e431f5c",
+}
+UNIT = 10 ** 18
+
+
+class MockCeloNode(BaseHTTPRequestHandler):
+    requests: List[List[Dict[str, Any]]] = []
+
+    def do_POST(self):
+        calls: List[Dict[str, Any]] = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(calls)
+        responses = [{"jsonrpc": "2.0", "id": call["id"], "result": self.result(call["method"], call["params"])}
+                     for call in calls]
+        body: bytes = json.dumps(responses).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def result(self, method: str, params: List[Any]) -> Any:
+        if method == "eth_blockNumber":
+            return "0x10"
+        if method == "eth_syncing":
+            return False
+        if method == "eth_getBalance":
+            return hex(3 * UNIT)
+        data: bytes = HexBytes(params[0]["data"])
+        selector, args = data[:4], data[4:]
+        if selector == GET_ADDRESS_FOR_STRING_SELECTOR:
+            assert params[0]["to"] == REGISTRY_ADDRESS
+            value = encode_abi(["address"], [CONTRACT_ADDRESSES[decode_abi(["string"], args)[0]]])
+        elif selector == GET_BUY_TOKEN_AMOUNT_SELECTOR:
+            sell_amount, sell_gold = decode_abi(["uint256", "bool"], args)
+            # 1 CGLD = 10 cUSD, with a 1% spread.
+            value = encode_abi(["uint256"], [sell_amount * 99 // 10 if sell_gold else sell_amount * 99 // 1000])
+        elif selector == GET_ACCOUNT_TOTAL_LOCKED_GOLD_SELECTOR:
+            value = encode_abi(["uint256"], [UNIT])
+        elif selector == BALANCE_OF_SELECTOR:
+            value = encode_abi(["uint256"], [50 * UNIT])
+        return HexBytes(value).hex()
+
+    def log_message(self, *args):
+        pass
+
+
+class CeloRPCUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server: HTTPServer = HTTPServer(("127.0.0.1", 0), MockCeloNode)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        CeloCLI.address = ADDRESS
+        err_msg = CeloCLI.connect_rpc(f"http://127.0.0.1:{cls.server.server_port}/")
+        assert err_msg is None, err_msg
+
+    @classmethod
+    def tearDownClass(cls):
+        CeloCLI.rpc.close()
+        CeloCLI.rpc = None
+        cls.server.shutdown()
+
+    def setUp(self):
+        MockCeloNode.requests.clear()
+
+    def test_exchange_rate(self):
+        rates = CeloCLI.exchange_rate(Decimal("2"))
+        self.assertEqual((CELO_BASE, Decimal(2), CELO_QUOTE, Decimal("19.8")), tuple(rates[0]))
+        self.assertEqual((CELO_QUOTE, Decimal(2), CELO_BASE, Decimal("0.198")), tuple(rates[1]))
+
+        # Quotes are cached for the block.
+        request_count: int = len(MockCeloNode.requests)
+        self.assertEqual(rates, CeloCLI.exchange_rate(Decimal("2")))
+        self.assertEqual(request_count, len(MockCeloNode.requests))
+
+    def test_balances(self):
+        balances = CeloCLI.balances()
+        self.assertEqual(Decimal(3), balances[CELO_BASE].total)
+        self.assertEqual(Decimal(1), balances[CELO_BASE].locked)
+        self.assertEqual(Decimal(50), balances[CELO_QUOTE].total)
+
+        # Once the contract addresses are known, all the balances come in one request.
+        MockCeloNode.requests.clear()
+        CeloCLI.balances()
+        self.assertEqual(1, len(MockCeloNode.requests))
+
+    def test_validate_node_synced(self):
+        self.assertIsNone(CeloCLI.validate_node_synced())
+
+    def test_celocli_fallback(self):
+        rpc: CeloRPC = CeloCLI.rpc
+        with socket.socket() as closed_socket:
+            closed_socket.bind(("127.0.0.1", 0))
+            unreachable_node_url: str = f"http://127.0.0.1:{closed_socket.getsockname()[1]}/"
+        try:
+            CeloCLI.rpc = CeloRPC(unreachable_node_url)
+            CeloCLI.address = TEST_ADDRESS
+            with mock.patch("hummingbot.market.celo.celo_cli.command",
+                            side_effect=lambda commands: celo_outputs[tuple(commands)]):
+                # The node can't be reached anymore, the reads go through celocli from then on.
+                balances = CeloCLI.balances()
+                self.assertIsNone(CeloCLI.rpc)
+                self.assertEqual(Decimal("29.630453216355095281"), balances[CELO_QUOTE].total)
+                self.assertIsNone(CeloCLI.validate_node_synced())
+                self.assertEqual(Decimal(2), CeloCLI.exchange_rate(Decimal("2"))[0].from_amount)
+        finally:
+            CeloCLI.rpc = rpc
+            CeloCLI.address = ADDRESS
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+
+import pandas as pd
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.triangular_arbitrage.triangular_arbitrage import TriangularArbitrageStrategy
+from test.test_order_book_tracker_registry import CountingOrderBookTracker
+
+
+class PaperTradeOrderBookTracker(CountingOrderBookTracker):
+    @property
+    def exchange_name(self) -> str:
+        # Estimates the paper trade fees with the binance default fees.
+        return "binance"
+
+
+class PaperTradeTargetMarket:
+    @staticmethod
+    def split_trading_pair(trading_pair: str) -> Tuple[str, str]:
+        base_asset, quote_asset = trading_pair.split("-")
+        return base_asset, quote_asset
+
+    @staticmethod
+    def convert_from_exchange_trading_pair(exchange_trading_pair: str) -> str:
+        return exchange_trading_pair
+
+    @staticmethod
+    def convert_to_exchange_trading_pair(hb_trading_pair: str) -> str:
+        return hb_trading_pair
+
+
+def create_paper_trade_exchange(trading_pairs: List[str]) -> PaperTradeExchange:
+    order_book_tracker: PaperTradeOrderBookTracker = PaperTradeOrderBookTracker(trading_pairs)
+    market: PaperTradeExchange = PaperTradeExchange(order_book_tracker,
+                                                    MarketConfig.default_config(),
+                                                    PaperTradeTargetMarket)
+    order_book_tracker.start()
+    return market
+
+
+class CompositeOrderBookPaperTradeTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair: str = "COINALPHA-WETH"
+
+    def setUp(self):
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        self.buy_market: PaperTradeExchange = create_paper_trade_exchange([self.trading_pair])
+        self.sell_market: PaperTradeExchange = create_paper_trade_exchange([self.trading_pair])
+        self.assertTrue(self.buy_market.ready and self.sell_market.ready)
+        self.buy_market.get_order_book(self.trading_pair).source_order_book.apply_snapshot(
+            [OrderBookRow(0.98, 5.0, 1)],
+            [OrderBookRow(1.0, 1.0, 1), OrderBookRow(1.02, 5.0, 1)],
+            1
+        )
+        self.sell_market.get_order_book(self.trading_pair).source_order_book.apply_snapshot(
+            [OrderBookRow(1.1, 10.0, 1)],
+            [OrderBookRow(1.12, 5.0, 1)],
+            1
+        )
+        for market in (self.buy_market, self.sell_market):
+            market.set_balance("COINALPHA", Decimal(500))
+            market.set_balance("WETH", Decimal(500))
+            self.clock.add_iterator(market)
+        self.clock.backtest_til(self.start_timestamp)
+        self.buy_market_info: MarketTradingPairTuple = MarketTradingPairTuple(self.buy_market, self.trading_pair,
+                                                                              "COINALPHA", "WETH")
+        self.sell_market_info: MarketTradingPairTuple = MarketTradingPairTuple(self.sell_market, self.trading_pair,
+                                                                               "COINALPHA", "WETH")
+
+    def tearDown(self):
+        tasks = asyncio.all_tasks(self.ev_loop)
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def fill_market_order(self, market: PaperTradeExchange, trading_pair: str, amount: Decimal):
+        market.buy(trading_pair, amount)
+        self.clock.backtest_til(self.clock.current_timestamp + PaperTradeExchange.TRADE_EXECUTION_DELAY + 1)
+
+    def test_arbitrage_walk_skips_paper_fills(self):
+        strategy: ArbitrageStrategy = ArbitrageStrategy(
+            [ArbitrageMarketPair(self.buy_market_info, self.sell_market_info)],
+            min_profitability=Decimal("0.03")
+        )
+        amount, profitability, bid_price, ask_price = strategy.find_best_profitable_amount(
+            self.buy_market_info, self.sell_market_info
+        )
+        self.assertEqual(Decimal("6"), amount)
+        self.assertEqual(Decimal("1.02"), ask_price)
+        initial_profitability: Decimal = profitability
+
+        # The paper market order takes the whole best ask level.
+        self.fill_market_order(self.buy_market, self.trading_pair, Decimal("1"))
+        order_book = self.buy_market.get_order_book(self.trading_pair)
+        self.assertEqual([(1.0, 1.0)], [(row.price, row.amount) for row in order_book.traded_order_book.ask_entries()])
+
+        amount, profitability, bid_price, ask_price = strategy.find_best_profitable_amount(
+            self.buy_market_info, self.sell_market_info
+        )
+        self.assertEqual(Decimal("5"), amount)
+        self.assertEqual(Decimal("1.02"), ask_price)
+        self.assertEqual(Decimal("1.1"), bid_price)
+        self.assertLess(profitability, initial_profitability)
+        self.assertAlmostEqual(1.1 * 0.999 / (1.02 * 1.001), float(profitability))
+
+    def test_triangular_arbitrage_edges_skip_paper_fills(self):
+        market: PaperTradeExchange = create_paper_trade_exchange(["ETH-USDT", "BTC-USDT", "ETH-BTC"])
+        self.assertTrue(market.ready)
+        market.get_order_book("ETH-USDT").source_order_book.apply_snapshot(
+            [OrderBookRow(399, 10.0, 1)], [OrderBookRow(400, 1.0, 1), OrderBookRow(401, 10.0, 1)], 1
+        )
+        market.get_order_book("BTC-USDT").source_order_book.apply_snapshot(
+            [OrderBookRow(9990, 10.0, 1)], [OrderBookRow(10010, 10.0, 1)], 1
+        )
+        market.get_order_book("ETH-BTC").source_order_book.apply_snapshot(
+            [OrderBookRow(0.0399, 10.0, 1)], [OrderBookRow(0.0401, 10.0, 1)], 1
+        )
+        market.set_balance("USDT", Decimal(10000))
+        market_infos: List[MarketTradingPairTuple] = [
+            MarketTradingPairTuple(market, trading_pair, *trading_pair.split("-"))
+            for trading_pair in ["ETH-USDT", "BTC-USDT", "ETH-BTC"]
+        ]
+        strategy: TriangularArbitrageStrategy = TriangularArbitrageStrategy(market_infos, Decimal("0.003"))
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.clock.current_timestamp + 1)
+        # Edge 1 buys ETH with USDT.
+        self.assertAlmostEqual(0.999 / 400, strategy.graph.edge_rate(1))
+        self.assertAlmostEqual(400, strategy.graph.edge_volume(1))
+
+        # The paper market order takes the whole best ask level, the edge moves to the next level.
+        self.fill_market_order(market, "ETH-USDT", Decimal("1"))
+        self.assertAlmostEqual(0.999 / 401, strategy.graph.edge_rate(1))
+        self.assertAlmostEqual(4010, strategy.graph.edge_volume(1))
+
+    def test_paper_markets_share_live_order_books(self):
+        order_book_tracker: PaperTradeOrderBookTracker = PaperTradeOrderBookTracker(["ETH-USDT"])
+        order_book_tracker.start()
+        first_market, second_market = [PaperTradeExchange(order_book_tracker,
+                                                          MarketConfig.default_config(),
+                                                          PaperTradeTargetMarket) for _ in range(2)]
+        self.assertTrue(first_market.ready and second_market.ready)
+        live_order_book: OrderBook = order_book_tracker.order_books["ETH-USDT"]
+        self.assertIs(type(live_order_book), OrderBook)
+        first_order_book: CompositeOrderBook = first_market.get_order_book("ETH-USDT")
+        second_order_book: CompositeOrderBook = second_market.get_order_book("ETH-USDT")
+        self.assertIsNot(first_order_book, second_order_book)
+        self.assertIs(live_order_book, first_order_book.source_order_book)
+        self.assertIs(first_order_book, first_market.get_order_book("ETH-USDT"))
+
+        # The paper order books follow the live order book.
+        live_order_book.apply_snapshot([OrderBookRow(399, 10.0, 1)],
+                                       [OrderBookRow(400, 1.0, 1), OrderBookRow(401, 10.0, 1)], 1)
+        self.assertEqual(400, first_order_book.get_price(True))
+        self.assertEqual(400, second_order_book.get_price(True))
+        # They read the entries of the live order book, without copying them.
+        self.assertEqual([], list(OrderBook.ask_entries(first_order_book)))
+        self.assertEqual([(400, 1.0), (401, 10.0)], [(row.price, row.amount) for row in first_order_book.ask_entries()])
+
+        # The fills of a paper market are only subtracted from its own order book.
+        first_market.set_balance("USDT", Decimal(10000))
+        self.clock.add_iterator(first_market)
+        self.clock.add_iterator(second_market)
+        self.fill_market_order(first_market, "ETH-USDT", Decimal("1"))
+        self.assertEqual(401, first_order_book.get_price(True))
+        self.assertEqual(400, second_order_book.get_price(True))
+        self.assertEqual(400, live_order_book.get_price(True))
+        self.assertEqual([], list(second_order_book.traded_order_book.ask_entries()))
+
+
+if __name__ == "__main__":
+    unittest.main()
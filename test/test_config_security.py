@@ -9,7 +9,15 @@ import unittest
 from hummingbot.client.config.security import Security
 from hummingbot.client import settings
 from hummingbot.client.config.global_config_map import global_config_map
-from hummingbot.client.config.config_crypt import encrypt_n_save_config_value
+from hummingbot.client.config.config_crypt import (
+    encrypt_n_save_config_value,
+    encrypted_file_path,
+    is_master_key_encrypted,
+    master_key_exists,
+    master_key_file_path,
+    read_encrypted_file,
+)
+from hummingbot.client.errors import MissingMasterKeyError
 import os
 import shutil
 import asyncio
@@ -24,6 +32,8 @@ class ConfigSecurityNewPasswordUnitTest(unittest.TestCase):
         os.makedirs(settings.CONF_FILE_PATH, exist_ok=False)
 
     def tearDown(self):
+        # Lets the decryption scheduled by the logins finish before the files are removed.
+        asyncio.get_event_loop().run_until_complete(Security.wait_til_decryption_done())
         shutil.rmtree(temp_folder)
 
     def test_new_password_process(self):
@@ -36,6 +46,24 @@ class ConfigSecurityNewPasswordUnitTest(unittest.TestCase):
         Security.update_secure_config("new_key", "new_value")
         self.assertTrue(os.path.exists(f"{temp_folder}encrypted_new_key.json"))
         self.assertTrue(Security.encrypted_file_exists("new_key"))
+        self.assertTrue(master_key_exists())
+        self.assertTrue(is_master_key_encrypted(read_encrypted_file(encrypted_file_path("new_key"))))
+        self.assertFalse(Security.new_password_required())
+        self.assertFalse(Security.login("b"))
+        self.assertTrue(Security.login("a"))
+        Security.decrypt_file(encrypted_file_path("new_key"))
+        self.assertEqual("new_value", Security.decrypted_value("new_key"))
+
+    def test_missing_master_key(self):
+        self.assertTrue(Security.login("a"))
+        Security.update_secure_config("new_key", "new_value")
+        os.unlink(master_key_file_path())
+        # The values are decrypted with the master key of the login.
+        Security.decrypt_file(encrypted_file_path("new_key"))
+        self.assertEqual("new_value", Security.decrypted_value("new_key"))
+        self.assertFalse(Security.new_password_required())
+        with self.assertRaises(MissingMasterKeyError):
+            Security.login("a")
 
 
 class ConfigSecurityExistingPasswordUnitTest(unittest.TestCase):
@@ -69,6 +97,14 @@ class ConfigSecurityExistingPasswordUnitTest(unittest.TestCase):
         self.assertEqual("test_value_1", config_value)
         Security.update_secure_config("test_key_1", "new_value")
         self.assertEqual("new_value", Security.decrypted_value("test_key_1"))
+        # the config values are migrated to the master key
+        self.assertTrue(master_key_exists())
+        for key in ("test_key_1", "test_key_2"):
+            self.assertTrue(is_master_key_encrypted(read_encrypted_file(encrypted_file_path(key))))
+        self.assertFalse(Security.login("b"))
+        self.assertTrue(Security.login("a"))
+        Security.decrypt_all()
+        self.assertEqual({"test_key_1": "new_value", "test_key_2": "test_value_2"}, Security.all_decrypted_values())
 
     def test_existing_password(self):
         loop = asyncio.get_event_loop()
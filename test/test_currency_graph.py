@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import unittest
+
+from hummingbot.strategy.triangular_arbitrage.currency_graph import CurrencyGraph
+
+
+class CurrencyGraphUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.graph: CurrencyGraph = CurrencyGraph()
+        # ETH-USDT, BTC-USDT and ETH-BTC on one exchange, sell and buy edges for each
+        self.eth_usdt_sell = self.graph.add_edge("ETH", "USDT", ("ETH-USDT", False))
+        self.eth_usdt_buy = self.graph.add_edge("USDT", "ETH", ("ETH-USDT", True))
+        self.btc_usdt_sell = self.graph.add_edge("BTC", "USDT", ("BTC-USDT", False))
+        self.btc_usdt_buy = self.graph.add_edge("USDT", "BTC", ("BTC-USDT", True))
+        self.eth_btc_sell = self.graph.add_edge("ETH", "BTC", ("ETH-BTC", False))
+        self.eth_btc_buy = self.graph.add_edge("BTC", "ETH", ("ETH-BTC", True))
+
+    def set_books(self, eth_usdt_bid: float, eth_usdt_ask: float, btc_usdt_bid: float, btc_usdt_ask: float,
+                  eth_btc_bid: float, eth_btc_ask: float):
+        self.graph.update_edge(self.eth_usdt_sell, eth_usdt_bid, 10)
+        self.graph.update_edge(self.eth_usdt_buy, 1 / eth_usdt_ask, 10 * eth_usdt_ask)
+        self.graph.update_edge(self.btc_usdt_sell, btc_usdt_bid, 10)
+        self.graph.update_edge(self.btc_usdt_buy, 1 / btc_usdt_ask, 10 * btc_usdt_ask)
+        self.graph.update_edge(self.eth_btc_sell, eth_btc_bid, 10)
+        self.graph.update_edge(self.eth_btc_buy, 1 / eth_btc_ask, 10 * eth_btc_ask)
+
+    def raise_eth_btc_price(self):
+        # ETH-BTC goes up: buy ETH with USDT, sell ETH for BTC, sell BTC for USDT
+        self.graph.update_edge(self.eth_btc_sell, 0.0420, 10)
+        self.graph.update_edge(self.eth_btc_buy, 1 / 0.0422, 10 * 0.0422)
+
+    def test_no_cycle_in_consistent_market(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        self.assertEqual([], self.graph.find_best_cycle(0, 3))
+        self.assertEqual(0, self.graph.changed_edge_count)
+
+    def test_find_triangular_cycle(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        self.graph.find_best_cycle(0, 3)
+        self.raise_eth_btc_price()
+        # Only the sell edge got a better rate
+        self.assertEqual(1, self.graph.changed_edge_count)
+        cycle = self.graph.find_best_cycle(0, 3)
+        self.assertEqual({self.eth_usdt_buy, self.eth_btc_sell, self.btc_usdt_sell}, set(cycle))
+        self.assertEqual(self.eth_btc_sell, cycle[0])
+        self.assertAlmostEqual(1 / 401 * 0.0420 * 9990, self.graph.get_cycle_rate(cycle))
+
+        # The edges of the found cycle are in trading order, each one starting where the previous one ended.
+        for previous_edge, edge in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertEqual(self.graph.edge_assets(previous_edge)[1], self.graph.edge_assets(edge)[0])
+
+    def test_min_profitability(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        self.graph.find_best_cycle(0, 3)
+        self.raise_eth_btc_price()
+        profitability = 1 / 401 * 0.0420 * 9990 - 1
+        self.assertEqual([], self.graph.find_best_cycle(profitability + 0.001, 3))
+
+        # The edge was already searched, and did not change since.
+        self.assertEqual([], self.graph.find_best_cycle(0, 3))
+        self.graph.mark_all_changed()
+        self.assertEqual(3, len(self.graph.find_best_cycle(profitability - 0.001, 3)))
+
+    def test_max_legs(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        self.graph.find_best_cycle(0, 3)
+        self.raise_eth_btc_price()
+        self.assertEqual([], self.graph.find_best_cycle(0, 2))
+
+    def test_two_legs_cross_exchange(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        other_eth_usdt_sell = self.graph.add_edge("ETH", "USDT", ("other ETH-USDT", False))
+        self.graph.find_best_cycle(0, 3)
+        self.graph.update_edge(other_eth_usdt_sell, 405, 10)
+        cycle = self.graph.find_best_cycle(0, 3)
+        self.assertEqual([other_eth_usdt_sell, self.eth_usdt_buy], cycle)
+        self.assertAlmostEqual(405 / 401, self.graph.get_cycle_rate(cycle))
+
+    def test_empty_book_edge_is_unusable(self):
+        self.set_books(399, 401, 9990, 10010, 0.0399, 0.0401)
+        self.graph.update_edge(self.eth_btc_sell, 0.0420, 0)
+        self.graph.update_edge(self.btc_usdt_sell, math.nan, 10)
+        self.graph.mark_all_changed()
+        self.assertEqual([], self.graph.find_best_cycle(0, 3))
+
+    def test_rejected_non_simple_cycle(self):
+        # X -> Y is searched, the lightest path back from Y goes around the A <-> B loop.
+        graph: CurrencyGraph = CurrencyGraph()
+        x_y = graph.add_edge("X", "Y")
+        for from_asset, to_asset, rate in [("Y", "A", 1.0), ("A", "B", 1.1), ("B", "A", 1.1), ("A", "X", 1.0)]:
+            graph.update_edge(graph.add_edge(from_asset, to_asset), rate, 10)
+        self.assertEqual(2, len(graph.find_best_cycle(0, 5)))
+        self.assertEqual(0, graph.rejected_cycle_count)
+
+        graph.update_edge(x_y, 1.01, 10)
+        self.assertEqual([], graph.find_best_cycle(0, 5))
+        self.assertEqual(1, graph.rejected_cycle_count)
+        # The simple cycle X -> Y -> A -> X is found when the loop can't fit in the legs.
+        graph.update_edge(x_y, 1.02, 10)
+        self.assertEqual(3, len(graph.find_best_cycle(0, 3)))
+        self.assertEqual(1, graph.rejected_cycle_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
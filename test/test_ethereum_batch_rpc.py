@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from eth_abi import encode_abi
+from hexbytes import HexBytes
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.wallet.ethereum.ethereum_batch_rpc import (
+    EthereumBatchRPC,
+    JSONRPCError,
+    shared_block_cache,
+)
+
+ACCOUNT = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+TOKENS = ["0x1dC4c1cEFEF38a777b15aA20260a54E584b16C48", "0x1D7022f5B17d2F8B695918FB48fa1089C9f85401"]
+TX_HASH = "0x" + "11" * 32
+PENDING_TX_HASH = "0x" + "22" * 32
+BLOCK_HASH = "0x" + "33" * 32
+
+
+class EthereumBatchRPCUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        cls.requests: List[List[Dict[str, Any]]] = []
+        app: web.Application = web.Application()
+        app.router.add_post("/", cls.handle_batch)
+        cls.runner: web.AppRunner = web.AppRunner(app)
+        cls.ev_loop.run_until_complete(cls.runner.setup())
+        site: web.TCPSite = web.TCPSite(cls.runner, "127.0.0.1", 0)
+        cls.ev_loop.run_until_complete(site.start())
+        port: int = site._server.sockets[0].getsockname()[1]
+        cls.batch_rpc: EthereumBatchRPC = EthereumBatchRPC(f"http://127.0.0.1:{port}/")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ev_loop.run_until_complete(cls.batch_rpc.close())
+        cls.ev_loop.run_until_complete(cls.runner.cleanup())
+
+    @classmethod
+    async def handle_batch(cls, request: web.Request) -> web.Response:
+        calls: List[Dict[str, Any]] = await request.json()
+        cls.requests.append(calls)
+        responses: List[Dict[str, Any]] = []
+        for call in calls:
+            method, params = call["method"], call["params"]
+            response: Dict[str, Any] = {"jsonrpc": "2.0", "id": call["id"]}
+            if method == "eth_getBalance":
+                response["result"] = hex(10 ** 18)
+            elif method == "eth_call":
+                balance: int = TOKENS.index(params[0]["to"]) + 1
+                response["result"] = HexBytes(encode_abi(["uint256"], [balance])).hex()
+            elif method == "eth_getTransactionReceipt" and params[0] == TX_HASH:
+                response["result"] = {"transactionHash": TX_HASH, "blockHash": BLOCK_HASH, "blockNumber": "0x10",
+                                      "gasUsed": "0x5208", "status": "0x1"}
+            elif method == "eth_getTransactionReceipt":
+                response["result"] = None
+            elif method == "eth_getBlockByHash":
+                response["result"] = {"hash": BLOCK_HASH, "parentHash": "0x" + "00" * 32, "number": "0x10",
+                                      "timestamp": "0x5f5e1000"}
+            else:
+                response["error"] = {"code": -32601, "message": "Method not found"}
+            responses.append(response)
+        # Batch responses may come in any order.
+        return web.Response(text=json.dumps(list(reversed(responses))), content_type="application/json")
+
+    def setUp(self):
+        self.requests.clear()
+        shared_block_cache().clear()
+
+    def test_batch_call(self):
+        results = self.ev_loop.run_until_complete(self.batch_rpc.batch_call([
+            ("eth_getBalance", [ACCOUNT, "latest"]),
+            ("eth_unknown", []),
+        ]))
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(hex(10 ** 18), results[0])
+        self.assertIsInstance(results[1], JSONRPCError)
+
+    def test_get_balances(self):
+        eth_balance, token_balances = self.ev_loop.run_until_complete(self.batch_rpc.get_balances(ACCOUNT, TOKENS))
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(10 ** 18, eth_balance)
+        self.assertEqual([1, 2], token_balances)
+
+    def test_receipts_and_blocks(self):
+        receipts = self.ev_loop.run_until_complete(
+            self.batch_rpc.get_transaction_receipts([TX_HASH, PENDING_TX_HASH])
+        )
+        self.assertIsNone(receipts[1])
+        self.assertEqual(HexBytes(BLOCK_HASH), receipts[0].blockHash)
+        self.assertEqual(21000, receipts[0].gasUsed)
+        self.assertEqual(1, receipts[0].status)
+
+        blocks = self.ev_loop.run_until_complete(self.batch_rpc.get_blocks([receipts[0].blockHash]))
+        self.assertEqual(0x5f5e1000, blocks[0].timestamp)
+
+        # The block is now in the shared cache.
+        self.ev_loop.run_until_complete(self.batch_rpc.get_blocks([receipts[0].blockHash]))
+        self.assertEqual(2, len(self.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
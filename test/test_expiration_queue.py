@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import unittest
+
+from hummingbot.core.data_type.expiration_queue import ExpirationQueue
+
+
+class ExpirationQueueUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.queue: ExpirationQueue = ExpirationQueue()
+
+    def test_pop_expired(self):
+        self.queue.push("tx-2", 0, 20)
+        self.queue.push("tx-1", 0, 10)
+        self.queue.push("tx-3", 0, 10)
+        self.assertEqual(3, len(self.queue))
+        self.assertEqual(10, self.queue.next_expiration())
+
+        # Keys expire strictly after their expiration timestamp, earliest first.
+        self.assertEqual([], self.queue.pop_expired(10))
+        self.assertEqual(["tx-1", "tx-3"], self.queue.pop_expired(10.5))
+        self.assertNotIn("tx-1", self.queue)
+        self.assertIn("tx-2", self.queue)
+        self.assertEqual(["tx-2"], self.queue.pop_expired(100))
+        self.assertEqual(0, len(self.queue))
+        self.assertTrue(math.isnan(self.queue.next_expiration()))
+
+    def test_push_and_remove(self):
+        self.queue.push("tx-1", 0, 10)
+        self.queue.push("tx-2", 0, 20)
+        # Pushing a key again replaces its expiration.
+        self.queue.push("tx-1", 5, 30)
+        self.assertEqual(2, len(self.queue))
+        self.assertEqual(20, self.queue.next_expiration())
+
+        self.assertTrue(self.queue.remove("tx-2"))
+        self.assertFalse(self.queue.remove("tx-2"))
+        self.assertEqual(30, self.queue.next_expiration())
+        self.assertEqual(["tx-1"], self.queue.pop_expired(31))
+
+    def test_nan_expiration(self):
+        self.queue.push("tx-1", 0, 5)
+        self.queue.push("tx-2", 0, 10)
+        # Keys pushed before the clock started have NaN timestamps, they never expire.
+        self.queue.push("tx-nan", math.nan, math.nan)
+        self.assertEqual(3, len(self.queue))
+        self.assertEqual(5, self.queue.next_expiration())
+        self.assertTrue(self.queue.remove("tx-nan"))
+        self.assertNotIn("tx-nan", self.queue)
+        self.assertEqual(2, len(self.queue))
+
+        self.queue.push("tx-nan", math.nan, math.nan)
+        self.assertEqual(["tx-1", "tx-2"], self.queue.pop_expired(100))
+        self.assertEqual(["tx-nan"], [key for key in ["tx-1", "tx-2", "tx-nan"] if key in self.queue])
+        # The key can be pushed again once the clock started.
+        self.queue.push("tx-nan", 100, 110)
+        self.assertEqual(["tx-nan"], self.queue.pop_expired(111))
+        self.assertEqual(0, len(self.queue))
+
+
+if __name__ == "__main__":
+    unittest.main()
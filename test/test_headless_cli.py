@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import List
+import unittest
+
+from ruamel.yaml import YAML
+
+from hummingbot import (
+    remove_cli_log_handlers,
+    root_path,
+)
+from hummingbot.client.ui.headless_cli import HeadlessCLI
+
+
+class HeadlessCLIUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.commands: List[str] = []
+        self.cli: HeadlessCLI = HeadlessCLI(input_handler=self.commands.append)
+
+    def test_accept_command(self):
+        self.cli.accept("status\n")
+        self.assertEqual(["status"], self.commands)
+
+    def test_accept_answers_prompt(self):
+        async def answer():
+            await asyncio.sleep(0.01)
+            self.cli.accept("yes\n")
+
+        prompt_task = asyncio.ensure_future(self.cli.prompt("Continue? >>> "))
+        self.ev_loop.run_until_complete(answer())
+        self.assertEqual("yes", self.ev_loop.run_until_complete(prompt_task))
+        # The answer to the prompt is not handled as a command.
+        self.assertEqual([], self.commands)
+
+    def test_control_socket(self):
+        socket_path: str = join(root_path(), "test", "test_headless_cli.sock")
+        self.cli.control_socket_path = socket_path
+
+        # Like the application, commands log their output to the CLI.
+        def handle_command(command: str):
+            self.commands.append(command)
+            self.cli.log("\n  No past trades to report.")
+
+        self.cli.input_handler = handle_command
+        run_task = asyncio.ensure_future(self.cli.run())
+        # The command is echoed, followed by its output.
+        expected: bytes = b"\n>>>  history\n\n  No past trades to report.\n"
+
+        async def send_command() -> bytes:
+            await asyncio.sleep(0.1)
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            writer.write(b"history\n")
+            output: bytes = await reader.readexactly(len(expected))
+            writer.close()
+            return output
+
+        self.assertEqual(expected, self.ev_loop.run_until_complete(send_command()))
+        self.assertEqual(["history"], self.commands)
+        self.cli.exit()
+        self.ev_loop.run_until_complete(run_task)
+
+    def test_remove_cli_log_handlers(self):
+        with open(join(root_path(), "hummingbot", "templates", "hummingbot_logs_TEMPLATE.yml")) as fd:
+            config_dict = YAML().load(fd)
+        remove_cli_log_handlers(config_dict)
+        self.assertEqual(["file_handler", "report_proxy_handler", "null"], list(config_dict["handlers"].keys()))
+        self.assertEqual(["file_handler"], config_dict["root"]["handlers"])
+        self.assertEqual(["file_handler", "report_proxy_handler"],
+                         config_dict["loggers"]["hummingbot.strategy"]["handlers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import random
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.ladder_order_book import LadderOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+
+TICK_SIZE = 0.01
+
+
+def random_rows(rng: random.Random, mid_tick: int, is_bid: bool, count: int, update_id: int,
+                removal_ratio: float = 0.3) -> List[OrderBookRow]:
+    rows: List[OrderBookRow] = []
+    for _ in range(count):
+        # Mostly close to the touch, sometimes far away from it.
+        distance: int = int(rng.expovariate(1 / 20)) + 1 if rng.random() < 0.9 else rng.randint(100, 5000)
+        tick: int = mid_tick - distance if is_bid else mid_tick + distance
+        amount: float = 0.0 if rng.random() < removal_ratio else round(rng.uniform(0.1, 10), 3)
+        rows.append(OrderBookRow(round(tick * TICK_SIZE, 2), amount, update_id))
+    return rows
+
+
+class LadderOrderBookUnitTest(unittest.TestCase):
+    def assertBooksEqual(self, expected: OrderBook, actual: OrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+            for volume in (0.5, 7, 150, 1e6):
+                self.assertQueryResultsEqual(expected.get_price_for_volume(is_buy, volume),
+                                             actual.get_price_for_volume(is_buy, volume))
+                self.assertQueryResultsEqual(expected.get_vwap_for_volume(is_buy, volume),
+                                             actual.get_vwap_for_volume(is_buy, volume))
+                self.assertQueryResultsEqual(expected.get_price_for_quote_volume(is_buy, volume * 100),
+                                             actual.get_price_for_quote_volume(is_buy, volume * 100))
+                self.assertQueryResultsEqual(expected.get_quote_volume_for_base_amount(is_buy, volume),
+                                             actual.get_quote_volume_for_base_amount(is_buy, volume))
+            for price in (95.0, 99.9, 100.0, 100.1, 105.0):
+                self.assertQueryResultsEqual(expected.get_volume_for_price(is_buy, price),
+                                             actual.get_volume_for_price(is_buy, price))
+                self.assertQueryResultsEqual(expected.get_quote_volume_for_price(is_buy, price),
+                                             actual.get_quote_volume_for_price(is_buy, price))
+
+    def assertQueryResultsEqual(self, expected, actual):
+        for field in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value, actual_value = getattr(expected, field), getattr(actual, field)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value), field)
+            else:
+                self.assertEqual(expected_value, actual_value, field)
+
+    def replay(self, dex: bool, seed: int):
+        rng: random.Random = random.Random(seed)
+        # A small window, so the sparse levels and the window moves are exercised.
+        order_book: OrderBook = OrderBook(dex=dex)
+        ladder_order_book: LadderOrderBook = LadderOrderBook(TICK_SIZE, dex=dex, window_size=64)
+        mid_tick: int = 10000
+        snapshot_bids = random_rows(rng, mid_tick, True, 200, 1, removal_ratio=0)
+        snapshot_asks = random_rows(rng, mid_tick, False, 200, 1, removal_ratio=0)
+        order_book.apply_snapshot(snapshot_bids, snapshot_asks, 1)
+        ladder_order_book.apply_snapshot(snapshot_bids, snapshot_asks, 1)
+        self.assertBooksEqual(order_book, ladder_order_book)
+
+        for update_id in range(2, 300):
+            # The market drifts away from the window, and sometimes crosses the other side of the book.
+            mid_tick += rng.randint(-30, 30)
+            bids = random_rows(rng, mid_tick + rng.randint(-2, 3), True, 10, update_id)
+            asks = random_rows(rng, mid_tick - rng.randint(-2, 3), False, 10, update_id)
+            order_book.apply_diffs(bids, asks, update_id)
+            ladder_order_book.apply_diffs(bids, asks, update_id)
+            self.assertEqual(order_book.last_diff_uid, ladder_order_book.last_diff_uid)
+            if update_id % 20 == 0:
+                self.assertBooksEqual(order_book, ladder_order_book)
+        self.assertBooksEqual(order_book, ladder_order_book)
+
+    def test_replay_centralised(self):
+        for seed in range(5):
+            self.replay(False, seed)
+
+    def test_replay_dex(self):
+        for seed in range(5):
+            self.replay(True, seed)
+
+    def test_snapshot_keeps_first_entry(self):
+        ladder_order_book: LadderOrderBook = LadderOrderBook(TICK_SIZE)
+        ladder_order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1), OrderBookRow(99.0, 2.0, 1)],
+                                         [OrderBookRow(101.0, 1.0, 1)], 1)
+        self.assertEqual([OrderBookRow(99.0, 1.0, 1)], list(ladder_order_book.bid_entries()))
+        self.assertEqual(1, ladder_order_book.snapshot_uid)
+
+    def test_empty_book(self):
+        ladder_order_book: LadderOrderBook = LadderOrderBook(TICK_SIZE)
+        with self.assertRaises(EnvironmentError):
+            ladder_order_book.get_price(True)
+        ladder_order_book.apply_diffs([OrderBookRow(99.0, 1.0, 1)], [], 1)
+        self.assertEqual(99.0, ladder_order_book.get_price(False))
+        ladder_order_book.apply_diffs([OrderBookRow(99.0, 0.0, 2)], [], 2)
+        with self.assertRaises(EnvironmentError):
+            ladder_order_book.get_price(False)
+
+    def test_apply_order_book(self):
+        rng: random.Random = random.Random(0)
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot(random_rows(rng, 10000, True, 200, 1, removal_ratio=0),
+                                  random_rows(rng, 10000, False, 200, 1, removal_ratio=0), 1)
+        order_book.apply_diffs(random_rows(rng, 10000, True, 10, 2), random_rows(rng, 10000, False, 10, 2), 2)
+
+        # A tracker carrying over its ladder order book, then a paper market following it.
+        ladder_order_book: LadderOrderBook = LadderOrderBook(TICK_SIZE, window_size=64)
+        ladder_order_book.apply_order_book(order_book)
+        self.assertBooksEqual(order_book, ladder_order_book)
+        self.assertEqual((1, 2), (ladder_order_book.snapshot_uid, ladder_order_book.last_diff_uid))
+        composite_order_book: CompositeOrderBook = CompositeOrderBook(ladder_order_book)
+        self.assertBooksEqual(order_book, composite_order_book)
+
+        # And back to a set order book, with the recorded fills.
+        best_ask: float = composite_order_book.get_price(True)
+        composite_order_book.record_filled_order(OrderFilledEvent(1, "1", "A-B", TradeType.BUY, OrderType.MARKET,
+                                                                  best_ask, 1e6, TradeFee(0)))
+        round_trip_order_book: OrderBook = OrderBook()
+        round_trip_order_book.apply_order_book(composite_order_book)
+        self.assertLess(best_ask, round_trip_order_book.get_price(True))
+        self.assertEqual(list(composite_order_book.ask_entries()), list(round_trip_order_book.ask_entries()))
+        self.assertEqual(list(order_book.bid_entries()), list(round_trip_order_book.bid_entries()))
+
+    def test_invalid_tick_size(self):
+        with self.assertRaises(ValueError):
+            LadderOrderBook(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import aiohttp
+import asyncio
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.metrics import (
+    class_label,
+    Counter,
+    MetricsRegistry,
+    MetricsServer,
+    metrics_registry,
+    rest_path_label,
+)
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    pass
+
+
+class MetricsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.registry: MetricsRegistry = MetricsRegistry()
+
+    def test_exposition(self):
+        counter = self.registry.counter("orders_total", "Orders placed.", ["side"])
+        counter.labels("buy").inc()
+        counter.labels("buy").inc(2)
+        self.registry.gauge("queue_size", "Queued \"messages\".").labels().set(1.5)
+        histogram = self.registry.histogram("latency_seconds", "Request latency.", buckets=[0.1, 1.0])
+        for value in (0.05, 0.5, 5.0):
+            histogram.labels().observe(value)
+
+        self.assertEqual("\n".join([
+            "# HELP orders_total Orders placed.",
+            "# TYPE orders_total counter",
+            "orders_total{side=\"buy\"} 3",
+            "# HELP queue_size Queued \"messages\".",
+            "# TYPE queue_size gauge",
+            "queue_size 1.5",
+            "# HELP latency_seconds Request latency.",
+            "# TYPE latency_seconds histogram",
+            "latency_seconds_bucket{le=\"0.1\"} 1",
+            "latency_seconds_bucket{le=\"1\"} 2",
+            "latency_seconds_bucket{le=\"+Inf\"} 3",
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+        ]) + "\n", self.registry.exposition())
+
+    def test_registration(self):
+        counter = self.registry.counter("orders_total", "Orders placed.", ["side"])
+        self.assertIs(counter, self.registry.counter("orders_total", "Orders placed.", ["side"]))
+        with self.assertRaises(ValueError):
+            self.registry.gauge("orders_total", "Orders placed.", ["side"])
+        with self.assertRaises(ValueError):
+            counter.labels("buy", "binance")
+
+    def test_bounded_label_sets(self):
+        counter: Counter = Counter("requests_total", "Requests sent.", ["path"], max_label_sets=2)
+        for path in ("/a", "/b", "/a", "/c"):
+            counter.labels(path).inc()
+        # The oldest label set is evicted.
+        self.assertEqual(["requests_total{path=\"/b\"} 1", "requests_total{path=\"/c\"} 1"],
+                         counter.exposition().split("\n")[2:])
+
+    def test_rest_path_label(self):
+        self.assertEqual("/v3/orders/{id}", rest_path_label("/v3/orders/0b8a8bd3-1234-4cde-9f00-6a1e8f6f2d3c"))
+        self.assertEqual("/api/v3/order/{id}", rest_path_label("/api/v3/order/12345?symbol=ETHUSDT"))
+        self.assertEqual("/v3/markets/ETH-USDT/orderbook", rest_path_label("/v3/markets/ETH-USDT/orderbook"))
+        self.assertEqual("/0/private/Balance", rest_path_label("/0/private/Balance"))
+
+    def test_object_collector(self):
+        order_book: OrderBook = OrderBook()
+        self.registry.counter("updates_total", "Order book updates.").add_object_collector(
+            order_book, lambda book: [((), book.version)])
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        self.assertIn("updates_total 1\n", self.registry.exposition())
+
+        # The collector doesn't keep the order book alive, and goes away with it.
+        del order_book
+        self.assertNotIn("updates_total 1", self.registry.exposition())
+
+    def test_order_book_tracker(self):
+        self.assertEqual("coinbase_pro", class_label(type("CoinbaseProOrderBookTracker", (), {})(),
+                                                     "OrderBookTracker"))
+        tracker: MockOrderBookTracker = MockOrderBookTracker(None, ["BTC-USDT"])
+        order_book: OrderBook = OrderBook()
+        tracker.order_books["BTC-USDT"] = order_book
+        order_book.apply_diffs([OrderBookRow(99, 1, 1)], [], 1)
+        order_book.apply_diffs([OrderBookRow(98, 1, 2)], [], 2)
+        exposition: str = metrics_registry().exposition()
+        self.assertIn("hummingbot_order_book_updates_total{exchange=\"mock\",trading_pair=\"BTC-USDT\"} 2",
+                      exposition)
+        self.assertIn("hummingbot_order_book_diff_queue_size{exchange=\"mock\"} 0", exposition)
+
+    def test_server(self):
+        self.registry.counter("orders_total", "Orders placed.").labels().inc()
+        server: MetricsServer = MetricsServer(0, registry=self.registry)
+
+        async def scrape():
+            await server.start()
+            try:
+                async with aiohttp.ClientSession() as client:
+                    async with client.get(f"http://127.0.0.1:{server.port}/metrics") as response:
+                        return response.headers["Content-Type"], await response.text()
+            finally:
+                await server.stop()
+
+        content_type, text = asyncio.get_event_loop().run_until_complete(scrape())
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        self.assertEqual(self.registry.exposition(), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+from typing import List
+import unittest
+
+from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class DynamicDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.subscriptions: List[str] = []
+        self.snapshot_requests: List[str] = []
+
+    @property
+    def dynamic_trading_pairs(self) -> bool:
+        return True
+
+    async def add_trading_pair(self, trading_pair: str):
+        self.subscriptions.append(f"+{trading_pair}")
+
+    async def remove_trading_pair(self, trading_pair: str):
+        self.subscriptions.append(f"-{trading_pair}")
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests.append(trading_pair)
+        return self.order_book_create_function()
+
+    async def listen_for_order_book_diffs(self, ev_loop, output):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop, output):
+        pass
+
+    async def listen_for_trades(self, ev_loop, output):
+        pass
+
+
+class DynamicOrderBookTracker(OrderBookTracker):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(DynamicDataSource(trading_pairs), trading_pairs)
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: List[dict] = []
+
+    async def send(self, message: str):
+        self.sent.append(json.loads(message))
+
+
+class OrderBookTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        tasks = asyncio.all_tasks(self.ev_loop)
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.ev_loop.close()
+
+    def test_add_and_remove_trading_pairs(self):
+        tracker = DynamicOrderBookTracker(["A-B"])
+        self.assertTrue(tracker.dynamic_trading_pairs)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 5))
+        first_order_book = tracker.order_books["A-B"]
+
+        self.ev_loop.run_until_complete(tracker.add_trading_pair("C-D"))
+        self.ev_loop.run_until_complete(tracker.add_trading_pair("C-D"))
+        self.assertEqual(["A-B", "C-D"], tracker._trading_pairs)
+        self.assertEqual(["+C-D"], tracker.data_source.subscriptions)
+        # Only the new order book is initialized.
+        self.assertEqual(["A-B", "C-D"], tracker.data_source.snapshot_requests)
+        self.assertIs(first_order_book, tracker.order_books["A-B"])
+        self.assertIn("C-D", tracker._tracking_tasks)
+
+        self.ev_loop.run_until_complete(tracker.remove_trading_pair("A-B"))
+        self.assertEqual(["C-D"], tracker._trading_pairs)
+        self.assertEqual(["+C-D", "-A-B"], tracker.data_source.subscriptions)
+        self.assertEqual(["C-D"], list(tracker.order_books.keys()))
+        self.assertNotIn("A-B", tracker._tracking_tasks)
+        tracker.stop()
+
+    def test_add_before_start(self):
+        tracker = DynamicOrderBookTracker(["A-B"])
+        self.ev_loop.run_until_complete(tracker.add_trading_pair("C-D"))
+        self.assertEqual({}, tracker.order_books)
+        tracker.start()
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 5))
+        self.assertEqual(["A-B", "C-D"], sorted(tracker.order_books.keys()))
+        tracker.stop()
+
+    def test_binance_subscriptions(self):
+        data_source = BinanceAPIOrderBookDataSource(["BTC-USDT"])
+        self.assertTrue(data_source.dynamic_trading_pairs)
+        depth_ws, trade_ws = FakeWebSocket(), FakeWebSocket()
+        data_source._websockets = {"depth": depth_ws, "trade": trade_ws}
+        self.ev_loop.run_until_complete(data_source.add_trading_pair("ETH-USDT"))
+        self.ev_loop.run_until_complete(data_source.remove_trading_pair("BTC-USDT"))
+        self.assertEqual(["ETH-USDT"], data_source._trading_pairs)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["ethusdt@depth"], "id": 1},
+                          {"method": "UNSUBSCRIBE", "params": ["btcusdt@depth"], "id": 3}], depth_ws.sent)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["ethusdt@trade"], "id": 2},
+                          {"method": "UNSUBSCRIBE", "params": ["btcusdt@trade"], "id": 4}], trade_ws.sent)
+
+
+if __name__ == "__main__":
+    unittest.main()
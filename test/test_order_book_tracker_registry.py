@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_registry import OrderBookTrackerRegistry
+from test.test_order_book_tracker import DynamicOrderBookTracker
+
+
+class NullDataSource(OrderBookTrackerDataSource):
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def get_trading_pairs(self):
+        return self._trading_pairs
+
+    async def listen_for_order_book_diffs(self, ev_loop, output):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop, output):
+        pass
+
+    async def listen_for_trades(self, ev_loop, output):
+        pass
+
+
+class CountingOrderBookTracker(OrderBookTracker):
+    started: List["CountingOrderBookTracker"] = []
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(NullDataSource(trading_pairs), trading_pairs)
+        self.running = False
+
+    @property
+    def exchange_name(self) -> str:
+        return "counting"
+
+    def start(self):
+        self.running = True
+        self.started.append(self)
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._order_books_initialized.set()
+
+    def stop(self):
+        self.running = False
+
+
+class NullOrderBookTracker(OrderBookTracker):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(NullDataSource(trading_pairs), trading_pairs)
+
+    @property
+    def exchange_name(self) -> str:
+        return "null"
+
+
+class OrderBookTrackerRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        CountingOrderBookTracker.started.clear()
+        self.registry = OrderBookTrackerRegistry()
+
+    def tearDown(self):
+        tasks = asyncio.all_tasks(self.ev_loop)
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def test_shared_order_books(self):
+        first = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"])
+        second = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"])
+        self.assertEqual("counting", first.exchange_name)
+        self.assertFalse(first.ready)
+        first.start()
+        second.start()
+        self.assertEqual(1, len(CountingOrderBookTracker.started))
+        self.assertTrue(first.ready and second.ready)
+        self.assertIs(first.order_books["A-B"], second.order_books["A-B"])
+
+        # Stopping one user keeps the tracker running for the other.
+        first.stop()
+        first.stop()
+        tracker = second.tracker
+        self.assertTrue(tracker.running)
+        second.stop()
+        self.assertFalse(tracker.running)
+        self.assertIsNone(second.tracker)
+        self.assertEqual({}, second.order_books)
+
+    def test_trading_pair_views(self):
+        first = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"])
+        second = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B", "C-D"])
+        first.start()
+        second.start()
+        self.assertEqual(["A-B", "C-D"], second.tracker._trading_pairs)
+        self.assertEqual(["A-B"], list(first.order_books.keys()))
+        self.assertEqual(["A-B", "C-D"], list(second.order_books.keys()))
+        self.assertEqual(["A-B", "C-D"], self.registry.trading_pairs(second._key))
+        second.stop()
+        self.assertEqual(["A-B"], self.registry.trading_pairs(first._key))
+        self.assertTrue(first.ready)
+
+    def test_order_book_classes(self):
+        live = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"])
+        paper = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"], order_book_class=CompositeOrderBook)
+        live.start()
+        paper.start()
+        self.assertEqual(2, len(CountingOrderBookTracker.started))
+        self.assertIs(type(live.order_books["A-B"]), OrderBook)
+        self.assertIs(type(paper.order_books["A-B"]), CompositeOrderBook)
+
+    def test_cached_order_books(self):
+        view = self.registry.shared_tracker(CountingOrderBookTracker, ["A-B"])
+        view.start()
+        order_books = view.order_books
+        self.assertIs(order_books, view.order_books)
+        other = self.registry.shared_tracker(CountingOrderBookTracker, ["C-D"])
+        other.start()
+        self.assertIsNot(order_books, view.order_books)
+        self.assertEqual(["A-B"], list(view.order_books.keys()))
+        self.assertIs(view.order_books, view.order_books)
+
+    def test_restart_keeps_order_books(self):
+        first = self.registry.shared_tracker(NullOrderBookTracker, ["A-B"])
+        first.start()
+        tracker = first.tracker
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 5))
+        order_book = first.order_books["A-B"]
+        self.assertTrue(first.ready)
+
+        # The tracker is replaced to follow the new trading pair, the order book in use stays ready.
+        second = self.registry.shared_tracker(NullOrderBookTracker, ["C-D"])
+        second.start()
+        self.assertIsNot(tracker, first.tracker)
+        self.assertFalse(second.ready)
+        self.assertTrue(first.ready)
+        self.assertIs(order_book, first.order_books["A-B"])
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(first.tracker._order_books_initialized.wait(), 5))
+        self.assertTrue(first.ready and second.ready)
+        self.assertIs(order_book, first.order_books["A-B"])
+        first.stop()
+        second.stop()
+
+    def test_dynamic_trading_pairs(self):
+        first = self.registry.shared_tracker(DynamicOrderBookTracker, ["A-B"])
+        second = self.registry.shared_tracker(DynamicOrderBookTracker, ["C-D"])
+        first.start()
+        tracker = first.tracker
+        second.start()
+        self.assertIs(tracker, second.tracker)
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 5))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(["+C-D"], tracker.data_source.subscriptions)
+        self.assertTrue(second.ready)
+        self.assertEqual(["C-D"], list(second.order_books.keys()))
+
+        first.stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(["+C-D", "-A-B"], tracker.data_source.subscriptions)
+        self.assertEqual(["C-D"], list(tracker.order_books.keys()))
+        second.stop()
+
+    def test_unsupported_tracker(self):
+        class ExtraArgumentOrderBookTracker(CountingOrderBookTracker):
+            def __init__(self, trading_pairs: List[str], rest_api_url: str):
+                super().__init__(trading_pairs)
+
+        with self.assertRaises(ValueError):
+            self.registry.shared_tracker(ExtraArgumentOrderBookTracker, ["A-B"])
+
+    def test_tracker_factory(self):
+        class ConfiguredOrderBookTracker(CountingOrderBookTracker):
+            def __init__(self, trading_pairs: List[str], rest_api_url: str = "https://default"):
+                super().__init__(trading_pairs)
+                self.rest_api_url = rest_api_url
+
+        def tracker_factory(trading_pairs: List[str]) -> ConfiguredOrderBookTracker:
+            return ConfiguredOrderBookTracker(trading_pairs, rest_api_url="https://configured")
+
+        first = self.registry.shared_tracker(ConfiguredOrderBookTracker, ["A-B"], tracker_factory=tracker_factory)
+        first.start()
+        self.assertEqual("https://configured", first.tracker.rest_api_url)
+        # The trackers following new trading pairs, and the users without a factory, keep the configuration.
+        second = self.registry.shared_tracker(ConfiguredOrderBookTracker, ["C-D"])
+        second.start()
+        self.assertEqual(["A-B", "C-D"], second.tracker._trading_pairs)
+        self.assertEqual("https://configured", second.tracker.rest_api_url)
+
+        class ExtraArgumentOrderBookTracker(CountingOrderBookTracker):
+            def __init__(self, trading_pairs: List[str], rest_api_url: str):
+                super().__init__(trading_pairs)
+
+        view = self.registry.shared_tracker(ExtraArgumentOrderBookTracker, ["A-B"],
+                                            tracker_factory=lambda trading_pairs: ExtraArgumentOrderBookTracker(
+                                                trading_pairs, "https://configured"))
+        view.start()
+        self.assertTrue(view.ready)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import pickle
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+
+class OrderBookTradeEventUnitTest(unittest.TestCase):
+    def test_fields(self):
+        event: OrderBookTradeEvent = OrderBookTradeEvent(trading_pair="ETH-USDT", timestamp=1.0, type=TradeType.SELL,
+                                                         price=0.1, amount=Decimal("2.5"))
+        # Listeners read the float price and amount, as the order book trackers emit them.
+        self.assertIsInstance(event.price, float)
+        self.assertEqual(0.1, event.price)
+        self.assertEqual(Decimal("0.1"), event.decimal_price)
+        self.assertIsInstance(event.amount, float)
+        self.assertEqual(2.5, event.amount)
+        self.assertEqual(Decimal("2.5"), event.decimal_amount)
+        self.assertEqual(("ETH-USDT", 1.0, TradeType.SELL, 0.1, 2.5), tuple(event))
+        self.assertEqual({"trading_pair": "ETH-USDT", "timestamp": 1.0, "type": TradeType.SELL,
+                          "price": 0.1, "amount": 2.5}, event._asdict())
+
+        replaced: OrderBookTradeEvent = event._replace(price=0.2)
+        self.assertEqual(0.2, replaced.price)
+        self.assertEqual(Decimal("0.2"), replaced.decimal_price)
+        self.assertNotEqual(event, replaced)
+        self.assertEqual(event, OrderBookTradeEvent("ETH-USDT", 1.0, TradeType.SELL, 0.1, 2.5))
+        self.assertEqual(event, pickle.loads(pickle.dumps(event)))
+
+    def test_apply_trade(self):
+        order_book: OrderBook = OrderBook()
+        event_logger: EventLogger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, event_logger)
+        event: OrderBookTradeEvent = OrderBookTradeEvent("ETH-USDT", 1.0, TradeType.BUY, 101.5, 1.0)
+        order_book.apply_trade(event)
+        self.assertEqual(101.5, order_book.last_trade_price)
+        self.assertEqual([event], event_logger.event_log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import math
+import numpy as np
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_worker import (
+    SharedOrderBookSnapshots,
+    WorkerOrderBookTracker,
+)
+
+
+class FixedOrderBookTracker(OrderBookTracker):
+    """
+    Keeps order books with 3 levels per side around a mid price of 100, moving up one level every 10ms.
+    """
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(None, trading_pairs)
+        self._move_task = None
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = OrderBook()
+        self._order_books_initialized.set()
+        self._move_task = asyncio.ensure_future(self._move_loop())
+
+    def stop(self):
+        if self._move_task is not None:
+            self._move_task.cancel()
+
+    async def _move_loop(self):
+        mid_price: float = 100
+        update_id: int = 1
+        while True:
+            for order_book in self._order_books.values():
+                order_book.apply_numpy_snapshot(
+                    np.array([[mid_price - 1, 1, update_id], [mid_price - 2, 2, update_id],
+                              [mid_price - 3, 3, update_id]], dtype=np.float64),
+                    np.array([[mid_price + 1, 1, update_id], [mid_price + 2, 2, update_id],
+                              [mid_price + 3, 3, update_id]], dtype=np.float64))
+                order_book.last_trade_price = mid_price
+            mid_price += 1
+            update_id += 1
+            await asyncio.sleep(0.01)
+
+
+class OrderBookWorkerUnitTest(unittest.TestCase):
+    def test_snapshots(self):
+        snapshots: SharedOrderBookSnapshots = SharedOrderBookSnapshots(2, 2)
+        try:
+            self.assertIsNone(snapshots.read(0, 0))
+            order_book: OrderBook = OrderBook()
+            order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+                                            np.array([[101, 1, 1]], dtype=np.float64))
+            snapshots.write(1, order_book)
+
+            reader: SharedOrderBookSnapshots = SharedOrderBookSnapshots(2, 2, name=snapshots.name)
+            version, bids, asks, last_trade_price = reader.read(1, 0)
+            self.assertEqual(order_book.version, version)
+            # Only the top 2 levels are kept.
+            self.assertEqual([[99, 1, version], [98, 2, version]], bids.tolist())
+            self.assertEqual([[101, 1, version]], asks.tolist())
+            self.assertTrue(math.isnan(last_trade_price))
+            self.assertIsNone(reader.read(1, version))
+            self.assertIsNone(reader.read(0, 0))
+            reader.close()
+        finally:
+            snapshots.close()
+            snapshots.unlink()
+
+    def test_worker_tracker(self):
+        self.assertIsNone(WorkerOrderBookTracker.from_tracker(OrderBookTracker(None, ["ETH-USDT"])))
+        tracker: WorkerOrderBookTracker = WorkerOrderBookTracker.from_tracker(
+            FixedOrderBookTracker(["ETH-USDT", "BTC-USDT"]))
+        self.assertEqual("fixed", tracker.exchange_name)
+
+        async def wait_for_order_books():
+            tracker.start()
+            try:
+                while not tracker.ready:
+                    await asyncio.sleep(0.01)
+                first_price: float = tracker.order_books["BTC-USDT"].get_price(True)
+                while tracker.order_books["BTC-USDT"].get_price(True) == first_price:
+                    await asyncio.sleep(0.01)
+            finally:
+                tracker.stop()
+
+        asyncio.get_event_loop().run_until_complete(asyncio.wait_for(wait_for_order_books(), 30))
+        order_book: OrderBook = tracker.order_books["BTC-USDT"]
+        best_bid: float = order_book.get_price(False)
+        self.assertEqual(best_bid + 2, order_book.get_price(True))
+        self.assertEqual(best_bid + 1, order_book.last_trade_price)
+        self.assertEqual(3, len(list(order_book.bid_entries())))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+from typing import (
+    Dict,
+    Optional,
+)
+import unittest
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_latency import (
+    DECISION,
+    FILL,
+    HEDGE_SUBMIT,
+    order_latency_stats,
+    OrderLatencyStats,
+    REST_RESPONSE,
+    REST_SEND,
+    SUBMIT,
+)
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderType,
+    TradeType,
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.strategy.dev_2_perform_trade.dev_2_perform_trade import PerformTradeStrategy
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class AsyncOrderExchange(ExchangeBase):
+    """
+    Places its orders in a coroutine, and only starts tracking them there, like most connectors.
+    """
+    def __init__(self):
+        super().__init__()
+        self._in_flight_orders: Dict[str, InFlightOrderBase] = {}
+        self.create_order_task: Optional[asyncio.Task] = None
+
+    @property
+    def name(self) -> str:
+        return "async_exchange"
+
+    @property
+    def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
+        return self._in_flight_orders
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type: OrderType = OrderType.MARKET,
+            price: Decimal = Decimal("NaN"), **kwargs) -> str:
+        order_id: str = f"buy-{trading_pair}-{len(self._in_flight_orders)}"
+        self.create_order_task = safe_ensure_future(self.create_order(order_id, trading_pair, amount, order_type,
+                                                                      price))
+        return order_id
+
+    async def create_order(self, order_id: str, trading_pair: str, amount: Decimal, order_type: OrderType,
+                           price: Decimal):
+        self._in_flight_orders[order_id] = InFlightOrderBase(order_id, None, trading_pair, order_type, TradeType.BUY,
+                                                             price, amount, "OPEN")
+        await asyncio.sleep(0.01)
+        self.trigger_event(MarketEvent.BuyOrderCreated,
+                           BuyOrderCreatedEvent(self.current_timestamp, order_type, trading_pair, amount, price,
+                                                order_id))
+
+
+class OrderLatencyStatsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.stats: OrderLatencyStats = OrderLatencyStats(max_samples=3, max_pending_orders=3)
+
+    def new_order(self, order_id: str, order_type: OrderType = OrderType.LIMIT) -> InFlightOrderBase:
+        return InFlightOrderBase(order_id, None, "ETH-USDT", order_type, TradeType.BUY, Decimal(100), Decimal(1),
+                                 "OPEN")
+
+    def intervals(self):
+        df = self.stats.samples_data_frame()
+        return {(row.exchange, row.order_type, row.interval): row.latency_ms for row in df.itertuples()}
+
+    def test_spans(self):
+        order: InFlightOrderBase = self.new_order("order-1")
+        self.stats.record_span("binance", order, DECISION, 10.0)
+        self.stats.record_span("binance", order, SUBMIT, 10.001)
+        self.stats.record_span("binance", order, REST_SEND, 10.002)
+        self.stats.record_span("binance", order, REST_RESPONSE, 10.052)
+        # Later records of the same span are ignored.
+        self.stats.record_span("binance", order, REST_RESPONSE, 11.0)
+        self.assertEqual(10.052, order.latency_spans[REST_RESPONSE])
+
+        intervals = self.intervals()
+        self.assertAlmostEqual(1, intervals[("binance", "LIMIT", "decision->submit")])
+        self.assertAlmostEqual(1, intervals[("binance", "LIMIT", "submit->rest_send")])
+        self.assertAlmostEqual(50, intervals[("binance", "LIMIT", "rest_send->rest_response")])
+        self.assertAlmostEqual(52, intervals[("binance", "LIMIT", "decision->rest_response")])
+        self.assertNotIn(("binance", "LIMIT", "decision->decision"), intervals)
+        self.assertEqual(5, len(intervals))
+
+    def test_missing_spans(self):
+        # Without the REST spans, the fill follows the submit, and the hedge follows the fill.
+        order: InFlightOrderBase = self.new_order("order-1", OrderType.LIMIT_MAKER)
+        self.stats.record_span("kucoin", order, SUBMIT, 1.0)
+        self.stats.record_span("kucoin", order, FILL, 3.0)
+        self.stats.record_span("kucoin", order, HEDGE_SUBMIT, 3.002)
+        intervals = self.intervals()
+        self.assertEqual({("kucoin", "LIMIT_MAKER", "submit->fill"), ("kucoin", "LIMIT_MAKER", "fill->hedge_submit")},
+                         set(intervals.keys()))
+        self.assertAlmostEqual(2, intervals[("kucoin", "LIMIT_MAKER", "fill->hedge_submit")])
+
+    def test_summary(self):
+        for i, latency in enumerate([0.01, 0.02, 0.03, 0.04]):
+            order: InFlightOrderBase = self.new_order(f"order-{i}", OrderType.MARKET)
+            self.stats.record_span("binance", order, REST_SEND, 0)
+            self.stats.record_span("binance", order, REST_RESPONSE, latency)
+
+        # Only the latest max_samples latencies are kept.
+        summary = self.stats.summary_data_frame()
+        self.assertEqual(1, len(summary))
+        row = summary.iloc[0]
+        self.assertEqual(("binance", "MARKET", "rest_send->rest_response", 3),
+                         (row.exchange, row.order_type, row.interval, row["count"]))
+        self.assertAlmostEqual(30, row.p50_ms)
+        self.assertAlmostEqual(40, row.max_ms)
+
+        self.stats.reset()
+        self.assertEqual(0, len(self.stats.summary_data_frame()))
+
+    def test_pending_spans(self):
+        self.stats.record_pending_span("order-1", DECISION, 1.0)
+        self.stats.record_pending_span("order-1", SUBMIT, 1.001)
+        # The connector starts tracking the order, and records its next span.
+        order: InFlightOrderBase = self.new_order("order-1")
+        self.stats.record_span("binance", order, REST_SEND, 1.002)
+        self.assertEqual(0, self.stats.pending_order_count)
+        self.assertEqual({DECISION: 1.0, SUBMIT: 1.001, REST_SEND: 1.002}, order.latency_spans)
+        intervals = self.intervals()
+        self.assertAlmostEqual(1, intervals[("binance", "LIMIT", "submit->rest_send")])
+        self.assertAlmostEqual(2, intervals[("binance", "LIMIT", "decision->rest_send")])
+
+        # Spans of orders which are never tracked are dropped, oldest orders first.
+        for i in range(5):
+            self.stats.record_pending_span(f"untracked-{i}", DECISION)
+        self.assertEqual(self.stats.max_pending_orders, self.stats.pending_order_count)
+        self.stats.reset()
+        self.assertEqual(0, self.stats.pending_order_count)
+
+
+class StrategyOrderLatencyUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        order_latency_stats().reset()
+        self.market: AsyncOrderExchange = AsyncOrderExchange()
+        self.market_info: MarketTradingPairTuple = MarketTradingPairTuple(self.market, "ETH-USDT", "ETH", "USDT")
+        self.strategy: PerformTradeStrategy = PerformTradeStrategy([self.market_info])
+
+    def tearDown(self):
+        tasks = asyncio.all_tasks(self.ev_loop)
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def test_async_connector_spans(self):
+        order_id: str = self.strategy.buy_with_specific_market(self.market_info, Decimal(1), OrderType.LIMIT,
+                                                               Decimal(100))
+        # The connector doesn't track the order yet.
+        self.assertNotIn(order_id, self.market.in_flight_orders)
+        self.ev_loop.run_until_complete(self.market.create_order_task)
+
+        order: InFlightOrderBase = self.market.in_flight_orders[order_id]
+        self.assertEqual([DECISION, SUBMIT, REST_RESPONSE], list(order.latency_spans.keys()))
+        df = order_latency_stats().samples_data_frame()
+        self.assertEqual({"decision->submit", "submit->rest_response", "decision->rest_response"},
+                         set(df[df.exchange == "async_exchange"].interval))
+
+
+if __name__ == "__main__":
+    unittest.main()
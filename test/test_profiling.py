@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderCancelledEvent,
+)
+from hummingbot.core.profiling import (
+    disable_profiling,
+    enable_profiling,
+    profiler,
+)
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class ProfilingUnitTest(unittest.TestCase):
+    def tearDown(self):
+        disable_profiling()
+
+    def run_clock(self, iterator: TimeIterator, ticks: int):
+        clock: Clock = Clock(ClockMode.BACKTEST, 1.0, 0, ticks)
+        clock.add_iterator(iterator)
+        clock.backtest()
+
+    def trigger_events(self, pub_sub: PubSub, count: int):
+        for _ in range(count):
+            pub_sub.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(0, "order"))
+
+    def test_disabled(self):
+        self.assertIsNone(profiler())
+        self.run_clock(TimeIterator(), 10)
+
+    def test_clock_ticks(self):
+        enable_profiling()
+        iterator: TimeIterator = TimeIterator()
+        self.run_clock(iterator, 10)
+        histograms = profiler().tick_histograms
+        self.assertEqual(1, len(histograms))
+        self.assertEqual("TimeIterator", histograms[0].name)
+        self.assertEqual(10, histograms[0].count)
+        self.assertEqual(10, sum(histograms[0].buckets))
+        self.assertLessEqual(histograms[0].percentile_ns(50), histograms[0].max_ns)
+
+    def test_event_dispatch(self):
+        pub_sub: PubSub = PubSub()
+        loggers = [EventLogger(), EventLogger()]
+        for event_logger in loggers:
+            pub_sub.add_listener(MarketEvent.OrderCancelled, event_logger)
+
+        self.trigger_events(pub_sub, 3)
+        enable_profiling()
+        self.trigger_events(pub_sub, 5)
+        histogram = profiler().event_histograms[0]
+        self.assertEqual("MarketEvent.OrderCancelled", histogram.name)
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(2, histogram.to_dict()["listeners"])
+
+        profiler().reset()
+        self.assertEqual(0, len(profiler().event_histograms))
+        disable_profiling()
+        self.trigger_events(pub_sub, 5)
+        self.assertIsNone(profiler())
+        self.assertEqual(13, len(loggers[0].event_log))
+
+
+if __name__ == "__main__":
+    unittest.main()
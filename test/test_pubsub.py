@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import gc
+import unittest
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.core.pubsub import PubSub
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.pubsub: PubSub = PubSub()
+        self.trade_event: OrderBookTradeEvent = OrderBookTradeEvent("ETH-USDT", 1.0, TradeType.BUY, 100.0, 1.0)
+
+    def test_has_listeners(self):
+        self.assertFalse(self.pubsub.has_listeners(OrderBookEvent.TradeEvent))
+        event_logger: EventLogger = EventLogger()
+        self.pubsub.add_listener(OrderBookEvent.TradeEvent, event_logger)
+        self.assertTrue(self.pubsub.has_listeners(OrderBookEvent.TradeEvent))
+        self.assertFalse(self.pubsub.has_listeners(OrderBookEvent.UpdateEvent))
+        self.pubsub.remove_listener(OrderBookEvent.TradeEvent, event_logger)
+        self.assertFalse(self.pubsub.has_listeners(OrderBookEvent.TradeEvent))
+
+    def test_dead_listeners(self):
+        live_logger: EventLogger = EventLogger()
+        dead_logger: EventLogger = EventLogger()
+        self.pubsub.add_listener(OrderBookEvent.TradeEvent, live_logger)
+        self.pubsub.add_listener(OrderBookEvent.TradeEvent, dead_logger)
+        del dead_logger
+        gc.collect()
+
+        # Dead listeners are counted until an event meets them, and are skipped and removed then.
+        self.assertTrue(self.pubsub.has_listeners(OrderBookEvent.TradeEvent))
+        self.pubsub.trigger_event(OrderBookEvent.TradeEvent, self.trade_event)
+        self.assertEqual([self.trade_event], live_logger.event_log)
+        self.assertEqual([live_logger], self.pubsub.get_listeners(OrderBookEvent.TradeEvent))
+
+        del live_logger
+        gc.collect()
+        self.pubsub.trigger_event(OrderBookEvent.TradeEvent, self.trade_event)
+        self.assertFalse(self.pubsub.has_listeners(OrderBookEvent.TradeEvent))
+
+
+if __name__ == "__main__":
+    unittest.main()
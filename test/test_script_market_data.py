@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import unittest
+from decimal import Decimal
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import (
+    balance_updates,
+    OnTick,
+    parameter_updates,
+    PMM_PARAMETER_NAMES,
+    PMMParameters,
+)
+from hummingbot.script.script_market_data import (
+    ScriptMarketData,
+    SharedTradeRing,
+)
+
+
+class ScriptMarketDataTest(unittest.TestCase):
+    def setUp(self):
+        self.market_data = ScriptMarketData(depth=2, trades_capacity=3)
+        self.reader = ScriptMarketData(depth=2, trades_capacity=3, names=self.market_data.names)
+
+    def tearDown(self):
+        self.reader.close()
+        self.market_data.close()
+        self.market_data.unlink()
+
+    def test_order_book(self):
+        self.assertIsNone(self.reader.read_order_book())
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 1], [98.0, 2.0, 1], [97.0, 3.0, 1]]),
+                                        np.array([[101.0, 4.0, 1]]))
+        self.market_data.write_order_book(order_book)
+        bids, asks = self.reader.read_order_book()
+        self.assertEqual([[99.0, 1.0], [98.0, 2.0]], bids.tolist())
+        self.assertEqual([[101.0, 4.0]], asks.tolist())
+        # Unchanged order books aren't published again.
+        self.market_data.write_order_book(order_book)
+        self.assertIsNone(self.reader.read_order_book())
+
+    def test_trades_wrap_around(self):
+        for i in range(2):
+            self.market_data.write_trade(OrderBookTradeEvent("A-B", float(i), TradeType.BUY, 100.0 + i, 1.0))
+        self.assertEqual([(0.0, 100.0, 1.0, TradeType.BUY), (1.0, 101.0, 1.0, TradeType.BUY)],
+                         [tuple(trade) for trade in self.reader.read_trades()])
+        self.assertEqual([], self.reader.read_trades())
+        for i in range(2, 7):
+            self.market_data.write_trade(OrderBookTradeEvent("A-B", float(i), TradeType.SELL, 100.0 + i, 2.0))
+        # Only the latest trades fit in the buffer.
+        trades = self.reader.read_trades()
+        self.assertEqual([4.0, 5.0, 6.0], [trade.timestamp for trade in trades])
+        self.assertEqual([104.0, 105.0, 106.0], [trade.price for trade in trades])
+        self.assertTrue(all(trade.trade_type == TradeType.SELL for trade in trades))
+
+    def test_trade_ring_read_during_write(self):
+        ring = SharedTradeRing(2)
+        try:
+            ring.write(1.0, 100.0, 1.0, TradeType.BUY)
+            ring._header[0] += 1
+            self.assertEqual((1, 0), (ring.read(1)[0], len(ring.read(1)[1])))
+            self.assertEqual(0, ring.read(0)[0])
+        finally:
+            ring.close()
+            ring.unlink()
+
+
+class ScriptUpdatesTest(unittest.TestCase):
+    class Strategy:
+        def __init__(self):
+            for name in PMM_PARAMETER_NAMES:
+                setattr(self, name, None)
+            self.bid_spread = Decimal("0.01")
+            self.buy_levels = 1
+
+    def test_parameter_updates(self):
+        strategy = self.Strategy()
+        last_values = {}
+        updates = parameter_updates(strategy, last_values)
+        self.assertEqual(set(PMM_PARAMETER_NAMES), set(updates.keys()))
+        self.assertEqual({}, parameter_updates(strategy, last_values))
+        strategy.bid_spread = Decimal("0.02")
+        self.assertEqual({"bid_spread": Decimal("0.02")}, parameter_updates(strategy, last_values))
+
+    def test_balance_updates(self):
+        last_balances = {}
+        balances = {"binance": {"BTC": Decimal("1"), "ETH": Decimal("2")}}
+        self.assertEqual(balances, balance_updates(balances, last_balances))
+        self.assertEqual({}, balance_updates(balances, last_balances))
+        balances = {"binance": {"BTC": Decimal("1.5")}}
+        self.assertEqual({"binance": {"BTC": Decimal("1.5"), "ETH": Decimal(0)}},
+                         balance_updates(balances, last_balances))
+
+    def test_apply_tick(self):
+        script = ScriptBase()
+        script.apply_tick(OnTick(Decimal("100"), {"bid_spread": Decimal("0.01"), "buy_levels": 1},
+                                 {"binance": {"BTC": Decimal("1"), "ETH": Decimal("2")}}))
+        script.apply_tick(OnTick(Decimal("101"), {"buy_levels": 2},
+                                 {"binance": {"ETH": Decimal(0)}}))
+        self.assertEqual([Decimal("100"), Decimal("101")], script.mid_prices)
+        self.assertIsInstance(script.pmm_parameters, PMMParameters)
+        self.assertEqual(Decimal("0.01"), script.pmm_parameters.bid_spread)
+        self.assertEqual(2, script.pmm_parameters.buy_levels)
+        self.assertEqual({"binance": {"BTC": Decimal("1")}}, script.all_total_balances)
+
+
+if __name__ == "__main__":
+    unittest.main()
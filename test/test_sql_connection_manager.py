@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import tempfile
+import unittest
+
+from sqlalchemy import inspect
+
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import (
+    SQLConnectionManager,
+    SQLConnectionType,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+
+class SQLConnectionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = join(self.db_dir.name, "trades.sqlite")
+
+    def tearDown(self):
+        self.db_dir.cleanup()
+
+    def open(self) -> SQLConnectionManager:
+        sql = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.addCleanup(sql.engine.dispose)
+        self.addCleanup(sql.get_shared_session().close)
+        return sql
+
+    def test_sqlite_pragmas(self):
+        sql = self.open()
+        with sql.engine.connect() as conn:
+            self.assertEqual("wal", conn.execute("PRAGMA journal_mode").scalar())
+            self.assertEqual(1, conn.execute("PRAGMA synchronous").scalar())
+
+    def test_create_missing_indexes(self):
+        sql = self.open()
+        with sql.engine.begin() as conn:
+            conn.execute("DROP INDEX tf_timestamp_index")
+        session = sql.get_shared_session()
+        session.query(Metadata).filter(Metadata.key == sql.LOCAL_DB_VERSION_KEY).one().value = "20190614"
+        session.commit()
+
+        sql = self.open()
+        self.assertIn("tf_timestamp_index", [index["name"] for index in inspect(sql.engine).get_indexes("TradeFill")])
+        self.assertEqual(sql.LOCAL_DB_VERSION_VALUE,
+                         sql.get_shared_session().query(Metadata)
+                         .filter(Metadata.key == sql.LOCAL_DB_VERSION_KEY).one().value)
+
+    def test_bulk_insert(self):
+        sql = self.open()
+        rows = [{"config_file_path": "config.yml", "strategy": "strategy", "market": "binance", "symbol": "ETH-USDT",
+                 "base_asset": "ETH", "quote_asset": "USDT", "timestamp": i, "order_id": str(i // 10),
+                 "trade_type": "BUY", "order_type": "LIMIT", "price": 100.0, "amount": 1.0,
+                 "trade_fee": {"percent": 0.001, "flat_fees": []}, "exchange_trade_id": str(i)}
+                for i in range(1000)]
+        sql.BULK_INSERT_BATCH_SIZE = 300
+        sql.bulk_insert(TradeFill.__table__, rows)
+        sql.commit()
+        session = sql.get_shared_session()
+        self.assertEqual(1000, session.query(TradeFill).count())
+        self.assertEqual({"percent": 0.001, "flat_fees": []},
+                         session.query(TradeFill).filter(TradeFill.exchange_trade_id == "999").one().trade_fee)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import os
+import tempfile
+from typing import List
+import unittest
+
+import pandas as pd
+
+from hummingbot.core.event.events import TradeFee
+from hummingbot.model import get_declarative_base
+from hummingbot.model.trade_archive import (
+    TradeArchive,
+    trade_fills_data_frame,
+    trades_display_data_frame,
+)
+from hummingbot.model.trade_fill import TradeFill
+
+DAY = 24 * 60 * 60 * 1000
+START_TIMESTAMP = 1600000000000
+
+
+def create_trade_fill(index: int, timestamp: int, market: str = "binance", config_file_path: str = "conf_1.yml",
+                      order_id: str = None) -> TradeFill:
+    return TradeFill(config_file_path=config_file_path,
+                     strategy="pure_market_making",
+                     market=market,
+                     symbol="ETH-USDT",
+                     base_asset="ETH",
+                     quote_asset="USDT",
+                     timestamp=timestamp,
+                     order_id=order_id or f"buy-ETH-USDT-{timestamp * 1000 - 5000000}",
+                     trade_type="BUY",
+                     order_type="LIMIT",
+                     price=100.0 + index,
+                     amount=1.5,
+                     trade_fee=TradeFee.to_json(TradeFee(0.001, [("USDT", 0.1), ("BNB", 0.01)])),
+                     exchange_trade_id=str(index))
+
+
+class TradeArchiveUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Maps the models the TradeFill relationships refer to.
+        get_declarative_base()
+
+    def setUp(self):
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.archive = TradeArchive(self.archive_dir.name)
+
+    def tearDown(self):
+        self.archive_dir.cleanup()
+
+    def append_trades(self) -> List[TradeFill]:
+        trades: List[TradeFill] = [
+            create_trade_fill(0, START_TIMESTAMP),
+            create_trade_fill(1, START_TIMESTAMP + 1000, market="kucoin", config_file_path="conf_2.yml"),
+            create_trade_fill(2, START_TIMESTAMP + DAY),
+            create_trade_fill(3, START_TIMESTAMP + DAY + 1000, order_id="buy-ETH-USDT//paper"),
+        ]
+        for trade in trades:
+            self.archive.append(trade)
+        return trades
+
+    def test_partitions(self):
+        self.append_trades()
+        self.assertEqual([], os.listdir(self.archive_dir.name))
+        self.assertEqual(["0", "1", "2", "3"], list(self.archive.trades()["exchange_trade_id"]))
+        self.archive.flush()
+        self.assertEqual(["2020-09-13", "2020-09-14"], sorted(os.listdir(self.archive_dir.name)))
+        self.assertEqual(["binance", "kucoin"], sorted(os.listdir(join(self.archive_dir.name, "2020-09-13"))))
+
+        trades: pd.DataFrame = self.archive.trades()
+        self.assertEqual(list(range(4)), [int(i) for i in trades["exchange_trade_id"]])
+        self.assertEqual([100.0, 101.0, 102.0, 103.0], list(trades["price"]))
+        self.assertEqual(0.1, trades["quote_flat_fees"][0])
+        self.assertEqual(0.001, trades["fee_percent"][0])
+
+    def test_filters(self):
+        self.append_trades()
+        self.archive.flush()
+        self.archive.append(create_trade_fill(4, START_TIMESTAMP + DAY + 2000))
+        self.assertEqual(["2", "3", "4"], list(self.archive.trades(START_TIMESTAMP + DAY)["exchange_trade_id"]))
+        self.assertEqual(["0", "1"], list(self.archive.trades(end_timestamp=START_TIMESTAMP + 1000)["exchange_trade_id"]))
+        self.assertEqual(["1"], list(self.archive.trades(config_file_path="conf_2")["exchange_trade_id"]))
+        self.assertEqual(["3", "4"], list(self.archive.trades(number_of_rows=2)["exchange_trade_id"]))
+        self.assertEqual(["1", "2", "3", "4"], list(self.archive.trades(number_of_rows=4)["exchange_trade_id"]))
+        self.assertEqual(0, len(self.archive.trades(START_TIMESTAMP + 2 * DAY)))
+
+    def test_chunk_size(self):
+        self.archive.CHUNK_SIZE = 2
+        self.append_trades()
+        self.assertEqual(["2020-09-13", "2020-09-14"], sorted(os.listdir(self.archive_dir.name)))
+        self.assertEqual(4, len(self.archive.trades()))
+
+    def test_display_data_frame(self):
+        trades: List[TradeFill] = self.append_trades()
+        self.archive.flush()
+        expected: pd.DataFrame = TradeFill.to_pandas(trades)
+        df: pd.DataFrame = trades_display_data_frame(self.archive.trades())
+        self.assert_data_frame_equal(expected, df)
+        self.assertEqual(["00:00:05", "00:00:05", "00:00:05", "n/a"], list(df["Age"]))
+        self.assert_data_frame_equal(expected, trades_display_data_frame(trade_fills_data_frame(trades)))
+
+        file_path: str = join(self.archive_dir.name, "trades.csv")
+        self.assertEqual(4, self.archive.export_csv(file_path, START_TIMESTAMP))
+        self.assert_data_frame_equal(expected, pd.read_csv(file_path, index_col="Index", keep_default_na=False))
+
+    @staticmethod
+    def assert_data_frame_equal(expected: pd.DataFrame, df: pd.DataFrame):
+        pd.testing.assert_frame_equal(expected, df, check_dtype=False, check_index_type=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,11 @@ import time
 from decimal import Decimal
 from typing import List, Dict
 import unittest
-from hummingbot.client.performance_analysis import calculate_asset_delta_from_trades, calculate_trade_performance
+from hummingbot.client.performance_analysis import (
+    calculate_asset_delta_from_trades,
+    calculate_asset_delta_from_trades_data_frame,
+    calculate_trade_performance,
+)
 from hummingbot.core.event.events import TradeFee, OrderType
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
@@ -11,6 +15,7 @@ from hummingbot.core.utils.async_utils import (
 )
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_archive import trade_fills_data_frame
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 
@@ -191,6 +196,41 @@ class TestTradePerformanceAnalysis(unittest.TestCase):
         }
         self.assertDictEqual(expected_stats, market_trading_pair_stats[self.trading_pair_tuple_1])
 
+    def test_calculate_asset_delta_from_trades_data_frame(self):
+        test_trades = [
+            ("BUY", 1, 100),
+            ("SELL", 0.9, 110),
+            ("BUY", 0.1, 100),
+            ("SELL", 1, 120)
+        ]
+        start_time = int(time.time() * 1e3) - 100000
+        self.save_trade_fill_records(test_trades,
+                                     self.trading_pair_tuple_1,
+                                     OrderType.MARKET.name,
+                                     start_time,
+                                     self.strategy_1
+                                     )
+        self.save_trade_fill_records([("BUY", 1, 100)],
+                                     self.trading_pair_tuple_1,
+                                     OrderType.MARKET.name,
+                                     start_time,
+                                     "strategy_2"
+                                     )
+        trades = trade_fills_data_frame(self.get_trades_from_session(start_time))
+        market_trading_pair_stats = calculate_asset_delta_from_trades_data_frame(
+            self.strategy_1, [self.trading_pair_tuple_1, self.trading_pair_tuple_2], trades
+        )
+
+        stats = market_trading_pair_stats[self.trading_pair_tuple_1]
+        self.assertEqual(Decimal("1.0"), stats["starting_quote_rate"])
+        self.assertEqual(4, stats["trade_count"])
+        expected_assets = {'WETH': {'spent': Decimal('230.0'), 'acquired': Decimal('198.000')},
+                           'DAI': {'spent': Decimal('110.00'), 'acquired': Decimal('216.8100')}}
+        for asset, expected_stats in expected_assets.items():
+            for key, expected_amount in expected_stats.items():
+                self.assertAlmostEqual(expected_amount, stats["asset"][asset][key], places=8)
+        self.assertEqual(0, market_trading_pair_stats[self.trading_pair_tuple_2]["trade_count"])
+
     def test_calculate_trade_performance(self):
         test_trades = [
             ("BUY", 100, 2),
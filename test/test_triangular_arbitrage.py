@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import List
+import unittest
+
+import pandas as pd
+
+from hummingbot.connector.exchange.paper_trade.market_config import MarketConfig
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.triangular_arbitrage.triangular_arbitrage import TriangularArbitrageStrategy
+from test.test_composite_order_book import (
+    PaperTradeOrderBookTracker,
+    PaperTradeTargetMarket,
+)
+
+
+class StaticOrderBookTracker(PaperTradeOrderBookTracker):
+    def start(self):
+        # The paper trade market starts the tracker again once connected, the order books are kept.
+        order_books = dict(self._order_books)
+        super().start()
+        self._order_books.update(order_books)
+
+
+class TriangularArbitrageUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pairs: List[str] = ["ETH-USDT", "ETH-BTC", "BTC-USDT"]
+    # The paper trade markets estimate the binance taker fee.
+    fee: float = 0.001
+
+    def setUp(self):
+        self.ev_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        order_book_tracker: StaticOrderBookTracker = StaticOrderBookTracker(self.trading_pairs)
+        order_book_tracker.start()
+        self.market: PaperTradeExchange = PaperTradeExchange(order_book_tracker,
+                                                             MarketConfig.default_config(),
+                                                             PaperTradeTargetMarket)
+        self.assertTrue(self.market.ready)
+        # ETH-BTC is priced above ETH-USDT / BTC-USDT: buy ETH with USDT, sell ETH for BTC, sell BTC for USDT.
+        self.set_order_book("ETH-USDT", [OrderBookRow(399, 10, 1)], [OrderBookRow(400, 1, 1), OrderBookRow(401, 10, 1)])
+        self.set_order_book("ETH-BTC", [OrderBookRow(0.042, 10, 1)], [OrderBookRow(0.0422, 10, 1)])
+        self.set_order_book("BTC-USDT", [OrderBookRow(10000, 10, 1)], [OrderBookRow(10010, 10, 1)])
+        self.market.set_balance("USDT", Decimal(10000))
+        self.market.set_balance("ETH", Decimal(5))
+        self.market.set_balance("BTC", Decimal(1))
+        self.market_infos: List[MarketTradingPairTuple] = [
+            MarketTradingPairTuple(self.market, trading_pair, *trading_pair.split("-"))
+            for trading_pair in self.trading_pairs
+        ]
+        self.strategy: TriangularArbitrageStrategy = TriangularArbitrageStrategy(
+            self.market_infos,
+            min_profitability=Decimal("0.01"),
+            logging_options=TriangularArbitrageStrategy.OPTION_LOG_ALL
+        )
+        self.clock.add_iterator(self.market)
+        self.clock.add_iterator(self.strategy)
+
+        self.order_fill_logger: EventLogger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.order_fill_logger)
+
+        # The strategy doesn't trade until the market is connected.
+        self.clock.backtest_til(self.start_timestamp)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual({}, self.taker_orders())
+
+    def tearDown(self):
+        tasks = asyncio.all_tasks(self.ev_loop)
+        for task in tasks:
+            task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+    def set_order_book(self, trading_pair: str, bids: List[OrderBookRow], asks: List[OrderBookRow]):
+        self.market.get_order_book(trading_pair).source_order_book.apply_snapshot(bids, asks, 1)
+
+    def taker_orders(self):
+        return {order.trading_pair: order
+                for _, order in self.strategy.tracked_limit_orders + self.strategy.tracked_market_orders}
+
+    def test_cycle_profitability(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(self.trading_pairs, [market_info.trading_pair for market_info in self.strategy.last_cycle])
+        # 1 / 400 ETH per USDT, 0.042 BTC per ETH and 10000 USDT per BTC, minus the fee of each leg.
+        self.assertAlmostEqual(1 / 400 * 0.042 * 10000 * (1 - self.fee) ** 3, self.strategy.last_cycle_profitability)
+
+    def test_not_profitable(self):
+        self.set_order_book("ETH-BTC", [OrderBookRow(0.0399, 10, 1)], [OrderBookRow(0.0401, 10, 1)])
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual({}, self.taker_orders())
+        self.assertEqual([], self.strategy.last_cycle)
+
+    def test_order_sizing(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        orders = self.taker_orders()
+        self.assertEqual(set(self.trading_pairs), set(orders.keys()))
+        # The cycle is bound by the volume of the best ETH-USDT ask: 400 USDT for 1 ETH.
+        self.assertTrue(orders["ETH-USDT"].is_buy)
+        self.assertEqual(Decimal(1), orders["ETH-USDT"].amount)
+        self.assertFalse(orders["ETH-BTC"].is_buy)
+        self.assertAlmostEqual(1 - self.fee, float(orders["ETH-BTC"].amount))
+        self.assertFalse(orders["BTC-USDT"].is_buy)
+        self.assertAlmostEqual((1 - self.fee) * 0.042 * (1 - self.fee), float(orders["BTC-USDT"].amount), places=6)
+
+    def test_order_sizing_by_balance(self):
+        # Only 0.5 ETH can be sold for BTC, which is what 200.2 USDT buy.
+        self.market.set_balance("ETH", Decimal("0.5"))
+        self.clock.backtest_til(self.start_timestamp + 1)
+        orders = self.taker_orders()
+        self.assertAlmostEqual(0.5 / (1 - self.fee), float(orders["ETH-USDT"].amount), places=6)
+        self.assertAlmostEqual(0.5, float(orders["ETH-BTC"].amount), places=6)
+        self.assertAlmostEqual(0.5 * 0.042 * (1 - self.fee), float(orders["BTC-USDT"].amount), places=6)
+
+    def test_cycle_execution(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.clock.backtest_til(self.start_timestamp + PaperTradeExchange.TRADE_EXECUTION_DELAY + 2)
+        fills = {fill.trading_pair: fill for fill in self.order_fill_logger.event_log}
+        self.assertEqual(set(self.trading_pairs), set(fills.keys()))
+        self.assertEqual({}, self.taker_orders())
+        self.assertEqual(Decimal(400), fills["ETH-USDT"].price)
+        self.assertAlmostEqual(0.042, float(fills["ETH-BTC"].price))
+        self.assertEqual(Decimal(10000), fills["BTC-USDT"].price)
+        # Less USDT was spent than received, the ETH and BTC balances are back where they were, minus rounding.
+        self.assertGreater(self.market.get_balance("USDT"), Decimal(10000))
+
+        # The cool off period holds the next trades, even though the paper fills don't change the order books.
+        self.clock.backtest_til(self.start_timestamp + PaperTradeExchange.TRADE_EXECUTION_DELAY + 5)
+        self.assertEqual({}, self.taker_orders())
+
+
+if __name__ == "__main__":
+    unittest.main()